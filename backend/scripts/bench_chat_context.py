@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Chat Context Benchmark
+
+1. Scores the local context classifier on held-out messages (written
+   separately from its training examples): how many it answers without the
+   model, and how many of those match the expected label.
+2. Times /chat turns against a stand-in model with a fixed round trip,
+   comparing the previous flow (LLM context detection, then the reply) with
+   the current one (local classifier, detection and reply concurrently).
+
+Usage:
+    python scripts/bench_chat_context.py
+    python scripts/bench_chat_context.py --model-ms 800 --turns 200
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import structlog
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.ai.client as ai_client
+from src.ai.context_classifier import ContextClassifier, get_context_classifier
+from src.ai.core import AssetClass, OSFCore
+from src.api.chat import ChatRequest, chat
+
+# (message, asset class, expected label)
+HELD_OUT = [
+    ("hello!", "property", "general"), ("hey, thanks for the help", "property", "general"),
+    ("what is this property like?", "property", "general"), ("how does the osf network work?", "property", "general"),
+    ("are there good schools nearby?", "property", "general"), ("how does governance voting work here", "property", "general"),
+    ("what size is the solar system", "energy", "general"), ("thank you", "energy", "general"),
+    ("my kitchen tap is leaking", "property", "maintenance"), ("the smoke alarm keeps beeping", "property", "maintenance"),
+    ("the dishwasher won't drain", "property", "maintenance"), ("can you send a plumber for the toilet", "property", "maintenance"),
+    ("there's mould on the bedroom ceiling", "property", "maintenance"), ("the aircon is broken again", "property", "maintenance"),
+    ("the front door lock is stuck", "property", "maintenance"), ("no hot water this morning", "property", "maintenance"),
+    ("the inverter shows an error code", "energy", "maintenance"), ("panels are dirty and need a clean", "energy", "maintenance"),
+    ("need to book a service for the battery", "energy", "maintenance"), ("the garage door won't open", "property", "maintenance"),
+    ("how much did my panels generate today?", "energy", "monitoring"), ("what's my output right now", "energy", "monitoring"),
+    ("show me this week's production", "energy", "monitoring"), ("why is generation lower than yesterday", "energy", "monitoring"),
+    ("what's the battery charge at", "energy", "monitoring"), ("how many kwh have we exported to the grid", "energy", "monitoring"),
+    ("is my system performing well", "energy", "monitoring"), ("output dropped a lot today", "energy", "monitoring"),
+    ("when is my rent due?", "property", "financial"), ("can i pay rent late this week?", "property", "financial"),
+    ("how much is my bond", "property", "financial"), ("when do dividends get paid", "property", "financial"),
+    ("what's the current token price", "property", "financial"), ("i want to sell some tokens", "property", "financial"),
+    ("how much have i saved on my electricity bill", "energy", "financial"), ("what are my feed in tariff earnings", "energy", "financial"),
+    ("what is the property valuation now", "property", "financial"), ("i'm behind on rent, can i get a payment plan", "property", "financial"),
+    ("there are sparks from the switchboard", "property", "emergency"), ("i can smell gas in the kitchen", "property", "emergency"),
+    ("water is pouring through the ceiling", "property", "emergency"), ("someone broke into the house", "property", "emergency"),
+    ("the house is on fire", "property", "emergency"), ("smoke coming from the inverter", "energy", "emergency"),
+    ("a tree fell on the roof in the storm", "property", "emergency"), ("the bathroom is flooding", "property", "emergency"),
+    ("i forgot my password", "property", "support"), ("i can't log in to the app", "property", "support"),
+    ("how do i change my email address", "property", "support"), ("i'd like to make a complaint", "property", "support"),
+    ("can i speak to a real person", "property", "support"), ("how do i renew my lease", "property", "support"),
+    ("my account got locked", "energy", "support"), ("the website keeps showing an error", "property", "support"),
+    ("what does the governor think about the market outlook for perth", "property", "general"),
+    ("should i buy more tokens or wait for the next month", "property", "financial"),
+    ("is it normal for the panels to make a clicking noise", "energy", "maintenance"),
+    ("can you explain the lease break fees", "property", "financial"),
+]
+
+
+class _Response:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _FakeModels:
+    """generate_content with a simulated round trip (+/- 20%)."""
+
+    def __init__(self, latency: float, rng: random.Random):
+        self.latency = latency
+        self.rng = rng
+
+    async def generate_content(self, model=None, contents=None, config=None):
+        await asyncio.sleep(self.latency * self.rng.uniform(0.8, 1.2))
+        return _Response("general" if isinstance(contents, str) else "Here to help.")
+
+
+class _FakeClient:
+    def __init__(self, latency: float, rng: random.Random):
+        self.aio = type("Aio", (), {})()
+        self.aio.models = _FakeModels(latency, rng)
+
+
+def evaluate_classifier() -> None:
+    classifier = ContextClassifier(min_confidence=get_context_classifier().min_confidence)
+    answered = correct = 0
+    start = time.perf_counter()
+    for message, asset_class, expected in HELD_OUT:
+        result = classifier.classify(message, AssetClass(asset_class))
+        if result:
+            answered += 1
+            correct += result[0].value == expected
+    per_call_us = (time.perf_counter() - start) / len(HELD_OUT) * 1e6
+
+    print(f"Classifier (min confidence {classifier.min_confidence}):")
+    print(f"  Answered locally:  {answered}/{len(HELD_OUT)} ({100 * answered / len(HELD_OUT):.0f}%)")
+    print(f"  Correct:           {correct}/{answered} ({100 * correct / max(answered, 1):.0f}%)")
+    print(f"  Time per message:  {per_call_us:.1f} µs")
+
+
+async def sequential_turn(core: OSFCore, request: ChatRequest) -> None:
+    """The previous /chat flow: model context detection, then the reply."""
+    asset_class = AssetClass(request.asset_class)
+    llm_only = ContextClassifier(min_confidence=1.01)
+    if llm_only.classify(request.message, asset_class) is None:
+        await core.client.aio.models.generate_content(model=core.model_name, contents=request.message)
+    await core.chat(message=request.message, asset_class=asset_class)
+
+
+def _summary(label: str, samples: list) -> float:
+    samples = sorted(samples)
+    median = statistics.median(samples)
+    p90 = samples[int(len(samples) * 0.9) - 1]
+    print(f"  {label:<28} median {median * 1000:7.1f} ms   p90 {p90 * 1000:7.1f} ms")
+    return median
+
+
+async def time_turns(turns: int, latency: float, seed: int) -> None:
+    rng = random.Random(seed)
+    ai_client._client = _FakeClient(latency, rng)
+    core = OSFCore()
+    requests = [
+        ChatRequest(message=message, asset_class=asset_class)
+        for message, asset_class, _ in (rng.choice(HELD_OUT) for _ in range(turns))
+    ]
+
+    before, after = [], []
+    for request in requests:
+        start = time.perf_counter()
+        await sequential_turn(core, request)
+        before.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await chat(request)
+        after.append(time.perf_counter() - start)
+
+    print(f"Chat turns ({turns}, model round trip {latency * 1000:.0f} ms):")
+    old = _summary("detect then reply (before)", before)
+    new = _summary("local + concurrent (now)", after)
+    print(f"  Median latency cut:          {100 * (1 - new / old):.0f}%")
+    print(f"  Context calls answered locally: {get_context_classifier().get_metrics()['local_rate']:.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark local context detection in /chat")
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--model-ms", type=float, default=400.0, help="Simulated model round trip")
+    parser.add_argument("--seed", type=int, default=48)
+    args = parser.parse_args()
+
+    # One osf_chat log line per turn would drown the results
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    print(f"\n{'='*60}")
+    print("OSF Chat Context Benchmark")
+    print(f"{'='*60}")
+    evaluate_classifier()
+    print()
+    asyncio.run(time_turns(args.turns, args.model_ms / 1000, args.seed))
+    print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    main()
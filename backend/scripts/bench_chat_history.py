@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Chat History Benchmark
+
+Plays one long tenant conversation through OSFCore.chat twice:
+
+- full replay: every earlier message sent on every turn (the old behaviour)
+- compacted: the configured HistoryManager (last HISTORY_KEEP_TURNS turns
+  verbatim, older turns summarized in the background, HISTORY_TOKEN_BUDGET)
+
+The model is a stand-in whose latency is a fixed round trip plus a cost
+per prompt token, measured from the contents and system instruction OSFCore
+actually builds. Summaries finish between turns, as they would while the
+user reads and types. Reports prompt size and latency at turns 5, 20 and 50.
+
+Usage:
+    python scripts/bench_chat_history.py
+    python scripts/bench_chat_history.py --turns 5 20 50 100 --ms-per-1k-tokens 80
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import structlog
+
+structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+from src.ai import client as ai_client
+from src.ai import history as ai_history
+from src.ai.core import AssetClass, Message, OSFCore
+from src.ai.history import CHARS_PER_TOKEN, HistoryManager
+from src.config import get_settings
+
+TENANT_LINES = [
+    "The hot water system in unit 4 has been lukewarm since Tuesday and the pilot light keeps going out.",
+    "I also noticed a damp patch spreading on the bathroom ceiling under the upstairs neighbour's shower.",
+    "Can the plumber come on Thursday afternoon? I work from home then and can let them in after two.",
+    "My rent is due on the 15th but my pay was delayed, can I pay on the 18th without a late fee this time?",
+    "The smoke alarm in the hallway chirps every few minutes even after I replaced the nine volt battery.",
+    "Last time the electrician said the switchboard needed an upgrade, has that been booked with the owner?",
+]
+
+
+def _reply(turn: int) -> str:
+    """A reply of typical length that mentions what was asked."""
+    return (
+        f"Thanks for letting me know (ref MR-{1000 + turn}). "
+        + "I have logged this with the details you gave and asked the contractor to confirm a time window. "
+        * 5
+        + "I will message you once it is booked, and please call the emergency line if anything gets worse."
+    )
+
+
+class _Response:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _Models:
+    """Gemini stand-in: latency grows with the prompt it is sent."""
+
+    def __init__(self, base_ms: float, ms_per_1k: float):
+        self.base_ms = base_ms
+        self.ms_per_1k = ms_per_1k
+        self.last_prompt_tokens = 0
+        self.turn = 0
+
+    async def generate_content(self, model, contents, config=None):
+        chars = sum(len(part.text or "") for content in contents for part in content.parts)
+        if config is not None and config.system_instruction:
+            chars += len(config.system_instruction)
+        self.last_prompt_tokens = chars // CHARS_PER_TOKEN
+        await asyncio.sleep((self.base_ms + self.ms_per_1k * self.last_prompt_tokens / 1000) / 1000)
+        return _Response(_reply(self.turn))
+
+
+class _FakeClient:
+    def __init__(self, models: _Models):
+        self.aio = type("Aio", (), {"models": models})()
+
+    async def close(self):
+        pass
+
+
+def _summarizer(base_ms: float):
+    async def summarize(previous, messages, max_tokens):
+        await asyncio.sleep(base_ms / 1000)
+        covered = (previous or "") + " " + " ".join(m.content[:60] for m in messages if m.role == "user")
+        return covered.strip()[: max_tokens * CHARS_PER_TOKEN]
+    return summarize
+
+
+async def play(manager: HistoryManager, models: _Models, turns: int, report: set) -> dict:
+    """Latency and prompt tokens at each reported turn."""
+    ai_history._history_manager = manager
+    core = OSFCore()
+    history = []
+    results = {}
+    for turn in range(1, turns + 1):
+        models.turn = turn
+        message = TENANT_LINES[(turn - 1) % len(TENANT_LINES)]
+        start = time.perf_counter()
+        reply = await core.chat(
+            message=message,
+            asset_class=AssetClass.PROPERTY,
+            conversation_history=history,
+            context={"property_address": "12 Example St", "unit": 4},
+            role="tenant",
+            conversation_id="bench",
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        if turn in report:
+            results[turn] = (elapsed, models.last_prompt_tokens)
+        history = history + [Message(role="user", content=message), Message(role="assistant", content=reply)]
+        await manager.drain()  # the user reading and typing
+    return results
+
+
+async def run(args) -> None:
+    settings = get_settings()
+    models = _Models(args.base_ms, args.ms_per_1k_tokens)
+    ai_client._client = _FakeClient(models)
+    settings.google_api_key = settings.google_api_key or "bench"
+    report = set(args.turns)
+
+    full = HistoryManager(keep_turns=10**6, token_budget=10**9, max_summaries=0)
+    compact = HistoryManager(
+        keep_turns=settings.history_keep_turns,
+        token_budget=settings.history_token_budget,
+        summarize=_summarizer(args.base_ms),
+    )
+    before = await play(full, models, max(report), report)
+    after = await play(compact, models, max(report), report)
+
+    print(f"Model: {args.base_ms:.0f} ms round trip + {args.ms_per_1k_tokens:.0f} ms per 1k prompt tokens")
+    print(f"History: last {settings.history_keep_turns} turns verbatim, budget {settings.history_token_budget} tokens")
+    print(f"  {'turn':>4}  {'full replay':>22}  {'compacted':>22}  {'cut':>5}")
+    for turn in sorted(report):
+        (b_ms, b_tok), (a_ms, a_tok) = before[turn], after[turn]
+        print(
+            f"  {turn:>4}  {b_ms:8.0f} ms {b_tok:6d} tok   {a_ms:8.0f} ms {a_tok:6d} tok  "
+            f"{100 * (1 - a_ms / b_ms):4.0f}%"
+        )
+    metrics = compact.get_metrics()
+    print(f"  Summaries written: {metrics['summaries']}, turns sent with a summary: {metrics['summarized']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chat latency with full vs compacted history")
+    parser.add_argument("--turns", type=int, nargs="+", default=[5, 20, 50], help="Turns to report")
+    parser.add_argument("--base-ms", type=float, default=300.0, help="Model round trip for a tiny prompt")
+    parser.add_argument("--ms-per-1k-tokens", type=float, default=60.0, help="Extra latency per 1k prompt tokens")
+    args = parser.parse_args()
+
+    print(f"\n{'='*60}")
+    print("OSF Chat History Benchmark")
+    print(f"{'='*60}")
+    asyncio.run(run(args))
+    print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    main()
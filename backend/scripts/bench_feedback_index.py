@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Feedback Index Benchmark
+
+Builds the feedback duplicate index over synthetic items and measures:
+
+- Indexing time per item
+- Duplicate lookup latency (reworded copies of indexed items)
+- Recall: how often the original is returned for its reworded copy
+- First page by score from the index vs sorting every item per request
+
+Usage:
+    python scripts/bench_feedback_index.py
+    python scripts/bench_feedback_index.py --items 50000 --queries 2000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.feedback_index import FeedbackIndex
+
+# Zipf-distributed content words: ranks 100+ of a 20k-word vocabulary, since
+# the most frequent words are stopwords that tokenize() drops
+VOCABULARY = [f"w{rank}" for rank in range(100, 20100)]
+WEIGHTS = [1 / (rank + 1) for rank in range(100, 20100)]
+
+
+def words(rng: random.Random, count: int) -> list:
+    return rng.choices(VOCABULARY, weights=WEIGHTS, k=count)
+
+
+def make_item(rng: random.Random, i: int) -> dict:
+    text = words(rng, 30)
+    return {
+        "id": f"fb-{i:06d}",
+        "title": " ".join(text[:6]),
+        "description": " ".join(text[6:]),
+        "feedback_type": rng.choice(["bug", "enhancement", "question"]),
+        "ai_priority": rng.choice(["critical", "high", "medium", "low"]),
+        "status": "open",
+        "upvotes": rng.randint(0, 200),
+        "downvotes": rng.randint(0, 20),
+        "created_at": f"2026-01-01T00:00:{i:06d}",
+    }
+
+
+def reword(rng: random.Random, item: dict) -> str:
+    """Copy with a fifth of its words replaced."""
+    text = f"{item['title']} {item['description']}".split()
+    for pos in rng.sample(range(len(text)), len(text) // 5):
+        text[pos] = words(rng, 1)[0]
+    return " ".join(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark feedback duplicate detection")
+    parser.add_argument("--items", type=int, default=20000, help="Items to index")
+    parser.add_argument("--queries", type=int, default=1000, help="Duplicate lookups")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    items = [make_item(rng, i) for i in range(args.items)]
+    index = FeedbackIndex()
+
+    print("OSF Feedback Index Benchmark")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    for item in items:
+        index.add(item)
+    elapsed = time.perf_counter() - start
+    print(f"  indexed {len(index):,} items in {elapsed:.2f}s ({elapsed / len(index) * 1e6:.0f} µs/item)")
+
+    samples, hits = [], 0
+    for item in rng.sample(items, args.queries):
+        text = reword(rng, item)
+        start = time.perf_counter()
+        matches = index.similar(text)
+        samples.append((time.perf_counter() - start) * 1e6)
+        hits += any(feedback_id == item["id"] for feedback_id, _ in matches)
+    samples.sort()
+    print(f"  lookup            p50 {statistics.median(samples):8.1f} µs   "
+          f"p99 {samples[int(len(samples) * 0.99) - 1]:8.1f} µs")
+    print(f"  recall            {hits / args.queries:.1%}")
+
+    by_id = {item["id"]: item for item in items}
+    start = time.perf_counter()
+    for _ in range(100):
+        page = [by_id[feedback_id] for feedback_id in index.ranked("upvotes", 0, 50)]
+    walk_ms = (time.perf_counter() - start) * 10
+    start = time.perf_counter()
+    for _ in range(10):
+        resorted = sorted(by_id.values(), key=lambda x: x["upvotes"] - x["downvotes"], reverse=True)
+    sort_ms = (time.perf_counter() - start) * 100
+    assert [i["id"] for i in page] == [i["id"] for i in resorted[:50]]
+    print(f"  top 50 by score   index {walk_ms:6.3f} ms   re-sort {sort_ms:6.2f} ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Middleware Benchmark
+
+Compares the previous BaseHTTPMiddleware-based API key and error handling
+middleware with the pure ASGI versions in src/middleware, each stacked under
+CORS like the real app:
+
+- Requests per second on a trivial JSON endpoint
+- Time to first byte of an SSE stream
+
+Requests are driven straight through the ASGI interface (no HTTP client or
+socket) so the numbers isolate middleware overhead.
+
+Usage:
+    python scripts/bench_middleware.py
+    python scripts/bench_middleware.py --requests 20000 --streams 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.middleware import ApiKeyMiddleware, ErrorHandlerMiddleware
+
+API_KEY = "bench-key"
+
+
+# =============================================================================
+# Previous implementations (BaseHTTPMiddleware)
+# =============================================================================
+
+class LegacyErrorHandlerMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable):
+        try:
+            return await call_next(request)
+        except HTTPException as e:
+            return JSONResponse(status_code=e.status_code, content={"error": True, "message": e.detail})
+        except Exception:
+            return JSONResponse(status_code=500, content={"error": True})
+
+
+def add_legacy_api_key(app: FastAPI):
+    @app.middleware("http")
+    async def api_key_middleware(request: Request, call_next):
+        public_paths = ["/", "/health", "/docs", "/openapi.json", "/redoc"]
+        if request.url.path in public_paths:
+            return await call_next(request)
+        if request.headers.get("X-API-Key") != API_KEY:
+            return JSONResponse(status_code=403, content={"detail": "Invalid or missing API key"})
+        return await call_next(request)
+
+
+# =============================================================================
+# Apps
+# =============================================================================
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/api/v1/stream")
+    async def stream():
+        async def events():
+            yield "event: clock_sync\ndata: {}\n\n"
+            await asyncio.sleep(3600)
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    app.add_middleware(CORSMiddleware, allow_origins=["http://localhost:5173"], allow_methods=["*"])
+    if legacy:
+        app.add_middleware(LegacyErrorHandlerMiddleware)
+        add_legacy_api_key(app)
+    else:
+        app.add_middleware(ErrorHandlerMiddleware)
+        app.add_middleware(ApiKeyMiddleware, api_key=API_KEY, enabled=True)
+    return app
+
+
+def make_scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"x-api-key", API_KEY.encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+
+async def request_once(app, path: str, first_byte: asyncio.Event = None) -> int:
+    """Run one request through the ASGI app; returns the status code."""
+    disconnect = asyncio.Event()
+    status = 0
+
+    async def receive():
+        if first_byte is None:
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and message.get("body") and first_byte is not None:
+            first_byte.set()
+
+    if first_byte is None:
+        await app(make_scope(path), receive, send)
+    else:
+        # Streaming: stop as soon as the first event arrives
+        task = asyncio.create_task(app(make_scope(path), receive, send))
+        await first_byte.wait()
+        disconnect.set()
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+    return status
+
+
+async def bench_rps(app, count: int) -> float:
+    assert await request_once(app, "/api/v1/ping") == 200
+    start = time.perf_counter()
+    for _ in range(count):
+        await request_once(app, "/api/v1/ping")
+    return count / (time.perf_counter() - start)
+
+
+async def bench_first_byte(app, count: int) -> list:
+    samples = []
+    for _ in range(count):
+        first_byte = asyncio.Event()
+        start = time.perf_counter()
+        await request_once(app, "/api/v1/stream", first_byte)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def percentiles(samples_us: list) -> str:
+    ordered = sorted(samples_us)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50 {p50:8.1f} µs   p99 {p99:8.1f} µs"
+
+
+async def run(requests: int, streams: int):
+    for label, legacy in [("BaseHTTPMiddleware (before)", True), ("pure ASGI (after)", False)]:
+        app = build_app(legacy)
+        rps = await bench_rps(app, requests)
+        ttfb = await bench_first_byte(app, streams)
+        print(f"  {label}")
+        print(f"    trivial endpoint   {rps:10,.0f} req/s")
+        print(f"    SSE first byte     {percentiles(ttfb)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP middleware overhead")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests to the trivial endpoint")
+    parser.add_argument("--streams", type=int, default=300, help="SSE streams opened")
+    args = parser.parse_args()
+
+    print("OSF Middleware Benchmark")
+    print("=" * 60)
+    asyncio.run(run(args.requests, args.streams))
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
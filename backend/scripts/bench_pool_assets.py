@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Pool Asset Benchmark
+
+Builds synthetic property pools at several sizes in the old format (inline
+base64 images) and migrates a copy to the asset store, then measures for
+each format, in a fresh process:
+
+- Startup: time for load_property_pool() to parse the pool
+- Resident memory added by the loaded pool
+- Pool file size and first-page (/pool/properties, limit 50) payload size
+
+Images are random bytes behind a JPEG header, two per property.
+
+Usage:
+    python scripts/bench_pool_assets.py
+    python scripts/bench_pool_assets.py --sizes 50,500,5000 --image-kb 48
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Runs in a fresh interpreter so each measurement starts from the same baseline
+CHILD = """
+import json, sys, time
+from pathlib import Path
+import src.api.pool as pool_api
+
+def rss():
+    return int(Path("/proc/self/statm").read_text().split()[1]) * 4096
+
+pool_api.PROPERTY_POOL_PATH = Path(sys.argv[1])
+before = rss()
+start = time.perf_counter()
+pool = pool_api.load_property_pool()
+elapsed = time.perf_counter() - start
+page = json.dumps(pool["properties"][:50])
+print(json.dumps({"seconds": elapsed, "rss": rss() - before, "page": len(page)}))
+"""
+
+
+def build_pool(count: int, image_kb: int, rng: random.Random) -> dict:
+    from src.services.image_generator import encode_image_base64
+    from src.services.property_generator import generate_property_data
+
+    properties = []
+    for i in range(count):
+        data = generate_property_data(index=i).to_dict()
+        images = {
+            name: encode_image_base64(b"\xff\xd8\xff\xe0" + rng.randbytes(image_kb * 1024))
+            for name in ("isometric", "floorplan")
+        }
+        properties.append({
+            "id": data["id"],
+            "status": "draft",
+            "data": data,
+            "listing": {"headline": f"Property {i}", "description": "x" * 2000, "highlights": []},
+            "images": images,
+        })
+    return {"generated_at": "2026-01-01T00:00:00", "count": count, "properties": properties}
+
+
+def measure(path: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, str(path)],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "LOG_LEVEL": "WARNING"},
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inline vs content-addressed pool images")
+    parser.add_argument("--sizes", type=str, default="50,500,5000", help="Comma-separated pool sizes")
+    parser.add_argument("--image-kb", type=int, default=48, help="Size of each synthetic image")
+    args = parser.parse_args()
+
+    from src.services.asset_store import AssetStore
+
+    rng = random.Random(3)
+    print("OSF Pool Asset Benchmark")
+    print("=" * 78)
+    print(f"  {'props':>6}  {'format':<8} {'file':>10} {'load':>9} {'RSS':>10} {'page 50':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AssetStore(Path(tmp) / "assets")
+        for count in (int(n) for n in args.sizes.split(",")):
+            pool = build_pool(count, args.image_kb, rng)
+            inline_path = Path(tmp) / f"inline_{count}.json"
+            inline_path.write_text(json.dumps(pool, indent=2))
+
+            for prop in pool["properties"]:
+                prop["images"] = store.put_images(prop["images"])
+            asset_path = Path(tmp) / f"assets_{count}.json"
+            asset_path.write_text(json.dumps(pool, indent=2))
+            del pool
+
+            for label, path in (("inline", inline_path), ("assets", asset_path)):
+                m = measure(path)
+                print(f"  {count:>6}  {label:<8} {path.stat().st_size / 1e6:>8.1f}MB "
+                      f"{m['seconds'] * 1000:>7.1f}ms {m['rss'] / 1e6:>8.1f}MB {m['page'] / 1e3:>8.1f}KB")
+            inline_path.unlink()
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
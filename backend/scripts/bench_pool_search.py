@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Pool Search Benchmark
+
+Builds the in-memory pool search index over synthetic properties and times
+a mix of queries (filters, ranges, sorts, deep cursor pages, facets). Each
+query's results are also checked against a brute-force filter and sort
+over the same entries.
+
+Usage:
+    python scripts/bench_pool_search.py
+    python scripts/bench_pool_search.py --sizes 1000,10000,50000 --queries 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.pool_search import PoolSearchIndex, _summary
+from src.services.property_generator import SUBURBS, generate_property_data
+
+
+def build_entries(count: int, rng: random.Random) -> list:
+    entries = []
+    for i in range(count):
+        data = generate_property_data(index=i).to_dict()
+        entries.append({
+            "id": f"{data['id']}-{i}",
+            "position": i,
+            "status": rng.choice(("draft", "draft", "draft", "available")),
+            "data": data,
+            "listing": {"headline": f"Property {i}", "highlights": []},
+            "images": {"isometric": f"/assets/00/{i:064d}.png"},
+        })
+    return entries
+
+
+def random_query(rng: random.Random) -> dict:
+    query = {"terms": {}, "ranges": {}}
+    if rng.random() < 0.5:
+        query["terms"]["suburb"] = rng.sample(sorted(SUBURBS), rng.randint(1, 3))
+    if rng.random() < 0.3:
+        query["terms"]["status"] = ["draft"]
+    if rng.random() < 0.5:
+        low = rng.randrange(300_000, 1_500_000, 50_000)
+        query["ranges"]["valuation"] = (low, low + rng.randrange(100_000, 1_000_000, 50_000))
+    if rng.random() < 0.3:
+        query["ranges"]["bedrooms"] = (rng.randint(2, 4), None)
+    if rng.random() < 0.3:
+        query["ranges"]["gross_yield"] = (rng.choice((3.5, 4.0, 4.5, 5.0)), None)
+    query["sort"] = rng.choice(("position", "valuation", "gross_yield", "land_size"))
+    query["descending"] = query["sort"] != "position" and rng.random() < 0.5
+    return query
+
+
+def brute_force(entries: list, query: dict) -> list:
+    """Ids of all matches in sorted order, the slow way."""
+    rows = []
+    for e in entries:
+        s = {**_summary(e), "status": e["status"]}
+        if any(s[f] not in values for f, values in query["terms"].items()):
+            continue
+        if any((lo is not None and s[f] < lo) or (hi is not None and s[f] > hi)
+               for f, (lo, hi) in query["ranges"].items()):
+            continue
+        rows.append((s[query["sort"]] if query["sort"] != "position" else e["position"], e["position"], s["id"]))
+    rows.sort(reverse=query["descending"])
+    return [row[2] for row in rows]
+
+
+def percentile(samples: list, p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pool search index")
+    parser.add_argument("--sizes", type=str, default="1000,10000", help="Comma-separated pool sizes")
+    parser.add_argument("--queries", type=int, default=1000, help="Queries per size")
+    parser.add_argument("--limit", type=int, default=50, help="Page size")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    print("OSF Pool Search Benchmark")
+    print("=" * 78)
+    print(f"  {'props':>6} {'build':>9}   {'first page p50/p99':>20}   {'page 5 p50/p99':>18}   {'no facets p99':>13}")
+
+    for count in (int(n) for n in args.sizes.split(",")):
+        entries = build_entries(count, rng)
+        index = PoolSearchIndex()
+        start = time.perf_counter()
+        index.build(entries)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        first, deep, bare = [], [], []
+        checked = 0
+        for _ in range(args.queries):
+            query = random_query(rng)
+            params = dict(terms=query["terms"], ranges=query["ranges"], sort=query["sort"],
+                          descending=query["descending"], limit=args.limit)
+
+            start = time.perf_counter()
+            result = index.search(**params)
+            first.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            index.search(**params, facets=False)
+            bare.append(time.perf_counter() - start)
+
+            # Follow cursors to page 5, timing the last hop
+            ids = [item["id"] for item in result["items"]]
+            page = result
+            for hop in range(4):
+                if not page["next_cursor"]:
+                    break
+                start = time.perf_counter()
+                page = index.search(**params, cursor=page["next_cursor"], facets=False)
+                if hop == 3:
+                    deep.append(time.perf_counter() - start)
+                ids += [item["id"] for item in page["items"]]
+
+            if checked < 50:
+                expected = brute_force(entries, query)
+                assert result["total"] == len(expected), (query, result["total"], len(expected))
+                assert ids == expected[:len(ids)], query
+                checked += 1
+
+        print(f"  {count:>6} {build_ms:>7.0f}ms   "
+              f"{percentile(first, 0.5) * 1e3:>8.3f}/{percentile(first, 0.99) * 1e3:.3f} ms   "
+              f"{percentile(deep, 0.5) * 1e3:>6.3f}/{percentile(deep, 0.99) * 1e3:.3f} ms   "
+              f"{percentile(bare, 0.99) * 1e3:>10.3f} ms")
+
+    print("=" * 78)
+    print("  Results matched a brute-force filter and sort on 50 queries per size")
+
+
+if __name__ == "__main__":
+    main()
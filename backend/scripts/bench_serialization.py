@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark
+
+Measures p50/p99 latency for:
+- GET /api/v1/network/history/snapshots and /api/v1/network/state through
+  the ASGI app (as configured, i.e. with the fast JSON response class)
+- Rendering those responses with FastAPI's JSONResponse vs FastJSONResponse
+- SSE fan-out of one clock message to N subscribers: json.dumps per
+  subscriber (old clock_stream) vs serialize once and reuse the string
+
+Usage:
+    python scripts/bench_serialization.py
+    python scripts/bench_serialization.py --requests 2000 --subscribers 500
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.serialization import FastJSONResponse, dumps_str, orjson
+
+
+def percentiles(samples_us: list) -> str:
+    """Format p50/p99 of microsecond samples."""
+    ordered = sorted(samples_us)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50 {p50:9.1f} µs   p99 {p99:9.1f} µs"
+
+
+def time_calls(fn, count: int) -> list:
+    """Run fn count times, returning per-call microseconds."""
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+async def bench_endpoints(count: int) -> dict:
+    """Time endpoints through the ASGI app and capture their payloads."""
+    import httpx
+    from src.main import app
+
+    payloads = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for path in ["/api/v1/network/history/snapshots?months=120", "/api/v1/network/state"]:
+                samples = []
+                for _ in range(count):
+                    start = time.perf_counter()
+                    response = await client.get(path)
+                    samples.append((time.perf_counter() - start) * 1e6)
+                payloads[path] = response.json()
+                print(f"  GET {path:<48} {percentiles(samples)}")
+    return payloads
+
+
+def bench_render(payloads: dict, count: int):
+    """Compare response rendering with the stock and fast response classes."""
+    for path, payload in payloads.items():
+        # FastAPI runs jsonable_encoder before the stock JSONResponse
+        stock = time_calls(lambda: JSONResponse(jsonable_encoder(payload)), count)
+        fast = time_calls(lambda: FastJSONResponse(payload), count)
+        print(f"  {path}")
+        print(f"    JSONResponse      {percentiles(stock)}")
+        print(f"    FastJSONResponse  {percentiles(fast)}")
+
+
+def bench_fanout(subscribers: int, count: int, payload: dict):
+    """Compare per-subscriber json.dumps with serialize-once fan-out."""
+    queues = [[] for _ in range(subscribers)]
+
+    def per_subscriber():
+        for q in queues:
+            q.append(json.dumps(payload))
+        for q in queues:
+            q.clear()
+
+    def serialize_once():
+        data = dumps_str(payload)
+        for q in queues:
+            q.append(data)
+        for q in queues:
+            q.clear()
+
+    print(f"  json.dumps per subscriber   {percentiles(time_calls(per_subscriber, count))}")
+    print(f"  serialize once             {percentiles(time_calls(serialize_once, count))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization paths")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint")
+    parser.add_argument("--subscribers", type=int, default=200, help="SSE subscribers for fan-out")
+    parser.add_argument("--skip-http", action="store_true", help="Only run the in-process benchmarks")
+    args = parser.parse_args()
+
+    print("OSF Serialization Benchmark")
+    print("=" * 60)
+    print(f"  Backend: {'orjson' if orjson else 'json (orjson not installed)'}")
+    print()
+
+    payloads = {}
+    if not args.skip_http:
+        print("Endpoint latency (ASGI, in-process):")
+        payloads = asyncio.run(bench_endpoints(args.requests))
+        print()
+
+    if payloads:
+        print("Response rendering:")
+        bench_render(payloads, args.requests)
+        print()
+
+    # A month_completed message carries the whole batch result
+    month_completed = {
+        "month": 42,
+        "next_tick_in": 300,
+        "result": {
+            "month": 42,
+            "events": [
+                {"type": "market", "title": f"Event {i}", "description": "x" * 200, "severity": "info"}
+                for i in range(50)
+            ],
+            "valuations": {f"prop-{i}": 650000 + i * 1000.5 for i in range(200)},
+            "governor_summary": "Quiet month across the network. " * 20,
+        },
+    }
+    print(f"SSE fan-out to {args.subscribers} subscribers (month_completed):")
+    bench_fanout(args.subscribers, max(50, args.requests // 5), month_completed)
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+
+Measures how long the API takes to come up, in fresh processes:
+
+- Import: `python -X importtime -c "import src.main"`, with the slowest
+  modules by cumulative time and whether google.genai was pulled in (it
+  should only load on the first AI call, or during AI_WARMUP).
+- Time to first 200: spawns uvicorn and polls /health until it answers.
+
+Runs against the configured environment (same database and data/ files as
+`uvicorn src.main:app`). Exits 1 if a median exceeds its budget, so it can
+gate CI.
+
+Usage:
+    python scripts/bench_startup.py
+    python scripts/bench_startup.py --runs 5 --import-budget-ms 2000 --health-budget-ms 5000
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+BACKEND = Path(__file__).parent.parent
+
+# Median budgets (also checked by tests/test_startup.py for the import)
+IMPORT_BUDGET_MS = 2500.0
+HEALTH_BUDGET_MS = 6000.0
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(BACKEND)
+    env.setdefault("LOG_LEVEL", "WARNING")
+    return env
+
+
+def measure_import() -> tuple:
+    """(total ms, {module: cumulative ms}) for one fresh import of src.main."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        cwd=BACKEND, env=_env(), capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            modules[name.strip()] = int(cumulative) / 1000
+        except ValueError:
+            continue  # header line
+    return modules.get("src.main", 0.0), modules
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_first_200(timeout: float) -> float:
+    """Milliseconds from spawning uvicorn to the first 200 from /health."""
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND, env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client() as client:
+            while time.perf_counter() - start < timeout:
+                if server.poll() is not None:
+                    raise RuntimeError(f"uvicorn exited with {server.returncode}")
+                try:
+                    if client.get(f"http://127.0.0.1:{port}/health", timeout=1.0).status_code == 200:
+                        return (time.perf_counter() - start) * 1000
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.01)
+        raise RuntimeError(f"/health did not answer within {timeout:.0f}s")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API import time and time to first 200")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh processes per measurement")
+    parser.add_argument("--top", type=int, default=12, help="Slowest imported modules to list")
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--health-budget-ms", type=float, default=HEALTH_BUDGET_MS)
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for /health")
+    args = parser.parse_args()
+
+    print(f"\n{'='*60}")
+    print("OSF Startup Benchmark")
+    print(f"{'='*60}")
+
+    imports = []
+    modules = {}
+    for _ in range(args.runs):
+        total, modules = measure_import()
+        imports.append(total)
+    import_ms = statistics.median(imports)
+
+    # Direct children of the app and heavy third-party packages, slowest first
+    print(f"Import src.main: {import_ms:.0f} ms median ({', '.join(f'{t:.0f}' for t in imports)})")
+    print(f"  google.genai imported: {'yes' if 'google.genai' in modules else 'no'}")
+    ranked = sorted(
+        ((name, ms) for name, ms in modules.items()
+         if name != "src.main" and ("." not in name or name.startswith("src."))),
+        key=lambda item: -item[1],
+    )
+    for name, ms in ranked[:args.top]:
+        print(f"    {ms:8.1f} ms  {name}")
+
+    firsts = [measure_first_200(args.timeout) for _ in range(args.runs)]
+    health_ms = statistics.median(firsts)
+    print(f"First 200 on /health: {health_ms:.0f} ms median ({', '.join(f'{t:.0f}' for t in firsts)})")
+
+    failed = []
+    if import_ms > args.import_budget_ms:
+        failed.append(f"import {import_ms:.0f} ms > {args.import_budget_ms:.0f} ms")
+    if health_ms > args.health_budget_ms:
+        failed.append(f"first 200 {health_ms:.0f} ms > {args.health_budget_ms:.0f} ms")
+    print(f"Budget: {'OVER - ' + '; '.join(failed) if failed else 'ok'}")
+    print(f"{'='*60}\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
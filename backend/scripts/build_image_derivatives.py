@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Build Pool Image Derivatives
+
+Renders the AVIF/WebP thumbnail and medium variants of every property and
+avatar image in the pool tables, across a process pool. Images whose
+variants already exist for the current recipe are skipped, so this is cheap
+to re-run after generating new pool entries. (The API builds any missing
+variants on demand too; this just does it up front.)
+
+Reports the bytes a browser downloads for the pool's images: originals vs
+the thumbnail variant a listing card would pick.
+
+Usage:
+    python scripts/build_image_derivatives.py
+    python scripts/build_image_derivatives.py --workers 8
+    python scripts/build_image_derivatives.py --force
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import async_session, init_db, close_db
+from src.repositories import PoolRepository
+from src.services.asset_store import get_asset_store
+from src.services.image_derivatives import ImageDerivatives
+
+
+async def pool_image_urls() -> list:
+    await init_db()
+    try:
+        async with async_session() as session:
+            repo = PoolRepository(session)
+            urls = [url for p in await repo.export_properties() for url in (p["images"] or {}).values()]
+            urls += [a.image for a in await repo.list_avatars()]
+    finally:
+        await close_db()
+    return urls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build AVIF/WebP variants of pool images")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rebuild variants that already exist")
+    args = parser.parse_args()
+
+    print(f"\n{'='*60}")
+    print("OSF Image Derivatives")
+    print(f"{'='*60}")
+
+    derivatives = ImageDerivatives(get_asset_store(), workers=args.workers or os.cpu_count() or 1)
+    if not derivatives.enabled:
+        print("  ✗ Pillow is not installed (pip install Pillow); originals will be served")
+        return
+
+    urls = asyncio.run(pool_image_urls())
+    print(f"Images:  {len(urls)} ({len(set(urls))} unique)")
+    print(f"Formats: {', '.join(derivatives.formats)}   Workers: {derivatives.workers}")
+
+    start = time.perf_counter()
+    manifests = derivatives.build_all(urls, force=args.force)
+    elapsed = time.perf_counter() - start
+    derivatives.shutdown()
+
+    skipped = len(set(urls)) - len(manifests)
+    print(f"  ✓ {len(manifests)} images with variants in {elapsed:.1f}s"
+          + (f" ({skipped} not in the asset store)" if skipped else ""))
+
+    if manifests:
+        best = derivatives.formats[0]
+        original = sum(m["bytes"] for m in manifests)
+        thumbs = sum(m["variants"][0][f"{best}_bytes"] for m in manifests)
+        medium = sum(m["variants"][-1][f"{best}_bytes"] for m in manifests)
+        print(f"{'='*60}")
+        print(f"{'Originals:':<20} {original / 1e6:>8.2f} MB")
+        for label, size in ((f"Thumbnails ({best}):", thumbs), (f"Medium ({best}):", medium)):
+            print(f"{label:<20} {size / 1e6:>8.2f} MB  ({original / max(size, 1):.0f}x smaller)")
+    print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,7 @@ from src.services.image_generator import (
     generate_avatar,
     build_avatar_prompt,
     generate_image_sync,
-    encode_image_base64,
+    store_image,
 )
 
 
@@ -74,7 +74,7 @@ def generate_avatar_sync(role: str) -> str:
     image_bytes = generate_image_sync(prompt, aspect_ratio="1:1")
     
     if image_bytes:
-        return encode_image_base64(image_bytes)
+        return store_image(image_bytes)
     return None
 
 
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Pool Asset Migration
+
+One-shot conversion of property and avatar pools from inline base64 data
+URLs to the content-addressed asset store. Each image is written once to
+ASSET_DIR (default data/assets) and replaced in the JSON by its /assets URL.
+
+Safe to re-run: images that are already asset URLs are left alone, and the
+original file is kept as <name>.json.bak the first time it is rewritten.
+
+Usage:
+    python scripts/migrate_pool_assets.py
+    python scripts/migrate_pool_assets.py --properties data/property_pool.json --avatars data/avatars.json
+    python scripts/migrate_pool_assets.py --dry-run
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.asset_store import get_asset_store, is_data_url
+
+
+def migrate_file(path: Path, dry_run: bool = False) -> int:
+    """Move inline images in one pool file to the asset store. Returns images moved."""
+    if not path.exists():
+        print(f"  ⚠ Not found: {path}")
+        return 0
+
+    before = path.stat().st_size
+    pool = json.loads(path.read_text())
+    store = get_asset_store()
+    moved = 0
+
+    def convert(image: str) -> str:
+        nonlocal moved
+        if not is_data_url(image):
+            return image
+        moved += 1
+        return image if dry_run else store.put_data_url(image)
+
+    for prop in pool.get("properties", []):
+        if prop.get("images"):
+            prop["images"] = {name: convert(image) for name, image in prop["images"].items()}
+    if "avatars" in pool:
+        pool["avatars"] = {role: convert(image) for role, image in pool["avatars"].items()}
+
+    if moved and not dry_run:
+        backup = path.with_suffix(path.suffix + ".bak")
+        if not backup.exists():
+            shutil.copy2(path, backup)
+        path.write_text(json.dumps(pool, indent=2))
+        print(f"  ✓ {path}: {moved} images, {before / 1e6:.1f} MB -> {path.stat().st_size / 1e6:.2f} MB")
+    elif moved:
+        print(f"  {path}: {moved} inline images would be moved ({before / 1e6:.1f} MB)")
+    else:
+        print(f"  ✓ {path}: already migrated")
+    return moved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move inline pool images to the asset store")
+    parser.add_argument("--properties", type=str, default="data/property_pool.json", help="Property pool file")
+    parser.add_argument("--avatars", type=str, default="data/avatars.json", help="Avatar pool file")
+    parser.add_argument("--dry-run", action="store_true", help="Report without writing")
+    args = parser.parse_args()
+
+    print(f"\n{'='*60}")
+    print("OSF Pool Asset Migration")
+    print(f"{'='*60}")
+    print(f"Asset dir: {get_asset_store().root}")
+
+    total = 0
+    for path in (args.properties, args.avatars):
+        total += migrate_file(Path(path), dry_run=args.dry_run)
+
+    print(f"{'='*60}")
+    print(f"Images {'to move' if args.dry_run else 'moved'}: {total}")
+    if total and not args.dry_run:
+        print("Restart the backend or POST /api/v1/pool/reload to pick up the new files.")
+    print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    main()
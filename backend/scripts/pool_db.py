@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Pool Database Import/Export
+
+The property and avatar pools are served from the pool_properties and
+pool_avatars tables; the JSON files are only an interchange format.
+
+- import: upsert the pool files into the tables (existing rows keep their
+  status unless --with-status is given)
+- export: write the tables back out as pool files
+
+Usage:
+    python scripts/pool_db.py import
+    python scripts/pool_db.py import --with-status --properties backup/property_pool.json
+    python scripts/pool_db.py export --properties backup/property_pool.json --avatars backup/avatars.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import async_session, init_db, close_db
+from src.repositories import PoolRepository
+
+
+async def import_pools(properties_path: Path, avatars_path: Path, with_status: bool):
+    async with async_session() as session:
+        repo = PoolRepository(session)
+        if properties_path.exists():
+            entries = json.loads(properties_path.read_text()).get("properties", [])
+            result = await repo.import_properties(entries, keep_status=not with_status)
+            print(f"  ✓ Properties: {result['inserted']} new, {result['updated']} updated")
+        else:
+            print(f"  ⚠ Not found: {properties_path}")
+        if avatars_path.exists():
+            avatars = json.loads(avatars_path.read_text()).get("avatars", {})
+            result = await repo.import_avatars(avatars)
+            print(f"  ✓ Avatars: {result['inserted']} new, {result['updated']} updated")
+        else:
+            print(f"  ⚠ Not found: {avatars_path}")
+        await session.commit()
+
+
+async def export_pools(properties_path: Path, avatars_path: Path):
+    async with async_session() as session:
+        repo = PoolRepository(session)
+        properties = await repo.export_properties()
+        avatars = await repo.export_avatars()
+
+    exported_at = datetime.utcnow().isoformat()
+    for path, pool in (
+        (properties_path, {"generated_at": exported_at, "count": len(properties), "properties": properties}),
+        (avatars_path, {"generated_at": exported_at, "avatars": avatars}),
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(pool, indent=2))
+    print(f"  ✓ Properties: {len(properties)} -> {properties_path}")
+    print(f"  ✓ Avatars: {len(avatars)} -> {avatars_path}")
+
+
+async def run(args):
+    await init_db()
+    try:
+        if args.command == "import":
+            await import_pools(Path(args.properties), Path(args.avatars), args.with_status)
+        else:
+            await export_pools(Path(args.properties), Path(args.avatars))
+    finally:
+        await close_db()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import or export the asset pool tables")
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("--properties", type=str, default="data/property_pool.json", help="Property pool file")
+    parser.add_argument("--avatars", type=str, default="data/avatars.json", help="Avatar pool file")
+    parser.add_argument("--with-status", action="store_true", help="Import: overwrite statuses from the file")
+    args = parser.parse_args()
+
+    print(f"\n{'='*60}")
+    print(f"OSF Pool {args.command.title()}")
+    print(f"{'='*60}")
+    asyncio.run(run(args))
+    print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Precompress Static Files
+
+Writes maximum-level .br and .gz siblings next to the text files the
+backend serves statically: the asset viewer page and any SVG/JSON/HTML in
+ASSET_DIR. Clients that accept an encoding get the sibling as-is, with no
+compression work per request. Images are skipped (already compressed).
+
+Siblings are rewritten only when the source is newer, so this is cheap to
+re-run after generating assets. The server also precompresses the viewer
+page at startup.
+
+Usage:
+    python scripts/precompress_static.py
+    python scripts/precompress_static.py --dir data/assets --dir data/other
+"""
+
+import argparse
+import mimetypes
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.compression import ENCODINGS, SUFFIXES, is_compressible, precompress_file
+from src.config import get_settings
+
+
+def static_files(directories: list) -> list:
+    files = [Path("data/viewer.html")]
+    sibling_suffixes = tuple(SUFFIXES.values())
+    for directory in directories:
+        root = Path(directory)
+        if root.exists():
+            files += [p for p in root.rglob("*") if p.is_file() and not p.name.endswith(sibling_suffixes)]
+    return [p for p in files if p.exists() and is_compressible(mimetypes.guess_type(p.name)[0])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write .br/.gz siblings for static text files")
+    parser.add_argument("--dir", action="append", help="Directory to scan (default: ASSET_DIR)")
+    args = parser.parse_args()
+
+    print(f"\n{'='*60}")
+    print("OSF Static Precompression")
+    print(f"{'='*60}")
+    print(f"Encodings: {', '.join(ENCODINGS)}")
+
+    original = {encoding: 0 for encoding in ENCODINGS}
+    compressed = {encoding: 0 for encoding in ENCODINGS}
+    files = static_files(args.dir or [get_settings().asset_dir])
+    for path in files:
+        size = path.stat().st_size
+        for encoding, sibling in precompress_file(path).items():
+            original[encoding] += size
+            compressed[encoding] += sibling.stat().st_size
+
+    print(f"  ✓ {len(files)} files")
+    for encoding in ENCODINGS:
+        if original[encoding]:
+            print(f"  {encoding:<5} {original[encoding] / 1e3:>9.1f} KB -> {compressed[encoding] / 1e3:>8.1f} KB "
+                  f"({100 * compressed[encoding] / original[encoding]:.0f}%)")
+    print(f"{'='*60}\n")
+
+
+if __name__ == "__main__":
+    main()
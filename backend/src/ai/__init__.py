@@ -1,5 +1,7 @@
 # OSF Demo - AI Module
 from src.ai.core import OSFCore, AssetClass, ContextType, TriageResult, Message
+from src.ai.context_classifier import ContextClassifier
+from src.ai.history import HistoryManager
 from src.ai.property_manager import PropertyManager
 from src.ai.energy import EnergyManager
 from src.ai.screening import ScreeningEngine
@@ -9,6 +11,8 @@ __all__ = [
     "OSFCore",
     "AssetClass", 
     "ContextType",
+    "ContextClassifier",
+    "HistoryManager",
     "TriageResult",
     "Message",
     "PropertyManager",
@@ -0,0 +1,80 @@
+"""
+OSF - AI Client Registry
+One lazily created Gemini client shared by the whole process
+
+google.genai takes most of a second to import, and every genai.Client opens
+its own HTTP connection pools. Everything that calls Gemini asks here
+instead: the import happens on first use (or during warm-up, see AI_WARMUP)
+and all callers share one client and its connections.
+"""
+
+import asyncio
+import threading
+import time
+
+import structlog
+
+from src.config import get_settings
+
+logger = structlog.get_logger()
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_genai_client():
+    """The shared google.genai Client, or None when GOOGLE_API_KEY is unset."""
+    global _client
+    if _client is None:
+        settings = get_settings()
+        if not settings.google_api_key:
+            return None
+        # Sync callers run in worker threads, so guard the first creation
+        with _client_lock:
+            if _client is None:
+                from google import genai
+                _client = genai.Client(api_key=settings.google_api_key)
+    return _client
+
+
+async def warm_up() -> dict:
+    """
+    Import google.genai, create the shared client and open a connection to
+    the model API, so the first user request pays none of it.
+
+    Failures are logged, not raised: warm-up is an optimisation.
+    """
+    settings = get_settings()
+    if not settings.google_api_key:
+        return {"configured": False}
+
+    start = time.perf_counter()
+    client = await asyncio.to_thread(get_genai_client)
+    client_ms = (time.perf_counter() - start) * 1000
+
+    result = {"configured": True, "client_ms": round(client_ms, 1)}
+    start = time.perf_counter()
+    try:
+        # Model metadata is a cheap authenticated round trip
+        await client.aio.models.get(model=settings.gemini_model)
+        result["connect_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    except Exception as e:
+        result["error"] = str(e)
+        logger.warning("ai_warmup_failed", error=str(e))
+        return result
+
+    logger.info("ai_warmed_up", **result)
+    return result
+
+
+async def close_genai_client() -> None:
+    """Close the shared client's connection pools (at shutdown)."""
+    global _client
+    client, _client = _client, None
+    if client is None:
+        return
+    try:
+        await client.aio.aclose()
+        client.close()
+    except Exception as e:
+        logger.warning("ai_client_close_failed", error=str(e))
@@ -0,0 +1,223 @@
+"""
+OSF - Local Context Classifier
+Naive Bayes over ContextType labels, so common chat messages are classified
+without a model round trip
+
+Words and word pairs are scored against a small labelled seed set
+(TRAINING_EXAMPLES). A label is returned only when its posterior clears
+the confidence threshold; otherwise the caller falls back to the LLM.
+Safety phrases (on fire, gas leak, ...) mean EMERGENCY unless the model
+is confident the message is a general or financial question ("is it in a
+flooding zone?").
+"""
+
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.ai.core import AssetClass, ContextType
+
+# Labels each asset class can be given (monitoring is energy-only)
+LABELS: Dict[AssetClass, Tuple[ContextType, ...]] = {
+    AssetClass.PROPERTY: (
+        ContextType.GENERAL, ContextType.MAINTENANCE, ContextType.FINANCIAL,
+        ContextType.EMERGENCY, ContextType.SUPPORT,
+    ),
+    AssetClass.ENERGY: (
+        ContextType.GENERAL, ContextType.MONITORING, ContextType.MAINTENANCE,
+        ContextType.FINANCIAL, ContextType.EMERGENCY, ContextType.SUPPORT,
+    ),
+}
+
+# Phrases that make a message an emergency unless it confidently reads as a
+# GENERAL or FINANCIAL question (see NOT_OVERRIDDEN). Not bare "fire",
+# "smoke", "flooding" or "sparks": fire pits, smoke alarm batteries and
+# flood zones are not emergencies.
+EMERGENCY_TERMS = (
+    "on fire", "there is a fire", "there's a fire", "house fire", "fire in the", "smoke from",
+    "smoke coming", "gas leak", "smell gas", "sparks coming", "sparks from", "sparking", "arc fault",
+    "is flooding", "flooding the", "flooding in", "burst pipe", "electrocuted", "electric shock",
+    "broke in", "broken into", "carbon monoxide", "ceiling collapsed", "roof collapsed",
+    "has collapsed", "injured", "call 000",
+)
+
+# Labels that win over a safety phrase (questions about a property, not incidents)
+NOT_OVERRIDDEN = frozenset({ContextType.GENERAL, ContextType.FINANCIAL})
+
+TRAINING_EXAMPLES: Dict[ContextType, List[str]] = {
+    ContextType.GENERAL: [
+        "hi", "hello there", "hey", "good morning", "good afternoon", "thanks", "thank you so much",
+        "cheers", "how are you", "what can you do", "who are you", "nice to meet you",
+        "tell me about this property", "tell me about the neighbourhood", "what is osf",
+        "how does tokenization work", "what is the network", "explain how this works",
+        "what suburb is this in", "how many bedrooms does it have", "is there parking",
+        "what schools are nearby", "what kind of solar system is this", "how old is the house",
+        "what does the governor do", "how does voting work", "what is a proposal",
+        "is there a fire pit in the backyard", "does it have a fire place", "does it have a wood fire",
+        "is it in a flood zone", "is the area prone to flooding", "does it have gas heating",
+    ],
+    ContextType.MAINTENANCE: [
+        "the tap is leaking", "dripping tap in the kitchen", "the heater is not working",
+        "air conditioner broken", "aircon stopped cooling", "can someone fix the dishwasher",
+        "toilet is blocked", "the oven stopped working", "need a plumber", "need an electrician",
+        "light switch is broken", "window won't close", "mould in the bathroom",
+        "the door lock is broken", "hot water system not working", "no hot water",
+        "book a repair", "the fence is damaged", "smoke alarm is beeping", "smoke alarm battery",
+        "washing machine broken", "blocked drain", "cracked tiles", "garage door stuck",
+        "leak under the sink", "pest problem cockroaches", "broken window", "repair request",
+        "panels need cleaning", "inverter needs a service", "replace the battery",
+        "inverter error code", "inverter fault light", "panel is cracked", "schedule a service",
+        "the gutter is blocked", "fix the gate",
+    ],
+    ContextType.MONITORING: [
+        "how much power did my panels generate today", "what is my solar output",
+        "show me production data", "current output is low", "kwh generated this week",
+        "how is my system performing", "battery charge level", "battery state of charge",
+        "inverter readings", "performance ratio", "export to grid today",
+        "generation compared to yesterday", "irradiance and output", "system efficiency",
+        "energy production this month", "why is production down", "output dropped this afternoon",
+        "how many kwh did i export", "self consumption today", "daily generation",
+    ],
+    ContextType.FINANCIAL: [
+        "when is rent due", "how do i pay rent", "what is my balance", "my rent payment",
+        "can i get a rent receipt", "rent increase", "pay rent late", "rent arrears",
+        "what is the yield", "how much are dividends", "when are dividends paid",
+        "token price", "what is my return on investment", "how much is my bond",
+        "bond refund", "feed in tariff earnings", "how much did i save on my bill",
+        "electricity bill", "invoice", "payment plan for arrears", "what are the fees",
+        "how much is the property worth", "valuation", "buy more tokens", "sell my tokens",
+        "my portfolio value", "how much money have i made", "direct debit", "overdue payment",
+    ],
+    ContextType.EMERGENCY: [
+        "there is a fire", "i smell gas", "smoke alarm going off and smoke everywhere",
+        "water is flooding the kitchen", "burst pipe", "sparks coming from the inverter",
+        "smoke from the roof", "someone broke in", "electric shock from the switch",
+        "ceiling collapsed", "urgent help now", "emergency", "power lines down",
+        "the roof is leaking badly in the storm", "water pouring through the ceiling",
+        "the switchboard is hot and buzzing", "tree fell on the house", "exposed live wires",
+    ],
+    ContextType.SUPPORT: [
+        "i can't log in", "reset my password", "forgot my password", "how do i update my details",
+        "i want to make a complaint", "talk to a human", "contact the property manager",
+        "my account is locked", "change my email", "the app is not working",
+        "how do i end my lease", "i need help with my account", "speak to someone",
+        "lodge a dispute", "update my phone number", "where do i find my lease",
+        "renew my lease", "add someone to the lease", "website error", "cancel my account",
+        "how do i contact support", "i didn't get the email",
+    ],
+}
+
+# Too common to say anything about the label
+STOPWORDS = frozenset(
+    "a an the is are was were be been am i me my we our you your it its this that there "
+    "to of in on at for from with and or but so do does did can could would should will "
+    "just please some any have has had again still really very".split()
+)
+
+_WORD = re.compile(r"[a-z0-9']+")
+_EMERGENCY = re.compile(r"\b(?:" + "|".join(re.escape(term) for term in EMERGENCY_TERMS) + r")\b")
+
+
+def _features(text: str) -> List[str]:
+    """Words and adjacent word pairs, stopwords dropped."""
+    words = [w for w in _WORD.findall(text.lower()) if w not in STOPWORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+class ContextClassifier:
+    """Multinomial naive Bayes over ContextType labels with additive smoothing."""
+
+    def __init__(
+        self,
+        examples: Optional[Dict[ContextType, Iterable[str]]] = None,
+        min_confidence: float = 0.85,
+        smoothing: float = 0.1,
+    ):
+        self.min_confidence = min_confidence
+        self.smoothing = smoothing
+        self.hits = 0
+        self.misses = 0
+        self.train(TRAINING_EXAMPLES if examples is None else examples)
+
+    def train(self, examples: Dict[ContextType, Iterable[str]]) -> None:
+        """Replace the model with one fitted to these labelled examples."""
+        counts: Dict[ContextType, Dict[str, int]] = {}
+        for label, texts in examples.items():
+            label_counts = counts.setdefault(label, {})
+            for text in texts:
+                for feature in _features(text):
+                    label_counts[feature] = label_counts.get(feature, 0) + 1
+
+        vocabulary = {feature for label_counts in counts.values() for feature in label_counts}
+        self._vocabulary = vocabulary
+        # Log P(feature | label); unseen features fall back to the smoothed floor
+        self._log_probs: Dict[ContextType, Dict[str, float]] = {}
+        self._log_floor: Dict[ContextType, float] = {}
+        for label, label_counts in counts.items():
+            total = sum(label_counts.values()) + self.smoothing * len(vocabulary)
+            self._log_probs[label] = {
+                f: math.log((n + self.smoothing) / total) for f, n in label_counts.items()
+            }
+            self._log_floor[label] = math.log(self.smoothing / total)
+
+    def scores(self, message: str, asset_class: AssetClass = AssetClass.PROPERTY) -> Dict[ContextType, float]:
+        """Posterior per label (uniform priors); empty if no word is known."""
+        features = [f for f in _features(message) if f in self._vocabulary]
+        if not features:
+            return {}
+        labels = [label for label in LABELS[asset_class] if label in self._log_probs]
+        logs = {
+            label: sum(self._log_probs[label].get(f, self._log_floor[label]) for f in features)
+            for label in labels
+        }
+        top = max(logs.values())
+        weights = {label: math.exp(value - top) for label, value in logs.items()}
+        total = sum(weights.values())
+        return {label: weight / total for label, weight in weights.items()}
+
+    def classify(
+        self, message: str, asset_class: AssetClass = AssetClass.PROPERTY,
+    ) -> Optional[Tuple[ContextType, float]]:
+        """(label, confidence) when confident enough, else None (ask the LLM)."""
+        scores = self.scores(message, asset_class)
+        label, confidence = max(scores.items(), key=lambda item: item[1]) if scores else (None, 0.0)
+        confident = confidence >= self.min_confidence
+
+        # A safety phrase wins unless this is confidently a question about the property
+        if not (confident and label in NOT_OVERRIDDEN):
+            if _EMERGENCY.search(" ".join(_WORD.findall(message.lower()))):
+                self.hits += 1
+                return ContextType.EMERGENCY, 1.0
+
+        if confident:
+            self.hits += 1
+            return label, confidence
+        self.misses += 1
+        return None
+
+    def get_metrics(self) -> dict:
+        answered = self.hits + self.misses
+        return {
+            "local": self.hits,
+            "llm": self.misses,
+            "local_rate": round(self.hits / answered, 3) if answered else None,
+            "min_confidence": self.min_confidence,
+        }
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_context_classifier: Optional[ContextClassifier] = None
+
+
+def get_context_classifier() -> ContextClassifier:
+    """Get the singleton context classifier."""
+    global _context_classifier
+    if _context_classifier is None:
+        from src.config import get_settings
+        _context_classifier = ContextClassifier(
+            min_confidence=get_settings().context_classifier_min_confidence,
+        )
+    return _context_classifier
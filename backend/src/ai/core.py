@@ -13,11 +13,11 @@ from typing import Optional, AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
 
-from google import genai
-from google.genai import types
 import structlog
 
 from src.config import get_settings
+from src.ai.client import get_genai_client
+from src.ai.history import get_history_manager, summary_block
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -222,16 +222,19 @@ URGENCY GUIDE:
     def __init__(self):
         """Initialize the OSF AI Core."""
         if settings.google_api_key:
-            self.client = genai.Client(api_key=settings.google_api_key)
             self.model_name = settings.gemini_model
             self.pro_model_name = settings.gemini_pro_model
         else:
-            self.client = None
             self.model_name = None
             self.pro_model_name = None
             logger.warning("osf_core_not_configured", 
                           message="GOOGLE_API_KEY not set, AI features disabled")
 
+    @property
+    def client(self):
+        """The shared Gemini client (None when GOOGLE_API_KEY is unset)."""
+        return get_genai_client()
+
     async def chat(
         self,
         message: str,
@@ -239,6 +242,7 @@ URGENCY GUIDE:
         conversation_history: list[Message] = None,
         context: dict = None,
         role: str = None,
+        conversation_id: str = None,
     ) -> str:
         """
         Chat with user about their asset.
@@ -249,10 +253,13 @@ URGENCY GUIDE:
             conversation_history: Previous messages
             context: Asset-specific context (property details, energy system data, etc.)
             role: User role (tenant, homeowner, investor, custodian, energy_owner)
+            conversation_id: Client conversation ID, for reusing history summaries
             
         Returns:
             AI response
         """
+        from google.genai import types
+        
         if not self.client:
             return "OSF AI is not configured. Please contact support."
         
@@ -271,14 +278,16 @@ URGENCY GUIDE:
             role_context=role_context
         )
         
-        # Build conversation contents
+        # Recent turns verbatim, older ones as a summary (see src/ai/history.py)
+        history = get_history_manager().prepare(conversation_history, conversation_id)
+        system_prompt += summary_block(history.summary)
+        
         contents = []
-        if conversation_history:
-            for msg in conversation_history:
-                contents.append(types.Content(
-                    role="user" if msg.role == "user" else "model",
-                    parts=[types.Part.from_text(text=msg.content)]
-                ))
+        for msg in history.messages:
+            contents.append(types.Content(
+                role="user" if msg.role == "user" else "model",
+                parts=[types.Part.from_text(text=msg.content)]
+            ))
         
         # Add current user message (system prompt passed separately)
         contents.append(types.Content(
@@ -320,8 +329,11 @@ URGENCY GUIDE:
         conversation_history: list[Message] = None,
         context: dict = None,
         role: str = None,
+        conversation_id: str = None,
     ) -> AsyncIterator[str]:
         """Stream chat response for real-time display."""
+        from google.genai import types
+        
         if not self.client:
             yield "OSF AI is not configured. Please contact support."
             return
@@ -340,13 +352,16 @@ URGENCY GUIDE:
             role_context=role_context
         )
         
+        # Recent turns verbatim, older ones as a summary (see src/ai/history.py)
+        history = get_history_manager().prepare(conversation_history, conversation_id)
+        system_prompt += summary_block(history.summary)
+        
         contents = []
-        if conversation_history:
-            for msg in conversation_history:
-                contents.append(types.Content(
-                    role="user" if msg.role == "user" else "model",
-                    parts=[types.Part.from_text(text=msg.content)]
-                ))
+        for msg in history.messages:
+            contents.append(types.Content(
+                role="user" if msg.role == "user" else "model",
+                parts=[types.Part.from_text(text=msg.content)]
+            ))
         
         contents.append(types.Content(
             role="user",
@@ -392,6 +407,8 @@ URGENCY GUIDE:
         Returns:
             TriageResult with classification and recommendations
         """
+        from google.genai import types
+        
         if not self.client:
             return TriageResult(
                 urgency="routine",
@@ -475,7 +492,13 @@ URGENCY GUIDE:
             )
 
     async def detect_context(self, message: str, asset_class: AssetClass) -> ContextType:
-        """Detect the context/intent of a message."""
+        """Detect the context/intent of a message (locally when the classifier is confident)."""
+        from src.ai.context_classifier import get_context_classifier
+        
+        local = get_context_classifier().classify(message, asset_class)
+        if local is not None:
+            return local[0]
+        
         if not self.client:
             return ContextType.GENERAL
         
@@ -516,6 +539,8 @@ Respond with just the category name, nothing else."""
         Analyze a document using Gemini Vision.
         Works across asset classes with asset-specific extraction.
         """
+        from google.genai import types
+        
         if not self.client:
             return {"error": "AI not configured", "verified": False}
         
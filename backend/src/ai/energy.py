@@ -14,11 +14,10 @@ from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
-from google import genai
-from google.genai import types
 import structlog
 
 from src.config import get_settings
+from src.ai.client import get_genai_client
 from src.ai.core import OSFCore, AssetClass
 
 logger = structlog.get_logger()
@@ -133,12 +132,15 @@ Return empty array [] if no alerts needed.
         """Initialize Energy Manager."""
         self.core = OSFCore()
         if settings.google_api_key:
-            self.client = genai.Client(api_key=settings.google_api_key)
             self.model_name = settings.gemini_model
         else:
-            self.client = None
             self.model_name = None
 
+    @property
+    def client(self):
+        """The shared Gemini client (None when GOOGLE_API_KEY is unset)."""
+        return get_genai_client()
+
     async def analyze_production(
         self,
         system_info: dict,
@@ -277,6 +279,7 @@ Return empty array [] if no alerts needed.
         message: str,
         context: dict = None,
         conversation_history: list = None,
+        conversation_id: str = None,
     ) -> str:
         """Chat about energy assets using OSF Core."""
         return await self.core.chat(
@@ -284,6 +287,7 @@ Return empty array [] if no alerts needed.
             asset_class=AssetClass.ENERGY,
             context=context,
             conversation_history=conversation_history,
+            conversation_id=conversation_id,
         )
 
     async def triage_issue(
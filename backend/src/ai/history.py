@@ -0,0 +1,235 @@
+"""
+OSF - Conversation History Compaction
+Bounded chat prompts: recent turns verbatim, older turns as a running summary
+
+Clients send the whole conversation with every message, so replaying it
+makes each prompt (and each reply's latency) grow with the conversation.
+Instead a turn is sent as:
+
+- a summary of everything before the last HISTORY_KEEP_TURNS turns, added
+  to the system prompt, and
+- the messages after it verbatim,
+
+trimmed oldest-first to fit HISTORY_TOKEN_BUDGET (estimated tokens).
+
+Summaries are written by a background model call, never on the request
+path: a turn uses the newest summary already made for its conversation and
+sends whatever comes after it verbatim (within the budget), then schedules
+a fold of the older messages for the next turn. Summaries are cached by
+conversation ID and a digest of the exact messages they cover, so an edited
+history never picks up a summary of something else.
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+SYSTEM_KEY = "system:history"
+
+# Rough estimate for English prose; only used to budget, never billed
+CHARS_PER_TOKEN = 4
+
+SUMMARY_PROMPT = """Summarize this conversation between a user and an asset-management assistant so the assistant can pick it up from the summary alone.
+Keep names, addresses, reported problems, amounts, dates, decisions and anything promised. Plain prose, no more than {max_words} words.
+
+{previous}Conversation:
+{transcript}"""
+
+# (previous summary or None, messages to fold in, max tokens) -> new summary
+Summarizer = Callable[[Optional[str], Sequence, int], Awaitable[str]]
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def summary_block(summary: Optional[str]) -> str:
+    """Text appended to a system prompt to carry the earlier conversation."""
+    if not summary:
+        return ""
+    return f"\n\nSummary of the earlier conversation (older messages are not repeated):\n{summary}"
+
+
+def _prefix_digests(messages: Sequence) -> List[str]:
+    """digests[n] identifies messages[:n]."""
+    h = hashlib.blake2b(digest_size=16)
+    digests = [h.hexdigest()]
+    for msg in messages:
+        h.update(msg.role.encode())
+        h.update(b"\x00")
+        h.update(msg.content.encode())
+        h.update(b"\x01")
+        digests.append(h.hexdigest())
+    return digests
+
+
+async def summarize_with_model(previous: Optional[str], messages: Sequence, max_tokens: int) -> str:
+    """Fold messages into the previous summary with the shared Gemini client."""
+    from google.genai import types
+    from src.ai.client import get_genai_client
+    from src.config import get_settings
+    from src.services.admission import get_admission
+
+    client = get_genai_client()
+    if client is None:
+        raise RuntimeError("GOOGLE_API_KEY not set")
+    transcript = "\n".join(
+        f"{'User' if msg.role == 'user' else 'Assistant'}: {msg.content}" for msg in messages
+    )
+    prompt = SUMMARY_PROMPT.format(
+        max_words=max(int(max_tokens * 0.75), 50),
+        previous=f"Summary so far:\n{previous}\n\n" if previous else "",
+        transcript=transcript,
+    )
+    async with get_admission().slot(SYSTEM_KEY):
+        response = await client.aio.models.generate_content(
+            model=get_settings().gemini_model,
+            contents=prompt,
+            config=types.GenerateContentConfig(temperature=0.2, max_output_tokens=max_tokens),
+        )
+    return (response.text or "").strip()
+
+
+@dataclass
+class CompactHistory:
+    """What to send for one turn."""
+    summary: Optional[str]
+    messages: list
+    dropped: int  # history messages not sent verbatim
+
+
+class HistoryManager:
+    """Keeps the last turns verbatim and folds older ones into cached summaries."""
+
+    def __init__(
+        self,
+        keep_turns: int = 4,
+        token_budget: int = 2000,
+        max_summaries: int = 1024,
+        summarize: Optional[Summarizer] = None,
+    ):
+        # A turn is a user message and the reply to it
+        self.keep_messages = max(keep_turns, 0) * 2
+        self.token_budget = token_budget
+        self.summary_tokens = max(token_budget // 4, 64)
+        self.max_summaries = max_summaries
+        self._summarize = summarize or summarize_with_model
+        # (conversation id, digest of the messages covered) -> summary
+        self._summaries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        # One fold at a time per conversation
+        self._folding: Dict[str, asyncio.Task] = {}
+        self.stats: Dict[str, int] = {
+            "turns": 0, "summarized": 0, "trimmed": 0,
+            "summaries": 0, "summary_errors": 0, "messages_dropped": 0,
+        }
+
+    def prepare(self, history: Optional[Sequence], conversation_id: Optional[str] = None) -> CompactHistory:
+        """Summary plus verbatim messages for this turn; schedules the next fold."""
+        history = list(history or [])
+        self.stats["turns"] += 1
+        cid = conversation_id or ""
+        cut = max(len(history) - self.keep_messages, 0)
+
+        summary, covered = None, 0
+        if cut and self.max_summaries > 0:
+            digests = _prefix_digests(history[:cut])
+            # Newest summary made for this conversation's older messages
+            for n in range(cut, 0, -1):
+                key = (cid, digests[n])
+                if key in self._summaries:
+                    self._summaries.move_to_end(key)
+                    summary, covered = self._summaries[key], n
+                    break
+            if covered < cut:
+                self._schedule((cid, digests[cut]), summary, history[covered:cut])
+
+        # Verbatim from the newest backwards, while the budget lasts
+        used = estimate_tokens(summary) if summary else 0
+        kept = []
+        for msg in reversed(history[covered:]):
+            used += estimate_tokens(msg.content)
+            if used > self.token_budget:
+                break
+            kept.append(msg)
+        kept.reverse()
+
+        if covered:
+            self.stats["summarized"] += 1
+        if len(kept) < len(history) - covered:
+            self.stats["trimmed"] += 1
+        dropped = len(history) - len(kept)
+        self.stats["messages_dropped"] += dropped
+        return CompactHistory(summary=summary, messages=kept, dropped=dropped)
+
+    def _schedule(self, key: Tuple[str, str], previous: Optional[str], messages: list) -> None:
+        # Anonymous histories are only told apart by their content
+        slot = key[0] or key[1]
+        if slot in self._folding:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self._fold(key, previous, messages))
+        except RuntimeError:
+            return  # no event loop (sync caller): send verbatim, fold later
+        self._folding[slot] = task
+        task.add_done_callback(lambda _: self._folding.pop(slot, None))
+
+    async def _fold(self, key: Tuple[str, str], previous: Optional[str], messages: list) -> None:
+        from src.services.admission import AdmissionRejected
+
+        try:
+            summary = await self._summarize(previous, messages, self.summary_tokens)
+        except AdmissionRejected as e:
+            logger.info("history_summary_deferred", reason=e.reason)
+            return
+        except Exception as e:
+            self.stats["summary_errors"] += 1
+            logger.warning("history_summary_failed", error=str(e))
+            return
+        if not summary:
+            return
+        self._summaries[key] = summary[: self.summary_tokens * CHARS_PER_TOKEN]
+        self._summaries.move_to_end(key)
+        self.stats["summaries"] += 1
+        while len(self._summaries) > self.max_summaries:
+            self._summaries.popitem(last=False)
+
+    async def drain(self) -> None:
+        """Wait for scheduled summaries (benchmarks and shutdown)."""
+        if self._folding:
+            await asyncio.gather(*self._folding.values(), return_exceptions=True)
+
+    def get_metrics(self) -> dict:
+        return {
+            **self.stats,
+            "cached_summaries": len(self._summaries),
+            "folding": len(self._folding),
+            "keep_turns": self.keep_messages // 2,
+            "token_budget": self.token_budget,
+        }
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_history_manager: Optional[HistoryManager] = None
+
+
+def get_history_manager() -> HistoryManager:
+    """Get the singleton history manager."""
+    global _history_manager
+    if _history_manager is None:
+        from src.config import get_settings
+        settings = get_settings()
+        _history_manager = HistoryManager(
+            keep_turns=settings.history_keep_turns,
+            token_budget=settings.history_token_budget,
+            max_summaries=settings.history_summary_cache_size,
+        )
+    return _history_manager
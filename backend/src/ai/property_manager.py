@@ -17,11 +17,11 @@ from typing import Optional, AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
 
-from google import genai
-from google.genai import types
 import structlog
 
 from src.config import get_settings
+from src.ai.client import get_genai_client
+from src.ai.history import get_history_manager, summary_block
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -111,21 +111,25 @@ Respond helpfully and professionally. If you need to escalate, say so clearly.""
     def __init__(self):
         """Initialize the AI Property Manager."""
         if settings.google_api_key:
-            self.client = genai.Client(api_key=settings.google_api_key)
             self.model_name = settings.gemini_model
             self.pro_model_name = settings.gemini_pro_model
         else:
-            self.client = None
             self.model_name = None
             self.pro_model_name = None
             logger.warning("gemini_not_configured", 
                           message="GOOGLE_API_KEY not set, AI features disabled")
 
+    @property
+    def client(self):
+        """The shared Gemini client (None when GOOGLE_API_KEY is unset)."""
+        return get_genai_client()
+
     async def chat(
         self,
         message: str,
         conversation_history: list[Message] = None,
         context: dict = None,
+        conversation_id: str = None,
     ) -> str:
         """
         Chat with tenant/user about property matters.
@@ -134,10 +138,13 @@ Respond helpfully and professionally. If you need to escalate, say so clearly.""
             message: User's message
             conversation_history: Previous messages in conversation
             context: Property/tenant context for personalization
+            conversation_id: Client conversation ID, for reusing history summaries
             
         Returns:
             AI response
         """
+        from google.genai import types
+        
         if not self.client:
             return "AI Property Manager is not configured. Please contact support."
         
@@ -150,14 +157,16 @@ Respond helpfully and professionally. If you need to escalate, say so clearly.""
             account_balance=context.get("account_balance", "$0.00"),
         )
         
-        # Build conversation contents
+        # Recent turns verbatim, older ones as a summary (see src/ai/history.py)
+        history = get_history_manager().prepare(conversation_history, conversation_id)
+        system_prompt += summary_block(history.summary)
+        
         contents = []
-        if conversation_history:
-            for msg in conversation_history:
-                contents.append(types.Content(
-                    role="user" if msg.role == "user" else "model",
-                    parts=[types.Part.from_text(text=msg.content)]
-                ))
+        for msg in history.messages:
+            contents.append(types.Content(
+                role="user" if msg.role == "user" else "model",
+                parts=[types.Part.from_text(text=msg.content)]
+            ))
         
         # Add current message with system prompt
         contents.append(types.Content(
@@ -188,6 +197,7 @@ Respond helpfully and professionally. If you need to escalate, say so clearly.""
         message: str,
         conversation_history: list[Message] = None,
         context: dict = None,
+        conversation_id: str = None,
     ) -> AsyncIterator[str]:
         """
         Stream chat response for better UX.
@@ -195,6 +205,8 @@ Respond helpfully and professionally. If you need to escalate, say so clearly.""
         Yields:
             Chunks of the AI response
         """
+        from google.genai import types
+        
         if not self.client:
             yield "AI Property Manager is not configured. Please contact support."
             return
@@ -207,13 +219,16 @@ Respond helpfully and professionally. If you need to escalate, say so clearly.""
             account_balance=context.get("account_balance", "$0.00"),
         )
         
+        # Recent turns verbatim, older ones as a summary (see src/ai/history.py)
+        history = get_history_manager().prepare(conversation_history, conversation_id)
+        system_prompt += summary_block(history.summary)
+        
         contents = []
-        if conversation_history:
-            for msg in conversation_history:
-                contents.append(types.Content(
-                    role="user" if msg.role == "user" else "model",
-                    parts=[types.Part.from_text(text=msg.content)]
-                ))
+        for msg in history.messages:
+            contents.append(types.Content(
+                role="user" if msg.role == "user" else "model",
+                parts=[types.Part.from_text(text=msg.content)]
+            ))
         
         contents.append(types.Content(
             role="user",
@@ -249,6 +264,8 @@ Respond helpfully and professionally. If you need to escalate, say so clearly.""
         Returns:
             MaintenanceClassification with AI analysis
         """
+        from google.genai import types
+        
         if not self.client:
             return MaintenanceClassification(
                 urgency="routine",
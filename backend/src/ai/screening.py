@@ -10,11 +10,10 @@ from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
 
-from google import genai
-from google.genai import types
 import structlog
 
 from src.config import get_settings
+from src.ai.client import get_genai_client
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -109,14 +108,17 @@ Be fair, be thorough, be explainable."""
     def __init__(self):
         """Initialize screening engine."""
         if settings.google_api_key:
-            self.client = genai.Client(api_key=settings.google_api_key)
             # Use Pro model for important decisions
             self.model_name = settings.gemini_pro_model
         else:
-            self.client = None
             self.model_name = None
             logger.warning("screening_engine_not_configured")
 
+    @property
+    def client(self):
+        """The shared Gemini client (None when GOOGLE_API_KEY is unset)."""
+        return get_genai_client()
+
     async def screen_application(
         self,
         application_data: dict,
@@ -223,6 +225,8 @@ Be fair, be thorough, be explainable."""
         Returns:
             Extracted data and verification status
         """
+        from google.genai import types
+        
         if not self.client:
             return {"error": "AI not configured", "verified": False}
         
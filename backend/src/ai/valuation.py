@@ -7,11 +7,10 @@ import json
 from dataclasses import dataclass
 from typing import Optional
 
-from google import genai
-from google.genai import types
 import structlog
 
 from src.config import get_settings
+from src.ai.client import get_genai_client
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -66,13 +65,16 @@ Be conservative and explain your reasoning."""
     def __init__(self):
         """Initialize valuation engine."""
         if settings.google_api_key:
-            self.client = genai.Client(api_key=settings.google_api_key)
             self.model_name = settings.gemini_pro_model
         else:
-            self.client = None
             self.model_name = None
             logger.warning("valuation_engine_not_configured")
 
+    @property
+    def client(self):
+        """The shared Gemini client (None when GOOGLE_API_KEY is unset)."""
+        return get_genai_client()
+
     async def value_property(
         self,
         property_data: dict,
@@ -176,6 +178,8 @@ Be conservative and explain your reasoning."""
         Returns:
             Analysis including condition, features, concerns
         """
+        from google.genai import types
+        
         if not self.client or not photos:
             return {"error": "Analysis unavailable", "analyzed": False}
         
@@ -4,12 +4,13 @@ Unified chat endpoint for all asset classes
 """
 
 from typing import Optional, Literal
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, Field
+import asyncio
 import json
 
 from src.ai.core import OSFCore, AssetClass, Message
+from src.services.admission import AdmittedStreamingResponse, client_key, get_admission, llm_admission
 
 router = APIRouter()
 osf_core = OSFCore()
@@ -21,6 +22,8 @@ class ChatRequest(BaseModel):
     asset_class: Literal["property", "energy"] = "property"
     role: Optional[Literal["tenant", "homeowner", "investor", "custodian", "energy_owner"]] = None
     history: Optional[list[dict]] = None
+    # Lets older history be summarized once per conversation instead of replayed
+    conversation_id: Optional[str] = Field(None, max_length=128)
     context: Optional[dict] = None
 
 
@@ -31,7 +34,7 @@ class ChatResponse(BaseModel):
     context_detected: Optional[str] = None
 
 
-@router.post("", response_model=ChatResponse)
+@router.post("", response_model=ChatResponse, dependencies=[Depends(llm_admission)])
 async def chat(request: ChatRequest):
     """
     Chat with the OSF AI Manager.
@@ -53,16 +56,18 @@ async def chat(request: ChatRequest):
             for msg in request.history
         ]
     
-    # Detect conversation context
-    context_type = await osf_core.detect_context(request.message, asset_class)
-    
-    # Get AI response
-    response = await osf_core.chat(
-        message=request.message,
-        asset_class=asset_class,
-        conversation_history=history,
-        context=request.context,
-        role=request.role,
+    # Context only labels the response, so detect it alongside the reply
+    # (usually locally; otherwise a second model call in parallel)
+    context_type, response = await asyncio.gather(
+        osf_core.detect_context(request.message, asset_class),
+        osf_core.chat(
+            message=request.message,
+            asset_class=asset_class,
+            conversation_history=history,
+            context=request.context,
+            role=request.role,
+            conversation_id=request.conversation_id,
+        ),
     )
     
     return ChatResponse(
@@ -72,8 +77,22 @@ async def chat(request: ChatRequest):
     )
 
 
+@router.get("/context/metrics")
+async def context_metrics():
+    """How many context detections the local classifier answered without the model."""
+    from src.ai.context_classifier import get_context_classifier
+    return get_context_classifier().get_metrics()
+
+
+@router.get("/history/metrics")
+async def history_metrics():
+    """How often chat history was summarized or trimmed to stay within budget."""
+    from src.ai.history import get_history_manager
+    return get_history_manager().get_metrics()
+
+
 @router.post("/stream")
-async def chat_stream(request: ChatRequest):
+async def chat_stream(http_request: Request, request: ChatRequest):
     """
     Stream chat response for real-time display.
     
@@ -88,6 +107,10 @@ async def chat_stream(request: ChatRequest):
             for msg in request.history
         ]
     
+    # Hold the model-call slot until the response ends (released by the response)
+    admission = get_admission()
+    await admission.acquire(client_key(http_request))
+    
     async def generate():
         async for chunk in osf_core.chat_stream(
             message=request.message,
@@ -95,12 +118,14 @@ async def chat_stream(request: ChatRequest):
             conversation_history=history,
             context=request.context,
             role=request.role,
+            conversation_id=request.conversation_id,
         ):
             yield f"data: {json.dumps({'content': chunk})}\n\n"
         yield "data: [DONE]\n\n"
     
-    return StreamingResponse(
+    return AdmittedStreamingResponse(
         generate(),
+        admission,
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
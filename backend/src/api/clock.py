@@ -10,8 +10,8 @@ from sse_starlette.sse import EventSourceResponse
 from pydantic import BaseModel
 from typing import Optional, List
 import asyncio
-import json
 
+from src.services.broadcast_hub import encode_sse
 from src.services.network_clock import (
     get_network_clock,
     ClockMode,
@@ -352,39 +352,37 @@ async def clock_stream():
     - mode_changed: Mode changed
     """
     clock = get_network_clock()
-    queue = clock.subscribe()
+    subscriber = clock.subscribe()
     
     async def event_generator():
         try:
             # Send initial state
-            yield {
-                "event": "clock_sync",
-                "data": json.dumps(clock.get_state().to_dict())
-            }
+            yield encode_sse("clock_sync", clock.get_state().to_dict())
             
-            while True:
-                try:
-                    # Wait for events with timeout
-                    message = await asyncio.wait_for(queue.get(), timeout=10.0)
-                    yield {
-                        "event": message["event"],
-                        "data": json.dumps(message["data"])
-                    }
-                except asyncio.TimeoutError:
+            while not subscriber.closed:
+                # Pre-encoded chunks from the hub; bytes pass through as-is
+                chunks = await subscriber.wait(timeout=10.0)
+                if chunks:
+                    for chunk in chunks:
+                        yield chunk
+                elif not subscriber.closed:
                     # Send heartbeat/sync
-                    yield {
-                        "event": "clock_sync",
-                        "data": json.dumps(clock.get_state().to_dict())
-                    }
+                    yield encode_sse("clock_sync", clock.get_state().to_dict())
                     
         except asyncio.CancelledError:
             pass
         finally:
-            clock.unsubscribe(queue)
+            clock.unsubscribe(subscriber)
     
     return EventSourceResponse(event_generator())
 
 
+@router.get("/stream/metrics")
+async def clock_stream_metrics():
+    """Subscriber count, lag and drop counters for the clock stream."""
+    return get_network_clock().hub.get_metrics()
+
+
 # =============================================================================
 # Reset Endpoint (Testing)
 # =============================================================================
@@ -4,11 +4,12 @@ Energy asset monitoring and management endpoints
 """
 
 from typing import Optional
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
 from src.ai.energy import EnergyManager
 from src.ai.core import OSFCore, AssetClass
+from src.services.admission import llm_admission
 
 router = APIRouter()
 energy_manager = EnergyManager()
@@ -91,7 +92,7 @@ class TriageResponse(BaseModel):
     estimated_production_loss_kwh: Optional[float] = None
 
 
-@router.post("/analyze", response_model=ProductionResponse)
+@router.post("/analyze", response_model=ProductionResponse, dependencies=[Depends(llm_admission)])
 async def analyze_production(request: ProductionRequest):
     """
     Analyze current energy production.
@@ -121,7 +122,7 @@ async def analyze_production(request: ProductionRequest):
     )
 
 
-@router.post("/alerts", response_model=list[AlertResponse])
+@router.post("/alerts", response_model=list[AlertResponse], dependencies=[Depends(llm_admission)])
 async def generate_alerts(request: ProductionRequest):
     """
     Generate alerts based on current system state.
@@ -155,7 +156,7 @@ async def generate_alerts(request: ProductionRequest):
     ]
 
 
-@router.post("/triage", response_model=TriageResponse)
+@router.post("/triage", response_model=TriageResponse, dependencies=[Depends(llm_admission)])
 async def triage_issue(request: IssueRequest):
     """
     Triage an energy system issue.
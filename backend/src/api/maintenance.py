@@ -4,10 +4,11 @@ AI-powered maintenance triage
 """
 
 from typing import Optional
-from fastapi import APIRouter, UploadFile, File, Form
+from fastapi import APIRouter, Depends, UploadFile, File, Form
 from pydantic import BaseModel
 
 from src.ai.property_manager import PropertyManager
+from src.services.admission import llm_admission
 
 router = APIRouter()
 property_manager = PropertyManager()
@@ -31,7 +32,7 @@ class MaintenanceResponse(BaseModel):
     estimated_cost_high: Optional[float] = None
 
 
-@router.post("", response_model=MaintenanceResponse)
+@router.post("", response_model=MaintenanceResponse, dependencies=[Depends(llm_admission)])
 async def create_maintenance_request(request: MaintenanceRequest):
     """
     Submit a maintenance request for AI triage.
@@ -57,7 +58,7 @@ async def create_maintenance_request(request: MaintenanceRequest):
     )
 
 
-@router.post("/with-images", response_model=MaintenanceResponse)
+@router.post("/with-images", response_model=MaintenanceResponse, dependencies=[Depends(llm_admission)])
 async def create_maintenance_with_images(
     description: str = Form(...),
     images: list[UploadFile] = File(default=[]),
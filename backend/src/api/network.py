@@ -5,18 +5,21 @@ Provides access to network state and interactive agent chat.
 These endpoints are for real-time interactions between clock ticks.
 """
 
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
+import asyncio
 import json
 
-from google import genai
-from google.genai import types
 import structlog
 
 from src.config import get_settings
+from src.ai.client import get_genai_client
 from src.services.network_clock import get_network_clock
+from src.serialization import FastJSONResponse, sse_message
+from src.services.admission import AdmissionRejected, AdmittedStreamingResponse, client_key, get_admission
+from src.services.answer_cache import context_hash, get_answer_cache, replay_chunks
+from src.services.response_cache import get_response_cache
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -91,19 +94,22 @@ async def get_network_state(request: Request):
     
     state = request.app.state.network_state
     
-    # Calculate totals
-    total_value = sum(p.valuation * p.network_ownership for p in state.properties)
-    avg_yield = sum(p.gross_yield for p in state.properties) / max(len(state.properties), 1)
-    
-    return NetworkStateResponse(
-        month=state.month,
-        property_count=len(state.properties),
-        participant_count=len(state.participants),
-        total_value=total_value,
-        average_yield=avg_yield,
-        market_trend=state.market_conditions.get("wa_market_trend", "stable"),
-        active_proposals=len([p for p in state.governance_proposals if p.get("status") == "voting"]),
-    )
+    def build():
+        # Calculate totals
+        total_value = sum(p.valuation * p.network_ownership for p in state.properties)
+        avg_yield = sum(p.gross_yield for p in state.properties) / max(len(state.properties), 1)
+        
+        return NetworkStateResponse(
+            month=state.month,
+            property_count=len(state.properties),
+            participant_count=len(state.participants),
+            total_value=total_value,
+            average_yield=avg_yield,
+            market_trend=state.market_conditions.get("wa_market_trend", "stable"),
+            active_proposals=len([p for p in state.governance_proposals if p.get("status") == "voting"]),
+        )
+    
+    return await get_response_cache().respond(request, state.month, build)
 
 
 @router.get("/properties", response_model=List[PropertySummary])
@@ -114,18 +120,21 @@ async def get_properties(request: Request):
     
     state = request.app.state.network_state
     
-    return [
-        PropertySummary(
-            id=p.id,
-            address=p.address,
-            suburb=p.suburb,
-            valuation=p.valuation,
-            yield_percent=p.gross_yield,
-            network_ownership=p.network_ownership,
-            status=p.status,
-        )
-        for p in state.properties
-    ]
+    def build():
+        return [
+            PropertySummary(
+                id=p.id,
+                address=p.address,
+                suburb=p.suburb,
+                valuation=p.valuation,
+                yield_percent=p.gross_yield,
+                network_ownership=p.network_ownership,
+                status=p.status,
+            )
+            for p in state.properties
+        ]
+    
+    return await get_response_cache().respond(request, state.month, build)
 
 
 @router.get("/participants", response_model=List[ParticipantSummary])
@@ -136,17 +145,20 @@ async def get_participants(request: Request):
     
     state = request.app.state.network_state
     
-    return [
-        ParticipantSummary(
-            id=p.id,
-            name=p.name,
-            type=p.type,
-            role=p.role,
-            balance=p.balance,
-            holdings_count=len(p.holdings),
-        )
-        for p in state.participants
-    ]
+    def build():
+        return [
+            ParticipantSummary(
+                id=p.id,
+                name=p.name,
+                type=p.type,
+                role=p.role,
+                balance=p.balance,
+                holdings_count=len(p.holdings),
+            )
+            for p in state.participants
+        ]
+    
+    return await get_response_cache().respond(request, state.month, build)
 
 
 # =============================================================================
@@ -182,6 +194,8 @@ async def chat_with_governor(request: Request, chat_request: GovernorChatRequest
     The Governor can answer questions about the network, explain concepts,
     and suggest actions.
     """
+    from google.genai import types
+    
     if not hasattr(request.app.state, 'network_state'):
         raise HTTPException(500, "Network state not initialized")
     
@@ -220,9 +234,31 @@ async def chat_with_governor(request: Request, chat_request: GovernorChatRequest
             suggestions=["View properties", "Check your portfolio", "Explore governance"],
         )
     
-    # Call Gemini
+    # Generate suggestions based on context
+    suggestions = []
+    if not chat_request.user_id:
+        suggestions.append("Sign up as an investor")
+    if state.governance_proposals:
+        suggestions.append("Vote on active proposals")
+    if any(p.status == "available" for p in state.properties):
+        suggestions.append("Explore available properties")
+    
+    # Same question against the same context this month: reuse the answer
+    answers = get_answer_cache()
+    context_key = context_hash(network_context)
+    cached = answers.get("governor", context_key, chat_request.message)
+    if cached is not None:
+        return GovernorChatResponse(
+            response=cached,
+            month=state.month,
+            suggestions=suggestions if suggestions else None,
+        )
+    
+    # Call Gemini (429 here if the model quota is saturated)
+    admission = get_admission()
+    await admission.acquire(client_key(request))
     try:
-        client = genai.Client(api_key=settings.google_api_key)
+        client = get_genai_client()
         
         system_prompt = GOVERNOR_SYSTEM_PROMPT.format(
             network_context=json.dumps(network_context, indent=2)
@@ -240,15 +276,7 @@ async def chat_with_governor(request: Request, chat_request: GovernorChatRequest
                 max_output_tokens=1024,
             ),
         )
-        
-        # Generate suggestions based on context
-        suggestions = []
-        if not chat_request.user_id:
-            suggestions.append("Sign up as an investor")
-        if state.governance_proposals:
-            suggestions.append("Vote on active proposals")
-        if any(p.status == "available" for p in state.properties):
-            suggestions.append("Explore available properties")
+        answers.put("governor", context_key, chat_request.message, response.text)
         
         logger.info("governor_chat_completed",
                    user_id=chat_request.user_id,
@@ -268,13 +296,14 @@ async def chat_with_governor(request: Request, chat_request: GovernorChatRequest
                      f"The network is currently in Month {state.month}. Please try again shortly.",
             month=state.month,
         )
+    finally:
+        await admission.release()
 
 
 @router.get("/governor/chat/stream")
 async def stream_chat_with_governor(
     request: Request,
     message: str,
-    user_id: Optional[str] = None,
 ):
     """
     Stream a response from the Network Governor.
@@ -294,14 +323,33 @@ async def stream_chat_with_governor(
         "market_trend": state.market_conditions.get("wa_market_trend"),
     }
     
+    # A cached answer is replayed as the same token/done events, without a model call
+    answers = get_answer_cache()
+    context_key = context_hash(network_context)
+    cached = answers.get("governor", context_key, message) if settings.google_api_key else None
+    
+    # Hold the model-call slot until the response ends (released by the response)
+    admission = None
+    if settings.google_api_key and cached is None:
+        admission = get_admission()
+        await admission.acquire(client_key(request))
+    
     async def generate():
+        from google.genai import types
+        
         if not settings.google_api_key:
-            yield f"data: {json.dumps({'type': 'token', 'content': 'Gemini not configured. '})}\n\n"
-            yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            yield sse_message({'type': 'token', 'content': 'Gemini not configured. '})
+            yield sse_message({'type': 'done'})
+            return
+        
+        if cached is not None:
+            for piece in replay_chunks(cached):
+                yield sse_message({'type': 'token', 'content': piece})
+            yield sse_message({'type': 'done'})
             return
         
         try:
-            client = genai.Client(api_key=settings.google_api_key)
+            client = get_genai_client()
             
             system_prompt = GOVERNOR_SYSTEM_PROMPT.format(
                 network_context=json.dumps(network_context, indent=2)
@@ -319,18 +367,23 @@ async def stream_chat_with_governor(
                     max_output_tokens=1024,
                 ),
             )
+            parts = []
             async for chunk in stream:
                 if chunk.text:
-                    yield f"data: {json.dumps({'type': 'token', 'content': chunk.text})}\n\n"
+                    parts.append(chunk.text)
+                    yield sse_message({'type': 'token', 'content': chunk.text})
+            # Only complete answers are cached
+            answers.put("governor", context_key, message, "".join(parts))
             
-            yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            yield sse_message({'type': 'done'})
             
         except Exception as e:
             logger.error("governor_stream_error", error=str(e))
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield sse_message({'type': 'error', 'message': str(e)})
     
-    return StreamingResponse(
+    return AdmittedStreamingResponse(
         generate(),
+        admission,
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -339,6 +392,18 @@ async def stream_chat_with_governor(
     )
 
 
+@router.get("/admission/metrics")
+async def admission_metrics():
+    """Queue depth, in-flight calls and reject counts for model-call admission."""
+    return get_admission().get_metrics()
+
+
+@router.get("/answers/metrics")
+async def answer_cache_metrics():
+    """Exact and similar-question hits of the governor/advisor answer cache."""
+    return get_answer_cache().get_metrics()
+
+
 # =============================================================================
 # Portfolio Advisor (Interactive Agent)
 # =============================================================================
@@ -387,6 +452,8 @@ async def get_portfolio_advice(request: Request, advisor_request: AdvisorRequest
     The Portfolio Advisor analyzes your holdings and provides
     investment suggestions and insights.
     """
+    from google.genai import types
+    
     if not hasattr(request.app.state, 'network_state'):
         raise HTTPException(500, "Network state not initialized")
     
@@ -448,8 +515,32 @@ async def get_portfolio_advice(request: Request, advisor_request: AdvisorRequest
             opportunities=[{"property": p.address, "yield": p.gross_yield} for p in available[:3]],
         )
     
+    # Generate opportunities
+    opportunities = [
+        {
+            "property": p.address,
+            "suburb": p.suburb,
+            "yield": p.gross_yield,
+            "min_investment": p.valuation / 100,  # 1%
+        }
+        for p in sorted(available, key=lambda x: -x.gross_yield)[:3]
+    ]
+    
+    # Same question against the same portfolio and market this month: reuse the advice
+    answers = get_answer_cache()
+    context_key = context_hash(portfolio_context, properties_context, market_context)
+    cached = answers.get("advisor", context_key, advisor_request.question)
+    if cached is not None:
+        return AdvisorResponse(
+            advice=cached,
+            portfolio_summary=portfolio_context,
+            opportunities=opportunities,
+        )
+    
+    admission = get_admission()
+    await admission.acquire(client_key(request))
     try:
-        client = genai.Client(api_key=settings.google_api_key)
+        client = get_genai_client()
         
         system_prompt = ADVISOR_SYSTEM_PROMPT.format(
             portfolio_context=json.dumps(portfolio_context, indent=2),
@@ -469,17 +560,7 @@ async def get_portfolio_advice(request: Request, advisor_request: AdvisorRequest
                 max_output_tokens=1500,
             ),
         )
-        
-        # Generate opportunities
-        opportunities = [
-            {
-                "property": p.address,
-                "suburb": p.suburb,
-                "yield": p.gross_yield,
-                "min_investment": p.valuation / 100,  # 1%
-            }
-            for p in sorted(available, key=lambda x: -x.gross_yield)[:3]
-        ]
+        answers.put("advisor", context_key, advisor_request.question, response.text)
         
         logger.info("advisor_completed",
                    user_id=advisor_request.user_id,
@@ -498,6 +579,8 @@ async def get_portfolio_advice(request: Request, advisor_request: AdvisorRequest
                    f"Your portfolio is worth ${portfolio_value:,.0f}. Please try again shortly.",
             portfolio_summary=portfolio_context,
         )
+    finally:
+        await admission.release()
 
 
 # =============================================================================
@@ -517,6 +600,12 @@ class SnapshotResponse(BaseModel):
     rent_collected: float
     governor_summary: Optional[str] = None
     created_at: str
+    # Only with fields= (full_state and batch_response can be megabytes)
+    total_tokens_issued: Optional[float] = None
+    tokens_traded: Optional[float] = None
+    processing_time_ms: Optional[int] = None
+    full_state: Optional[Dict[str, Any]] = None
+    batch_response: Optional[Dict[str, Any]] = None
 
 
 class EventResponse(BaseModel):
@@ -528,88 +617,167 @@ class EventResponse(BaseModel):
     description: str
     severity: str
     created_at: str
-
-
-@router.get("/history/snapshots", response_model=List[SnapshotResponse])
+    # Only with fields=
+    participant_id: Optional[str] = None
+    property_id: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+
+
+# fields= names -> (model column, JSON conversion). Only the selected columns
+# are read, so large JSON columns cost nothing unless asked for.
+
+def _iso(value: Any) -> str:
+    return value.isoformat()
+
+
+SNAPSHOT_FIELDS = {
+    "month": ("network_month", None),
+    "total_properties": ("total_properties", None),
+    "total_participants": ("total_participants", None),
+    "total_valuation": ("total_valuation", float),
+    "total_tokens_issued": ("total_tokens_issued", float),
+    "avg_token_price": ("avg_token_price", float),
+    "avg_yield": ("avg_yield", float),
+    "actions_processed": ("actions_processed", None),
+    "tokens_traded": ("tokens_traded", float),
+    "dividends_paid": ("dividends_paid", float),
+    "rent_collected": ("rent_collected", float),
+    "governor_summary": ("governor_summary", None),
+    "processing_time_ms": ("processing_time_ms", None),
+    "created_at": ("created_at", _iso),
+    "full_state": ("full_state", None),
+    "batch_response": ("batch_response", None),
+}
+SNAPSHOT_DEFAULT_FIELDS = (
+    "month", "total_properties", "total_participants", "total_valuation", "avg_token_price",
+    "avg_yield", "actions_processed", "dividends_paid", "rent_collected", "governor_summary",
+    "created_at",
+)
+
+EVENT_FIELDS = {
+    "id": ("id", None),
+    "month": ("network_month", None),
+    "event_type": ("event_type", None),
+    "title": ("title", None),
+    "description": ("description", None),
+    "severity": ("severity", None),
+    "participant_id": ("participant_id", None),
+    "property_id": ("property_id", None),
+    "data": ("data", None),
+    "created_at": ("created_at", _iso),
+}
+EVENT_DEFAULT_FIELDS = ("id", "month", "event_type", "title", "description", "severity", "created_at")
+
+# /feed names the type column "type"
+FEED_FIELDS = {("type" if name == "event_type" else name): spec for name, spec in EVENT_FIELDS.items()}
+FEED_DEFAULT_FIELDS = ("id", "month", "title", "description", "type", "severity", "created_at")
+
+
+def _columns(names: List[str], spec: Dict[str, tuple]) -> List[str]:
+    return [spec[name][0] for name in names]
+
+
+def _pick(row: Any, names: List[str], spec: Dict[str, tuple]) -> Dict[str, Any]:
+    """The selected fields of a row, JSON-ready."""
+    picked = {}
+    for name in names:
+        column, convert = spec[name]
+        value = getattr(row, column)
+        picked[name] = convert(value) if convert and value is not None else value
+    return picked
+
+
+@router.get("/history/snapshots")
 async def get_snapshots(
-    months: int = 12,
+    months: int = Query(12, ge=1, le=120),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
 ):
-    """Get historical network snapshots."""
-    from src.database import async_session
+    """
+    Get historical network snapshots (pass next_cursor to page back).
+    
+    Returns {"snapshots": [...], "next_cursor": ...}, newest first.
+    fields= is a comma-separated subset of SnapshotResponse (e.g.
+    month,governor_summary); only those columns are read. full_state and
+    batch_response are only returned when listed.
+    """
+    from src.database import async_read_session
     from src.repositories import NetworkRepository
+    from src.repositories.fieldsets import InvalidFieldsError, parse_fields
+    from src.repositories.pagination import InvalidCursorError, month_key, next_cursor
     
     try:
-        async with async_session() as session:
+        names = parse_fields(fields, SNAPSHOT_FIELDS, SNAPSHOT_DEFAULT_FIELDS)
+        async with async_read_session() as session:
             repo = NetworkRepository(session)
-            snapshots = await repo.get_snapshots(limit=months)
+            snapshots = await repo.get_snapshots(
+                limit=months, cursor=cursor, columns=_columns(names, SNAPSHOT_FIELDS),
+            )
             
-            return [
-                SnapshotResponse(
-                    month=s.network_month,
-                    total_properties=s.total_properties,
-                    total_participants=s.total_participants,
-                    total_valuation=float(s.total_valuation),
-                    avg_token_price=float(s.avg_token_price),
-                    avg_yield=float(s.avg_yield),
-                    actions_processed=s.actions_processed,
-                    dividends_paid=float(s.dividends_paid),
-                    rent_collected=float(s.rent_collected),
-                    governor_summary=s.governor_summary,
-                    created_at=s.created_at.isoformat(),
-                )
-                for s in snapshots
-            ]
+            return FastJSONResponse({
+                "snapshots": [_pick(s, names, SNAPSHOT_FIELDS) for s in snapshots],
+                "next_cursor": next_cursor(snapshots, months, month_key),
+            })
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error("get_snapshots_error", error=str(e))
-        return []
+        return FastJSONResponse({"snapshots": [], "next_cursor": None})
 
 
-@router.get("/history/events", response_model=List[EventResponse])
+@router.get("/history/events")
 async def get_events(
     month: Optional[int] = None,
     event_type: Optional[str] = None,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
 ):
-    """Get network events with optional filters."""
-    from src.database import async_session
+    """
+    Get network events with optional filters (pass next_cursor to page back).
+    
+    Returns {"events": [...], "next_cursor": ...}, newest first.
+    fields= is a comma-separated subset of EventResponse; only those
+    columns are read (data only when listed).
+    """
+    from src.database import async_read_session
     from src.repositories import NetworkRepository
+    from src.repositories.fieldsets import InvalidFieldsError, parse_fields
+    from src.repositories.pagination import InvalidCursorError, created_key, next_cursor
     
     try:
-        async with async_session() as session:
+        names = parse_fields(fields, EVENT_FIELDS, EVENT_DEFAULT_FIELDS)
+        async with async_read_session() as session:
             repo = NetworkRepository(session)
             events = await repo.get_events(
                 network_month=month,
                 event_type=event_type,
                 limit=limit,
+                cursor=cursor,
+                columns=_columns(names, EVENT_FIELDS),
             )
             
-            return [
-                EventResponse(
-                    id=e.id,
-                    month=e.network_month,
-                    event_type=e.event_type,
-                    title=e.title,
-                    description=e.description,
-                    severity=e.severity,
-                    created_at=e.created_at.isoformat(),
-                )
-                for e in events
-            ]
+            return FastJSONResponse({
+                "events": [_pick(e, names, EVENT_FIELDS) for e in events],
+                "next_cursor": next_cursor(events, limit, created_key),
+            })
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error("get_events_error", error=str(e))
-        return []
+        return FastJSONResponse({"events": [], "next_cursor": None})
 
 
 @router.get("/history/metrics")
 async def get_metrics_history(
-    months: int = 12,
+    months: int = Query(12, ge=1, le=120),
 ):
     """Get historical metrics for charts."""
-    from src.database import async_session
+    from src.database import async_read_session
     from src.repositories import NetworkRepository
     
     try:
-        async with async_session() as session:
+        async with async_read_session() as session:
             repo = NetworkRepository(session)
             return await repo.get_metrics_history(months=months)
     except Exception as e:
@@ -617,6 +785,40 @@ async def get_metrics_history(
         return []
 
 
+@router.get("/history/archive")
+async def get_event_archive_status():
+    """Get the event retention policy and archived months."""
+    from src.services.event_retention import get_event_retention
+    
+    return get_event_retention().get_status()
+
+
+@router.get("/history/archive/{month}")
+async def get_archived_events(month: int):
+    """Read an archived month's events straight from the archive file."""
+    from src.services.event_retention import get_event_retention
+    
+    retention = get_event_retention()
+    if not retention.archive.has_month(month):
+        raise HTTPException(status_code=404, detail="Month not archived")
+    
+    events = await asyncio.to_thread(retention.archive.read_month, month)
+    return {"month": month, "events": events, "total": len(events)}
+
+
+@router.post("/history/archive/{month}/rehydrate")
+async def rehydrate_archived_events(month: int):
+    """Load an archived month back into the events table."""
+    from src.services.event_retention import get_event_retention
+    
+    retention = get_event_retention()
+    if not retention.archive.has_month(month):
+        raise HTTPException(status_code=404, detail="Month not archived")
+    
+    loaded = await retention.rehydrate_month(month)
+    return {"month": month, "events_loaded": loaded}
+
+
 # =============================================================================
 # NPC Endpoints
 # =============================================================================
@@ -634,14 +836,18 @@ class NPCSummary(BaseModel):
 
 
 @router.get("/npcs", response_model=List[NPCSummary])
-async def list_npcs():
+async def list_npcs(request: Request):
     """Get all NPC participants with their personalities and goals."""
     from src.services.npc_system import get_npc_manager
     
     try:
         npc_manager = get_npc_manager()
         await npc_manager.initialize()
-        return npc_manager.get_npc_summaries()
+        return await get_response_cache().respond(
+            request,
+            get_network_clock().current_month,
+            npc_manager.get_npc_summaries,
+        )
     except Exception as e:
         logger.error("list_npcs_error", error=str(e))
         return []
@@ -651,7 +857,7 @@ async def list_npcs():
 async def get_npc(npc_id: str):
     """Get detailed information about a specific NPC."""
     from src.services.npc_system import get_npc_manager
-    from src.database import async_session
+    from src.database import async_read_session
     from src.repositories import ParticipantRepository
     
     try:
@@ -664,7 +870,7 @@ async def get_npc(npc_id: str):
         npc = npc_manager.npcs[npc_id]
         
         # Get holdings from database
-        async with async_session() as session:
+        async with async_read_session() as session:
             repo = ParticipantRepository(session)
             participant = await repo.get_by_id(npc_id)
             holdings = await repo.get_holdings(npc_id)
@@ -716,6 +922,7 @@ async def initialize_npcs():
     try:
         npc_manager = get_npc_manager()
         count = await npc_manager.initialize()
+        get_response_cache().invalidate("npcs_initialized")
         return {
             "message": f"Initialized {count} NPCs",
             "npc_count": count,
@@ -746,21 +953,31 @@ class GenerateEventsRequest(BaseModel):
 
 
 @router.get("/economy", response_model=EconomicStateResponse)
-async def get_economic_state():
+async def get_economic_state(request: Request):
     """Get current economic conditions affecting the simulation."""
     from src.services.event_generator import get_event_generator
     
     generator = get_event_generator()
-    state = generator.get_economic_state()
     
-    return EconomicStateResponse(**state)
+    return await get_response_cache().respond(
+        request,
+        get_network_clock().current_month,
+        lambda: EconomicStateResponse(**generator.get_economic_state()),
+    )
 
 
 @router.post("/events/generate")
-async def generate_events(request: GenerateEventsRequest):
-    """Generate events for the current or specified month."""
+async def generate_events(http_request: Request, request: GenerateEventsRequest):
+    """
+    Generate events for the current or specified month.
+    
+    news_summary is the month's article from the news service, which stores
+    it for GET /news/{month}; it is null if the model call was rate limited
+    (the next GET /news/{month} generates it).
+    """
     from src.services.event_generator import get_event_generator
     from src.services.network_clock import get_network_clock
+    from src.services.news import get_news_service
     
     generator = get_event_generator()
     clock = get_network_clock()
@@ -791,9 +1008,17 @@ async def generate_events(request: GenerateEventsRequest):
     
     # Save to database
     saved = await generator.save_events(events)
+    get_response_cache().invalidate("events_generated")
+    
+    # The month's stored article no longer covers all of its events
+    news_service = get_news_service()
+    await news_service.invalidate(month)
     
-    # Generate news article
-    news = await generator.generate_news_article(events, month)
+    # Generate (and store) the article covering the new events
+    try:
+        news = (await news_service.get_news(month, client_key(http_request)))["news"]
+    except AdmissionRejected:
+        news = None
     
     return {
         "month": month,
@@ -806,56 +1031,19 @@ async def generate_events(request: GenerateEventsRequest):
 
 
 @router.get("/news/{month}")
-async def get_monthly_news(month: int):
-    """Get news summary for a specific month."""
-    from src.database import async_session
-    from src.repositories import NetworkRepository
-    from src.services.event_generator import get_event_generator, SimulationEvent, EventCategory, EventSeverity
+async def get_monthly_news(request: Request, month: int):
+    """
+    Get news summary for a specific month.
+    
+    Articles are generated once per completed month and then served
+    from the monthly_news table.
+    """
+    from src.services.news import get_news_service
     
     try:
-        async with async_session() as session:
-            repo = NetworkRepository(session)
-            db_events = await repo.get_events(network_month=month, limit=10)
-            
-            if not db_events:
-                return {
-                    "month": month,
-                    "news": "No events recorded for this month.",
-                    "events": [],
-                }
-            
-            # Convert to SimulationEvent objects for news generation
-            events = []
-            for e in db_events:
-                events.append(SimulationEvent(
-                    id=e.id,
-                    category=EventCategory(e.event_type) if e.event_type in [c.value for c in EventCategory] else EventCategory.MARKET,
-                    severity=EventSeverity(e.severity) if e.severity in [s.value for s in EventSeverity] else EventSeverity.INFO,
-                    title=e.title,
-                    description=e.description or "",
-                    impact={},
-                    narrative="",
-                    month=e.network_month,
-                ))
-            
-            # Generate news
-            generator = get_event_generator()
-            news = await generator.generate_news_article(events, month)
-            
-            return {
-                "month": month,
-                "news": news,
-                "events": [
-                    {
-                        "id": e.id,
-                        "title": e.title,
-                        "description": e.description,
-                        "type": e.event_type,
-                        "severity": e.severity,
-                    }
-                    for e in db_events
-                ],
-            }
+        return await get_news_service().get_news(month, client_key(request))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("get_news_error", month=month, error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -863,36 +1051,35 @@ async def get_monthly_news(month: int):
 
 @router.get("/feed")
 async def get_event_feed(
-    limit: int = 20,
+    limit: int = Query(20, ge=1, le=100),
     category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
 ):
-    """Get recent events as a news feed."""
-    from src.database import async_session
+    """Get recent events as a news feed (fields= selects keys, as for /history/events)."""
+    from src.database import async_read_session
     from src.repositories import NetworkRepository
+    from src.repositories.fieldsets import InvalidFieldsError, parse_fields
+    from src.repositories.pagination import InvalidCursorError, created_key, next_cursor
     
     try:
-        async with async_session() as session:
+        names = parse_fields(fields, FEED_FIELDS, FEED_DEFAULT_FIELDS)
+        async with async_read_session() as session:
             repo = NetworkRepository(session)
             events = await repo.get_events(
                 event_type=category,
                 limit=limit,
+                cursor=cursor,
+                columns=_columns(names, FEED_FIELDS),
             )
             
             return {
-                "events": [
-                    {
-                        "id": e.id,
-                        "month": e.network_month,
-                        "title": e.title,
-                        "description": e.description,
-                        "type": e.event_type,
-                        "severity": e.severity,
-                        "created_at": e.created_at.isoformat(),
-                    }
-                    for e in events
-                ],
+                "events": [_pick(e, names, FEED_FIELDS) for e in events],
                 "total": len(events),
+                "next_cursor": next_cursor(events, limit, created_key),
             }
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error("get_feed_error", error=str(e))
-        return {"events": [], "total": 0}
+        return {"events": [], "total": 0, "next_cursor": None}
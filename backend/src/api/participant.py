@@ -3,7 +3,7 @@ Participant API Endpoints
 User-participant management for the simulation
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
 from typing import Optional, List
 import structlog
@@ -11,6 +11,7 @@ import structlog
 from src.services.participant_service import (
     get_or_create_participant,
     get_participant_by_user,
+    list_participants,
     update_participant_role,
     update_participant_avatar,
     get_participant_portfolio,
@@ -38,6 +39,12 @@ class ParticipantResponse(BaseModel):
     is_active: bool
 
 
+class ParticipantPage(BaseModel):
+    """A page of participants, oldest first."""
+    participants: List[ParticipantResponse]
+    next_cursor: Optional[str] = None
+
+
 class CreateParticipantRequest(BaseModel):
     """Request to create/link a participant."""
     user_id: str
@@ -108,6 +115,45 @@ async def create_or_get_participant(request: CreateParticipantRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/", response_model=ParticipantPage)
+async def get_participants(
+    participant_type: Optional[str] = None,
+    role: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+):
+    """List active participants (pass next_cursor to get the next page)."""
+    from src.repositories.pagination import InvalidCursorError
+    
+    try:
+        participants, next_cursor = await list_participants(
+            participant_type=participant_type,
+            role=role,
+            limit=limit,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return ParticipantPage(
+        participants=[
+            ParticipantResponse(
+                id=p.id,
+                name=p.name,
+                role=p.role,
+                participant_type=p.participant_type,
+                avatar_key=p.avatar_key,
+                balance=float(p.balance),
+                total_invested=float(p.total_invested),
+                total_dividends=float(p.total_dividends),
+                is_active=p.is_active,
+            )
+            for p in participants
+        ],
+        next_cursor=next_cursor,
+    )
+
+
 @router.get("/{user_id}", response_model=ParticipantResponse)
 async def get_participant(user_id: str):
     """Get participant for a user."""
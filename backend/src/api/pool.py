@@ -2,15 +2,27 @@
 Property and Avatar Pool API
 
 Endpoints for accessing pre-generated property and avatar pools.
+
+The pools live in the pool_properties and pool_avatars tables. The JSON
+files in data/ are an import/export format only: they are imported on first
+startup (or POST /pool/reload) and written by scripts/pool_db.py export.
+
+GET /pool/properties/search filters, facets, sorts and pages the pool from
+an in-memory index (see pool_search); the other listings query the table.
+
+Images are returned as asset URLs, plus (under "thumbnails") AVIF/WebP
+srcsets once their variants have been built; see image_derivatives.
 """
 
 import json
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, HTTPException, Query
+from typing import Optional, List, Dict, Any, Literal
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 import structlog
 
+from src.services.asset_store import is_data_url
+
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/pool", tags=["Asset Pools"])
@@ -29,6 +41,21 @@ class PoolStatus(BaseModel):
     enabled: int
 
 
+class ImageSource(BaseModel):
+    """One <picture> <source>: a srcset in a single format."""
+    type: str
+    srcset: str
+
+
+class ImageSet(BaseModel):
+    """Resized variants of an image (use src/srcset for a plain <img>)."""
+    src: str
+    srcset: str
+    sources: List[ImageSource]
+    width: int
+    height: int
+
+
 class PropertySummary(BaseModel):
     """Property summary for listing."""
     id: str
@@ -39,14 +66,26 @@ class PropertySummary(BaseModel):
     bedrooms: int
     bathrooms: int
     valuation: int
+    gross_yield: Optional[float] = None
+    land_size: Optional[int] = None
     headline: Optional[str]
     has_images: bool
     # Include images for frontend display
     images: Optional[Dict[str, str]] = None
+    # Resized variants, for images that have them
+    thumbnails: Optional[Dict[str, ImageSet]] = None
     # Include listing highlights
     highlights: Optional[List[Dict[str, str]]] = None
 
 
+class PropertySearchResult(BaseModel):
+    """One page of pool search results."""
+    total: int
+    items: List[PropertySummary]
+    facets: Optional[Dict[str, Dict[str, int]]] = None
+    next_cursor: Optional[str] = None
+
+
 class PropertyDetail(BaseModel):
     """Full property detail."""
     id: str
@@ -54,6 +93,7 @@ class PropertyDetail(BaseModel):
     data: Dict[str, Any]
     listing: Optional[Dict[str, Any]]
     images: Dict[str, str]
+    thumbnails: Optional[Dict[str, ImageSet]] = None
 
 
 class AvatarInfo(BaseModel):
@@ -63,69 +103,92 @@ class AvatarInfo(BaseModel):
 
 
 # =============================================================================
-# Pool Loading
+# Pool Files (import/export format)
 # =============================================================================
 
 PROPERTY_POOL_PATH = Path("data/property_pool.json")
 AVATAR_POOL_PATH = Path("data/avatars.json")
 
-# In-memory cache
-_property_pool = None
-_avatar_pool = None
-
 
 def load_property_pool() -> dict:
-    """Load property pool from disk."""
-    global _property_pool
-    
-    if _property_pool is not None:
-        return _property_pool
-    
+    """Read the property pool file."""
     if not PROPERTY_POOL_PATH.exists():
         return {"properties": [], "generated_at": None}
     
     try:
-        _property_pool = json.loads(PROPERTY_POOL_PATH.read_text())
-        logger.info("property_pool_loaded", count=len(_property_pool.get("properties", [])))
-        return _property_pool
+        pool = json.loads(PROPERTY_POOL_PATH.read_text())
+        properties = pool.get("properties", [])
+        logger.info("property_pool_loaded", count=len(properties))
+        inline = sum(
+            1 for p in properties for image in (p.get("images") or {}).values() if is_data_url(image)
+        )
+        if inline:
+            logger.warning("property_pool_inline_images", count=inline,
+                           hint="run scripts/migrate_pool_assets.py")
+        return pool
     except Exception as e:
         logger.error("property_pool_load_failed", error=str(e))
         return {"properties": [], "generated_at": None}
 
 
 def load_avatar_pool() -> dict:
-    """Load avatar pool from disk."""
-    global _avatar_pool
-    
-    if _avatar_pool is not None:
-        return _avatar_pool
-    
+    """Read the avatar pool file."""
     if not AVATAR_POOL_PATH.exists():
         return {"avatars": {}, "generated_at": None}
     
     try:
-        _avatar_pool = json.loads(AVATAR_POOL_PATH.read_text())
-        logger.info("avatar_pool_loaded", count=len(_avatar_pool.get("avatars", {})))
-        return _avatar_pool
+        pool = json.loads(AVATAR_POOL_PATH.read_text())
+        avatars = pool.get("avatars", {})
+        logger.info("avatar_pool_loaded", count=len(avatars))
+        inline = sum(1 for image in avatars.values() if is_data_url(image))
+        if inline:
+            logger.warning("avatar_pool_inline_images", count=inline,
+                           hint="run scripts/migrate_pool_assets.py")
+        return pool
     except Exception as e:
         logger.error("avatar_pool_load_failed", error=str(e))
         return {"avatars": {}, "generated_at": None}
 
 
-def save_property_pool():
-    """Save property pool to disk."""
-    global _property_pool
-    if _property_pool:
-        PROPERTY_POOL_PATH.write_text(json.dumps(_property_pool, indent=2))
+async def import_pool_files(only_if_empty: bool = False) -> dict:
+    """
+    Import the pool files into the pool tables (existing rows keep their status).
+    
+    With only_if_empty, a table that already has rows is left alone, so the
+    database stays the source of truth across restarts.
+    """
+    from src.database import async_session
+    from src.repositories import PoolRepository
+    
+    imported = {"properties": 0, "avatars": 0}
+    async with async_session() as session:
+        repo = PoolRepository(session)
+        
+        if not (only_if_empty and sum((await repo.status_counts()).values())):
+            result = await repo.import_properties(load_property_pool().get("properties", []))
+            imported["properties"] = result["inserted"] + result["updated"]
+        
+        if not (only_if_empty and await repo.count_avatars()):
+            result = await repo.import_avatars(load_avatar_pool().get("avatars", {}))
+            imported["avatars"] = result["inserted"] + result["updated"]
+        
+        await session.commit()
+    return imported
 
 
-def reload_pools():
-    """Force reload pools from disk."""
-    global _property_pool, _avatar_pool
-    _property_pool = None
-    _avatar_pool = None
-    load_property_pool()
-    load_avatar_pool()
+def _base_url(request: Request) -> str:
+    return str(request.base_url).rstrip("/")
+
+
+def _absolute(url: str, request: Request) -> str:
+    """Asset paths (/assets/...) as absolute URLs; the frontend is on another origin."""
+    if url and url.startswith("/"):
+        return _base_url(request) + url
+    return url
+
+
+def _absolute_images(images: Dict[str, str], request: Request) -> Dict[str, str]:
+    return {name: _absolute(url, request) for name, url in images.items()}
 
 
 # =============================================================================
@@ -135,122 +198,201 @@ def reload_pools():
 @router.get("/properties/status", response_model=PoolStatus)
 async def get_property_pool_status():
     """Get property pool status."""
-    pool = load_property_pool()
-    properties = pool.get("properties", [])
+    from src.database import async_read_session
+    from src.repositories import PoolRepository
+    
+    async with async_read_session() as session:
+        repo = PoolRepository(session)
+        counts = await repo.status_counts()
+        imported_at = await repo.last_imported_at()
     
-    available = sum(1 for p in properties if p.get("status") == "draft")
-    enabled = sum(1 for p in properties if p.get("status") != "draft")
+    total = sum(counts.values())
+    available = counts.get("draft", 0)
     
     return PoolStatus(
-        exists=PROPERTY_POOL_PATH.exists(),
-        count=len(properties),
-        generated_at=pool.get("generated_at"),
+        exists=total > 0,
+        count=total,
+        generated_at=imported_at.isoformat() if imported_at else None,
         available=available,
-        enabled=enabled,
+        enabled=total - available,
     )
 
 
 @router.get("/properties", response_model=List[PropertySummary])
 async def list_properties(
+    request: Request,
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by status"),
     suburb: Optional[str] = Query(None, description="Filter by suburb"),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
 ):
-    """List properties in the pool."""
-    pool = load_property_pool()
-    properties = pool.get("properties", [])
+    """List properties in the pool (next page cursor in the X-Next-Cursor header)."""
+    from src.database import async_read_session
+    from src.repositories import PoolRepository
+    from src.repositories.pagination import InvalidCursorError, next_cursor, position_key
+    from src.services.image_derivatives import get_image_derivatives
+    
+    try:
+        async with async_read_session() as session:
+            properties = await PoolRepository(session).list_properties(
+                status=status, suburb=suburb, limit=limit, cursor=cursor,
+            )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # Filter
-    if status:
-        properties = [p for p in properties if p.get("status") == status]
-    if suburb:
-        properties = [p for p in properties if p.get("data", {}).get("suburb") == suburb]
+    following = next_cursor(properties, limit, position_key)
+    if following:
+        response.headers["X-Next-Cursor"] = following
     
-    # Build summaries
-    summaries = []
-    for prop in properties[:limit]:
-        data = prop.get("data", {})
-        listing = prop.get("listing", {})
-        images = prop.get("images", {})
-        
-        summaries.append(PropertySummary(
-            id=prop.get("id", ""),
-            status=prop.get("status", "draft"),
-            address=data.get("address", ""),
-            suburb=data.get("suburb", ""),
-            property_type=data.get("property_type", ""),
-            bedrooms=data.get("bedrooms", 0),
-            bathrooms=data.get("bathrooms", 0),
-            valuation=data.get("valuation", 0),
-            headline=listing.get("headline") if listing else None,
-            has_images=bool(images.get("isometric")),
-            images=images if images else None,
-            highlights=listing.get("highlights") if listing else None,
-        ))
+    derivatives = get_image_derivatives()
+    base_url = _base_url(request)
+    return [
+        PropertySummary(
+            id=prop.id,
+            status=prop.status,
+            address=prop.address,
+            suburb=prop.suburb,
+            property_type=prop.property_type,
+            bedrooms=prop.bedrooms,
+            bathrooms=prop.bathrooms,
+            valuation=prop.valuation,
+            gross_yield=prop.data.get("gross_yield"),
+            land_size=prop.data.get("land_size"),
+            headline=prop.listing.get("headline") if prop.listing else None,
+            has_images=bool(prop.images.get("isometric")),
+            images=_absolute_images(prop.images, request) if prop.images else None,
+            thumbnails=derivatives.image_sets(prop.images, base_url) if prop.images else None,
+            highlights=prop.listing.get("highlights") if prop.listing else None,
+        )
+        for prop in properties
+    ]
+
+
+SEARCH_SORTS = Literal[
+    "position", "valuation", "-valuation", "gross_yield", "-gross_yield",
+    "bedrooms", "-bedrooms", "land_size", "-land_size",
+]
+
+
+@router.get("/properties/search", response_model=PropertySearchResult)
+async def search_properties(
+    request: Request,
+    suburb: Optional[List[str]] = Query(None, description="Any of these suburbs"),
+    property_type: Optional[List[str]] = Query(None, description="Any of these property types"),
+    status: Optional[List[str]] = Query(None, description="Any of these statuses"),
+    min_price: Optional[int] = Query(None, ge=0),
+    max_price: Optional[int] = Query(None, ge=0),
+    min_yield: Optional[float] = Query(None, ge=0),
+    max_yield: Optional[float] = Query(None, ge=0),
+    min_bedrooms: Optional[int] = Query(None, ge=0),
+    max_bedrooms: Optional[int] = Query(None, ge=0),
+    min_land: Optional[int] = Query(None, ge=0),
+    max_land: Optional[int] = Query(None, ge=0),
+    sort: SEARCH_SORTS = Query("position", description="Field, prefixed with - for descending"),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    facets: bool = Query(True, description="Include per-value counts"),
+):
+    """Search the pool with combined filters, facet counts, sort and cursor paging."""
+    from src.repositories.pagination import InvalidCursorError
+    from src.services.image_derivatives import get_image_derivatives
+    from src.services.pool_search import get_pool_search_index
+    
+    try:
+        result = get_pool_search_index().search(
+            terms={"suburb": suburb, "property_type": property_type, "status": status},
+            ranges={
+                "valuation": (min_price, max_price),
+                "gross_yield": (min_yield, max_yield),
+                "bedrooms": (min_bedrooms, max_bedrooms),
+                "land_size": (min_land, max_land),
+            },
+            sort=sort.lstrip("-"),
+            descending=sort.startswith("-"),
+            limit=limit,
+            cursor=cursor,
+            facets=facets,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return summaries
+    derivatives = get_image_derivatives()
+    base_url = _base_url(request)
+    for item in result["items"]:
+        images = item["images"]
+        item["images"] = _absolute_images(images, request) if images else None
+        item["thumbnails"] = derivatives.image_sets(images, base_url) if images else None
+    return result
 
 
 @router.get("/properties/{property_id}", response_model=PropertyDetail)
-async def get_property(property_id: str):
+async def get_property(property_id: str, request: Request):
     """Get full property details."""
-    pool = load_property_pool()
+    from src.database import async_read_session
+    from src.repositories import PoolRepository
+    from src.services.image_derivatives import get_image_derivatives
     
-    for prop in pool.get("properties", []):
-        if prop.get("id") == property_id:
-            return PropertyDetail(
-                id=prop.get("id"),
-                status=prop.get("status", "draft"),
-                data=prop.get("data", {}),
-                listing=prop.get("listing"),
-                images=prop.get("images", {}),
-            )
+    async with async_read_session() as session:
+        prop = await PoolRepository(session).get_property(property_id)
+    
+    if prop is None:
+        raise HTTPException(404, f"Property {property_id} not found")
     
-    raise HTTPException(404, f"Property {property_id} not found")
+    return PropertyDetail(
+        id=prop.id,
+        status=prop.status,
+        data=prop.data,
+        listing=prop.listing,
+        images=_absolute_images(prop.images, request),
+        thumbnails=get_image_derivatives().image_sets(prop.images, _base_url(request)),
+    )
 
 
 @router.post("/properties/{property_id}/enable")
 async def enable_property(property_id: str):
     """Enable a property (change status from draft to available)."""
-    pool = load_property_pool()
+    from src.database import async_session
+    from src.repositories import PoolRepository
     
-    for prop in pool.get("properties", []):
-        if prop.get("id") == property_id:
-            if prop.get("status") == "draft":
-                prop["status"] = "available"
-                save_property_pool()
-                logger.info("property_enabled", id=property_id)
-                return {"status": "enabled", "property_id": property_id}
-            else:
-                return {"status": "already_enabled", "property_id": property_id}
+    async with async_session() as session:
+        repo = PoolRepository(session)
+        enabled = await repo.enable_property(property_id)
+        await session.commit()
+        if not enabled and await repo.get_property(property_id) is None:
+            raise HTTPException(404, f"Property {property_id} not found")
     
-    raise HTTPException(404, f"Property {property_id} not found")
+    if enabled:
+        from src.services.pool_search import get_pool_search_index
+        get_pool_search_index().set_status(property_id, "available")
+        logger.info("property_enabled", id=property_id)
+        return {"status": "enabled", "property_id": property_id}
+    return {"status": "already_enabled", "property_id": property_id}
 
 
 @router.post("/properties/enable-next")
 async def enable_next_property(suburb: Optional[str] = None):
     """Enable the next available draft property."""
-    pool = load_property_pool()
+    from src.database import async_session
+    from src.repositories import PoolRepository
+    
+    async with async_session() as session:
+        repo = PoolRepository(session)
+        prop = await repo.enable_next(suburb)
+        await session.commit()
+        if prop is None:
+            raise HTTPException(404, "No draft properties available")
+        remaining = (await repo.status_counts()).get("draft", 0)
     
-    for prop in pool.get("properties", []):
-        if prop.get("status") == "draft":
-            if suburb and prop.get("data", {}).get("suburb") != suburb:
-                continue
-            
-            prop["status"] = "available"
-            save_property_pool()
-            
-            remaining = sum(1 for p in pool["properties"] if p.get("status") == "draft")
-            
-            logger.info("next_property_enabled", id=prop["id"])
-            
-            return {
-                "property_id": prop["id"],
-                "suburb": prop.get("data", {}).get("suburb"),
-                "remaining_in_pool": remaining,
-            }
+    from src.services.pool_search import get_pool_search_index
+    get_pool_search_index().set_status(prop.id, "available")
+    logger.info("next_property_enabled", id=prop.id)
     
-    raise HTTPException(404, "No draft properties available")
+    return {
+        "property_id": prop.id,
+        "suburb": prop.suburb,
+        "remaining_in_pool": remaining,
+    }
 
 
 # =============================================================================
@@ -260,61 +402,61 @@ async def enable_next_property(suburb: Optional[str] = None):
 @router.get("/avatars/status", response_model=PoolStatus)
 async def get_avatar_pool_status():
     """Get avatar pool status."""
-    pool = load_avatar_pool()
-    avatars = pool.get("avatars", {})
+    from src.database import async_read_session
+    from src.repositories import PoolRepository
+    
+    async with async_read_session() as session:
+        count = await PoolRepository(session).count_avatars()
     
     return PoolStatus(
-        exists=AVATAR_POOL_PATH.exists(),
-        count=len(avatars),
-        generated_at=pool.get("generated_at"),
-        available=len(avatars),
-        enabled=len(avatars),  # All avatars are always "enabled"
+        exists=count > 0,
+        count=count,
+        generated_at=None,
+        available=count,
+        enabled=count,  # All avatars are always "enabled"
     )
 
 
 @router.get("/avatars")
 async def list_avatars(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter: participant or service"),
 ):
     """List all available avatars."""
-    pool = load_avatar_pool()
-    avatars = pool.get("avatars", {})
+    from src.database import async_read_session
+    from src.repositories import PoolRepository
     
-    service_prefixes = [
-        'plumber', 'electrician', 'gardener', 'cleaner', 'painter', 
-        'handyman', 'building', 'real_estate', 'pool', 'security', 
-        'hvac', 'locksmith', 'pest', 'roofer', 'conveyancer', 'accountant'
-    ]
+    from src.services.image_derivatives import get_image_derivatives
     
-    result = {}
+    async with async_read_session() as session:
+        avatars = await PoolRepository(session).list_avatars(category)
     
-    for role, image in avatars.items():
-        is_service = any(role.startswith(s) for s in service_prefixes)
-        
-        if category == "participant" and is_service:
-            continue
-        if category == "service" and not is_service:
-            continue
-        
-        result[role] = {
-            "role": role,
-            "category": "service" if is_service else "participant",
-            "image": image,
+    derivatives = get_image_derivatives()
+    base_url = _base_url(request)
+    return {
+        avatar.role: {
+            "role": avatar.role,
+            "category": avatar.category,
+            "image": _absolute(avatar.image, request),
+            "thumbnail": derivatives.image_set(avatar.image, base_url),
         }
-    
-    return result
+        for avatar in avatars
+    }
 
 
 @router.get("/avatars/{role}")
-async def get_avatar(role: str):
+async def get_avatar(role: str, request: Request):
     """Get a specific avatar."""
-    pool = load_avatar_pool()
-    avatars = pool.get("avatars", {})
+    from src.database import async_read_session
+    from src.repositories import PoolRepository
+    
+    async with async_read_session() as session:
+        avatar = await PoolRepository(session).get_avatar(role)
     
-    if role in avatars:
-        return {"role": role, "image": avatars[role]}
+    if avatar is None:
+        raise HTTPException(404, f"Avatar for role '{role}' not found")
     
-    raise HTTPException(404, f"Avatar for role '{role}' not found")
+    return {"role": role, "image": _absolute(avatar.image, request)}
 
 
 # =============================================================================
@@ -323,13 +465,13 @@ async def get_avatar(role: str):
 
 @router.post("/reload")
 async def reload_all_pools():
-    """Reload pools from disk (use after regenerating)."""
-    reload_pools()
+    """Import the pool files again (use after regenerating; statuses are kept)."""
+    from src.services.pool_search import get_pool_search_index
     
-    prop_pool = load_property_pool()
-    avatar_pool = load_avatar_pool()
+    imported = await import_pool_files()
+    await get_pool_search_index().rebuild()
     
     return {
-        "properties_loaded": len(prop_pool.get("properties", [])),
-        "avatars_loaded": len(avatar_pool.get("avatars", {})),
+        "properties_loaded": imported["properties"],
+        "avatars_loaded": imported["avatars"],
     }
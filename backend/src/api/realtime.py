@@ -0,0 +1,186 @@
+"""
+Realtime WebSocket Endpoint
+
+One multiplexed socket per client for clock, events, alerts and chat.
+
+Connect with ?token=<JWT access token> to subscribe to the user-scoped
+topics (events, alerts). ?user_id= without a token is only accepted when
+WS_ALLOW_PLAIN_USER_ID is set, for local development.
+
+Client -> server (JSON objects):
+    {"op": "sub", "topics": ["clock", "events", "alerts"]}
+    {"op": "unsub", "topics": ["clock"]}
+    {"op": "chat", "id": "c1", "message": "...", "asset_class": "property"}
+
+Server -> client (compact JSON arrays):
+    ["clock", "clock_sync", {...}]
+    ["events", "event", {...}]
+    ["alerts", "alert", {"to": ..., "type": ..., "message": ...}]
+    ["chat", "token", {"id": "c1", "c": "..."}]
+    ["chat", "done", {"id": "c1"}]
+    ["sys", "ping", {}]
+    ["sys", "error", {"error": "Authentication required", "topics": ["alerts"]}]
+"""
+
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+import structlog
+
+from src.config import get_settings
+from src.services.admission import client_key
+from src.services.realtime import TOPICS, USER_TOPICS, encode_frame, get_realtime_bus
+
+logger = structlog.get_logger()
+settings = get_settings()
+
+router = APIRouter(tags=["Realtime"])
+
+PING_INTERVAL_SECONDS = 20.0
+
+# Close code for a client that fell too far behind (RFC 6455 "try again later")
+CLOSE_LAGGING = 1013
+
+
+def _resolve_user(token: Optional[str], user_id: Optional[str]) -> Optional[str]:
+    """User id from a JWT access token; a plain user_id only in development (WS_ALLOW_PLAIN_USER_ID)."""
+    if token:
+        from src.auth.jwt import TokenError, decode_access_token
+        try:
+            return decode_access_token(token).sub
+        except TokenError:
+            return None
+    if settings.ws_allow_plain_user_id:
+        return user_id
+    return None
+
+
+async def _run_chat(websocket: WebSocket, send_lock: asyncio.Lock, key: str, request: dict) -> None:
+    """Stream one chat reply as chat/token frames."""
+    from src.ai.core import AssetClass
+    from src.api.chat import osf_core
+    from src.services.admission import AdmissionRejected, get_admission
+
+    chat_id = request.get("id")
+    admission = get_admission()
+    try:
+        await admission.acquire(key)
+    except AdmissionRejected as e:
+        async with send_lock:
+            await websocket.send_text(encode_frame("chat", "error", {
+                "id": chat_id, "error": e.detail, "retry_after": int(e.headers["Retry-After"]),
+            }))
+        return
+    try:
+        asset_class = AssetClass(request.get("asset_class", "property"))
+        async for chunk in osf_core.chat_stream(
+            message=request.get("message", ""),
+            asset_class=asset_class,
+            context=request.get("context"),
+            role=request.get("role"),
+        ):
+            async with send_lock:
+                await websocket.send_text(encode_frame("chat", "token", {"id": chat_id, "c": chunk}))
+        frame = encode_frame("chat", "done", {"id": chat_id})
+    except Exception as e:
+        logger.error("ws_chat_failed", error=str(e))
+        frame = encode_frame("chat", "error", {"id": chat_id, "error": "Chat failed"})
+    finally:
+        await admission.release()
+    async with send_lock:
+        await websocket.send_text(frame)
+
+
+@router.websocket("/ws")
+async def realtime_socket(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None),
+    user_id: Optional[str] = Query(None),
+    api_key: Optional[str] = Query(None),
+):
+    """Multiplexed realtime socket (see module docstring for framing)."""
+    if settings.require_api_key:
+        key = api_key or websocket.headers.get("x-api-key")
+        if key != settings.api_secret_key:
+            await websocket.close(code=1008)
+            return
+
+    resolved_user = _resolve_user(token, user_id)
+    if (token or user_id) and resolved_user is None:
+        # Bad token, or a user_id that is not trusted without one
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    bus = get_realtime_bus()
+    connection = bus.connect(resolved_user)
+    await bus.refresh_holdings([connection])
+
+    send_lock = asyncio.Lock()
+    chat_tasks: set = set()
+
+    async def sender():
+        while True:
+            frames = await connection.outbox.wait(timeout=PING_INTERVAL_SECONDS)
+            if connection.outbox.closed:
+                if connection.outbox.close_reason == "lagging":
+                    await websocket.close(code=CLOSE_LAGGING)
+                return
+            if not frames:
+                frames = [encode_frame("sys", "ping", {})]
+            async with send_lock:
+                for frame in frames:
+                    await websocket.send_text(frame)
+
+    sender_task = asyncio.create_task(sender())
+    logger.info("ws_connected", user_id=resolved_user)
+
+    try:
+        while True:
+            message = await websocket.receive_json()
+            op = message.get("op") if isinstance(message, dict) else None
+
+            if op in ("sub", "unsub"):
+                topics = set(message.get("topics") or []) & TOPICS
+                if op == "sub":
+                    denied = topics & USER_TOPICS if resolved_user is None else set()
+                    connection.topics |= topics - denied
+                else:
+                    denied = set()
+                    connection.topics -= topics
+                async with send_lock:
+                    if denied:
+                        await websocket.send_text(encode_frame(
+                            "sys", "error", {"error": "Authentication required", "topics": sorted(denied)},
+                        ))
+                    await websocket.send_text(
+                        encode_frame("sys", "topics", {"topics": sorted(connection.topics)})
+                    )
+            elif op == "chat" and "chat" in connection.topics:
+                key = client_key(websocket, resolved_user)
+                task = asyncio.create_task(_run_chat(websocket, send_lock, key, message))
+                chat_tasks.add(task)
+                task.add_done_callback(chat_tasks.discard)
+            else:
+                async with send_lock:
+                    await websocket.send_text(
+                        encode_frame("sys", "error", {"error": f"Unsupported op: {op}"})
+                    )
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    except ValueError:
+        # Non-JSON frame from the client
+        await websocket.close(code=1003)
+    finally:
+        bus.disconnect(connection)
+        sender_task.cancel()
+        for task in chat_tasks:
+            task.cancel()
+        logger.info("ws_disconnected", user_id=resolved_user)
+
+
+@router.get("/ws/metrics")
+async def realtime_metrics():
+    """Connection, topic subscription and drop counters for /ws."""
+    return get_realtime_bus().get_metrics()
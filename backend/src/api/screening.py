@@ -4,10 +4,11 @@ Fair, explainable tenant screening
 """
 
 from typing import Optional
-from fastapi import APIRouter, UploadFile, File
+from fastapi import APIRouter, Depends, UploadFile, File
 from pydantic import BaseModel
 
 from src.ai.screening import ScreeningEngine, ScreeningDecision
+from src.services.admission import llm_admission
 
 router = APIRouter()
 screening_engine = ScreeningEngine()
@@ -43,7 +44,7 @@ class ScreeningResponse(BaseModel):
     rental_history_years: Optional[float] = None
 
 
-@router.post("/analyze", response_model=ScreeningResponse)
+@router.post("/analyze", response_model=ScreeningResponse, dependencies=[Depends(llm_admission)])
 async def screen_application(application: ApplicationData):
     """
     Screen a tenant application.
@@ -85,7 +86,7 @@ class DocumentAnalysisResponse(BaseModel):
     error: Optional[str] = None
 
 
-@router.post("/document", response_model=DocumentAnalysisResponse)
+@router.post("/document", response_model=DocumentAnalysisResponse, dependencies=[Depends(llm_admission)])
 async def analyze_document(
     document_type: str,  # id, payslip, bank_statement
     file: UploadFile = File(...),
@@ -5,22 +5,26 @@ Paper trading functionality for user engagement
 ⚠️ DEMO MODE WARNING ⚠️
 This simulation mode is for demonstration purposes only.
 - No authentication/authorization is enforced
-- All data is ephemeral (in-memory storage)
+- State is served from memory and written behind to the sim_* tables
 - Not suitable for production use without security hardening
 - user_id is passed as a parameter with no ownership verification
 """
 
+import re
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
 
 from src.database import get_db
+from src.services.feedback_index import get_feedback_index
+from src.services.leaderboard import get_leaderboard as get_leaderboard_engine
+from src.services.sim_store import get_sim_store
 
 router = APIRouter(
     tags=["Simulation (Demo Mode)"],
@@ -96,14 +100,15 @@ class SimVoteRequest(BaseModel):
 
 
 # ============================================
-# In-Memory Storage (Demo Mode)
-# For hackathon - replace with DB in production
+# Storage (Demo Mode)
+# In-memory, written behind to the database by SimStore
 # ============================================
 
-sim_users: dict = {}
-sim_holdings: dict = {}  # user_id -> list of holdings
-sim_transactions: dict = {}  # user_id -> list of transactions
-sim_proposals: list = []
+store = get_sim_store()
+sim_users = store.users
+sim_holdings = store.holdings  # user_id -> property_id -> holding
+sim_transactions = store.transactions  # user_id -> list of transactions
+sim_proposals = store.proposals  # proposal_id -> proposal
 
 # Sample properties
 SIM_PROPERTIES = [
@@ -189,8 +194,26 @@ SIM_PROPERTIES = [
     },
 ]
 
-# Initial proposals
-sim_proposals = [
+SIM_PROPERTIES_BY_ID = {p["id"]: p for p in SIM_PROPERTIES}
+
+# Ranked incrementally; call _rank_user() after any balance or holdings change
+leaderboard = get_leaderboard_engine()
+leaderboard.set_prices({p["id"]: p["token_price"] for p in SIM_PROPERTIES})
+
+
+def _rank_user(user_id: str) -> None:
+    user = sim_users[user_id]
+    leaderboard.update_user(
+        user_id,
+        display_name=user.get("display_name"),
+        balance=user["balance_aud"],
+        holdings=list(sim_holdings.get(user_id, {}).values()),
+        total_trades=user.get("total_trades", 0),
+    )
+
+
+# Initial proposals (inserted on first startup)
+SEED_PROPOSALS = [
     {
         "id": "gov-001",
         "proposer_id": "system",
@@ -229,21 +252,22 @@ async def simulation_signup(request: SimSignupRequest):
     """Create a simulation account with $100K starting balance."""
     
     # Check if email already exists
-    for user in sim_users.values():
-        if user["email"] == request.email:
-            return SimSignupResponse(
-                user_id=user["id"],
-                email=user["email"],
-                display_name=user.get("display_name"),
-                balance_aud=user["balance_aud"],
-                message="Welcome back! Your simulation account is ready."
-            )
+    existing_id = store.user_by_email.get(request.email)
+    if existing_id:
+        user = sim_users[existing_id]
+        return SimSignupResponse(
+            user_id=user["id"],
+            email=user["email"],
+            display_name=user.get("display_name"),
+            balance_aud=user["balance_aud"],
+            message="Welcome back! Your simulation account is ready."
+        )
     
     # Create new user
     user_id = str(uuid4())
     display_name = request.display_name or request.email.split("@")[0]
     
-    sim_users[user_id] = {
+    store.add_user({
         "id": user_id,
         "email": request.email,
         "display_name": display_name,
@@ -252,10 +276,8 @@ async def simulation_signup(request: SimSignupRequest):
         "total_invested": 0,
         "created_at": datetime.utcnow().isoformat(),
         "last_active_at": datetime.utcnow().isoformat(),
-    }
-    
-    sim_holdings[user_id] = []
-    sim_transactions[user_id] = []
+    })
+    _rank_user(user_id)
     
     return SimSignupResponse(
         user_id=user_id,
@@ -274,7 +296,7 @@ async def get_portfolio(user_id: str):
         raise HTTPException(status_code=404, detail="User not found")
     
     user = sim_users[user_id]
-    holdings = sim_holdings.get(user_id, [])
+    holdings = sim_holdings.get(user_id, {}).values()
     transactions = sim_transactions.get(user_id, [])
     
     # Calculate portfolio value
@@ -283,7 +305,7 @@ async def get_portfolio(user_id: str):
     holdings_with_details = []
     
     for holding in holdings:
-        prop = next((p for p in SIM_PROPERTIES if p["id"] == holding["property_id"]), None)
+        prop = SIM_PROPERTIES_BY_ID.get(holding["property_id"])
         if prop:
             current_value = holding["token_amount"] * prop["token_price"]
             cost_basis = holding["token_amount"] * holding["avg_price"]
@@ -339,7 +361,7 @@ async def buy_tokens(user_id: str, request: SimTradeRequest):
         raise HTTPException(status_code=404, detail="User not found")
     
     user = sim_users[user_id]
-    prop = next((p for p in SIM_PROPERTIES if p["id"] == request.property_id), None)
+    prop = SIM_PROPERTIES_BY_ID.get(request.property_id)
     
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
@@ -360,9 +382,10 @@ async def buy_tokens(user_id: str, request: SimTradeRequest):
     user["total_invested"] += request.amount_aud
     user["last_active_at"] = datetime.utcnow().isoformat()
     
+    store.touch_user(user_id)
+    
     # Update or create holding
-    holdings = sim_holdings[user_id]
-    existing = next((h for h in holdings if h["property_id"] == request.property_id), None)
+    existing = sim_holdings[user_id].get(request.property_id)
     
     if existing:
         # Update average price
@@ -370,16 +393,18 @@ async def buy_tokens(user_id: str, request: SimTradeRequest):
         total_cost = (existing["token_amount"] * existing["avg_price"]) + request.amount_aud
         existing["avg_price"] = total_cost / total_tokens
         existing["token_amount"] = total_tokens
+        store.set_holding(user_id, request.property_id, existing)
     else:
-        holdings.append({
+        store.set_holding(user_id, request.property_id, {
             "property_id": request.property_id,
             "token_amount": token_amount,
             "avg_price": token_price,
         })
+    _rank_user(user_id)
     
     # Record transaction
     tx_id = str(uuid4())
-    sim_transactions[user_id].append({
+    store.add_transaction(user_id, {
         "id": tx_id,
         "tx_type": "buy",
         "property_id": request.property_id,
@@ -410,14 +435,13 @@ async def sell_tokens(user_id: str, request: SimTradeRequest):
         raise HTTPException(status_code=404, detail="User not found")
     
     user = sim_users[user_id]
-    prop = next((p for p in SIM_PROPERTIES if p["id"] == request.property_id), None)
+    prop = SIM_PROPERTIES_BY_ID.get(request.property_id)
     
     if not prop:
         raise HTTPException(status_code=404, detail="Property not found")
     
     # Find holding
-    holdings = sim_holdings[user_id]
-    holding = next((h for h in holdings if h["property_id"] == request.property_id), None)
+    holding = sim_holdings[user_id].get(request.property_id)
     
     if not holding:
         raise HTTPException(status_code=400, detail="You don't own any tokens for this property")
@@ -431,17 +455,18 @@ async def sell_tokens(user_id: str, request: SimTradeRequest):
     
     # Update holding
     holding["token_amount"] -= tokens_to_sell
-    if holding["token_amount"] <= 0:
-        holdings.remove(holding)
+    store.set_holding(user_id, request.property_id, holding if holding["token_amount"] > 0 else None)
     
     # Update balance
     user["balance_aud"] += request.amount_aud
     user["total_trades"] += 1
     user["last_active_at"] = datetime.utcnow().isoformat()
+    store.touch_user(user_id)
+    _rank_user(user_id)
     
     # Record transaction
     tx_id = str(uuid4())
-    sim_transactions[user_id].append({
+    store.add_transaction(user_id, {
         "id": tx_id,
         "tx_type": "sell",
         "property_id": request.property_id,
@@ -497,8 +522,7 @@ async def reset_account(user_id: str):
     user["total_trades"] = 0
     user["total_invested"] = 0
     user["last_reset"] = datetime.utcnow().isoformat()
-    sim_holdings[user_id] = []
-    sim_transactions[user_id] = [{
+    store.reset_user(user_id, {
         "id": str(uuid4()),
         "tx_type": "reset",
         "property_id": None,
@@ -506,8 +530,9 @@ async def reset_account(user_id: str):
         "token_amount": 0,
         "aud_amount": 100000,
         "token_price": 0,
-        "created_at": datetime.utcnow().isoformat(),
-    }]
+        "created_at": user["last_reset"],
+    })
+    _rank_user(user_id)
     
     return {
         "message": "Account reset to $100,000. Next reset available in 24 hours.",
@@ -517,52 +542,41 @@ async def reset_account(user_id: str):
 
 
 @router.get("/leaderboard")
-async def get_leaderboard():
-    """Get top performers leaderboard."""
-    
-    leaderboard = []
-    
-    for user_id, user in sim_users.items():
-        # Calculate portfolio value
-        portfolio_value = 0
-        holdings = sim_holdings.get(user_id, [])
-        
-        for holding in holdings:
-            prop = next((p for p in SIM_PROPERTIES if p["id"] == holding["property_id"]), None)
-            if prop:
-                portfolio_value += holding["token_amount"] * prop["token_price"]
-        
-        total_value = user["balance_aud"] + portfolio_value
-        total_return = total_value - 100000
-        total_return_percent = (total_return / 100000) * 100
-        
-        leaderboard.append({
-            "user_id": user_id,
-            "display_name": user.get("display_name", "Anonymous"),
-            "portfolio_value": total_value,
-            "total_return_percent": total_return_percent,
-            "total_trades": user.get("total_trades", 0),
-        })
-    
-    # Sort by return percent
-    leaderboard.sort(key=lambda x: x["total_return_percent"], reverse=True)
-    
-    # Add ranks
-    for i, entry in enumerate(leaderboard):
-        entry["rank"] = i + 1
+async def get_leaderboard(
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    user_id: Optional[str] = None,
+):
+    """
+    Get top performers leaderboard.
     
-    return {
-        "leaderboard": leaderboard[:50],  # Top 50
+    Pages with offset/limit; pass user_id to also get that user's rank.
+    Users with equal portfolio values are ordered by user_id.
+    """
+    response = {
+        "leaderboard": leaderboard.page(offset, limit),
         "total_users": len(leaderboard),
         "updated_at": datetime.utcnow().isoformat(),
     }
+    if user_id:
+        response["me"] = leaderboard.rank_of(user_id)
+    return response
+
+
+@router.get("/leaderboard/rank/{user_id}")
+async def get_leaderboard_rank(user_id: str):
+    """Get a user's leaderboard rank."""
+    entry = leaderboard.rank_of(user_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return {**entry, "total_users": len(leaderboard)}
 
 
 @router.get("/proposals")
 async def list_proposals():
     """List governance proposals."""
     return {
-        "proposals": sim_proposals,
+        "proposals": list(sim_proposals.values()),
         "total": len(sim_proposals),
     }
 
@@ -577,7 +591,7 @@ async def create_proposal(user_id: str, request: SimProposalRequest):
     user = sim_users[user_id]
     
     # Calculate voting power (total holdings)
-    holdings = sim_holdings.get(user_id, [])
+    holdings = sim_holdings.get(user_id, {}).values()
     total_tokens = sum(h["token_amount"] for h in holdings)
     
     if total_tokens < 10000:
@@ -601,7 +615,7 @@ async def create_proposal(user_id: str, request: SimProposalRequest):
         "created_at": datetime.utcnow().isoformat(),
     }
     
-    sim_proposals.append(proposal)
+    store.add_proposal(proposal)
     
     return {
         "proposal": proposal,
@@ -616,7 +630,7 @@ async def vote_on_proposal(proposal_id: str, user_id: str, request: SimVoteReque
     if user_id not in sim_users:
         raise HTTPException(status_code=404, detail="User not found")
     
-    proposal = next((p for p in sim_proposals if p["id"] == proposal_id), None)
+    proposal = sim_proposals.get(proposal_id)
     if not proposal:
         raise HTTPException(status_code=404, detail="Proposal not found")
     
@@ -624,7 +638,7 @@ async def vote_on_proposal(proposal_id: str, user_id: str, request: SimVoteReque
         raise HTTPException(status_code=400, detail="Voting has ended")
     
     # Calculate voting power
-    holdings = sim_holdings.get(user_id, [])
+    holdings = sim_holdings.get(user_id, {}).values()
     voting_power = sum(h["token_amount"] for h in holdings)
     
     if voting_power <= 0:
@@ -635,6 +649,7 @@ async def vote_on_proposal(proposal_id: str, user_id: str, request: SimVoteReque
         proposal["votes_for"] += voting_power
     elif request.vote == "against":
         proposal["votes_against"] += voting_power
+    store.record_proposal_vote(proposal_id, user_id, request.vote, voting_power)
     
     return {
         "message": f"Vote recorded: {request.vote}",
@@ -648,12 +663,14 @@ async def vote_on_proposal(proposal_id: str, user_id: str, request: SimVoteReque
 # Community Feedback System
 # ============================================
 
-# In-memory storage for feedback
-feedback_items: dict = {}  # feedback_id -> feedback
-feedback_votes: dict = {}  # feedback_id -> {user_id: vote}
-feedback_comments: dict = {}  # feedback_id -> list of comments
+feedback_items = store.feedback  # feedback_id -> feedback
+feedback_votes = store.feedback_votes  # feedback_id -> {user_id: vote}
+feedback_comments = store.feedback_comments  # feedback_id -> list of comments
+
+# Duplicate detection and pre-sorted orderings; add() every new item
+feedback_index = get_feedback_index()
 
-# Initialize with sample feedback
+# Sample feedback (inserted on first startup)
 INITIAL_FEEDBACK = [
     {
         "id": "fb-001",
@@ -702,11 +719,14 @@ INITIAL_FEEDBACK = [
     },
 ]
 
-# Initialize feedback storage
-for fb in INITIAL_FEEDBACK:
-    feedback_items[fb["id"]] = fb
-    feedback_votes[fb["id"]] = {}
-    feedback_comments[fb["id"]] = []
+
+async def load_simulation_state() -> None:
+    """Load persisted simulation state (seeding it on first run) and rank users."""
+    await store.load(SIM_PROPERTIES, SEED_PROPOSALS, INITIAL_FEEDBACK)
+    for user_id in sim_users:
+        _rank_user(user_id)
+    for item in feedback_items.values():
+        feedback_index.add(item)
 
 
 class FeedbackCreateRequest(BaseModel):
@@ -724,32 +744,43 @@ class FeedbackVoteRequest(BaseModel):
     vote: int  # 1 for upvote, -1 for downvote
 
 
+def _possible_duplicates(title: str, description: str, exclude: Optional[str] = None) -> list:
+    """Existing items that look like the same report."""
+    return [
+        {
+            "id": feedback_id,
+            "title": feedback_items[feedback_id]["title"],
+            "status": feedback_items[feedback_id]["status"],
+            "similarity": similarity,
+        }
+        for feedback_id, similarity in feedback_index.similar(f"{title} {description}", exclude=exclude)
+    ]
+
+
 @router.get("/feedback")
 async def list_feedback(
     feedback_type: Optional[str] = None,
     status: Optional[str] = None,
     sort_by: str = "upvotes",  # upvotes, created_at, ai_priority
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
 ):
-    """List all feedback items with optional filters."""
-    
-    items = list(feedback_items.values())
-    
-    # Filter by type
-    if feedback_type:
-        items = [f for f in items if f["feedback_type"] == feedback_type]
-    
-    # Filter by status
-    if status:
-        items = [f for f in items if f["status"] == status]
-    
-    # Sort
-    if sort_by == "upvotes":
-        items.sort(key=lambda x: x["upvotes"] - x["downvotes"], reverse=True)
-    elif sort_by == "created_at":
-        items.sort(key=lambda x: x["created_at"], reverse=True)
-    elif sort_by == "ai_priority":
-        priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3, None: 4}
-        items.sort(key=lambda x: priority_order.get(x.get("ai_priority"), 4))
+    """List feedback items with optional filters (all items unless limit is given)."""
+    
+    if feedback_type or status:
+        # Walk the pre-sorted ordering, filtering by type and status
+        matching = [
+            item
+            for item in map(feedback_items.__getitem__, feedback_index.ranked(sort_by))
+            if (not feedback_type or item["feedback_type"] == feedback_type)
+            and (not status or item["status"] == status)
+        ]
+        total = len(matching)
+        items = matching[offset:offset + limit if limit else None]
+    else:
+        # Unfiltered: read just the requested window
+        total = len(feedback_index)
+        items = [feedback_items[i] for i in feedback_index.ranked(sort_by, offset, limit)]
     
     # Add comment counts
     for item in items:
@@ -757,7 +788,7 @@ async def list_feedback(
     
     return {
         "feedback": items,
-        "total": len(items),
+        "total": total,
         "filters": {
             "types": ["bug", "enhancement", "question"],
             "statuses": ["open", "in_review", "planned", "in_progress", "resolved", "wont_fix"],
@@ -765,6 +796,16 @@ async def list_feedback(
     }
 
 
+@router.get("/feedback/duplicates")
+async def find_duplicate_feedback(title: str, description: str = ""):
+    """Check for similar existing feedback before submitting."""
+    duplicates = _possible_duplicates(title, description)
+    return {
+        "possible_duplicates": duplicates,
+        "total": len(duplicates),
+    }
+
+
 @router.get("/feedback/{feedback_id}")
 async def get_feedback(feedback_id: str):
     """Get a single feedback item with comments."""
@@ -795,6 +836,7 @@ async def create_feedback(user_id: str, request: FeedbackCreateRequest):
     ai_category = _triage_category(request.title, request.description)
     ai_priority = _triage_priority(request.feedback_type, request.description)
     ai_summary = _generate_summary(request.description)
+    duplicates = _possible_duplicates(request.title, request.description)
     
     feedback = {
         "id": feedback_id,
@@ -806,6 +848,7 @@ async def create_feedback(user_id: str, request: FeedbackCreateRequest):
         "ai_category": ai_category,
         "ai_priority": ai_priority,
         "ai_summary": ai_summary,
+        "ai_similar_items": [d["id"] for d in duplicates],
         "ai_triaged_at": datetime.utcnow().isoformat(),
         "status": "open",
         "upvotes": 0,
@@ -814,12 +857,18 @@ async def create_feedback(user_id: str, request: FeedbackCreateRequest):
         "updated_at": datetime.utcnow().isoformat(),
     }
     
-    feedback_items[feedback_id] = feedback
-    feedback_votes[feedback_id] = {}
-    feedback_comments[feedback_id] = []
+    store.add_feedback(feedback)
+    feedback_index.add(feedback)
+    
+    # Similarity is symmetric: link the new item from its matches too
+    for duplicate in duplicates:
+        match = feedback_items[duplicate["id"]]
+        match["ai_similar_items"] = (match.get("ai_similar_items") or []) + [feedback_id]
+        store.touch_feedback(duplicate["id"])
     
     return {
         "feedback": feedback,
+        "possible_duplicates": duplicates,
         "message": "Thank you for your feedback! Our AI has categorized it and the community can now vote and comment.",
     }
 
@@ -845,7 +894,6 @@ async def vote_feedback(feedback_id: str, user_id: str, request: FeedbackVoteReq
     
     if previous_vote == request.vote:
         # Remove vote
-        votes.pop(user_id, None)
         if request.vote == 1:
             feedback["upvotes"] -= 1
         else:
@@ -863,9 +911,12 @@ async def vote_feedback(feedback_id: str, user_id: str, request: FeedbackVoteReq
         else:
             feedback["downvotes"] += 1
         
-        votes[user_id] = request.vote
         new_vote = request.vote
     
+    feedback["updated_at"] = datetime.utcnow().isoformat()
+    store.set_feedback_vote(feedback_id, user_id, new_vote)
+    feedback_index.update_score(feedback_id, feedback["upvotes"] - feedback["downvotes"])
+    
     return {
         "feedback_id": feedback_id,
         "your_vote": new_vote,
@@ -886,7 +937,6 @@ async def add_comment(feedback_id: str, user_id: str, request: FeedbackCommentRe
         raise HTTPException(status_code=404, detail="Feedback not found")
     
     user = sim_users[user_id]
-    comments = feedback_comments[feedback_id]
     
     comment_id = f"cmt-{str(uuid4())[:8]}"
     
@@ -901,7 +951,7 @@ async def add_comment(feedback_id: str, user_id: str, request: FeedbackCommentRe
         "created_at": datetime.utcnow().isoformat(),
     }
     
-    comments.append(comment)
+    store.add_comment(feedback_id, comment)
     
     return {
         "comment": comment,
@@ -928,22 +978,24 @@ async def list_comments(feedback_id: str):
 # AI Triage Helper Functions (Mock for Demo)
 # ============================================
 
+# First matching category wins (substring match, one compiled scan each)
+_CATEGORY_KEYWORDS = [
+    ("ui", re.compile("ui|button|page|display|screen|image|layout")),
+    ("api", re.compile("api|endpoint|request|response|server")),
+    ("trading", re.compile("trade|buy|sell|token|portfolio|dividend")),
+    ("governance", re.compile("vote|proposal|governance|dao")),
+    ("docs", re.compile("docs|documentation|help|guide")),
+]
+
+
 def _triage_category(title: str, description: str) -> str:
     """Simple keyword-based categorization for demo."""
     text = (title + " " + description).lower()
     
-    if any(word in text for word in ["ui", "button", "page", "display", "screen", "image", "layout"]):
-        return "ui"
-    elif any(word in text for word in ["api", "endpoint", "request", "response", "server"]):
-        return "api"
-    elif any(word in text for word in ["trade", "buy", "sell", "token", "portfolio", "dividend"]):
-        return "trading"
-    elif any(word in text for word in ["vote", "proposal", "governance", "dao"]):
-        return "governance"
-    elif any(word in text for word in ["docs", "documentation", "help", "guide"]):
-        return "docs"
-    else:
-        return "general"
+    for category, keywords in _CATEGORY_KEYWORDS:
+        if keywords.search(text):
+            return category
+    return "general"
 
 
 def _triage_priority(feedback_type: str, description: str) -> str:
@@ -0,0 +1,249 @@
+"""
+OSF Demo - Response Compression
+Content negotiation, compressors and byte counters shared by the
+compression middleware, the response cache and static file serving
+
+Brotli is used when the brotli package is installed and the client accepts
+it; otherwise gzip.
+"""
+
+import gzip
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional
+
+from starlette.responses import FileResponse
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Preferred first
+ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+
+# Sibling file suffix for each encoding (viewer.html -> viewer.html.br)
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Dynamic responses favour speed; precompressed files are done once, so max out
+DYNAMIC_LEVEL = {"br": 4, "gzip": 6}
+STATIC_LEVEL = {"br": 11, "gzip": 9}
+
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/x-ndjson",
+    "image/svg+xml",
+)
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    """Text-like types; images, archives and SSE streams are left alone."""
+    if not content_type:
+        return False
+    content_type = content_type.split(";", 1)[0].strip().lower()
+    return content_type != "text/event-stream" and content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+def negotiate(accept_encoding: Optional[str], available: Iterable[str] = ENCODINGS) -> Optional[str]:
+    """The preferred encoding the client accepts (q > 0), if any."""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+    for encoding in available:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """
+    The strong ETag of an encoded representation: '"<tag>-br"'.
+
+    Byte-different representations need different strong validators;
+    weak tags already compare equal across encodings and are kept.
+    """
+    if not encoding or etag.startswith("W/") or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for it)."""
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == opaque:
+            return True
+    return False
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """One-shot compression of a whole body."""
+    level = DYNAMIC_LEVEL[encoding] if level is None else level
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+class StreamCompressor:
+    """
+    Incremental compressor for bodies sent in several chunks.
+
+    Each chunk is flushed, so whatever the app has sent reaches the client
+    without waiting for more data (at a small cost in ratio).
+    """
+
+    def __init__(self, encoding: str, level: Optional[int] = None):
+        level = DYNAMIC_LEVEL[encoding] if level is None else level
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish() if self.encoding == "br" else self._compressor.flush()
+
+
+def precompress_file(path: Path, encodings: Iterable[str] = ENCODINGS) -> Dict[str, Path]:
+    """
+    Write .br/.gz siblings of a file at maximum level (skipped if up to date,
+    or if compression would not make the file smaller). Returns the siblings.
+
+    Slow (brotli quality 11): run at startup or from
+    scripts/precompress_static.py, never per request. Each sibling is written
+    then renamed, and gets the mtime the source had when it was read, so a
+    source changed meanwhile leaves the sibling stale rather than served.
+    """
+    siblings = {}
+    data = None
+    source = path.stat()
+    for encoding in encodings:
+        sibling = path.with_name(path.name + SUFFIXES[encoding])
+        if sibling.exists() and sibling.stat().st_mtime >= source.st_mtime:
+            siblings[encoding] = sibling
+            continue
+        if data is None:
+            data = path.read_bytes()
+        compressed = compress(data, encoding, STATIC_LEVEL[encoding])
+        if len(compressed) < len(data):
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(compressed)
+                os.utime(tmp, ns=(source.st_atime_ns, source.st_mtime_ns))
+                os.replace(tmp, sibling)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            siblings[encoding] = sibling
+    return siblings
+
+
+def precompressed_sibling(path: Path, accept_encoding: Optional[str]) -> Optional[tuple]:
+    """(encoding, sibling path) for the best up-to-date sibling the client accepts."""
+    available = []
+    for encoding in ENCODINGS:
+        sibling = path.with_name(path.name + SUFFIXES[encoding])
+        try:
+            if sibling.stat().st_mtime >= path.stat().st_mtime:
+                available.append(encoding)
+        except OSError:
+            continue
+    encoding = negotiate(accept_encoding, available)
+    if encoding is None:
+        return None
+    return encoding, path.with_name(path.name + SUFFIXES[encoding])
+
+
+def precompressed_file_response(
+    path: Path,
+    request_headers: Mapping[str, str],
+    media_type: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> FileResponse:
+    """
+    FileResponse for path, served from its .br/.gz sibling when the client
+    accepts that encoding (the sibling is sent as-is, no work per request).
+    """
+    headers = dict(headers or {})
+    if is_compressible(media_type):
+        headers["Vary"] = "Accept-Encoding"
+    match = precompressed_sibling(path, request_headers.get("accept-encoding"))
+    if match is None:
+        return FileResponse(path, media_type=media_type, headers=headers)
+
+    encoding, sibling = match
+    get_compression_stats().record("static", encoding, path.stat().st_size, sibling.stat().st_size)
+    headers["Content-Encoding"] = encoding
+    return FileResponse(sibling, media_type=media_type, headers=headers)
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+class CompressionStats:
+    """Bytes before and after compression, by source (dynamic, cache, static)."""
+
+    def __init__(self):
+        self._sources: Dict[str, Dict[str, int]] = {}
+        self.skipped: Dict[str, int] = {}
+
+    def record(self, source: str, encoding: str, original: int, sent: int) -> None:
+        stats = self._sources.setdefault(source, {"responses": 0, "bytes_in": 0, "bytes_out": 0})
+        stats["responses"] += 1
+        stats["bytes_in"] += original
+        stats["bytes_out"] += sent
+        stats[encoding] = stats.get(encoding, 0) + 1
+
+    def skip(self, reason: str) -> None:
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+
+    def get_metrics(self) -> dict:
+        sources = {}
+        for source, stats in self._sources.items():
+            saved = stats["bytes_in"] - stats["bytes_out"]
+            sources[source] = {
+                **stats,
+                "bytes_saved": saved,
+                "ratio": round(stats["bytes_out"] / stats["bytes_in"], 3) if stats["bytes_in"] else None,
+            }
+        return {
+            "encodings": list(ENCODINGS),
+            "sources": sources,
+            "bytes_saved": sum(s["bytes_saved"] for s in sources.values()),
+            "skipped": dict(self.skipped),
+        }
+
+
+_compression_stats: Optional[CompressionStats] = None
+
+
+def get_compression_stats() -> CompressionStats:
+    """Get the singleton compression counters."""
+    global _compression_stats
+    if _compression_stats is None:
+        _compression_stats = CompressionStats()
+    return _compression_stats
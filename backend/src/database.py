@@ -18,6 +18,15 @@ logger = structlog.get_logger()
 settings = get_settings()
 
 
+def _to_asyncpg_url(database_url: str) -> str:
+    """Convert postgres:// URLs to postgresql+asyncpg://."""
+    if database_url.startswith("postgres://"):
+        return database_url.replace("postgres://", "postgresql+asyncpg://", 1)
+    if database_url.startswith("postgresql://") and "+asyncpg" not in database_url:
+        return database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return database_url
+
+
 def get_database_url() -> str:
     """Get database URL, using SQLite for demo if PostgreSQL not available."""
     database_url = settings.database_url
@@ -33,14 +42,8 @@ def get_database_url() -> str:
         logger.info("database_using_sqlite", path=str(db_path))
         return sqlite_url
     
-    # Convert postgres:// to postgresql+asyncpg://
-    if database_url.startswith("postgres://"):
-        database_url = database_url.replace("postgres://", "postgresql+asyncpg://", 1)
-    elif database_url.startswith("postgresql://") and "+asyncpg" not in database_url:
-        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-    
     logger.info("database_using_postgresql")
-    return database_url
+    return _to_asyncpg_url(database_url)
 
 
 # Get appropriate database URL
@@ -63,13 +66,39 @@ else:
         max_overflow=10,
     )
 
-# Session factory
+# Read-only engine: replica if configured, otherwise the primary pool with
+# dialect hints so reads never open a write transaction.
+if is_sqlite:
+    # No BEGIN/COMMIT round trip; each statement runs on its own
+    read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+elif settings.database_replica_url:
+    read_engine = create_async_engine(
+        _to_asyncpg_url(settings.database_replica_url),
+        echo=settings.is_development,
+        pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=10,
+        execution_options={"postgresql_readonly": True},
+    )
+    logger.info("database_using_read_replica")
+else:
+    read_engine = engine.execution_options(postgresql_readonly=True)
+
+# Session factories
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+# Read-only sessions: never commit, never autoflush
+async_read_session = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 # Naming convention for constraints
 convention = {
     "ix": "ix_%(column_0_label)s",
@@ -100,6 +129,12 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for a read-only database session (no commit)."""
+    async with async_read_session() as session:
+        yield session
+
+
 async def init_db():
     """Initialize database - create all tables."""
     async with engine.begin() as conn:
@@ -109,5 +144,7 @@ async def init_db():
 
 async def close_db():
     """Close database connections."""
+    if read_engine.sync_engine.pool is not engine.sync_engine.pool:
+        await read_engine.dispose()
     await engine.dispose()
     logger.info("database_closed")
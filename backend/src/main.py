@@ -13,6 +13,7 @@ Core Features:
 - Mock blockchain for ownership tracking
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Optional
@@ -25,6 +26,7 @@ from pathlib import Path
 import structlog
 
 from src.config import get_settings
+from src.serialization import FastJSONResponse
 
 # Configure structured logging
 structlog.configure(
@@ -37,6 +39,9 @@ logger = structlog.get_logger()
 
 settings = get_settings()
 
+# Asset viewer page served at /viewer (precompressed at startup)
+VIEWER_PATH = "data/viewer.html"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -48,6 +53,44 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("database_ready")
     
+    # Fill chart rollups for snapshots written before the rollup existed
+    try:
+        from src.database import async_session
+        from src.repositories import NetworkRepository
+        async with async_session() as session:
+            await NetworkRepository(session).backfill_monthly_metrics()
+            await session.commit()
+    except Exception as e:
+        logger.error("monthly_metrics_backfill_failed", error=str(e))
+    
+    # Asset pools: import the pool files the first time the tables are empty
+    try:
+        from src.api.pool import import_pool_files
+        from src.services.pool_search import get_pool_search_index
+        imported = await import_pool_files(only_if_empty=True)
+        await get_pool_search_index().rebuild()
+        logger.info("asset_pools_ready", **imported)
+    except Exception as e:
+        logger.error("asset_pool_import_failed", error=str(e))
+    
+    # Pool image thumbnails are built on demand in worker processes
+    from src.services.image_derivatives import get_image_derivatives
+    logger.info("image_derivatives", formats=list(get_image_derivatives().formats))
+    
+    # .br/.gz siblings of the viewer page, served as-is by /viewer
+    if Path(VIEWER_PATH).exists():
+        try:
+            from src.compression import precompress_file
+            await asyncio.to_thread(precompress_file, Path(VIEWER_PATH))
+        except Exception as e:
+            logger.error("viewer_precompress_failed", error=str(e))
+    
+    # Simulation mode state (write-behind to the sim_* tables)
+    from src.api.simulation import load_simulation_state
+    from src.services.sim_store import get_sim_store
+    await load_simulation_state()
+    await get_sim_store().start()
+    
     # Startup - Initialize network clock and batch processor
     from src.services.network_clock import get_network_clock, ClockPreset, PendingAction
     from src.services.batch_processor import (
@@ -197,11 +240,15 @@ async def lifespan(app: FastAPI):
         # Persist to database
         processing_time_ms = int((time.time() - start_time) * 1000)
         try:
+            from src.services.event_retention import get_event_retention
             async with async_session() as session:
                 network_repo = NetworkRepository(session)
                 
+                # Month partitions (PostgreSQL) for this and next month's events
+                await get_event_retention().ensure_partitions(session, result.month + 1)
+                
                 # Create snapshot
-                await network_repo.create_snapshot(
+                snapshot = await network_repo.create_snapshot(
                     network_month=result.month,
                     total_properties=len(network_state.properties),
                     total_participants=len(network_state.participants),
@@ -240,6 +287,9 @@ async def lifespan(app: FastAPI):
                         data=event.to_dict(),
                     )
                 
+                # Chart rollup, committed atomically with the snapshot
+                await network_repo.record_monthly_metrics(snapshot)
+                
                 await session.commit()
                 logger.info("tick_state_persisted", 
                            month=result.month,
@@ -248,6 +298,23 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error("tick_persistence_failed", error=str(e))
         
+        # Move months outside the hot window to the archive
+        try:
+            from src.services.event_retention import get_event_retention
+            await get_event_retention().apply(result.month)
+        except Exception as e:
+            logger.error("event_retention_failed", error=str(e))
+        
+        # Push events and alerts to subscribed WebSocket clients
+        try:
+            from src.services.realtime import get_realtime_bus
+            await get_realtime_bus().publish_month(
+                events=result.events + [event.to_dict() for event in generated_events],
+                alerts=result.alerts,
+            )
+        except Exception as e:
+            logger.error("realtime_publish_failed", error=str(e))
+        
         logger.info("tick_handler_completed",
                    new_month=result.month,
                    events=len(result.events),
@@ -259,6 +326,24 @@ async def lifespan(app: FastAPI):
     # Register tick handler
     clock.on_tick(on_tick)
     
+    # Drop cached GET responses and governor/advisor answers once a month lands
+    from src.services.answer_cache import get_answer_cache
+    from src.services.news import get_news_service
+    from src.services.response_cache import get_response_cache
+    
+    async def on_clock_broadcast(event: str, data: dict):
+        if event == "month_completed":
+            get_response_cache().invalidate(event)
+            get_answer_cache().invalidate(event)
+            # Have the month's news ready before anyone asks
+            get_news_service().pregenerate(data["month"])
+    
+    clock.on_broadcast(on_clock_broadcast)
+    
+    # Clock topic for the multiplexed /ws socket
+    from src.services.realtime import get_realtime_bus
+    clock.on_broadcast(get_realtime_bus().on_clock)
+    
     # Default to DEMO preset (5 min), can be changed via API
     # For testing, use: POST /api/v1/network/clock/preset {"preset": "test"}
     await clock.start()
@@ -266,10 +351,20 @@ async def lifespan(app: FastAPI):
                preset=clock.config.preset.value,
                interval=clock.config.interval_seconds)
     
+    # Gemini client is created on first use; optionally do it now, off the startup path
+    from src.ai.client import close_genai_client, warm_up
+    if settings.ai_warmup:
+        app.state.ai_warmup = asyncio.create_task(warm_up())
+    
     yield
     
-    # Shutdown - Stop the clock and close database
+    # Shutdown - Stop the clock, flush simulation state, stop thumbnail workers, close the Gemini client and database
     await clock.stop()
+    await get_sim_store().stop()
+    get_image_derivatives().shutdown()
+    if settings.ai_warmup:
+        app.state.ai_warmup.cancel()
+    await close_genai_client()
     await close_db()
     logger.info("shutting_down_ospf_demo")
 
@@ -309,6 +404,7 @@ One AI Core (powered by Gemini) that adapts to any asset class while sharing:
     """,
     version=settings.app_version,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS - Allow frontend access
@@ -327,6 +423,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Retry-After"],
 )
 
 # Error handling middleware
@@ -337,24 +434,17 @@ setup_error_handlers(app)
 # ============================================
 # Security Middleware
 # ============================================
-@app.middleware("http")
-async def api_key_middleware(request: Request, call_next):
-    """Check API key for protected endpoints."""
-    # Public endpoints
-    public_paths = ["/", "/health", "/docs", "/openapi.json", "/redoc"]
-    if request.url.path in public_paths:
-        return await call_next(request)
-    
-    # Check API key if required
-    if settings.require_api_key:
-        api_key = request.headers.get("X-API-Key")
-        if api_key != settings.api_secret_key:
-            return JSONResponse(
-                status_code=403,
-                content={"detail": "Invalid or missing API key"}
-            )
-    
-    return await call_next(request)
+# Pure ASGI (no BaseHTTPMiddleware) so SSE streams pass through untouched
+from src.middleware import ApiKeyMiddleware
+app.add_middleware(
+    ApiKeyMiddleware,
+    api_key=settings.api_secret_key,
+    enabled=settings.require_api_key,
+)
+
+# Brotli/gzip for JSON and text; SSE streams and images pass through untouched
+from src.middleware import CompressionMiddleware
+app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_min_size)
 
 
 # ============================================
@@ -406,6 +496,13 @@ async def health():
     }
 
 
+@app.get("/api/v1/compression/metrics", tags=["Info"])
+async def compression_metrics():
+    """Bytes saved by response compression (dynamic, stream, cache, static)."""
+    from src.compression import get_compression_stats
+    return get_compression_stats().get_metrics()
+
+
 # ============================================
 # API Routes
 # ============================================
@@ -419,6 +516,7 @@ from src.api.clock import router as clock_router
 from src.api.network import router as network_router
 from src.api.pool import router as pool_router
 from src.api.participant import router as participant_router
+from src.api.realtime import router as realtime_router
 from src.auth import auth_router
 
 # Auth routes (no prefix - /auth/*)
@@ -433,6 +531,11 @@ app.include_router(clock_router, prefix="/api/v1", tags=["Network Clock"])
 app.include_router(network_router, prefix="/api/v1", tags=["Network State & Agents"])
 app.include_router(pool_router, prefix="/api/v1", tags=["Asset Pools"])
 app.include_router(participant_router, prefix="/api/v1", tags=["Participants"])
+app.include_router(realtime_router, prefix="/api/v1", tags=["Realtime"])
+
+# Content-addressed pool images (immutable, Range-capable)
+from src.services.asset_store import ASSET_URL_PREFIX, get_asset_store
+app.mount(ASSET_URL_PREFIX, get_asset_store().static_app(), name="assets")
 
 
 # ============================================
@@ -440,11 +543,13 @@ app.include_router(participant_router, prefix="/api/v1", tags=["Participants"])
 # ============================================
 
 @app.get("/viewer")
-async def asset_viewer():
-    """Serve the asset viewer HTML page."""
-    viewer_path = Path("data/viewer.html")
+async def asset_viewer(request: Request):
+    """Serve the asset viewer HTML page (precompressed when the client accepts it)."""
+    from src.compression import precompressed_file_response
+    
+    viewer_path = Path(VIEWER_PATH)
     if viewer_path.exists():
-        return FileResponse(viewer_path, media_type="text/html")
+        return precompressed_file_response(viewer_path, request.headers, media_type="text/html")
     return JSONResponse({"error": "Viewer not found"}, status_code=404)
 
 
@@ -501,7 +606,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         content={
             "error": exc.detail,
             "status_code": exc.status_code,
-        }
+        },
+        headers=getattr(exc, "headers", None),
     )
 
 
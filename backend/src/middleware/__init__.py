@@ -2,6 +2,8 @@
 OSF Demo - Middleware
 """
 
+from src.middleware.api_key import ApiKeyMiddleware, PUBLIC_PATHS, PUBLIC_PREFIXES
+from src.middleware.compression import CompressionMiddleware, ROUTE_MIN_SIZES
 from src.middleware.error_handler import (
     ErrorHandlerMiddleware,
     RequestLoggingMiddleware,
@@ -9,6 +11,11 @@ from src.middleware.error_handler import (
 )
 
 __all__ = [
+    "ApiKeyMiddleware",
+    "PUBLIC_PATHS",
+    "PUBLIC_PREFIXES",
+    "CompressionMiddleware",
+    "ROUTE_MIN_SIZES",
     "ErrorHandlerMiddleware",
     "RequestLoggingMiddleware",
     "setup_error_handlers",
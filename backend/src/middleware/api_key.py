@@ -0,0 +1,58 @@
+"""
+API Key Middleware
+Require X-API-Key on non-public HTTP endpoints
+"""
+
+from typing import Iterable
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Endpoints reachable without an API key
+PUBLIC_PATHS = frozenset({"/", "/health", "/docs", "/openapi.json", "/redoc"})
+
+# Path prefixes reachable without an API key (<img> tags cannot send headers)
+PUBLIC_PREFIXES = ("/assets/",)
+
+
+class ApiKeyMiddleware:
+    """
+    Check the API key for protected endpoints (pure ASGI).
+
+    Only HTTP requests are checked; the /ws endpoint validates its own key.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        api_key: str,
+        enabled: bool = True,
+        public_paths: Iterable[str] = PUBLIC_PATHS,
+        public_prefixes: Iterable[str] = PUBLIC_PREFIXES,
+    ):
+        self.app = app
+        self.api_key = api_key
+        self.enabled = enabled
+        self.public_paths = frozenset(public_paths)
+        self.public_prefixes = tuple(public_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            not self.enabled
+            or scope["type"] != "http"
+            or scope["path"] in self.public_paths
+            or scope["path"].startswith(self.public_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if Headers(scope=scope).get("x-api-key") != self.api_key:
+            response = JSONResponse(
+                status_code=403,
+                content={"detail": "Invalid or missing API key"}
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
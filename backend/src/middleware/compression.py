@@ -0,0 +1,167 @@
+"""
+Compression Middleware
+Brotli/gzip for JSON and other text responses, with per-route size thresholds
+"""
+
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.compression import (
+    StreamCompressor, compress, encoded_etag, get_compression_stats, is_compressible, negotiate,
+)
+
+# Smallest body worth compressing, by path prefix (longest match wins).
+# Polled endpoints with large pages compress from a lower size.
+# Full mounted paths; tests/test_compression.py checks each matches a route.
+ROUTE_MIN_SIZES: Dict[str, int] = {
+    "/api/v1/network/history/": 512,
+    "/api/v1/network/clock/pending-actions": 512,
+    "/api/v1/pool/": 512,
+    "/api/v1/sim/feedback": 512,
+}
+
+
+class CompressionMiddleware:
+    """
+    Compress responses the client accepts an encoding for (pure ASGI).
+
+    - Responses that already have a Content-Encoding (cached month responses,
+      precompressed files) and non-text types are passed through.
+    - A body sent in one message is compressed if it reaches the route's
+      minimum size and compression makes it smaller.
+    - A body sent in several messages is compressed chunk by chunk, each chunk
+      flushed, so nothing is held back. SSE (text/event-stream) is never
+      compressed.
+    - A strong ETag on a compressed response gets the encoding appended.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        route_minimum_sizes: Optional[Dict[str, int]] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        routes = ROUTE_MIN_SIZES if route_minimum_sizes is None else route_minimum_sizes
+        # Longest prefix first
+        self.routes = sorted(routes.items(), key=lambda item: -len(item[0]))
+
+    def minimum_size_for(self, path: str) -> int:
+        for prefix, size in self.routes:
+            if path.startswith(prefix):
+                return size
+        return self.minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingSend(send, encoding, self.minimum_size_for(scope["path"]))
+        await self.app(scope, receive, responder)
+
+
+class _CompressingSend:
+    """send() wrapper for one response."""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.stats = get_compression_stats()
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.stream: Optional[StreamCompressor] = None
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    async def __call__(self, message: Message):
+        if message["type"] == "http.response.start":
+            self._on_start(message)
+            if self.passthrough:
+                await self.send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is not None:
+            await self._send_chunk(body, more_body)
+            return
+
+        if not more_body:
+            await self._send_whole(body)
+            return
+
+        # First of several chunks: stream-compress from here on
+        headers = MutableHeaders(scope=self.start)
+        del headers["content-length"]
+        self._mark_encoded(headers)
+        self.stream = StreamCompressor(self.encoding)
+        await self.send(self.start)
+        await self._send_chunk(body, more_body)
+
+    def _on_start(self, message: Message) -> None:
+        self.start = message
+        headers = Headers(raw=message["headers"])
+        status = message["status"]
+        content_length = headers.get("content-length")
+
+        if "content-encoding" in headers:
+            self.passthrough = True
+        elif status < 200 or status in (204, 206, 304):
+            self.passthrough = True
+        elif not is_compressible(headers.get("content-type")):
+            self.passthrough = True
+        elif content_length is not None and int(content_length) < self.minimum_size:
+            self.passthrough = True
+            self.stats.skip("below_threshold")
+
+    def _mark_encoded(self, headers: MutableHeaders) -> None:
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "etag" in headers:
+            headers["etag"] = encoded_etag(headers["etag"], self.encoding)
+
+    async def _send_whole(self, body: bytes) -> None:
+        if len(body) < self.minimum_size:
+            self.stats.skip("below_threshold")
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": body})
+            return
+
+        compressed = compress(body, self.encoding)
+        if len(compressed) >= len(body):
+            self.stats.skip("incompressible")
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": body})
+            return
+
+        headers = MutableHeaders(scope=self.start)
+        headers["content-length"] = str(len(compressed))
+        self._mark_encoded(headers)
+        self.stats.record("dynamic", self.encoding, len(body), len(compressed))
+        await self.send(self.start)
+        await self.send({"type": "http.response.body", "body": compressed})
+
+    async def _send_chunk(self, body: bytes, more_body: bool) -> None:
+        data = self.stream.compress(body) if body else b""
+        if not more_body:
+            data += self.stream.finish()
+        self.bytes_in += len(body)
+        self.bytes_out += len(data)
+        if not more_body:
+            self.stats.record("stream", self.encoding, self.bytes_in, self.bytes_out)
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
@@ -5,26 +5,54 @@ Comprehensive error handling for the OSF Demo API
 
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import structlog
+import time
 import traceback
-from typing import Callable
 
 logger = structlog.get_logger()
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Global error handling middleware."""
+class ErrorHandlerMiddleware:
+    """
+    Global error handling middleware (pure ASGI).
     
-    async def dispatch(self, request: Request, call_next: Callable):
-        try:
-            response = await call_next(request)
-            return response
+    Errors raised before the response starts are turned into JSON error
+    responses; once a response has started (e.g. an SSE stream) the error
+    is re-raised, since its status line has already been sent.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
         
-        except HTTPException as e:
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            if response_started:
+                raise
+            response = self._error_response(scope["path"], e)
+            await response(scope, receive, send)
+    
+    @staticmethod
+    def _error_response(path: str, e: Exception) -> JSONResponse:
+        if isinstance(e, HTTPException):
             # Pass through HTTP exceptions
             logger.warning("http_exception",
-                          path=request.url.path,
+                          path=path,
                           status=e.status_code,
                           detail=e.detail)
             return JSONResponse(
@@ -36,10 +64,10 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                 }
             )
         
-        except ValueError as e:
+        if isinstance(e, ValueError):
             # Validation errors
             logger.warning("validation_error",
-                          path=request.url.path,
+                          path=path,
                           error=str(e))
             return JSONResponse(
                 status_code=400,
@@ -51,10 +79,10 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                 }
             )
         
-        except ConnectionError as e:
+        if isinstance(e, ConnectionError):
             # Database or external service connection errors
             logger.error("connection_error",
-                        path=request.url.path,
+                        path=path,
                         error=str(e))
             return JSONResponse(
                 status_code=503,
@@ -66,56 +94,65 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                 }
             )
         
-        except Exception as e:
-            # Unexpected errors
-            error_id = id(e)  # Unique identifier for this error
-            logger.error("unhandled_exception",
-                        path=request.url.path,
-                        error=str(e),
-                        error_type=type(e).__name__,
-                        error_id=error_id,
-                        traceback=traceback.format_exc())
-            
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "error": True,
-                    "message": "An unexpected error occurred",
-                    "status_code": 500,
-                    "error_type": "internal",
-                    "error_id": error_id,
-                }
-            )
+        # Unexpected errors
+        error_id = id(e)  # Unique identifier for this error
+        logger.error("unhandled_exception",
+                    path=path,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    error_id=error_id,
+                    traceback=traceback.format_exc())
+        
+        return JSONResponse(
+            status_code=500,
+            content={
+                "error": True,
+                "message": "An unexpected error occurred",
+                "status_code": 500,
+                "error_type": "internal",
+                "error_id": error_id,
+            }
+        )
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Log all requests for debugging."""
+class RequestLoggingMiddleware:
+    """Log all requests for debugging (pure ASGI)."""
     
-    async def dispatch(self, request: Request, call_next: Callable):
-        import time
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
         start_time = time.time()
+        method = scope["method"]
+        path = scope["path"]
         
         # Log request
         logger.debug("request_started",
-                    method=request.method,
-                    path=request.url.path,
-                    query=str(request.query_params))
-        
-        response = await call_next(request)
-        
-        # Log response
-        duration_ms = int((time.time() - start_time) * 1000)
-        logger.debug("request_completed",
-                    method=request.method,
-                    path=request.url.path,
-                    status=response.status_code,
-                    duration_ms=duration_ms)
+                    method=method,
+                    path=path,
+                    query=scope.get("query_string", b"").decode("latin-1"))
         
-        # Add timing header
-        response.headers["X-Response-Time"] = f"{duration_ms}ms"
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                duration_ms = int((time.time() - start_time) * 1000)
+                
+                # Log response
+                logger.debug("request_completed",
+                            method=method,
+                            path=path,
+                            status=message["status"],
+                            duration_ms=duration_ms)
+                
+                # Add timing header
+                headers = MutableHeaders(scope=message)
+                headers["X-Response-Time"] = f"{duration_ms}ms"
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_wrapper)
 
 
 def setup_error_handlers(app):
@@ -21,9 +21,16 @@ from src.models.network import (
     PendingAction,
     NetworkSnapshot,
     NetworkEvent,
+    NetworkMetricsMonthly,
+    MonthlyNews,
     PropertyState,
 )
 
+from src.models.pool import (
+    PoolProperty,
+    PoolAvatar,
+)
+
 __all__ = [
     # Simulation models
     "SimUser",
@@ -42,5 +49,10 @@ __all__ = [
     "PendingAction",
     "NetworkSnapshot",
     "NetworkEvent",
+    "NetworkMetricsMonthly",
+    "MonthlyNews",
     "PropertyState",
+    # Asset pool models
+    "PoolProperty",
+    "PoolAvatar",
 ]
@@ -8,7 +8,7 @@ from decimal import Decimal
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import String, Numeric, DateTime, ForeignKey, Integer, Text, Boolean, JSON
+from sqlalchemy import String, Numeric, DateTime, ForeignKey, Integer, Text, Boolean, JSON, Index, DDL, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database import Base
@@ -17,6 +17,10 @@ from src.database import Base
 class Participant(Base):
     """Network participant - can be human user or NPC."""
     __tablename__ = "participants"
+    __table_args__ = (
+        # Keyset pagination
+        Index("ix_participants_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     
@@ -121,11 +125,11 @@ class NetworkSnapshot(Base):
     dividends_paid: Mapped[Decimal] = mapped_column(Numeric(15, 2), default=Decimal("0"))
     rent_collected: Mapped[Decimal] = mapped_column(Numeric(15, 2), default=Decimal("0"))
     
-    # Full state snapshot (for recovery/replay)
-    full_state: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Full state snapshot (for recovery/replay) - large, loaded only on access
+    full_state: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, deferred=True)
     
-    # Gemini batch response
-    batch_response: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Gemini batch response - large, loaded only on access
+    batch_response: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, deferred=True)
     governor_summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Timestamps
@@ -136,11 +140,18 @@ class NetworkSnapshot(Base):
 class NetworkEvent(Base):
     """Events generated during simulation."""
     __tablename__ = "network_events"
+    __table_args__ = (
+        # Keyset pagination and per-month filters
+        Index("ix_network_events_created_at_id", "created_at", "id"),
+        Index("ix_network_events_network_month", "network_month"),
+        # PostgreSQL: one partition per month, see services/event_retention.py
+        {"postgresql_partition_by": "RANGE (network_month)"},
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
     
-    # Event details
-    network_month: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Event details (network_month is part of the key so PostgreSQL can partition on it)
+    network_month: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
     event_type: Mapped[str] = mapped_column(String(50), nullable=False)  # trade, dividend, rent, governance, market, maintenance
     severity: Mapped[str] = mapped_column(String(20), default="info")  # info, warning, alert, critical
     
@@ -152,13 +163,60 @@ class NetworkEvent(Base):
     participant_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
     property_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
     
-    # Event data
-    data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Event data - loaded only on access
+    data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True, deferred=True)
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
 
+# Catch-all partition so inserts never fail before a month partition exists
+event.listen(
+    NetworkEvent.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS network_events_default "
+        "PARTITION OF network_events DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
+class NetworkMetricsMonthly(Base):
+    """Narrow per-month rollup for charts, written with each snapshot."""
+    __tablename__ = "network_metrics_monthly"
+
+    network_month: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    
+    # Totals and averages (copied from the snapshot)
+    total_properties: Mapped[int] = mapped_column(Integer, default=0)
+    total_participants: Mapped[int] = mapped_column(Integer, default=0)
+    total_valuation: Mapped[Decimal] = mapped_column(Numeric(18, 2), default=Decimal("0"))
+    total_tokens_issued: Mapped[Decimal] = mapped_column(Numeric(18, 8), default=Decimal("0"))
+    avg_token_price: Mapped[Decimal] = mapped_column(Numeric(10, 4), default=Decimal("1.00"))
+    avg_yield: Mapped[Decimal] = mapped_column(Numeric(5, 2), default=Decimal("4.2"))
+    actions_processed: Mapped[int] = mapped_column(Integer, default=0)
+    tokens_traded: Mapped[Decimal] = mapped_column(Numeric(18, 8), default=Decimal("0"))
+    dividends_paid: Mapped[Decimal] = mapped_column(Numeric(15, 2), default=Decimal("0"))
+    rent_collected: Mapped[Decimal] = mapped_column(Numeric(15, 2), default=Decimal("0"))
+    
+    # Event counts for the month
+    event_count: Mapped[int] = mapped_column(Integer, default=0)
+    events_by_type: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # {"market": 3, ...}
+    events_by_severity: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # {"info": 5, ...}
+    
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class MonthlyNews(Base):
+    """Generated news article for a completed month (written once, then served)."""
+    __tablename__ = "monthly_news"
+
+    network_month: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    article: Mapped[str] = mapped_column(Text, nullable=False)
+    events: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)  # Events the article covers
+    generated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 class PropertyState(Base):
     """Current state of a property in the network."""
     __tablename__ = "property_states"
@@ -0,0 +1,53 @@
+"""
+OSF Asset Pool Models
+Pre-generated properties and avatars (imported from the pool JSON files)
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, Integer, Text, JSON, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+
+
+class PoolProperty(Base):
+    """A pre-generated property waiting in (or released from) the pool."""
+    __tablename__ = "pool_properties"
+    __table_args__ = (
+        # /pool/properties?status=&suburb= and enable-next, in pool order
+        Index("ix_pool_properties_status_suburb_position", "status", "suburb", "position"),
+        Index("ix_pool_properties_suburb_position", "suburb", "position"),
+    )
+
+    id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, nullable=False, unique=True)  # Order in the pool file
+
+    status: Mapped[str] = mapped_column(String(20), default="draft")  # draft, available, ...
+    enabled_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # Filterable copies of fields in data
+    suburb: Mapped[str] = mapped_column(String(100), default="")
+    address: Mapped[str] = mapped_column(String(255), default="")
+    property_type: Mapped[str] = mapped_column(String(50), default="", index=True)
+    bedrooms: Mapped[int] = mapped_column(Integer, default=0, index=True)
+    bathrooms: Mapped[int] = mapped_column(Integer, default=0)
+    valuation: Mapped[int] = mapped_column(Integer, default=0, index=True)
+
+    data: Mapped[dict] = mapped_column(JSON, default=dict)
+    listing: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    images: Mapped[dict] = mapped_column(JSON, default=dict)  # name -> asset URL
+
+    imported_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class PoolAvatar(Base):
+    """A pre-generated avatar image for a participant or service role."""
+    __tablename__ = "pool_avatars"
+
+    role: Mapped[str] = mapped_column(String(100), primary_key=True)
+    category: Mapped[str] = mapped_column(String(20), default="participant", index=True)  # participant, service
+    image: Mapped[str] = mapped_column(Text, nullable=False)  # Asset URL (or legacy data URL)
+
+    imported_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
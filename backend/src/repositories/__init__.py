@@ -6,9 +6,11 @@ Database access patterns for simulation state
 from src.repositories.participant import ParticipantRepository
 from src.repositories.network import NetworkRepository
 from src.repositories.property import PropertyStateRepository
+from src.repositories.pool import PoolRepository
 
 __all__ = [
     "ParticipantRepository",
     "NetworkRepository",
     "PropertyStateRepository",
+    "PoolRepository",
 ]
@@ -0,0 +1,45 @@
+"""
+Sparse Fieldsets
+Map a fields= selection to the columns a query loads
+"""
+
+from typing import Any, Iterable, List, Optional, Sequence
+
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when a fields= selection names an unknown field."""
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str], default: Sequence[str]) -> List[str]:
+    """
+    Field names from a comma-separated fields= value, in the given order.
+
+    None or an empty value means the default selection.
+    """
+    if not fields or not fields.strip():
+        return list(default)
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    allowed = list(allowed)
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise InvalidFieldsError(
+            f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(allowed)}"
+        )
+    return names
+
+
+def load_columns(query: Select, model: Any, columns: Optional[Iterable[str]], always: Sequence[str] = ()) -> Select:
+    """
+    Load only these columns (plus always, e.g. the cursor key); None loads the
+    model's default columns.
+
+    Requested deferred columns are loaded; anything else raises on access
+    instead of issuing a lazy load.
+    """
+    if columns is None:
+        return query
+    names = dict.fromkeys([*always, *columns])
+    return query.options(load_only(*(getattr(model, name) for name in names), raiseload=True))
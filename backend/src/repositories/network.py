@@ -5,14 +5,16 @@ CRUD operations for network state, snapshots, and events
 
 from decimal import Decimal
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from uuid import uuid4
 
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
-from src.models.network import NetworkSnapshot, NetworkEvent
+from src.models.network import NetworkSnapshot, NetworkEvent, NetworkMetricsMonthly, MonthlyNews
+from src.repositories.fieldsets import load_columns
+from src.repositories.pagination import after_created, created_order, cursor_month
 
 logger = structlog.get_logger()
 
@@ -91,14 +93,24 @@ class NetworkRepository:
         from_month: Optional[int] = None,
         to_month: Optional[int] = None,
         limit: int = 12,
+        cursor: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[NetworkSnapshot]:
-        """Get snapshots with optional range filter."""
-        query = select(NetworkSnapshot)
+        """
+        Get snapshots (newest first) with optional range filter and cursor.
+        
+        columns limits the columns read (including deferred ones such as
+        full_state); None reads the default, non-deferred columns.
+        """
+        query = load_columns(select(NetworkSnapshot), NetworkSnapshot, columns, always=("network_month",))
         
         if from_month is not None:
             query = query.where(NetworkSnapshot.network_month >= from_month)
         if to_month is not None:
             query = query.where(NetworkSnapshot.network_month <= to_month)
+        before_month = cursor_month(cursor)
+        if before_month is not None:
+            query = query.where(NetworkSnapshot.network_month < before_month)
         
         query = query.order_by(NetworkSnapshot.network_month.desc()).limit(limit)
         result = await self.session.execute(query)
@@ -150,9 +162,11 @@ class NetworkRepository:
         event_type: Optional[str] = None,
         severity: Optional[str] = None,
         limit: int = 50,
+        cursor: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[NetworkEvent]:
-        """Get events with optional filters."""
-        query = select(NetworkEvent)
+        """Get events (newest first) with optional filters, cursor and column selection."""
+        query = load_columns(select(NetworkEvent), NetworkEvent, columns, always=("created_at", "id"))
         
         if network_month is not None:
             query = query.where(NetworkEvent.network_month == network_month)
@@ -161,18 +175,18 @@ class NetworkRepository:
         if severity:
             query = query.where(NetworkEvent.severity == severity)
         
-        query = query.order_by(NetworkEvent.created_at.desc()).limit(limit)
+        query = after_created(query, NetworkEvent, cursor)
+        query = created_order(query, NetworkEvent).limit(limit)
         result = await self.session.execute(query)
         return list(result.scalars().all())
     
-    async def get_recent_events(self, limit: int = 20) -> List[NetworkEvent]:
+    async def get_recent_events(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> List[NetworkEvent]:
         """Get most recent events across all months."""
-        result = await self.session.execute(
-            select(NetworkEvent)
-            .order_by(NetworkEvent.created_at.desc())
-            .limit(limit)
-        )
-        return list(result.scalars().all())
+        return await self.get_events(limit=limit, cursor=cursor)
     
     async def count_events(
         self,
@@ -192,22 +206,135 @@ class NetworkRepository:
     # Metrics
     # =========================================================================
     
+    async def record_monthly_metrics(self, snapshot: NetworkSnapshot) -> NetworkMetricsMonthly:
+        """
+        Write the chart rollup for a snapshot's month.
+        
+        Call after the month's events are flushed and before commit, so the
+        rollup lands in the same transaction as the snapshot.
+        """
+        metrics = await self.session.get(NetworkMetricsMonthly, snapshot.network_month)
+        if metrics is None:
+            metrics = NetworkMetricsMonthly(network_month=snapshot.network_month)
+            self.session.add(metrics)
+        
+        metrics.total_properties = snapshot.total_properties
+        metrics.total_participants = snapshot.total_participants
+        metrics.total_valuation = snapshot.total_valuation
+        metrics.total_tokens_issued = snapshot.total_tokens_issued
+        metrics.avg_token_price = snapshot.avg_token_price
+        metrics.avg_yield = snapshot.avg_yield
+        metrics.actions_processed = snapshot.actions_processed
+        metrics.tokens_traded = snapshot.tokens_traded
+        metrics.dividends_paid = snapshot.dividends_paid
+        metrics.rent_collected = snapshot.rent_collected
+        await self._count_events(metrics)
+        
+        await self.session.flush()
+        return metrics
+    
+    async def refresh_event_counts(self, network_month: int) -> None:
+        """
+        Recount a month's events into its rollup row, if it has one.
+        
+        For events added after the month's tick (/events/generate); call
+        after they are flushed, before commit.
+        """
+        metrics = await self.session.get(NetworkMetricsMonthly, network_month)
+        if metrics is not None:
+            await self._count_events(metrics)
+            await self.session.flush()
+    
+    async def _count_events(self, metrics: NetworkMetricsMonthly) -> None:
+        result = await self.session.execute(
+            select(NetworkEvent.event_type, NetworkEvent.severity, func.count(NetworkEvent.id))
+            .where(NetworkEvent.network_month == metrics.network_month)
+            .group_by(NetworkEvent.event_type, NetworkEvent.severity)
+        )
+        by_type: dict = {}
+        by_severity: dict = {}
+        for event_type, severity, count in result.all():
+            by_type[event_type] = by_type.get(event_type, 0) + count
+            by_severity[severity] = by_severity.get(severity, 0) + count
+        metrics.event_count = sum(by_type.values())
+        metrics.events_by_type = by_type
+        metrics.events_by_severity = by_severity
+    
+    async def backfill_monthly_metrics(self) -> int:
+        """Build missing rollup rows from existing snapshots. Returns rows written."""
+        result = await self.session.execute(
+            select(NetworkSnapshot)
+            .outerjoin(
+                NetworkMetricsMonthly,
+                NetworkMetricsMonthly.network_month == NetworkSnapshot.network_month,
+            )
+            .where(NetworkMetricsMonthly.network_month.is_(None))
+            .order_by(NetworkSnapshot.network_month)
+        )
+        snapshots = list(result.scalars().all())
+        for snapshot in snapshots:
+            await self.record_monthly_metrics(snapshot)
+        if snapshots:
+            logger.info("monthly_metrics_backfilled", months=len(snapshots))
+        return len(snapshots)
+    
     async def get_metrics_history(
         self,
         months: int = 12,
     ) -> List[dict]:
-        """Get historical metrics from snapshots."""
-        snapshots = await self.get_snapshots(limit=months)
+        """Get historical metrics from the monthly rollup (oldest first)."""
+        result = await self.session.execute(
+            select(NetworkMetricsMonthly)
+            .order_by(NetworkMetricsMonthly.network_month.desc())
+            .limit(months)
+        )
+        rows = list(result.scalars().all())
         return [
             {
-                "month": s.network_month,
-                "total_properties": s.total_properties,
-                "total_participants": s.total_participants,
-                "total_valuation": float(s.total_valuation),
-                "avg_token_price": float(s.avg_token_price),
-                "avg_yield": float(s.avg_yield),
-                "actions_processed": s.actions_processed,
-                "dividends_paid": float(s.dividends_paid),
+                "month": m.network_month,
+                "total_properties": m.total_properties,
+                "total_participants": m.total_participants,
+                "total_valuation": float(m.total_valuation),
+                "avg_token_price": float(m.avg_token_price),
+                "avg_yield": float(m.avg_yield),
+                "actions_processed": m.actions_processed,
+                "dividends_paid": float(m.dividends_paid),
+                "rent_collected": float(m.rent_collected),
+                "event_count": m.event_count,
+                "events_by_type": m.events_by_type or {},
+                "events_by_severity": m.events_by_severity or {},
             }
-            for s in reversed(snapshots)
+            for m in reversed(rows)
         ]
+    
+    # =========================================================================
+    # News
+    # =========================================================================
+    
+    async def get_monthly_news(self, network_month: int) -> Optional[MonthlyNews]:
+        """Get the stored news article for a month."""
+        return await self.session.get(MonthlyNews, network_month)
+    
+    async def save_monthly_news(
+        self,
+        network_month: int,
+        article: str,
+        events: List[dict],
+    ) -> MonthlyNews:
+        """Store (or replace) a month's news article."""
+        news = await self.session.get(MonthlyNews, network_month)
+        if news is None:
+            news = MonthlyNews(network_month=network_month)
+            self.session.add(news)
+        news.article = article
+        news.events = events
+        news.generated_at = datetime.utcnow()
+        await self.session.flush()
+        return news
+    
+    async def delete_monthly_news(self, network_month: int) -> None:
+        """Remove a month's stored news article, if any."""
+        news = await self.session.get(MonthlyNews, network_month)
+        if news is not None:
+            await self.session.delete(news)
+            await self.session.flush()
@@ -0,0 +1,123 @@
+"""
+Keyset Pagination
+Opaque cursors for paging through ordered tables in constant time
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql import Select
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(values: dict) -> str:
+    """Encode keyset values as an opaque, URL-safe cursor."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if not isinstance(values, dict):
+        raise InvalidCursorError("Invalid cursor")
+    return values
+
+
+def next_cursor(rows: Sequence[Any], limit: int, key) -> Optional[str]:
+    """Cursor for the page after rows, or None if this was the last page."""
+    if not rows or len(rows) < limit:
+        return None
+    return encode_cursor(key(rows[-1]))
+
+
+# =============================================================================
+# (created_at, id) keyset
+# =============================================================================
+
+def created_key(row: Any) -> dict:
+    """Keyset values for a row ordered by (created_at, id)."""
+    return {"created_at": row.created_at.isoformat(), "id": row.id}
+
+
+def created_order(query: Select, model: Any, descending: bool = True) -> Select:
+    """Order a query by (created_at, id)."""
+    if descending:
+        return query.order_by(model.created_at.desc(), model.id.desc())
+    return query.order_by(model.created_at.asc(), model.id.asc())
+
+
+def after_created(
+    query: Select,
+    model: Any,
+    cursor: Optional[str],
+    descending: bool = True,
+) -> Select:
+    """Restrict a (created_at, id)-ordered query to rows after the cursor."""
+    if not cursor:
+        return query
+    values = decode_cursor(cursor)
+    try:
+        created_at = datetime.fromisoformat(values["created_at"])
+        row_id = str(values["id"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+    if descending:
+        return query.where(or_(
+            model.created_at < created_at,
+            and_(model.created_at == created_at, model.id < row_id),
+        ))
+    return query.where(or_(
+        model.created_at > created_at,
+        and_(model.created_at == created_at, model.id > row_id),
+    ))
+
+
+# =============================================================================
+# network_month keyset
+# =============================================================================
+
+def month_key(row: Any) -> dict:
+    """Keyset values for a row unique per network_month."""
+    return {"month": row.network_month}
+
+
+def cursor_month(cursor: Optional[str]) -> Optional[int]:
+    """network_month encoded in a cursor, if any."""
+    if not cursor:
+        return None
+    try:
+        return int(decode_cursor(cursor)["month"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+# =============================================================================
+# position keyset (unique integer ordering column)
+# =============================================================================
+
+def position_key(row: Any) -> dict:
+    """Keyset values for a row ordered by a unique position."""
+    return {"pos": row.position}
+
+
+def after_position(query: Select, model: Any, cursor: Optional[str]) -> Select:
+    """Restrict a position-ordered query to rows after the cursor."""
+    if not cursor:
+        return query
+    try:
+        position = int(decode_cursor(cursor)["pos"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    return query.where(model.position > position)
@@ -13,6 +13,7 @@ from sqlalchemy.orm import selectinload
 import structlog
 
 from src.models.network import Participant, ParticipantHolding, PendingAction
+from src.repositories.pagination import after_created, created_order
 
 logger = structlog.get_logger()
 
@@ -94,8 +95,9 @@ class ParticipantRepository:
         role: Optional[str] = None,
         is_active: bool = True,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Participant]:
-        """Get all participants with optional filters."""
+        """Get participants (oldest first) with optional filters and cursor."""
         query = select(Participant).where(Participant.is_active == is_active)
         
         if participant_type:
@@ -103,7 +105,8 @@ class ParticipantRepository:
         if role:
             query = query.where(Participant.role == role)
         
-        query = query.limit(limit)
+        query = after_created(query, Participant, cursor, descending=False)
+        query = created_order(query, Participant, descending=False).limit(limit)
         result = await self.session.execute(query)
         return list(result.scalars().all())
     
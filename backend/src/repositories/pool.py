@@ -0,0 +1,201 @@
+"""
+Asset Pool Repository
+Queries, status changes and JSON import/export for the property and avatar pools
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, func, update, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from src.models.pool import PoolProperty, PoolAvatar
+from src.repositories.pagination import after_position
+
+logger = structlog.get_logger()
+
+SERVICE_ROLE_PREFIXES = (
+    'plumber', 'electrician', 'gardener', 'cleaner', 'painter',
+    'handyman', 'building', 'real_estate', 'pool', 'security',
+    'hvac', 'locksmith', 'pest', 'roofer', 'conveyancer', 'accountant',
+)
+
+
+def avatar_category(role: str) -> str:
+    return "service" if role.startswith(SERVICE_ROLE_PREFIXES) else "participant"
+
+
+def _property_columns(entry: dict) -> dict:
+    """Row values for a pool JSON property entry (status handled by the caller)."""
+    data = entry.get("data") or {}
+    return {
+        "suburb": data.get("suburb", ""),
+        "address": data.get("address", ""),
+        "property_type": data.get("property_type", ""),
+        "bedrooms": int(data.get("bedrooms") or 0),
+        "bathrooms": int(data.get("bathrooms") or 0),
+        "valuation": int(data.get("valuation") or 0),
+        "data": data,
+        "listing": entry.get("listing"),
+        "images": entry.get("images") or {},
+        "imported_at": datetime.utcnow(),
+    }
+
+
+class PoolRepository:
+    """Repository for the pre-generated property and avatar pools."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    # =========================================================================
+    # Properties
+    # =========================================================================
+
+    async def get_property(self, property_id: str) -> Optional[PoolProperty]:
+        return await self.session.get(PoolProperty, property_id)
+
+    async def list_properties(
+        self,
+        status: Optional[str] = None,
+        suburb: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> List[PoolProperty]:
+        """Properties in pool order (indexed on status, suburb, position)."""
+        query = select(PoolProperty)
+        if status:
+            query = query.where(PoolProperty.status == status)
+        if suburb:
+            query = query.where(PoolProperty.suburb == suburb)
+        query = after_position(query, PoolProperty, cursor)
+        result = await self.session.execute(query.order_by(PoolProperty.position).limit(limit))
+        return list(result.scalars().all())
+
+    async def all_properties(self) -> List[PoolProperty]:
+        """Every property in pool order (for building the search index)."""
+        result = await self.session.execute(select(PoolProperty).order_by(PoolProperty.position))
+        return list(result.scalars().all())
+
+    async def status_counts(self) -> Dict[str, int]:
+        result = await self.session.execute(
+            select(PoolProperty.status, func.count()).group_by(PoolProperty.status)
+        )
+        return dict(result.all())
+
+    async def last_imported_at(self) -> Optional[datetime]:
+        result = await self.session.execute(select(func.max(PoolProperty.imported_at)))
+        return result.scalar()
+
+    async def enable_property(self, property_id: str) -> bool:
+        """Move a draft property to available. False if it was not a draft."""
+        result = await self.session.execute(
+            update(PoolProperty)
+            .where(PoolProperty.id == property_id, PoolProperty.status == "draft")
+            .values(status="available", enabled_at=datetime.utcnow())
+        )
+        return result.rowcount == 1
+
+    async def enable_next(self, suburb: Optional[str] = None) -> Optional[PoolProperty]:
+        """Enable the first draft property (optionally in a suburb)."""
+        query = select(PoolProperty.id).where(PoolProperty.status == "draft")
+        if suburb:
+            query = query.where(PoolProperty.suburb == suburb)
+        query = query.order_by(PoolProperty.position).limit(1)
+
+        while True:
+            property_id = (await self.session.execute(query)).scalar_one_or_none()
+            if property_id is None:
+                return None
+            # Conditional update: if a concurrent request took it, try the next one
+            if await self.enable_property(property_id):
+                return await self.get_property(property_id)
+
+    async def import_properties(self, entries: List[dict], keep_status: bool = True) -> Dict[str, int]:
+        """
+        Upsert properties from pool JSON entries, in file order.
+
+        Existing rows keep their position and (unless keep_status is False)
+        their status, so re-importing a regenerated pool does not undo enables.
+        """
+        result = await self.session.execute(select(PoolProperty.id, PoolProperty.position))
+        existing = dict(result.all())
+        next_position = max(existing.values(), default=-1) + 1
+
+        inserts, updates = [], []
+        for entry in entries:
+            property_id = entry.get("id")
+            if not property_id:
+                continue
+            row = {"id": property_id, **_property_columns(entry)}
+            if property_id in existing:
+                if not keep_status:
+                    row["status"] = entry.get("status", "draft")
+                updates.append(row)
+            else:
+                row["position"] = next_position
+                row["status"] = entry.get("status", "draft")
+                next_position += 1
+                existing[property_id] = row["position"]
+                inserts.append(row)
+
+        if inserts:
+            await self.session.execute(insert(PoolProperty), inserts)
+        if updates:
+            await self.session.execute(update(PoolProperty), updates)
+        logger.info("pool_properties_imported", inserted=len(inserts), updated=len(updates))
+        return {"inserted": len(inserts), "updated": len(updates)}
+
+    async def export_properties(self) -> List[dict]:
+        """Properties in the pool JSON entry format, in pool order."""
+        result = await self.session.execute(select(PoolProperty).order_by(PoolProperty.position))
+        return [
+            {
+                "id": p.id,
+                "status": p.status,
+                "data": p.data,
+                "listing": p.listing,
+                "images": p.images,
+            }
+            for p in result.scalars()
+        ]
+
+    # =========================================================================
+    # Avatars
+    # =========================================================================
+
+    async def get_avatar(self, role: str) -> Optional[PoolAvatar]:
+        return await self.session.get(PoolAvatar, role)
+
+    async def list_avatars(self, category: Optional[str] = None) -> List[PoolAvatar]:
+        query = select(PoolAvatar)
+        if category:
+            query = query.where(PoolAvatar.category == category)
+        result = await self.session.execute(query.order_by(PoolAvatar.role))
+        return list(result.scalars().all())
+
+    async def count_avatars(self) -> int:
+        return (await self.session.execute(select(func.count()).select_from(PoolAvatar))).scalar()
+
+    async def import_avatars(self, avatars: Dict[str, str]) -> Dict[str, int]:
+        """Upsert avatars from the avatar pool JSON mapping (role -> image)."""
+        result = await self.session.execute(select(PoolAvatar.role))
+        existing = set(result.scalars())
+        now = datetime.utcnow()
+
+        rows = [
+            {"role": role, "category": avatar_category(role), "image": image, "imported_at": now}
+            for role, image in avatars.items()
+        ]
+        inserts = [r for r in rows if r["role"] not in existing]
+        updates = [r for r in rows if r["role"] in existing]
+        if inserts:
+            await self.session.execute(insert(PoolAvatar), inserts)
+        if updates:
+            await self.session.execute(update(PoolAvatar), updates)
+        logger.info("pool_avatars_imported", inserted=len(inserts), updated=len(updates))
+        return {"inserted": len(inserts), "updated": len(updates)}
+
+    async def export_avatars(self) -> Dict[str, str]:
+        return {a.role: a.image for a in await self.list_avatars()}
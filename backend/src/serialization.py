@@ -0,0 +1,67 @@
+"""
+OSF Demo - JSON Serialization
+Fast JSON encoding shared by responses, SSE streams and caches
+
+Uses orjson when installed and falls back to the standard library, so the
+output is always compact UTF-8 JSON bytes either way.
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode types neither backend handles natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "value"):  # Enums
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes."""
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes."""
+        return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+
+def dumps_str(obj: Any) -> str:
+    """Serialize to a compact JSON string (SSE data fields)."""
+    return dumps(obj).decode()
+
+
+def sse_message(obj: Any) -> str:
+    """Frame a payload as a raw SSE data message."""
+    return f"data: {dumps_str(obj)}\n\n"
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class: renders with dumps() instead of json.dumps."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
@@ -66,6 +66,9 @@ class ActionProcessor:
         try:
             result = await handler(participant_id, action_data, network_month)
             result.action_id = action_id
+            if result.success:
+                from src.services.response_cache import get_response_cache
+                get_response_cache().invalidate(action_type)
             return result
         except Exception as e:
             logger.error("action_processing_error",
@@ -0,0 +1,366 @@
+"""
+OSF Admission Control - Rate Limiting for Live Model Calls
+
+Every interactive endpoint that calls Gemini passes through here before
+making the call:
+
+- Per-user token bucket: one client cannot burn the shared quota
+- Global token bucket: paces the whole app below the provider's rate limit
+- Concurrency cap with a bounded FIFO wait queue and a deadline
+- Early 429 + Retry-After when the wait could not finish before the deadline
+
+A slice of the global tokens and concurrency is reserved for the monthly
+tick, which is always admitted so process_month never hits rate limits
+caused by interactive traffic.
+"""
+
+import asyncio
+import ipaddress
+import math
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Optional, Tuple, Union
+
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette.requests import HTTPConnection
+from starlette.types import Receive, Scope, Send
+import structlog
+
+from src.config import get_settings
+
+logger = structlog.get_logger()
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at `rate` tokens/second."""
+
+    __slots__ = ("rate", "capacity", "tokens", "_updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, floor: float = 0.0) -> float:
+        """Seconds until one token can be taken while leaving `floor` behind."""
+        self._refill()
+        missing = 1 + floor - self.tokens
+        if missing <= 0:
+            return 0.0
+        return missing / self.rate if self.rate > 0 else math.inf
+
+    def take(self, amount: float = 1.0) -> None:
+        """Take tokens unconditionally (may go negative for reserved callers)."""
+        self._refill()
+        self.tokens -= amount
+
+    def refund(self, amount: float = 1.0) -> None:
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class AdmissionRejected(HTTPException):
+    """429 with a Retry-After hint."""
+
+    def __init__(self, reason: str, retry_after: float):
+        self.reason = reason
+        super().__init__(
+            status_code=429,
+            detail=f"AI service busy ({reason}), please retry shortly",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+class AdmissionController:
+    """Token buckets, concurrency cap and wait queue for model calls."""
+
+    def __init__(
+        self,
+        global_rate: float,
+        global_burst: int,
+        user_rate: float,
+        user_burst: int,
+        max_concurrent: int,
+        tick_reserved: int,
+        queue_size: int,
+        queue_timeout: float,
+        max_tracked_users: int = 10_000,
+    ):
+        self.global_bucket = TokenBucket(global_rate, global_burst)
+        self.user_rate = user_rate
+        self.user_burst = user_burst
+        self.max_concurrent = max_concurrent
+        self.tick_reserved = tick_reserved
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.max_tracked_users = max_tracked_users
+
+        self._user_buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._in_flight = 0
+        self._tick_in_flight = 0
+        self._waiting = 0
+        self._changed = asyncio.Condition()
+
+        self.admitted = 0
+        self.admitted_after_wait = 0
+        self.tick_admitted = 0
+        self.rejected: Dict[str, int] = {
+            "user_rate": 0, "queue_full": 0, "global_rate": 0, "deadline": 0,
+        }
+        self._wait_total = 0.0
+
+    @property
+    def interactive_limit(self) -> int:
+        """Concurrent interactive calls allowed (the rest is held for the tick)."""
+        return max(1, self.max_concurrent - self.tick_reserved)
+
+    def _user_bucket(self, key: str) -> TokenBucket:
+        bucket = self._user_buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.user_rate, self.user_burst)
+            self._user_buckets[key] = bucket
+            while len(self._user_buckets) > self.max_tracked_users:
+                self._user_buckets.popitem(last=False)
+        else:
+            self._user_buckets.move_to_end(key)
+        return bucket
+
+    def _global_wait(self) -> float:
+        return self.global_bucket.wait_time(floor=self.tick_reserved)
+
+    def _can_admit(self) -> bool:
+        return self._in_flight < self.interactive_limit and self._global_wait() == 0
+
+    def _reject(self, reason: str, retry_after: float) -> AdmissionRejected:
+        self.rejected[reason] += 1
+        logger.warning("llm_admission_rejected", reason=reason, retry_after=round(retry_after, 2),
+                       in_flight=self._in_flight, waiting=self._waiting)
+        return AdmissionRejected(reason, retry_after)
+
+    def _admit(self) -> None:
+        self.global_bucket.take()
+        self._in_flight += 1
+        self.admitted += 1
+
+    async def acquire(self, key: str) -> None:
+        """Admit one interactive call or raise AdmissionRejected (429)."""
+        user_bucket = self._user_bucket(key)
+        user_wait = user_bucket.wait_time()
+        if user_wait > 0:
+            raise self._reject("user_rate", user_wait)
+        user_bucket.take()
+
+        # Newcomers don't overtake queued requests
+        if self._waiting == 0 and self._can_admit():
+            self._admit()
+            return
+
+        if self._waiting >= self.queue_size:
+            user_bucket.refund()
+            raise self._reject("queue_full", max(self._global_wait(), 1.0))
+        # Reject up front if the rate alone makes the deadline unreachable
+        expected = self._global_wait() + self._waiting / max(self.global_bucket.rate, 1e-9)
+        if expected > self.queue_timeout:
+            user_bucket.refund()
+            raise self._reject("global_rate", expected)
+
+        started = time.monotonic()
+        deadline = started + self.queue_timeout
+        self._waiting += 1
+        try:
+            async with self._changed:
+                while not self._can_admit():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        user_bucket.refund()
+                        raise self._reject("deadline", self._global_wait() or 1.0)
+                    # Wake on release, or when the bucket should have refilled
+                    timeout = min(remaining, self._global_wait() or remaining)
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                self._admit()
+        finally:
+            self._waiting -= 1
+        self.admitted_after_wait += 1
+        self._wait_total += time.monotonic() - started
+
+    async def release(self) -> None:
+        self._in_flight -= 1
+        async with self._changed:
+            self._changed.notify()
+
+    @asynccontextmanager
+    async def slot(self, key: str) -> AsyncIterator[None]:
+        """Hold an interactive slot for the duration of a model call."""
+        await self.acquire(key)
+        try:
+            yield
+        finally:
+            await self.release()
+
+    @asynccontextmanager
+    async def tick_slot(self) -> AsyncIterator[None]:
+        """
+        Admit the monthly tick unconditionally.
+
+        It draws on the reserved tokens and concurrency, so it is never
+        queued behind or rejected because of interactive traffic.
+        """
+        self.global_bucket.take()
+        self._tick_in_flight += 1
+        self.tick_admitted += 1
+        try:
+            yield
+        finally:
+            self._tick_in_flight -= 1
+
+    def get_metrics(self) -> dict:
+        return {
+            "in_flight": self._in_flight,
+            "tick_in_flight": self._tick_in_flight,
+            "queue_depth": self._waiting,
+            "queue_size": self.queue_size,
+            "interactive_limit": self.interactive_limit,
+            "tick_reserved": self.tick_reserved,
+            "global_tokens": round(self.global_bucket.tokens, 2),
+            "tracked_users": len(self._user_buckets),
+            "admitted": self.admitted,
+            "admitted_after_wait": self.admitted_after_wait,
+            "avg_wait_ms": round(self._wait_total / self.admitted_after_wait * 1000, 1)
+            if self.admitted_after_wait else 0,
+            "tick_admitted": self.tick_admitted,
+            "rejected": dict(self.rejected),
+            "rejected_total": sum(self.rejected.values()),
+        }
+
+
+@lru_cache(maxsize=8)
+def _proxy_networks(spec: str) -> Tuple[Union[ipaddress.IPv4Network, ipaddress.IPv6Network], ...]:
+    return tuple(ipaddress.ip_network(part.strip(), strict=False) for part in spec.split(",") if part.strip())
+
+
+def _is_trusted_proxy(host: Optional[str]) -> bool:
+    networks = _proxy_networks(get_settings().trusted_proxies)
+    if not host or not networks:
+        return False
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in networks)
+
+
+def client_address(request: HTTPConnection) -> str:
+    """
+    The caller's address.
+
+    X-Forwarded-For is only believed when the connection comes from a
+    TRUSTED_PROXIES address; then the client is the nearest hop that is not
+    itself a trusted proxy (the leftmost entries are whatever the client sent).
+    """
+    peer = request.client.host if request.client else None
+    forwarded = request.headers.get("x-forwarded-for")
+    if not forwarded or not _is_trusted_proxy(peer):
+        return peer or "unknown"
+    hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted_proxy(hop):
+            return hop
+    return hops[0] if hops else peer
+
+
+def verified_user_id(request: HTTPConnection) -> Optional[str]:
+    """User id from a valid Bearer access token, else None."""
+    from src.auth.jwt import TokenError, decode_access_token, extract_token_from_header
+
+    token = extract_token_from_header(request.headers.get("authorization"))
+    if not token:
+        return None
+    try:
+        return decode_access_token(token).sub
+    except TokenError:
+        return None
+
+
+def client_key(request: HTTPConnection, user_id: Optional[str] = None) -> str:
+    """
+    Per-user bucket key: the caller's verified user id, else their address.
+
+    user_id must already be verified (the realtime socket passes the id from
+    its token); without it the request's Bearer token is used. An id taken
+    from a request body or query string would let a caller pick a fresh
+    bucket on every request.
+    """
+    user_id = user_id or verified_user_id(request)
+    if user_id:
+        return f"user:{user_id}"
+    return f"ip:{client_address(request)}"
+
+
+class AdmittedStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that releases an already-acquired slot when it ends.
+
+    The slot is acquired before the response is returned, so a full queue
+    is still a 429 with Retry-After. Releasing it here rather than in the
+    body generator also covers a client that disconnects before the body is
+    iterated, when the generator never starts and its finally never runs.
+    """
+
+    def __init__(self, content, admission: Optional["AdmissionController"], **kwargs):
+        super().__init__(content, **kwargs)
+        self.admission = admission
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            if self.admission is not None:
+                await self.admission.release()
+
+
+async def llm_admission(request: Request) -> AsyncIterator[None]:
+    """
+    Route dependency holding a model-call slot while the endpoint runs.
+
+    Streaming endpoints acquire explicitly and return an
+    AdmittedStreamingResponse instead, since the slot must outlive the
+    endpoint function.
+    """
+    async with get_admission().slot(client_key(request)):
+        yield
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_admission: Optional[AdmissionController] = None
+
+
+def get_admission() -> AdmissionController:
+    """Get the singleton admission controller."""
+    global _admission
+    if _admission is None:
+        settings = get_settings()
+        _admission = AdmissionController(
+            global_rate=settings.llm_global_rate,
+            global_burst=settings.llm_global_burst,
+            user_rate=settings.llm_user_rate,
+            user_burst=settings.llm_user_burst,
+            max_concurrent=settings.llm_max_concurrent,
+            tick_reserved=settings.llm_tick_reserved,
+            queue_size=settings.llm_queue_size,
+            queue_timeout=settings.llm_queue_timeout,
+        )
+    return _admission
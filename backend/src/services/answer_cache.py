@@ -0,0 +1,203 @@
+"""
+OSF Answer Cache - Reuse Governor and Advisor Answers Within a Month
+
+In a class session many users ask nearly the same question against the
+same month's network. An answer is reused when:
+
+- it was given for the same prompt context: entries are bucketed by a
+  hash of the JSON the system prompt was formatted with (month, totals,
+  and the user's own figures where the prompt includes them), and
+- the question matches: same normalized text, or a Jaccard similarity of
+  stemmed content words at or above the threshold, with the same numbers
+  and negations ("buy 10 tokens" never matches "buy 100 tokens", nor
+  "should I invest" "should I not invest").
+
+Everything is dropped on month_completed; the LRU bounds memory in between.
+"""
+
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterator, Optional, Set, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+_CONTRACTIONS = {
+    "what's": "what is", "how's": "how is", "who's": "who is", "where's": "where is",
+    "when's": "when is", "it's": "it is", "there's": "there is", "i'm": "i am",
+    "don't": "do not", "doesn't": "does not", "isn't": "is not", "can't": "cannot",
+    "won't": "will not", "i've": "i have", "i'd": "i would", "shouldn't": "should not",
+    "wouldn't": "would not", "couldn't": "could not", "aren't": "are not", "wasn't": "was not",
+    "didn't": "did not", "haven't": "have not",
+}
+
+# Dropped before comparing: they rarely change what is being asked.
+# Single letters are kept ("property A" is not "property").
+_STOPWORDS = frozenset(
+    "an the is are was were be been am do does did can could would should will shall "
+    "me my we our you your it its this that these those there to of in on at for "
+    "from with and or so please just tell about currently right now".split()
+)
+
+# Must appear in both questions or neither, like numbers
+_NEGATIONS = frozenset("not no never nor cannot avoid without".split())
+
+_IRREGULAR = {"does": "do", "did": "do", "has": "have", "had": "have"}
+
+
+def normalize(text: str) -> str:
+    """Lowercase words with contractions expanded and punctuation dropped."""
+    words = []
+    for word in _WORD.findall(text.lower()):
+        words.extend(_CONTRACTIONS.get(word, word).split())
+    return " ".join(words)
+
+
+def _stem(word: str) -> str:
+    word = _IRREGULAR.get(word, word)
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def terms(normalized: str) -> FrozenSet[str]:
+    """Stemmed content words of a normalized question."""
+    return frozenset(_stem(w) for w in normalized.split() if w not in _STOPWORDS)
+
+
+def exact_terms(normalized: str) -> FrozenSet[str]:
+    """Numbers and negations, which a similar question must share exactly."""
+    negations = {w for w in normalized.split() if w in _NEGATIONS}
+    return frozenset(re.findall(r"\d+", normalized)) | negations
+
+
+def context_hash(*contexts: Any) -> str:
+    """Stable hash of the JSON a system prompt is formatted with."""
+    payload = json.dumps(contexts, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def replay_chunks(text: str, words_per_chunk: int = 6) -> Iterator[str]:
+    """A cached answer split into token-sized pieces for SSE replay."""
+    pieces = re.findall(r"\S+\s*", text)
+    for start in range(0, len(pieces), words_per_chunk):
+        yield "".join(pieces[start:start + words_per_chunk])
+
+
+@dataclass
+class _Entry:
+    answer: str
+    terms: FrozenSet[str]
+    exact: FrozenSet[str]
+
+
+class AnswerCache:
+    """LRU of model answers, bucketed by scope and prompt-context hash."""
+
+    def __init__(self, max_entries: int = 512, similarity: float = 0.85):
+        self.max_entries = max_entries
+        self.similarity = similarity
+        # (scope, context hash, normalized question) -> entry
+        self._entries: "OrderedDict[Tuple[str, str, str], _Entry]" = OrderedDict()
+        self._buckets: Dict[Tuple[str, str], Set[Tuple[str, str, str]]] = {}
+        self.stats: Dict[str, int] = {"exact": 0, "similar": 0, "misses": 0, "stored": 0, "invalidations": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, scope: str, context: str, question: str) -> Optional[str]:
+        """A cached answer to this question (or a close one) in this context."""
+        if self.max_entries <= 0:
+            return None
+        normalized = normalize(question)
+        key = (scope, context, normalized)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats["exact"] += 1
+            return entry.answer
+
+        asked = terms(normalized)
+        exact = exact_terms(normalized)
+        best_key, best_score = None, 0.0
+        for candidate in self._buckets.get((scope, context), ()):
+            cached = self._entries[candidate]
+            if cached.exact != exact or not asked or not cached.terms:
+                continue
+            score = len(asked & cached.terms) / len(asked | cached.terms)
+            if score > best_score:
+                best_key, best_score = candidate, score
+
+        if best_key is not None and best_score >= self.similarity:
+            self._entries.move_to_end(best_key)
+            self.stats["similar"] += 1
+            return self._entries[best_key].answer
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, scope: str, context: str, question: str, answer: str) -> None:
+        if self.max_entries <= 0 or not answer:
+            return
+        normalized = normalize(question)
+        key = (scope, context, normalized)
+        self._entries[key] = _Entry(
+            answer=answer,
+            terms=terms(normalized),
+            exact=exact_terms(normalized),
+        )
+        self._entries.move_to_end(key)
+        self._buckets.setdefault((scope, context), set()).add(key)
+        self.stats["stored"] += 1
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            bucket = self._buckets.get(evicted[:2])
+            if bucket is not None:
+                bucket.discard(evicted)
+                if not bucket:
+                    del self._buckets[evicted[:2]]
+
+    def invalidate(self, reason: str = "") -> None:
+        """Drop every answer (a new month changes what the prompts see)."""
+        self._entries.clear()
+        self._buckets.clear()
+        self.stats["invalidations"] += 1
+        logger.debug("answer_cache_invalidated", reason=reason)
+
+    def get_metrics(self) -> dict:
+        hits = self.stats["exact"] + self.stats["similar"]
+        lookups = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "contexts": len(self._buckets),
+            "hit_rate": round(hits / lookups, 3) if lookups else None,
+            "similarity": self.similarity,
+        }
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_answer_cache: Optional[AnswerCache] = None
+
+
+def get_answer_cache() -> AnswerCache:
+    """Get the singleton answer cache."""
+    global _answer_cache
+    if _answer_cache is None:
+        from src.config import get_settings
+        settings = get_settings()
+        _answer_cache = AnswerCache(
+            max_entries=settings.answer_cache_size,
+            similarity=settings.answer_cache_similarity,
+        )
+    return _answer_cache
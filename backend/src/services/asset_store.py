@@ -0,0 +1,151 @@
+"""
+OSF Asset Store - Content-Addressed Image Files
+
+Generated images (property renders, floorplans, avatars) are stored as
+binary files named by the SHA-256 of their bytes, instead of base64 data
+URLs inline in the pool JSON:
+
+    data/assets/3f/3fa2...c9.jpg  ->  /assets/3f/3fa2...c9.jpg
+
+A name never changes content, so the files are served with an immutable
+Cache-Control header (and Range support, from Starlette's FileResponse),
+and writing the same image twice stores it once. Text files in the store
+(SVG, JSON) are served from precompressed .br/.gz siblings when present;
+see scripts/precompress_static.py. Images are already compressed.
+"""
+
+import base64
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import StaticFiles
+
+from src.compression import get_compression_stats, is_compressible, precompressed_sibling
+from src.config import get_settings
+
+ASSET_URL_PREFIX = "/assets"
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+_DATA_URL = re.compile(r"^data:(?P<mime>[\w/+.-]+);base64,(?P<data>.*)$", re.DOTALL)
+
+_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+    "image/avif": "avif",
+}
+
+
+def sniff_content_type(data: bytes) -> Optional[str]:
+    """Image type from magic bytes (generators often mislabel PNG as JPEG)."""
+    if data[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[4:12] in (b"ftypavif", b"ftypavis"):
+        return "image/avif"
+    return None
+
+
+def is_data_url(value) -> bool:
+    return isinstance(value, str) and value.startswith("data:")
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for content-addressed files: cache forever, use precompressed siblings."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if isinstance(response, FileResponse) and is_compressible(response.media_type):
+            match = precompressed_sibling(Path(full_path), Headers(scope=scope).get("accept-encoding"))
+            if match:
+                encoding, sibling = match
+                get_compression_stats().record("static", encoding, stat_result.st_size, sibling.stat().st_size)
+                response = FileResponse(
+                    sibling,
+                    status_code=status_code,
+                    media_type=response.media_type,
+                    headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+                )
+            else:
+                response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE
+        return response
+
+
+class AssetStore:
+    """Write-once image files keyed by content hash."""
+
+    def __init__(self, root: Path, url_prefix: str = ASSET_URL_PREFIX):
+        self.root = Path(root)
+        self.url_prefix = url_prefix
+
+    def _relative_path(self, digest: str, ext: str) -> str:
+        return f"{digest[:2]}/{digest}.{ext}"
+
+    def put(self, data: bytes, content_type: Optional[str] = None) -> str:
+        """Store bytes (no-op if already present) and return the asset URL path."""
+        content_type = sniff_content_type(data) or content_type or "image/jpeg"
+        ext = _EXTENSIONS.get(content_type, "bin")
+        relative = self._relative_path(hashlib.sha256(data).hexdigest(), ext)
+        path = self.root / relative
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so readers never see a partial file
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+
+        return f"{self.url_prefix}/{relative}"
+
+    def put_data_url(self, value: str) -> str:
+        """Store a base64 data URL's image; other strings are returned unchanged."""
+        match = _DATA_URL.match(value) if is_data_url(value) else None
+        if not match:
+            return value
+        return self.put(base64.b64decode(match.group("data")), match.group("mime"))
+
+    def put_images(self, images: Dict[str, str]) -> Dict[str, str]:
+        """Replace any inline data URLs in an images dict with asset URLs."""
+        return {name: self.put_data_url(value) for name, value in images.items()}
+
+    def path_for(self, url: str) -> Optional[Path]:
+        """Local file for an asset URL path, if it is one of ours."""
+        if not url.startswith(self.url_prefix + "/"):
+            return None
+        return self.root / url[len(self.url_prefix) + 1:]
+
+    def static_app(self) -> ImmutableStaticFiles:
+        """ASGI app serving the store, for mounting at url_prefix."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        return ImmutableStaticFiles(directory=self.root)
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_asset_store: Optional[AssetStore] = None
+
+
+def get_asset_store() -> AssetStore:
+    """Get the singleton asset store."""
+    global _asset_store
+    if _asset_store is None:
+        _asset_store = AssetStore(Path(get_settings().asset_dir))
+    return _asset_store
@@ -22,10 +22,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 import structlog
 
-from google import genai
-from google.genai import types
-
 from src.config import get_settings
+from src.ai.client import get_genai_client
 from src.services.network_clock import PendingAction
 
 logger = structlog.get_logger()
@@ -269,14 +267,17 @@ class BatchProcessor:
     
     def __init__(self):
         if settings.google_api_key:
-            self.client = genai.Client(api_key=settings.google_api_key)
             self.model = settings.gemini_pro_model  # Use Pro for complex reasoning
         else:
-            self.client = None
             self.model = None
             logger.warning("batch_processor_not_configured",
                           message="GOOGLE_API_KEY not set, batch processing disabled")
     
+    @property
+    def client(self):
+        """The shared Gemini client (None when GOOGLE_API_KEY is unset)."""
+        return get_genai_client()
+    
     async def process_month(
         self,
         state: NetworkState,
@@ -294,6 +295,8 @@ class BatchProcessor:
         Returns:
             MonthResult with all events, state changes, and narratives
         """
+        from google.genai import types
+        
         next_month = state.month + 1
         
         logger.info("batch_processing_started",
@@ -316,20 +319,22 @@ class BatchProcessor:
                        estimated_tokens=estimated_tokens,
                        prompt_length=len(prompt))
             
-            # Call Gemini
-            response = await self.client.aio.models.generate_content(
-                model=self.model,
-                contents=[types.Content(
-                    role="user",
-                    parts=[types.Part.from_text(text=prompt)]
-                )],
-                config=types.GenerateContentConfig(
-                    system_instruction=SYSTEM_PROMPT,
-                    temperature=0.7,
-                    max_output_tokens=50000,
-                    response_mime_type="application/json",
-                ),
-            )
+            # Call Gemini on the capacity reserved for the tick
+            from src.services.admission import get_admission
+            async with get_admission().tick_slot():
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=[types.Content(
+                        role="user",
+                        parts=[types.Part.from_text(text=prompt)]
+                    )],
+                    config=types.GenerateContentConfig(
+                        system_instruction=SYSTEM_PROMPT,
+                        temperature=0.7,
+                        max_output_tokens=50000,
+                        response_mime_type="application/json",
+                    ),
+                )
             
             # Parse response
             result = self._parse_response(response.text, next_month)
@@ -0,0 +1,183 @@
+"""
+OSF Broadcast Hub - Fan-Out for Server-Sent Events
+
+Each published event is encoded once into SSE wire bytes and handed to
+every subscriber. Subscribers hold a bounded ring buffer instead of an
+unbounded queue:
+
+- Regular events: drop-oldest when the buffer is full
+- Coalesced events (e.g. clock_sync): only the latest is kept, in the
+  position it arrived in, so a stream always reads events in publish order
+- A subscriber that keeps overflowing without reading is disconnected so
+  a stalled client cannot pin memory; its stream ends and it reconnects
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Set, Tuple
+
+import structlog
+
+from src.serialization import dumps_str
+
+logger = structlog.get_logger()
+
+
+def encode_sse(event: str, data: dict) -> bytes:
+    """Encode one event as SSE wire bytes."""
+    return f"event: {event}\ndata: {dumps_str(data)}\n\n".encode()
+
+
+class Subscriber:
+    """One stream's bounded view of the hub."""
+
+    __slots__ = (
+        "_buffer", "_latest", "_capacity", "_regular", "_wakeup", "_max_drops",
+        "delivered", "dropped", "coalesced", "_drops_since_read",
+        "closed", "close_reason",
+    )
+
+    def __init__(self, capacity: int, max_drops: int):
+        # (coalesce key or None, chunk) in arrival order
+        self._buffer: Deque[Tuple[Optional[str], bytes]] = deque()
+        # Coalesce key -> its entry in _buffer
+        self._latest: Dict[str, Tuple[str, bytes]] = {}
+        self._capacity = capacity
+        self._regular = 0
+        self._wakeup = asyncio.Event()
+        self._max_drops = max_drops
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self._drops_since_read = 0
+        self.closed = False
+        self.close_reason: Optional[str] = None
+
+    @property
+    def lag(self) -> int:
+        """Messages waiting to be read."""
+        return len(self._buffer)
+
+    def push(self, event: str, chunk: bytes, coalesce: bool) -> bool:
+        """Queue a chunk. Returns False if the subscriber should be dropped."""
+        if self.closed:
+            return False
+        if coalesce:
+            previous = self._latest.get(event)
+            if previous is not None:
+                # Replaced by the newer state, which goes after what came between
+                self._buffer.remove(previous)
+                self.coalesced += 1
+            entry = (event, chunk)
+            self._latest[event] = entry
+            self._buffer.append(entry)
+        else:
+            if self._regular >= self._capacity:
+                self.dropped += 1
+                self._drops_since_read += 1
+                if self._drops_since_read >= self._max_drops:
+                    self.close("lagging")
+                    return False
+                self._drop_oldest_regular()
+            self._buffer.append((None, chunk))
+            self._regular += 1
+        self._wakeup.set()
+        return True
+
+    def _drop_oldest_regular(self) -> None:
+        for i, (key, _) in enumerate(self._buffer):
+            if key is None:
+                del self._buffer[i]
+                self._regular -= 1
+                return
+
+    def close(self, reason: str = "closed") -> None:
+        if not self.closed:
+            self.closed = True
+            self.close_reason = reason
+        self._wakeup.set()
+
+    def drain(self) -> list:
+        """Take everything pending, in arrival order."""
+        chunks = [chunk for _, chunk in self._buffer]
+        self._buffer.clear()
+        self._latest.clear()
+        self._regular = 0
+        self._drops_since_read = 0
+        self._wakeup.clear()
+        self.delivered += len(chunks)
+        return chunks
+
+    async def wait(self, timeout: Optional[float] = None) -> list:
+        """
+        Wait for pending chunks.
+
+        Returns [] on timeout or once the subscriber is closed.
+        """
+        if not self._buffer and not self.closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        if self.closed:
+            return []
+        return self.drain()
+
+
+class BroadcastHub:
+    """Encodes events once and fans them out to bounded subscribers."""
+
+    def __init__(
+        self,
+        capacity: int = 64,
+        max_drops: int = 256,
+        coalesce: Iterable[str] = (),
+    ):
+        self.capacity = capacity
+        self.max_drops = max_drops
+        self.coalesce: Set[str] = set(coalesce)
+        self._subscribers: Set[Subscriber] = set()
+        self.published = 0
+        self.disconnected_lagging = 0
+        self._dropped_closed = 0
+        self._coalesced_closed = 0
+
+    def subscribe(self) -> Subscriber:
+        subscriber = Subscriber(self.capacity, self.max_drops)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        if subscriber in self._subscribers:
+            self._subscribers.discard(subscriber)
+            self._dropped_closed += subscriber.dropped
+            self._coalesced_closed += subscriber.coalesced
+        subscriber.close()
+
+    def publish(self, event: str, data: dict) -> bytes:
+        """Encode once and deliver to every subscriber. Returns the wire bytes."""
+        chunk = encode_sse(event, data)
+        coalesce = event in self.coalesce
+        self.published += 1
+
+        lagging = [s for s in self._subscribers if not s.push(event, chunk, coalesce)]
+        for subscriber in lagging:
+            self.disconnected_lagging += 1
+            self.unsubscribe(subscriber)
+        if lagging:
+            logger.warning("sse_subscribers_disconnected", count=len(lagging), reason="lagging")
+        return chunk
+
+    def get_metrics(self) -> dict:
+        """Subscriber count, lag and drop counters."""
+        lags = [s.lag for s in self._subscribers]
+        return {
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+            "buffer_capacity": self.capacity,
+            "max_lag": max(lags, default=0),
+            "avg_lag": round(sum(lags) / len(lags), 2) if lags else 0,
+            "dropped": self._dropped_closed + sum(s.dropped for s in self._subscribers),
+            "coalesced": self._coalesced_closed + sum(s.coalesced for s in self._subscribers),
+            "disconnected_lagging": self.disconnected_lagging,
+        }
@@ -12,10 +12,8 @@ from uuid import uuid4
 import random
 import structlog
 
-from google import genai
-from google.genai import types
-
 from src.config import get_settings
+from src.ai.client import get_genai_client
 from src.database import async_session
 from src.repositories import NetworkRepository
 
@@ -555,7 +553,6 @@ class EventGenerator:
             housing_index=Decimal("105"),  # Above baseline due to growth
             consumer_confidence=self.market_data.conditions.seller_confidence,
         )
-        self._gemini_client = None
         self._probability_modifiers = self.market_data.get_event_probability_modifiers()
         
         logger.info("event_generator_initialized_with_market_data",
@@ -564,9 +561,7 @@ class EventGenerator:
     
     @property
     def gemini_client(self):
-        if self._gemini_client is None:
-            self._gemini_client = genai.Client(api_key=settings.gemini_api_key)
-        return self._gemini_client
+        return get_genai_client()
     
     def _should_trigger(self, template: Dict, phase: EconomicPhase) -> bool:
         """Determine if an event should trigger based on probability and phase."""
@@ -938,14 +933,14 @@ class EventGenerator:
         """Generate narrative for economic events."""
         return template["description"]
     
-    async def generate_news_article(
+    async def compose_news_article(
         self,
         events: List[SimulationEvent],
         network_month: int,
-    ) -> str:
-        """Generate a news article summarizing the month's events using Gemini."""
-        if not events:
-            return ""
+    ) -> Optional[str]:
+        """Write the month's article with Gemini. Returns None if unavailable."""
+        if not settings.google_api_key:
+            return None
         
         event_summaries = "\n".join([
             f"- {e.title}: {e.description}"
@@ -976,15 +971,14 @@ Remember this is an educational simulation - frame insights as learning opportun
 Do not use markdown formatting. Write as plain prose suitable for a newsletter."""
 
         try:
-            response = self.gemini_client.models.generate_content(
+            response = await self.gemini_client.aio.models.generate_content(
                 model="gemini-3-flash",
                 contents=prompt,
             )
             return response.text.strip()
         except Exception as e:
             logger.error("news_generation_failed", error=str(e))
-            # Fallback to simple summary
-            return f"Month {network_month} saw {len(events)} notable events in the OSF network."
+            return None
     
     async def save_events(
         self,
@@ -1006,6 +1000,9 @@ Do not use markdown formatting. Write as plain prose suitable for a newsletter."
                     data=event.to_dict(),
                 )
                 saved += 1
+            # Months that already have a chart rollup must count these too
+            for month in {event.month for event in events}:
+                await repo.refresh_event_counts(month)
             await session.commit()
         return saved
     
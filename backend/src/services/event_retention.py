@@ -0,0 +1,370 @@
+"""
+OSF Event Retention - Hot/Cold Storage for Network Events
+
+Keeps the most recent months of network_events in the database and moves
+older months into compressed archive files.
+
+- PostgreSQL: network_events is range-partitioned by network_month, one
+  partition per month; archiving a month detaches and drops its partition
+- SQLite (or an unpartitioned table): archived months are deleted
+- Archives: one NDJSON file per month, zstd-compressed (gzip when the
+  zstandard package is not installed), listed in index.json so a month
+  can be read or rehydrated on demand
+- Rehydrated months are pinned for EVENT_REHYDRATE_HOURS (in memory, so
+  a restart unpins them); archiving skips them until the pin expires
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+from sqlalchemy import select, delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+import structlog
+
+from src.config import get_settings
+from src.database import async_session, is_sqlite
+from src.models.network import NetworkEvent
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = structlog.get_logger()
+settings = get_settings()
+
+# Columns written to the archive, in order
+ARCHIVE_COLUMNS = [
+    "id",
+    "network_month",
+    "event_type",
+    "severity",
+    "title",
+    "description",
+    "participant_id",
+    "property_id",
+    "data",
+    "created_at",
+]
+
+
+def partition_name(network_month: int) -> str:
+    """Name of the PostgreSQL partition holding one network month."""
+    return f"network_events_m{network_month:06d}"
+
+
+# =============================================================================
+# Archive Files
+# =============================================================================
+
+class EventArchive:
+    """Compressed per-month NDJSON files plus an index."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.index_path = self.directory / "index.json"
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def extension(self) -> str:
+        return ".ndjson.zst" if zstandard else ".ndjson.gz"
+
+    def _compress(self, raw: bytes) -> bytes:
+        if zstandard:
+            return zstandard.ZstdCompressor(level=10).compress(raw)
+        return gzip.compress(raw, compresslevel=9)
+
+    @staticmethod
+    def _decompress(path: Path, payload: bytes) -> bytes:
+        if path.name.endswith(".zst"):
+            if not zstandard:
+                raise RuntimeError(f"zstandard is required to read {path.name}")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        return gzip.decompress(payload)
+
+    # -------------------------------------------------------------------------
+    # Index
+    # -------------------------------------------------------------------------
+
+    def index(self) -> Dict[str, Dict[str, Any]]:
+        """Archive index keyed by month (as a string)."""
+        if self._index is None:
+            if self.index_path.exists():
+                self._index = json.loads(self.index_path.read_text())
+            else:
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.index(), indent=2, sort_keys=True))
+        os.replace(tmp, self.index_path)
+
+    def has_month(self, network_month: int) -> bool:
+        return str(network_month) in self.index()
+
+    def months(self) -> List[int]:
+        return sorted(int(m) for m in self.index())
+
+    # -------------------------------------------------------------------------
+    # Read/Write
+    # -------------------------------------------------------------------------
+
+    def write_month(self, network_month: int, rows: List[dict]) -> Dict[str, Any]:
+        """
+        Write one month of events and record it in the index.
+
+        Merged with what is already archived for the month (by event id, the
+        new row winning), so events added to or rehydrated into an archived
+        month never replace the ones only the archive still holds.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        previous = self.index().get(str(network_month))
+        if previous:
+            merged = {row["id"]: row for row in self.read_month(network_month)}
+            merged.update((row["id"], row) for row in rows)
+            rows = sorted(merged.values(), key=lambda row: (row.get("created_at") or "", row["id"]))
+
+        raw = "".join(
+            json.dumps(row, separators=(",", ":"), default=str) + "\n"
+            for row in rows
+        ).encode()
+        payload = self._compress(raw)
+
+        path = self.directory / f"events-{network_month:06d}{self.extension}"
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+        if previous and previous["file"] != path.name:
+            # Written with the other compressor before; now merged into path
+            (self.directory / previous["file"]).unlink(missing_ok=True)
+
+        created = [row["created_at"] for row in rows if row.get("created_at")]
+        entry = {
+            "file": path.name,
+            "count": len(rows),
+            "raw_bytes": len(raw),
+            "compressed_bytes": len(payload),
+            "first_created_at": min(created) if created else None,
+            "last_created_at": max(created) if created else None,
+            "archived_at": datetime.utcnow().isoformat(),
+        }
+        self.index()[str(network_month)] = entry
+        self._save_index()
+        return entry
+
+    def read_month(self, network_month: int) -> List[dict]:
+        """Read one archived month back as event dicts."""
+        entry = self.index().get(str(network_month))
+        if not entry:
+            return []
+        path = self.directory / entry["file"]
+        raw = self._decompress(path, path.read_bytes())
+        return [json.loads(line) for line in raw.decode().splitlines() if line]
+
+
+# =============================================================================
+# Retention Policy
+# =============================================================================
+
+class EventRetention:
+    """Applies the hot-months policy and rehydrates archived months."""
+
+    def __init__(
+        self,
+        hot_months: int = settings.event_hot_months,
+        archive_dir: str = settings.event_archive_dir,
+        rehydrate_hours: float = settings.event_rehydrate_hours,
+    ):
+        self.hot_months = hot_months
+        self.archive = EventArchive(archive_dir)
+        self.rehydrate_seconds = rehydrate_hours * 3600
+        # Rehydrated month -> monotonic time its pin expires
+        self._pinned: Dict[int, float] = {}
+        self._partitioned: Optional[bool] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.hot_months > 0
+
+    # -------------------------------------------------------------------------
+    # PostgreSQL partitions
+    # -------------------------------------------------------------------------
+
+    async def is_partitioned(self, session: AsyncSession) -> bool:
+        """Whether network_events is a partitioned table (PostgreSQL only)."""
+        if is_sqlite:
+            return False
+        if self._partitioned is None:
+            result = await session.execute(text(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid "
+                "WHERE c.relname = 'network_events'"
+            ))
+            self._partitioned = result.scalar() is not None
+        return self._partitioned
+
+    async def ensure_partitions(self, session: AsyncSession, through_month: int) -> None:
+        """Create monthly partitions up to through_month (inclusive)."""
+        if not await self.is_partitioned(session):
+            return
+        start = max(0, through_month - 1)
+        for month in range(start, through_month + 1):
+            name = partition_name(month)
+            try:
+                async with session.begin_nested():
+                    await session.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF network_events "
+                        f"FOR VALUES FROM ({month}) TO ({month + 1})"
+                    ))
+            except Exception as e:
+                # Rows for this month already landed in the default partition
+                logger.warning("event_partition_create_failed", partition=name, error=str(e))
+
+    async def _drop_month(self, session: AsyncSession, network_month: int) -> None:
+        """Remove a month of events from the hot table."""
+        if await self.is_partitioned(session):
+            name = partition_name(network_month)
+            exists = await session.execute(text("SELECT to_regclass(:name)"), {"name": name})
+            if exists.scalar() is not None:
+                await session.execute(text(f"ALTER TABLE network_events DETACH PARTITION {name}"))
+                await session.execute(text(f"DROP TABLE {name}"))
+                return
+        await session.execute(
+            delete(NetworkEvent).where(NetworkEvent.network_month == network_month)
+        )
+
+    # -------------------------------------------------------------------------
+    # Archive / rehydrate
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _to_row(event: NetworkEvent) -> dict:
+        row = {column: getattr(event, column) for column in ARCHIVE_COLUMNS}
+        row["created_at"] = event.created_at.isoformat() if event.created_at else None
+        return row
+
+    @staticmethod
+    def _from_row(row: dict) -> NetworkEvent:
+        values = {column: row.get(column) for column in ARCHIVE_COLUMNS}
+        if values["created_at"]:
+            values["created_at"] = datetime.fromisoformat(values["created_at"])
+        return NetworkEvent(**values)
+
+    async def archive_month(self, network_month: int) -> int:
+        """Archive one month to disk and drop it from the hot table."""
+        async with async_session() as session:
+            result = await session.execute(
+                select(NetworkEvent)
+                .options(undefer(NetworkEvent.data))
+                .where(NetworkEvent.network_month == network_month)
+                .order_by(NetworkEvent.created_at, NetworkEvent.id)
+            )
+            rows = [self._to_row(e) for e in result.scalars().all()]
+
+            # File first: if the drop fails, the month is still in the DB and
+            # the next run merges it into the archive again.
+            entry = await asyncio.to_thread(self.archive.write_month, network_month, rows)
+            await self._drop_month(session, network_month)
+            await session.commit()
+
+        logger.info("events_archived",
+                   month=network_month,
+                   count=entry["count"],
+                   compressed_bytes=entry["compressed_bytes"])
+        return len(rows)
+
+    def pinned_months(self) -> List[int]:
+        """Rehydrated months still kept out of archiving (expired pins dropped)."""
+        now = time.monotonic()
+        self._pinned = {m: until for m, until in self._pinned.items() if until > now}
+        return sorted(self._pinned)
+
+    async def apply(self, current_month: int) -> List[int]:
+        """
+        Archive every month older than the hot window, except pinned
+        (recently rehydrated) ones. Returns archived months.
+        """
+        if not self.enabled:
+            return []
+        cutoff = current_month - self.hot_months
+        if cutoff <= 0:
+            return []
+
+        async with self._lock:
+            pinned = set(self.pinned_months())
+            async with async_session() as session:
+                result = await session.execute(
+                    select(NetworkEvent.network_month).distinct()
+                    .where(NetworkEvent.network_month < cutoff)
+                    .order_by(NetworkEvent.network_month)
+                )
+                months = [m for (m,) in result.all() if m not in pinned]
+
+            for month in months:
+                await self.archive_month(month)
+        return months
+
+    async def rehydrate_month(self, network_month: int) -> int:
+        """
+        Load an archived month back into the hot table and pin it there for
+        rehydrate_seconds. Returns rows loaded.
+        """
+        rows = await asyncio.to_thread(self.archive.read_month, network_month)
+        if not rows:
+            return 0
+
+        async with self._lock:
+            async with async_session() as session:
+                await self.ensure_partitions(session, network_month)
+                existing = await session.execute(
+                    select(NetworkEvent.id).where(NetworkEvent.network_month == network_month)
+                )
+                existing_ids = set(existing.scalars().all())
+                events = [self._from_row(r) for r in rows if r["id"] not in existing_ids]
+                session.add_all(events)
+                await session.commit()
+            self._pinned[network_month] = time.monotonic() + self.rehydrate_seconds
+
+        logger.info("events_rehydrated", month=network_month, count=len(events))
+        return len(events)
+
+    def get_status(self) -> dict:
+        """Retention policy and archive summary."""
+        index = self.archive.index()
+        return {
+            "hot_months": self.hot_months,
+            "enabled": self.enabled,
+            "rehydrate_hours": self.rehydrate_seconds / 3600,
+            "pinned_months": self.pinned_months(),
+            "archive_dir": str(self.archive.directory),
+            "compression": "zstd" if zstandard else "gzip",
+            "archived_months": self.archive.months(),
+            "archived_events": sum(e["count"] for e in index.values()),
+            "archived_bytes": sum(e["compressed_bytes"] for e in index.values()),
+        }
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_event_retention: Optional[EventRetention] = None
+
+
+def get_event_retention() -> EventRetention:
+    """Get the singleton event retention instance."""
+    global _event_retention
+    if _event_retention is None:
+        _event_retention = EventRetention()
+    return _event_retention
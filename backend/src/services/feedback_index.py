@@ -0,0 +1,191 @@
+"""
+OSF Feedback Index - Local Duplicate Detection and Ranked Listing
+
+Two in-memory indexes over the feedback board, both updated as items are
+created or voted on:
+
+- MinHash signatures over each item's word set, banded into LSH buckets.
+  Near-duplicates are found by probing one bucket per band and checking
+  exact Jaccard similarity on the few candidates, so a lookup costs about
+  the same at 100 items as at 50,000, and no model call is made.
+- Sorted orderings for the board's three sort modes (score, newest,
+  priority). Listing walks an ordering instead of re-sorting every item.
+"""
+
+import random
+import re
+import zlib
+from itertools import islice
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+
+from sortedcontainers import SortedList
+
+# 32 hash functions in 16 bands of 2: a pair shares at least one bucket with
+# probability 0.94 at Jaccard 0.4, 0.99 at 0.5 and 0.15 at 0.1
+NUM_PERM = 32
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+DUPLICATE_THRESHOLD = 0.4
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by can could do for from has have i if in is it "
+    "its me my not of on or so that the this to was we when with would you".split()
+)
+
+PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3, None: 4}
+
+# Fixed seed so signatures are comparable across restarts
+_rng = random.Random(1729)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Lower-cased content words of a text."""
+    return frozenset(w for w in _WORD.findall(text.lower()) if w not in _STOPWORDS and len(w) > 1)
+
+
+# Per-word hash vectors; vocabularies repeat, so most words hash only once
+_token_hashes: Dict[str, Tuple[int, ...]] = {}
+MAX_CACHED_TOKENS = 200_000
+
+
+def _hash_vector(token: str) -> Tuple[int, ...]:
+    vector = _token_hashes.get(token)
+    if vector is None:
+        h = zlib.crc32(token.encode())
+        vector = tuple(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for a, b in _PERMUTATIONS)
+        if len(_token_hashes) < MAX_CACHED_TOKENS:
+            _token_hashes[token] = vector
+    return vector
+
+
+def minhash(tokens: FrozenSet[str]) -> Tuple[int, ...]:
+    if not tokens:
+        return (_MAX_HASH,) * NUM_PERM
+    return tuple(map(min, zip(*map(_hash_vector, tokens))))
+
+
+def _bands(signature: Tuple[int, ...]) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+    for band in range(BANDS):
+        yield band, signature[band * ROWS:(band + 1) * ROWS]
+
+
+class FeedbackIndex:
+    """Near-duplicate lookup and pre-sorted orderings for feedback items."""
+
+    def __init__(self):
+        self._tokens: Dict[str, FrozenSet[str]] = {}
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = {}
+
+        # Insertion sequence breaks ties in the same order the board always used
+        self._seq: Dict[str, int] = {}
+        self._score: Dict[str, int] = {}
+        self._by_score: SortedList = SortedList()  # (-score, seq, id)
+        self._by_created: SortedList = SortedList()  # (created_at, seq, id)
+        self._by_priority: SortedList = SortedList()  # (priority, seq, id)
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+    def __contains__(self, feedback_id: str) -> bool:
+        return feedback_id in self._seq
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def add(self, item: dict) -> None:
+        """Index a new feedback item."""
+        feedback_id = item["id"]
+        if feedback_id in self._seq:
+            return
+        tokens = tokenize(f"{item['title']} {item['description']}")
+        self._tokens[feedback_id] = tokens
+        for key in _bands(minhash(tokens)):
+            self._buckets.setdefault(key, set()).add(feedback_id)
+
+        seq = len(self._seq)
+        score = item["upvotes"] - item["downvotes"]
+        self._seq[feedback_id] = seq
+        self._score[feedback_id] = score
+        self._by_score.add((-score, seq, feedback_id))
+        self._by_created.add((item["created_at"], seq, feedback_id))
+        self._by_priority.add((PRIORITY_ORDER.get(item.get("ai_priority"), 4), seq, feedback_id))
+
+    def update_score(self, feedback_id: str, score: int) -> None:
+        """Re-rank an item after a vote."""
+        old = self._score.get(feedback_id)
+        if old is None or old == score:
+            return
+        seq = self._seq[feedback_id]
+        self._by_score.remove((-old, seq, feedback_id))
+        self._by_score.add((-score, seq, feedback_id))
+        self._score[feedback_id] = score
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def similar(
+        self,
+        text: str,
+        limit: int = 5,
+        threshold: float = DUPLICATE_THRESHOLD,
+        exclude: Optional[str] = None,
+    ) -> List[Tuple[str, float]]:
+        """Indexed items whose Jaccard similarity to text is >= threshold, best first."""
+        tokens = tokenize(text)
+        if not tokens:
+            return []
+        candidates: Set[str] = set()
+        for key in _bands(minhash(tokens)):
+            candidates |= self._buckets.get(key, set())
+        candidates.discard(exclude)
+
+        matches = []
+        for feedback_id in candidates:
+            other = self._tokens[feedback_id]
+            similarity = len(tokens & other) / len(tokens | other)
+            if similarity >= threshold:
+                matches.append((feedback_id, round(similarity, 3)))
+        matches.sort(key=lambda m: (-m[1], self._seq[m[0]]))
+        return matches[:limit]
+
+    def ranked(self, sort_by: str = "upvotes", offset: int = 0, limit: Optional[int] = None) -> Iterator[str]:
+        """Item ids in board order for a sort mode (unknown modes: insertion order)."""
+        stop = offset + limit if limit is not None else None
+        if sort_by == "upvotes":
+            ordering = self._by_score.islice(offset, stop)
+        elif sort_by == "created_at":
+            # Newest first: the same window counted from the end
+            size = len(self._by_created)
+            start = max(size - stop, 0) if stop is not None else 0
+            ordering = self._by_created.islice(start, max(size - offset, 0), reverse=True)
+        elif sort_by == "ai_priority":
+            ordering = self._by_priority.islice(offset, stop)
+        else:
+            return islice(self._seq, offset, stop)
+        return (entry[2] for entry in ordering)
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_feedback_index: Optional[FeedbackIndex] = None
+
+
+def get_feedback_index() -> FeedbackIndex:
+    """Get the singleton feedback index."""
+    global _feedback_index
+    if _feedback_index is None:
+        _feedback_index = FeedbackIndex()
+    return _feedback_index
@@ -0,0 +1,321 @@
+"""
+OSF Image Derivatives - Thumbnails and Medium Variants for Pool Images
+
+Pool images are full-size generated renders (often 1-2 MB PNGs), but list
+views only show them as cards. Each source image in the asset store gets
+resized AVIF and WebP variants, stored in the same content-addressed store,
+plus a small manifest named after the source's hash:
+
+    data/assets/3f/3fa2...c9.png                  source
+    data/assets/derivatives/3f/3fa2...c9.<recipe>.json   manifest
+    data/assets/a1/a1b0...44.avif, ...             variants
+
+The recipe is a short hash of the widths, formats and quality settings, so
+changing them rebuilds every manifest while unchanged sources are skipped.
+
+Variants are built offline by scripts/build_image_derivatives.py, and on
+demand (in a background process pool) for any image a list endpoint serves
+before the script has covered it. Until then the endpoint falls back to the
+original image. A source that fails to build is not retried on every
+request: the failure is remembered per source hash and recipe, and retried
+after a backoff that doubles up to an hour. Without Pillow, derivatives are
+disabled and the originals are always served.
+"""
+
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from src.config import get_settings
+from src.services.asset_store import AssetStore, get_asset_store
+
+try:
+    from PIL import Image, features
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+logger = structlog.get_logger()
+
+# Target widths (never upscaled: a smaller source gives a single variant)
+VARIANT_WIDTHS = {"thumb": 320, "medium": 768}
+
+# Preferred first; AVIF needs Pillow >= 11.2 (or is skipped)
+FORMATS = ("avif", "webp")
+
+_ENCODE_OPTIONS = {
+    "avif": {"quality": 55, "speed": 6},
+    "webp": {"quality": 80, "method": 4},
+}
+
+_CONTENT_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+
+MANIFEST_DIR = "derivatives"
+
+# Retry a failed source after 1, 2, 4 ... minutes, at most hourly
+FAILURE_RETRY_SECONDS = 60.0
+FAILURE_RETRY_MAX_SECONDS = 3600.0
+# Failed sources remembered (oldest forgotten first)
+MAX_FAILURES = 4096
+
+
+def available_formats() -> tuple:
+    """Formats this Pillow build can encode."""
+    if Image is None:
+        return ()
+    return tuple(fmt for fmt in FORMATS if features.check(fmt))
+
+
+def recipe_id(formats: Iterable[str]) -> str:
+    """Short hash of the settings that determine a manifest's contents."""
+    recipe = json.dumps(
+        {"widths": VARIANT_WIDTHS, "formats": list(formats), "options": _ENCODE_OPTIONS},
+        sort_keys=True,
+    )
+    return hashlib.sha256(recipe.encode()).hexdigest()[:8]
+
+
+def manifest_path(root: Path, source_url: str, recipe: str) -> Optional[Path]:
+    """Where the manifest for an asset URL lives (None for non-asset URLs)."""
+    name = source_url.rsplit("/", 1)[-1]
+    digest = name.split(".", 1)[0]
+    if not source_url.startswith("/") or len(digest) != 64:
+        return None
+    return Path(root) / MANIFEST_DIR / digest[:2] / f"{digest}.{recipe}.json"
+
+
+def build_derivatives(root: str, source_url: str, formats: tuple) -> Optional[dict]:
+    """
+    Render, store and record the variants of one asset. Runs in a worker process.
+
+    Returns the manifest, or None if the source is missing or not an image.
+    """
+    store = AssetStore(Path(root))
+    source_path = store.path_for(source_url)
+    target = manifest_path(store.root, source_url, recipe_id(formats))
+    if source_path is None or target is None or not source_path.exists():
+        return None
+    if target.exists():
+        return json.loads(target.read_text())
+
+    try:
+        with Image.open(source_path) as image:
+            image.load()
+            source_width, source_height = image.size
+            # AVIF/WebP keep alpha; palette and CMYK sources are normalised
+            mode = "RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB"
+            image = image.convert(mode)
+
+            variants: List[dict] = []
+            seen_widths = set()
+            for name, width in sorted(VARIANT_WIDTHS.items(), key=lambda item: item[1]):
+                width = min(width, source_width)
+                if width in seen_widths:
+                    continue
+                seen_widths.add(width)
+                height = max(1, round(source_height * width / source_width))
+                resized = image if width == source_width else image.resize((width, height), Image.LANCZOS)
+
+                variant = {"name": name, "width": width, "height": height}
+                for fmt in formats:
+                    buffer = io.BytesIO()
+                    resized.save(buffer, format=fmt.upper(), **_ENCODE_OPTIONS[fmt])
+                    data = buffer.getvalue()
+                    variant[fmt] = store.put(data, _CONTENT_TYPES[fmt])
+                    variant[f"{fmt}_bytes"] = len(data)
+                variants.append(variant)
+    except (OSError, ValueError) as e:
+        logger.warning("image_derivative_failed", source=source_url, error=str(e))
+        return None
+
+    manifest = {
+        "source": source_url,
+        "width": source_width,
+        "height": source_height,
+        "bytes": source_path.stat().st_size,
+        "variants": variants,
+    }
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename, like AssetStore.put, so readers never see half a manifest
+    tmp = target.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest))
+    os.replace(tmp, target)
+    return manifest
+
+
+def _absolute(url: str, base_url: str) -> str:
+    return base_url + url if url.startswith("/") else url
+
+
+class ImageDerivatives:
+    """Looks up variant manifests and builds missing ones in a process pool."""
+
+    def __init__(self, store: AssetStore, workers: int = 0):
+        self.store = store
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.formats = available_formats()
+        self.recipe = recipe_id(self.formats)
+        self._manifests: Dict[str, dict] = {}
+        self._pending: Dict[str, Future] = {}
+        # "<source hash>.<recipe>" -> (failed attempts, monotonic time of next retry)
+        self._failures: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.formats)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs asyncio and DB threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def manifest(self, source_url: str) -> Optional[dict]:
+        """The variants manifest for an asset URL, if it has been built."""
+        cached = self._manifests.get(source_url)
+        if cached is not None:
+            return cached
+        path = manifest_path(self.store.root, source_url, self.recipe)
+        if path is None or not path.exists():
+            return None
+        manifest = json.loads(path.read_text())
+        self._manifests[source_url] = manifest
+        return manifest
+
+    def _record_failure(self, key: str) -> None:
+        attempts = self._failures.pop(key, (0, 0.0))[0] + 1
+        delay = min(FAILURE_RETRY_SECONDS * 2 ** (attempts - 1), FAILURE_RETRY_MAX_SECONDS)
+        self._failures[key] = (attempts, time.monotonic() + delay)
+        while len(self._failures) > MAX_FAILURES:
+            self._failures.popitem(last=False)
+
+    def schedule(self, source_url: str) -> None:
+        """Build an asset's variants in the background (deduplicated, backed off after failures)."""
+        if not self.enabled or source_url in self._pending:
+            return
+        path = manifest_path(self.store.root, source_url, self.recipe)
+        if path is None:
+            return  # Legacy data URL or external image
+        key = path.name[: -len(".json")]
+        failure = self._failures.get(key)
+        if failure is not None and time.monotonic() < failure[1]:
+            return
+
+        try:
+            future = self._get_executor().submit(
+                build_derivatives, str(self.store.root), source_url, self.formats,
+            )
+        except RuntimeError as e:  # Includes BrokenProcessPool; the next call starts a new pool
+            logger.warning("image_derivative_pool_unavailable", error=str(e))
+            self.shutdown()
+            return
+        self._pending[source_url] = future
+
+        def done(f: Future, url: str = source_url):
+            self._pending.pop(url, None)
+            if f.cancelled():
+                return
+            if f.exception() is not None:
+                logger.warning("image_derivative_failed", source=url, error=str(f.exception()))
+                self._record_failure(key)
+            elif f.result():
+                self._failures.pop(key, None)
+                self._manifests[url] = f.result()
+            else:
+                self._record_failure(key)  # Missing source or not an image
+
+        future.add_done_callback(done)
+
+    def build_all(self, source_urls: Iterable[str], force: bool = False) -> List[dict]:
+        """Build variants for many assets across the pool, blocking. Returns manifests."""
+        urls = [u for u in dict.fromkeys(source_urls) if manifest_path(self.store.root, u, self.recipe)]
+        if force:
+            for url in urls:
+                manifest_path(self.store.root, url, self.recipe).unlink(missing_ok=True)
+                self._manifests.pop(url, None)
+        if not self.enabled or not urls:
+            return []
+
+        executor = self._get_executor()
+        root = str(self.store.root)
+        results = executor.map(
+            build_derivatives, [root] * len(urls), urls, [self.formats] * len(urls), chunksize=4,
+        )
+        manifests = [m for m in results if m]
+        for manifest in manifests:
+            self._manifests[manifest["source"]] = manifest
+        return manifests
+
+    def image_set(self, source_url: str, base_url: str = "") -> Optional[dict]:
+        """
+        <picture>/srcset metadata for an asset, or None until its variants exist
+        (in which case they are scheduled).
+        """
+        if not self.enabled or not source_url:
+            return None
+        manifest = self.manifest(source_url)
+        if manifest is None:
+            self.schedule(source_url)
+            return None
+
+        variants = manifest["variants"]
+        formats = [fmt for fmt in FORMATS if all(fmt in v for v in variants)]
+        if not formats:
+            return None
+        sources = [
+            {
+                "type": _CONTENT_TYPES[fmt],
+                "srcset": ", ".join(f"{_absolute(v[fmt], base_url)} {v['width']}w" for v in variants),
+            }
+            for fmt in formats
+        ]
+        # Plain <img> fallback: the most widely supported format, largest variant
+        return {
+            "src": _absolute(variants[-1][formats[-1]], base_url),
+            "srcset": sources[-1]["srcset"],
+            "sources": sources,
+            "width": manifest["width"],
+            "height": manifest["height"],
+        }
+
+    def image_sets(self, images: Dict[str, str], base_url: str = "") -> Dict[str, dict]:
+        """image_set for each named image that has variants."""
+        sets = {}
+        for name, url in images.items():
+            image_set = self.image_set(url, base_url)
+            if image_set:
+                sets[name] = image_set
+        return sets
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_image_derivatives: Optional[ImageDerivatives] = None
+
+
+def get_image_derivatives() -> ImageDerivatives:
+    """Get the singleton image derivatives service."""
+    global _image_derivatives
+    if _image_derivatives is None:
+        _image_derivatives = ImageDerivatives(
+            get_asset_store(), workers=get_settings().image_derivative_workers,
+        )
+    return _image_derivatives
@@ -11,10 +11,9 @@ from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 import structlog
 
-from google import genai
-from google.genai import types
-
 from src.config import get_settings
+from src.ai.client import get_genai_client
+from src.services.asset_store import get_asset_store
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -51,11 +50,13 @@ async def generate_image(
     Returns:
         Image bytes or None if generation fails
     """
+    from google.genai import types
+    
     if not settings.google_api_key:
         logger.warning("image_generation_skipped", reason="No API key")
         return None
     
-    client = genai.Client(api_key=settings.google_api_key)
+    client = get_genai_client()
     
     # Try Imagen 3 Fast first
     try:
@@ -107,6 +108,11 @@ def encode_image_base64(image_bytes: bytes) -> str:
     return f"data:image/jpeg;base64,{encoded}"
 
 
+def store_image(image_bytes: bytes) -> str:
+    """Write image bytes to the asset store and return the asset URL path."""
+    return get_asset_store().put(image_bytes, "image/jpeg")
+
+
 # =============================================================================
 # Property Image Generation
 # =============================================================================
@@ -184,12 +190,13 @@ def generate_image_sync(
     aspect_ratio: str = "16:9",
 ) -> Optional[bytes]:
     """Generate an image using Imagen 3 Fast (sync version)."""
+    from google.genai import types
     
     if not settings.google_api_key:
         logger.warning("image_generation_skipped", reason="No API key")
         return None
     
-    client = genai.Client(api_key=settings.google_api_key)
+    client = get_genai_client()
     
     try:
         # Try Imagen 3 Fast
@@ -239,7 +246,7 @@ def generate_property_images_sync(
     Generate both property images (sync version).
     
     Returns:
-        Dict with 'isometric' and 'floorplan' base64 encoded images
+        Dict with 'isometric' and 'floorplan' asset URLs
     """
     images = {}
     
@@ -250,7 +257,7 @@ def generate_property_images_sync(
     # Generate isometric
     isometric_bytes = generate_image_sync(isometric_prompt, aspect_ratio="16:9")
     if isometric_bytes:
-        images["isometric"] = encode_image_base64(isometric_bytes)
+        images["isometric"] = store_image(isometric_bytes)
         logger.info("isometric_image_generated")
     else:
         logger.warning("isometric_image_failed")
@@ -258,7 +265,7 @@ def generate_property_images_sync(
     # Generate floorplan
     floorplan_bytes = generate_image_sync(floorplan_prompt, aspect_ratio="1:1")
     if floorplan_bytes:
-        images["floorplan"] = encode_image_base64(floorplan_bytes)
+        images["floorplan"] = store_image(floorplan_bytes)
         logger.info("floorplan_image_generated")
     else:
         logger.warning("floorplan_image_failed")
@@ -274,7 +281,7 @@ async def generate_property_images(
     Generate both property images in parallel.
     
     Returns:
-        Dict with 'isometric' and 'floorplan' base64 encoded images
+        Dict with 'isometric' and 'floorplan' asset URLs
     """
     images = {}
     
@@ -292,13 +299,13 @@ async def generate_property_images(
     isometric_bytes, floorplan_bytes = results
     
     if isinstance(isometric_bytes, bytes):
-        images["isometric"] = encode_image_base64(isometric_bytes)
+        images["isometric"] = store_image(isometric_bytes)
         logger.info("isometric_image_generated")
     else:
         logger.warning("isometric_image_failed", error=str(isometric_bytes))
     
     if isinstance(floorplan_bytes, bytes):
-        images["floorplan"] = encode_image_base64(floorplan_bytes)
+        images["floorplan"] = store_image(floorplan_bytes)
         logger.info("floorplan_image_generated")
     else:
         logger.warning("floorplan_image_failed", error=str(floorplan_bytes))
@@ -436,7 +443,7 @@ DO NOT include: Text, logos, watermarks, multiple characters"""
 
 
 async def generate_avatar(role: str) -> Optional[str]:
-    """Generate a single avatar image."""
+    """Generate a single avatar image, returning its asset URL."""
     
     brief = CHARACTER_BRIEFS.get(role)
     if not brief:
@@ -448,7 +455,7 @@ async def generate_avatar(role: str) -> Optional[str]:
     image_bytes = await generate_image(prompt, aspect_ratio="1:1")
     
     if image_bytes:
-        return encode_image_base64(image_bytes)
+        return store_image(image_bytes)
     
     return None
 
@@ -465,7 +472,7 @@ async def generate_all_avatars(
         variants_per_role: Number of variants per role (for diversity)
         
     Returns:
-        Dict mapping role names to base64 encoded images
+        Dict mapping role names to asset URLs
     """
     if roles is None:
         roles = list(CHARACTER_BRIEFS.keys())
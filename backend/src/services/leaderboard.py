@@ -0,0 +1,133 @@
+"""
+OSF Leaderboard - Incrementally Ranked Simulation Portfolios
+
+Each user's total value (cash + tokens x token price) is kept up to date
+as trades and resets happen, in a sorted structure keyed by value. Reads
+never recompute or re-sort:
+
+- top-K / paging: O(log n + k)
+- a user's rank: O(log n)
+- trade or reset: O(h + log n) for a user with h holdings
+
+Equal values are ordered by user_id, not by signup or insertion order.
+Simulation token prices are fixed, so they are registered once up front.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from sortedcontainers import SortedList
+
+STARTING_BALANCE = 100000.0
+
+
+@dataclass
+class _Standing:
+    """A user's leaderboard inputs and current total value."""
+    display_name: Optional[str]
+    balance: float
+    tokens: Dict[str, float] = field(default_factory=dict)  # property_id -> token amount
+    total_trades: int = 0
+    total_value: float = STARTING_BALANCE
+
+
+class LeaderboardEngine:
+    """Order-statistic ranking of simulation users by total return (ties by user_id)."""
+
+    def __init__(self, starting_balance: float = STARTING_BALANCE):
+        self.starting_balance = starting_balance
+        self._ranking: SortedList = SortedList()  # (-total_value, user_id)
+        self._standings: Dict[str, _Standing] = {}
+        self._prices: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._standings)
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def set_prices(self, prices: Dict[str, float]) -> None:
+        """Register token prices (before any users; existing users are not re-ranked)."""
+        self._prices.update(prices)
+
+    def update_user(
+        self,
+        user_id: str,
+        display_name: Optional[str],
+        balance: float,
+        holdings: List[dict],
+        total_trades: int,
+    ) -> None:
+        """Re-rank a user after signup, a trade or a reset."""
+        standing = self._standings.get(user_id)
+        if standing is not None:
+            self._ranking.remove((-standing.total_value, user_id))
+
+        standing = _Standing(display_name=display_name, balance=balance, total_trades=total_trades)
+        for holding in holdings:
+            if holding["token_amount"] > 0:
+                property_id = holding["property_id"]
+                standing.tokens[property_id] = standing.tokens.get(property_id, 0) + holding["token_amount"]
+
+        standing.total_value = self._value(standing)
+        self._standings[user_id] = standing
+        self._ranking.add((-standing.total_value, user_id))
+
+    def remove_user(self, user_id: str) -> None:
+        standing = self._standings.pop(user_id, None)
+        if standing is None:
+            return
+        self._ranking.remove((-standing.total_value, user_id))
+
+    def _value(self, standing: _Standing) -> float:
+        return standing.balance + sum(
+            amount * self._prices.get(property_id, 0.0)
+            for property_id, amount in standing.tokens.items()
+        )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def _entry(self, rank: int, user_id: str) -> dict:
+        standing = self._standings[user_id]
+        total_return = standing.total_value - self.starting_balance
+        return {
+            "rank": rank,
+            "user_id": user_id,
+            "display_name": standing.display_name or "Anonymous",
+            "portfolio_value": standing.total_value,
+            "total_return_percent": total_return / self.starting_balance * 100,
+            "total_trades": standing.total_trades,
+        }
+
+    def page(self, offset: int = 0, limit: int = 50) -> List[dict]:
+        """Entries ranked offset+1 .. offset+limit (equal values by user_id)."""
+        return [
+            self._entry(offset + i + 1, user_id)
+            for i, (_, user_id) in enumerate(self._ranking.islice(offset, offset + limit))
+        ]
+
+    def rank_of(self, user_id: str) -> Optional[dict]:
+        """A user's entry with their 1-based rank, or None if unknown."""
+        standing = self._standings.get(user_id)
+        if standing is None:
+            return None
+        index = self._ranking.index((-standing.total_value, user_id))
+        return self._entry(index + 1, user_id)
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_leaderboard: Optional[LeaderboardEngine] = None
+
+
+def get_leaderboard() -> LeaderboardEngine:
+    """Get the singleton leaderboard engine."""
+    global _leaderboard
+    if _leaderboard is None:
+        _leaderboard = LeaderboardEngine()
+    return _leaderboard
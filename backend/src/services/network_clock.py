@@ -20,6 +20,9 @@ from enum import Enum
 import structlog
 import json
 
+from src.config import get_settings
+from src.services.broadcast_hub import BroadcastHub, Subscriber
+
 logger = structlog.get_logger()
 
 
@@ -193,12 +196,17 @@ class NetworkClock:
         
         # Callbacks
         self._on_tick: Optional[Callable[[List[PendingAction]], Awaitable[dict]]] = None
-        self._on_broadcast: Optional[Callable[[str, dict], Awaitable[None]]] = None
+        self._broadcast_listeners: List[Callable[[str, dict], Awaitable[None]]] = []
         
         # Internal state
         self._task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
-        self._subscribers: List[asyncio.Queue] = []
+        settings = get_settings()
+        self.hub = BroadcastHub(
+            capacity=settings.sse_buffer_size,
+            max_drops=settings.sse_max_drops,
+            coalesce={"clock_sync"},  # Only the latest sync matters
+        )
         
         logger.info("network_clock_initialized", config=self.config.to_dict())
     
@@ -487,32 +495,23 @@ class NetworkClock:
     # Broadcasting
     # =========================================================================
     
-    def subscribe(self) -> asyncio.Queue:
-        """Subscribe to clock events."""
-        queue = asyncio.Queue()
-        self._subscribers.append(queue)
-        return queue
+    def subscribe(self) -> Subscriber:
+        """Subscribe to clock events (SSE wire bytes)."""
+        return self.hub.subscribe()
     
-    def unsubscribe(self, queue: asyncio.Queue):
+    def unsubscribe(self, subscriber: Subscriber):
         """Unsubscribe from clock events."""
-        if queue in self._subscribers:
-            self._subscribers.remove(queue)
+        self.hub.unsubscribe(subscriber)
     
     async def _broadcast(self, event: str, data: dict):
         """Broadcast event to all subscribers."""
-        message = {"event": event, "data": data, "timestamp": datetime.utcnow().isoformat()}
-        
-        # Internal subscribers
-        for queue in self._subscribers:
-            try:
-                queue.put_nowait(message)
-            except asyncio.QueueFull:
-                pass
+        # Encoded once, shared by every stream
+        self.hub.publish(event, data)
         
-        # External callback
-        if self._on_broadcast:
+        # External callbacks
+        for listener in self._broadcast_listeners:
             try:
-                await self._on_broadcast(event, data)
+                await listener(event, data)
             except Exception as e:
                 logger.error("broadcast_callback_error", error=str(e))
     
@@ -529,8 +528,8 @@ class NetworkClock:
         self._on_tick = callback
     
     def on_broadcast(self, callback: Callable[[str, dict], Awaitable[None]]):
-        """Register broadcast callback."""
-        self._on_broadcast = callback
+        """Register a broadcast callback (multiple callbacks may be registered)."""
+        self._broadcast_listeners.append(callback)
 
 
 # =============================================================================
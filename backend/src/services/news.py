@@ -0,0 +1,184 @@
+"""
+OSF Monthly News - Generated Once, Served From the Database
+
+A completed month's events don't change, so its news article is generated
+once, stored in monthly_news and served from there afterwards:
+
+- Concurrent requests for the same month share one in-flight generation
+- month_completed schedules generation in the background so the first
+  reader already gets a stored article
+- Nothing is stored when Gemini is unavailable, so a later request retries
+- Adding events to a month invalidates it: the stored article is deleted,
+  and a generation already running (which read the old events) finishes
+  for its callers but is not stored
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+import structlog
+
+from src.config import get_settings
+from src.database import async_read_session, async_session
+from src.repositories import NetworkRepository
+from src.services.admission import AdmissionRejected, get_admission
+
+logger = structlog.get_logger()
+settings = get_settings()
+
+NEWS_EVENT_LIMIT = 10
+
+# Admission key for background pregeneration
+SYSTEM_KEY = "system:news"
+
+
+def _news_payload(month: int, article: str, events: List[dict]) -> dict:
+    return {"month": month, "news": article, "events": events}
+
+
+class NewsService:
+    """Single-flight generation and persistence of monthly news."""
+
+    def __init__(self):
+        self._inflight: Dict[int, asyncio.Task] = {}
+        # Bumped by invalidate; a generation only stores if it is still current
+        self._generations: Dict[int, int] = {}
+        self.stats: Dict[str, int] = {
+            "hits": 0, "generated": 0, "coalesced": 0, "pregenerated": 0, "discarded": 0,
+        }
+
+    async def get_news(self, month: int, admission_key: str) -> dict:
+        """Stored article for the month, generating it (once) on a miss."""
+        async with async_read_session() as session:
+            stored = await NetworkRepository(session).get_monthly_news(month)
+        if stored is not None:
+            self.stats["hits"] += 1
+            return _news_payload(month, stored.article, stored.events or [])
+        return await self._join(month, admission_key)
+
+    def pregenerate(self, month: int) -> None:
+        """Generate a just-completed month's article in the background."""
+        if month in self._inflight:
+            return
+        self.stats["pregenerated"] += 1
+        self._start(month, SYSTEM_KEY)
+
+    async def invalidate(self, month: int) -> None:
+        """Drop a stored article (e.g. after events were added to its month)."""
+        self._generations[month] = self._generations.get(month, 0) + 1
+        # Later requests start a new generation instead of joining the stale one
+        self._inflight.pop(month, None)
+        async with async_session() as session:
+            await NetworkRepository(session).delete_monthly_news(month)
+            await session.commit()
+
+    def _start(self, month: int, admission_key: str) -> asyncio.Task:
+        task = asyncio.create_task(self._generate(month, admission_key, self._generations.get(month, 0)))
+        self._inflight[month] = task
+        task.add_done_callback(lambda t: self._inflight.pop(month) if self._inflight.get(month) is t else None)
+        if admission_key == SYSTEM_KEY:
+            task.add_done_callback(self._log_background_failure)
+        return task
+
+    async def _join(self, month: int, admission_key: str) -> dict:
+        task = self._inflight.get(month)
+        if task is None:
+            task = self._start(month, admission_key)
+        else:
+            self.stats["coalesced"] += 1
+        # Shield so one caller disconnecting doesn't cancel everyone's generation
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _log_background_failure(task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if isinstance(error, AdmissionRejected):
+            logger.info("news_pregeneration_deferred", reason=error.reason)
+        elif error is not None:
+            logger.error("news_pregeneration_failed", error=str(error))
+
+    async def _generate(self, month: int, admission_key: str, generation: int) -> dict:
+        from src.services.event_generator import (
+            get_event_generator, SimulationEvent, EventCategory, EventSeverity,
+        )
+        from src.services.network_clock import get_network_clock
+
+        async with async_read_session() as session:
+            db_events = await NetworkRepository(session).get_events(
+                network_month=month, limit=NEWS_EVENT_LIMIT,
+            )
+
+        if not db_events:
+            return _news_payload(month, "No events recorded for this month.", [])
+
+        event_dicts = [
+            {
+                "id": e.id,
+                "title": e.title,
+                "description": e.description,
+                "type": e.event_type,
+                "severity": e.severity,
+            }
+            for e in db_events
+        ]
+
+        # Convert to SimulationEvent objects for news generation
+        categories = {c.value for c in EventCategory}
+        severities = {s.value for s in EventSeverity}
+        events = [
+            SimulationEvent(
+                id=e.id,
+                category=EventCategory(e.event_type) if e.event_type in categories else EventCategory.MARKET,
+                severity=EventSeverity(e.severity) if e.severity in severities else EventSeverity.INFO,
+                title=e.title,
+                description=e.description or "",
+                impact={},
+                narrative="",
+                month=e.network_month,
+            )
+            for e in db_events
+        ]
+
+        generator = get_event_generator()
+        article: Optional[str] = None
+        if settings.google_api_key:
+            async with get_admission().slot(admission_key):
+                article = await generator.compose_news_article(events, month)
+
+        if article is None:
+            fallback = f"Month {month} saw {len(events)} notable events in the OSF network."
+            return _news_payload(month, fallback, event_dicts)
+
+        self.stats["generated"] += 1
+        if self._generations.get(month, 0) != generation:
+            # Events were added while this ran; the next request regenerates
+            self.stats["discarded"] += 1
+            logger.info("monthly_news_discarded", month=month)
+        # Only completed months are final; later months may still gain events
+        elif month <= get_network_clock().current_month:
+            async with async_session() as session:
+                await NetworkRepository(session).save_monthly_news(month, article, event_dicts)
+                await session.commit()
+            logger.info("monthly_news_stored", month=month, events=len(event_dicts))
+
+        return _news_payload(month, article, event_dicts)
+
+    def get_stats(self) -> dict:
+        return {**self.stats, "in_flight": len(self._inflight)}
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_news_service: Optional[NewsService] = None
+
+
+def get_news_service() -> NewsService:
+    """Get the singleton news service."""
+    global _news_service
+    if _news_service is None:
+        _news_service = NewsService()
+    return _news_service
@@ -4,10 +4,10 @@ Manages the connection between users and their simulation participants
 """
 
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional, Tuple
 import structlog
 
-from src.database import async_session
+from src.database import async_session, async_read_session
 from src.repositories.participant import ParticipantRepository
 from src.models.network import Participant
 
@@ -61,6 +61,26 @@ async def get_participant_by_user(user_id: str) -> Optional[Participant]:
         return await repo.get_by_user_id(user_id)
 
 
+async def list_participants(
+    participant_type: Optional[str] = None,
+    role: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Participant], Optional[str]]:
+    """Get a page of active participants and the cursor for the next page."""
+    from src.repositories.pagination import created_key, next_cursor
+    
+    async with async_read_session() as session:
+        repo = ParticipantRepository(session)
+        participants = await repo.get_all(
+            participant_type=participant_type,
+            role=role,
+            limit=limit,
+            cursor=cursor,
+        )
+        return participants, next_cursor(participants, limit, created_key)
+
+
 async def update_participant_role(
     user_id: str,
     new_role: str,
@@ -0,0 +1,329 @@
+"""
+OSF Pool Search - Faceted In-Memory Index over the Property Pool
+
+Built from pool_properties at startup (and on /pool/reload), kept current
+as properties are enabled. Each property gets an ordinal in pool order;
+sets of properties are Python ints used as bitmaps, so:
+
+- Term filters (suburb, type, status, bedrooms) are one precomputed mask
+  per value; several values of a field are OR-ed, fields are AND-ed.
+- Range filters (price, yield, bedrooms, land size) bisect a sorted array
+  and turn the rank range into a mask from prefix masks kept every 64 ranks.
+- Facet counts are popcounts of (value mask & result). Each field's counts
+  ignore that field's own filter, so a UI can offer the other suburbs
+  while one is selected.
+- Sorting walks the field's sorted array 64 ranks at a time, skipping a
+  block with one AND when it holds no matches, or sorts the matching
+  ordinals directly when there are few of them.
+
+The index lives in the API process. Enables made by another worker
+process show up here after the next /pool/reload.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from src.repositories.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+logger = structlog.get_logger()
+
+TERM_FIELDS = ("suburb", "property_type", "status", "bedrooms")
+RANGE_FIELDS = ("valuation", "gross_yield", "bedrooms", "land_size")
+SORT_FIELDS = ("position",) + RANGE_FIELDS
+
+# Prefix and block masks every BLOCK ranks: at most BLOCK - 1 bits are
+# OR-ed per range end, and a page walk tests at most BLOCK bits per block
+BLOCK = 64
+
+# Up to this many matches, sort the matches; above, walk the sorted array
+SPARSE_MATCHES = 256
+
+# Bit positions set in each byte value, for turning a mask into ordinals
+_BYTE_BITS = [tuple(i for i in range(8) if b >> i & 1) for b in range(256)]
+
+
+def _ordinals(mask: int) -> List[int]:
+    """Set bits of a mask, ascending."""
+    raw = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    return [
+        (index << 3) + bit
+        for index, byte in enumerate(raw) if byte
+        for bit in _BYTE_BITS[byte]
+    ]
+
+
+def _summary(entry: dict) -> dict:
+    """The search-result fields of a pool property."""
+    data = entry.get("data") or {}
+    listing = entry.get("listing") or {}
+    images = entry.get("images") or {}
+    return {
+        "id": entry["id"],
+        "address": data.get("address", ""),
+        "suburb": data.get("suburb", ""),
+        "property_type": data.get("property_type", ""),
+        "bedrooms": int(data.get("bedrooms") or 0),
+        "bathrooms": int(data.get("bathrooms") or 0),
+        "valuation": int(data.get("valuation") or 0),
+        "gross_yield": float(data.get("gross_yield") or 0.0),
+        "land_size": int(data.get("land_size") or 0),
+        "headline": listing.get("headline"),
+        "highlights": listing.get("highlights"),
+        "has_images": bool(images.get("isometric")),
+        "images": images,
+    }
+
+
+class _SortedField:
+    """One numeric field's values in sorted order, with rank-range and block masks."""
+
+    def __init__(self, values: List[float], positions: List[int]):
+        # Ties broken by pool position, which also makes cursors unambiguous
+        self.order = sorted(range(len(values)), key=lambda d: (values[d], positions[d]))
+        self.keys = [(values[d], positions[d]) for d in self.order]
+        self.rank = [0] * len(values)
+        for r, d in enumerate(self.order):
+            self.rank[d] = r
+
+        self.prefix = [0]
+        self.blocks = []
+        mask = block = 0
+        for r, d in enumerate(self.order, 1):
+            mask |= 1 << d
+            block |= 1 << d
+            if r % BLOCK == 0 or r == len(self.order):
+                self.blocks.append(block)
+                block = 0
+                if r % BLOCK == 0:
+                    self.prefix.append(mask)
+
+    def _prefix_mask(self, end: int) -> int:
+        """Mask of the ordinals ranked below end."""
+        block = end // BLOCK
+        mask = self.prefix[block]
+        for d in self.order[block * BLOCK:end]:
+            mask |= 1 << d
+        return mask
+
+    def range_mask(self, low: Optional[float], high: Optional[float]) -> int:
+        start = bisect_left(self.keys, (low, -1)) if low is not None else 0
+        end = bisect_right(self.keys, (high, float("inf"))) if high is not None else len(self.keys)
+        if start >= end:
+            return 0
+        return self._prefix_mask(end) ^ self._prefix_mask(start)
+
+
+class PoolSearchIndex:
+    """Filter, facet, sort and page over the property pool in memory."""
+
+    def __init__(self):
+        self.build([])
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def build(self, entries: Iterable[dict]) -> None:
+        """
+        Replace the index contents. Entries are pool properties as dicts
+        (id, position, status, data, listing, images), in any order.
+        """
+        entries = sorted(entries, key=lambda e: e["position"])
+        summaries = [_summary(e) for e in entries]
+        positions = [e["position"] for e in entries]
+        statuses = [e.get("status") or "draft" for e in entries]
+
+        terms: Dict[str, Dict[object, int]] = {field: {} for field in TERM_FIELDS}
+        for d, (summary, status) in enumerate(zip(summaries, statuses)):
+            bit = 1 << d
+            for field in TERM_FIELDS:
+                value = status if field == "status" else summary[field]
+                terms[field][value] = terms[field].get(value, 0) | bit
+
+        sorted_fields = {"position": _SortedField(positions, positions)}
+        for field in RANGE_FIELDS:
+            sorted_fields[field] = _SortedField([s[field] for s in summaries], positions)
+
+        # Swap everything in at once (build runs between awaits)
+        self._ids = {s["id"]: d for d, s in enumerate(summaries)}
+        self._summaries = summaries
+        self._positions = positions
+        self._statuses = statuses
+        self._terms = terms
+        self._sorted = sorted_fields
+        self._all = (1 << len(summaries)) - 1
+
+    async def rebuild(self) -> int:
+        """Rebuild from the pool_properties table. Returns the property count."""
+        from src.database import async_read_session
+        from src.repositories import PoolRepository
+
+        async with async_read_session() as session:
+            rows = await PoolRepository(session).all_properties()
+        self.build(
+            {
+                "id": p.id, "position": p.position, "status": p.status,
+                "data": p.data, "listing": p.listing, "images": p.images,
+            }
+            for p in rows
+        )
+        logger.info("pool_search_index_built", count=len(self))
+        return len(self)
+
+    def set_status(self, property_id: str, status: str) -> None:
+        """Move a property between status values (after enabling it)."""
+        d = self._ids.get(property_id)
+        if d is None or self._statuses[d] == status:
+            return
+        bit = 1 << d
+        masks = self._terms["status"]
+        masks[self._statuses[d]] &= ~bit
+        masks[status] = masks.get(status, 0) | bit
+        self._statuses[d] = status
+
+    def search(
+        self,
+        terms: Optional[Dict[str, List[object]]] = None,
+        ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        sort: str = "position",
+        descending: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        facets: bool = True,
+    ) -> dict:
+        """
+        Matching properties, one page at a time.
+
+        terms maps a TERM_FIELDS name to accepted values; ranges maps a
+        RANGE_FIELDS name to inclusive (min, max) bounds, either may be None.
+        Returns total, items (summaries with status), facets and next_cursor.
+        """
+        if sort not in self._sorted:
+            raise ValueError(f"Unknown sort field: {sort}")
+
+        filters: Dict[str, int] = {}
+        for field, values in (terms or {}).items():
+            if values:
+                masks = self._terms[field]
+                mask = 0
+                for value in values:
+                    mask |= masks.get(value, 0)
+                filters[field] = mask
+        for field, (low, high) in (ranges or {}).items():
+            if low is not None or high is not None:
+                mask = self._sorted[field].range_mask(low, high)
+                # Same-named term and range filters (bedrooms) both apply
+                filters[field] = filters[field] & mask if field in filters else mask
+
+        result = self._all
+        for mask in filters.values():
+            result &= mask
+
+        items, following = self._page(result, sort, descending, limit, cursor)
+        return {
+            "total": result.bit_count(),
+            "items": items,
+            "facets": self._facets(filters) if facets else None,
+            "next_cursor": following,
+        }
+
+    def _page(
+        self, result: int, sort: str, descending: bool, limit: int, cursor: Optional[str],
+    ) -> Tuple[List[dict], Optional[str]]:
+        field = self._sorted[sort]
+        size = len(field.order)
+
+        # Ranks still to visit: [start, size) ascending, [0, end) descending
+        start, end = 0, size
+        if cursor:
+            values = decode_cursor(cursor)
+            if values.get("s") != sort or values.get("d", False) != descending or "k" not in values:
+                raise InvalidCursorError("Cursor is for a different sort")
+            key = tuple(values["k"])
+            if descending:
+                end = bisect_left(field.keys, key)
+            else:
+                start = bisect_right(field.keys, key)
+
+        count = result.bit_count()
+        if count <= SPARSE_MATCHES:
+            ranks = sorted((field.rank[d] for d in _ordinals(result)), reverse=descending)
+            if descending:
+                ranks = [r for r in ranks if r < end]
+            else:
+                ranks = [r for r in ranks if r >= start]
+            page = [field.order[r] for r in ranks[:limit]]
+        else:
+            page = self._walk(field, result, start, end, descending, limit)
+
+        items = [{**self._summaries[d], "status": self._statuses[d]} for d in page]
+        following = None
+        if len(page) == limit:
+            last = field.keys[field.rank[page[-1]]]
+            following = encode_cursor({"s": sort, "d": descending, "k": list(last)})
+        return items, following
+
+    @staticmethod
+    def _walk(
+        field: _SortedField, result: int, start: int, end: int, descending: bool, limit: int,
+    ) -> List[int]:
+        """First limit matches in rank order, skipping blocks without matches."""
+        raw = result.to_bytes((len(field.order) + 7) // 8, "little")
+        page: List[int] = []
+        if descending:
+            r = end - 1
+            while r >= start and len(page) < limit:
+                block_start = r // BLOCK * BLOCK
+                if result & field.blocks[r // BLOCK]:
+                    for rank in range(r, block_start - 1, -1):
+                        d = field.order[rank]
+                        if raw[d >> 3] >> (d & 7) & 1:
+                            page.append(d)
+                            if len(page) == limit:
+                                break
+                r = block_start - 1
+        else:
+            r = start
+            while r < end and len(page) < limit:
+                block_end = min(r // BLOCK * BLOCK + BLOCK, end)
+                if result & field.blocks[r // BLOCK]:
+                    for rank in range(r, block_end):
+                        d = field.order[rank]
+                        if raw[d >> 3] >> (d & 7) & 1:
+                            page.append(d)
+                            if len(page) == limit:
+                                break
+                r = block_end
+        return page
+
+    def _facets(self, filters: Dict[str, int]) -> Dict[str, Dict[str, int]]:
+        """Per-value counts for each term field, ignoring that field's own filter."""
+        facets = {}
+        for field in TERM_FIELDS:
+            base = self._all
+            for other, mask in filters.items():
+                if other != field:
+                    base &= mask
+            counts = {}
+            for value, mask in self._terms[field].items():
+                count = (mask & base).bit_count()
+                if count:
+                    counts[str(value)] = count
+            facets[field] = dict(sorted(counts.items(), key=lambda item: -item[1]))
+        return facets
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_pool_search_index: Optional[PoolSearchIndex] = None
+
+
+def get_pool_search_index() -> PoolSearchIndex:
+    """Get the singleton pool search index."""
+    global _pool_search_index
+    if _pool_search_index is None:
+        _pool_search_index = PoolSearchIndex()
+    return _pool_search_index
@@ -15,10 +15,8 @@ from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field, asdict
 import structlog
 
-from google import genai
-from google.genai import types
-
 from src.config import get_settings
+from src.ai.client import get_genai_client
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -199,7 +197,7 @@ class GeneratedProperty:
     status: str  # draft, available, tenanted, archived
     data: PropertyData
     listing: Optional[PropertyListing] = None
-    images: Dict[str, str] = field(default_factory=dict)  # base64 encoded
+    images: Dict[str, str] = field(default_factory=dict)  # asset URLs
     created_at: str = ""
     
     def to_dict(self) -> dict:
@@ -446,6 +444,7 @@ IMPORTANT:
 
 def generate_property_listing_sync(property_data: PropertyData) -> Optional[PropertyListing]:
     """Generate marketing listing using Gemini (sync version)."""
+    from google.genai import types
     
     if not settings.google_api_key:
         logger.warning("listing_generation_skipped", reason="No API key")
@@ -475,7 +474,7 @@ def generate_property_listing_sync(property_data: PropertyData) -> Optional[Prop
     )
     
     try:
-        client = genai.Client(api_key=settings.google_api_key)
+        client = get_genai_client()
         
         # Use sync client instead of async
         response = client.models.generate_content(
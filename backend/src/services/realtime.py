@@ -0,0 +1,193 @@
+"""
+OSF Realtime Bus - Topic Fan-Out for the Multiplexed WebSocket
+
+One connection per user carries every realtime topic:
+- clock: network clock broadcasts (clock_sync coalesced)
+- events: network events for properties the user holds (or that name them)
+- alerts: MonthResult alerts addressed to the user or to "all"
+- chat: token streams for chat requests made over the socket
+
+Frames are compact JSON arrays, [topic, event, data], serialized once per
+message and filtered server-side before they are queued for a connection.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import select
+import structlog
+
+from src.config import get_settings
+from src.serialization import dumps_str
+from src.services.broadcast_hub import Subscriber
+
+logger = structlog.get_logger()
+settings = get_settings()
+
+TOPICS = {"clock", "events", "alerts", "chat"}
+# Filtered to one user, so only for an authenticated user
+USER_TOPICS = {"events", "alerts"}
+
+
+def encode_frame(topic: str, event: str, data: Any) -> str:
+    """Encode one compact [topic, event, data] frame."""
+    return dumps_str([topic, event, data])
+
+
+class Connection:
+    """A user's socket: topic subscriptions, filters and a bounded outbox."""
+
+    def __init__(self, user_id: Optional[str]):
+        self.user_id = user_id
+        self.participant_id: Optional[str] = None
+        self.property_ids: Set[str] = set()
+        self.topics: Set[str] = set()
+        self.outbox = Subscriber(settings.sse_buffer_size, settings.sse_max_drops)
+
+    def wants_event(self, event: dict) -> bool:
+        property_id = event.get("property_id")
+        if property_id and property_id in self.property_ids:
+            return True
+        participant_id = event.get("participant_id")
+        return bool(participant_id) and participant_id == self.participant_id
+
+    def wants_alert(self, alert: dict) -> bool:
+        to = alert.get("to")
+        return to == "all" or (to is not None and to in (self.user_id, self.participant_id))
+
+
+class RealtimeBus:
+    """Tracks connections and delivers filtered topic frames."""
+
+    def __init__(self):
+        self._connections: Set[Connection] = set()
+        self.frames_sent = 0
+
+    def connect(self, user_id: Optional[str]) -> Connection:
+        connection = Connection(user_id)
+        self._connections.add(connection)
+        return connection
+
+    def disconnect(self, connection: Connection) -> None:
+        self._connections.discard(connection)
+        connection.outbox.close()
+
+    def _deliver(
+        self,
+        topic: str,
+        event: str,
+        frame: str,
+        connections: Iterable[Connection],
+        coalesce: bool = False,
+    ) -> int:
+        delivered = 0
+        for connection in connections:
+            if connection.outbox.push(f"{topic}:{event}", frame, coalesce):
+                delivered += 1
+            else:
+                logger.warning("ws_connection_lagging", user_id=connection.user_id)
+        self.frames_sent += delivered
+        return delivered
+
+    # =========================================================================
+    # Topic publishers
+    # =========================================================================
+
+    async def on_clock(self, event: str, data: dict) -> None:
+        """Clock broadcast listener (see NetworkClock.on_broadcast)."""
+        listeners = [c for c in self._connections if "clock" in c.topics]
+        if listeners:
+            frame = encode_frame("clock", event, data)
+            self._deliver("clock", event, frame, listeners, coalesce=event == "clock_sync")
+
+    async def publish_month(self, events: List[dict], alerts: List[dict]) -> None:
+        """Deliver a processed month's events and alerts."""
+        if not self._connections:
+            return
+        # Holdings change with each month's trades
+        await self.refresh_holdings()
+        delivered = self.publish_events(events) + self.publish_alerts(alerts)
+        logger.debug("ws_month_published", events=len(events), alerts=len(alerts), delivered=delivered)
+
+    def publish_events(self, events: List[dict]) -> int:
+        """Deliver events to connections holding the affected property."""
+        listeners = [c for c in self._connections if "events" in c.topics]
+        delivered = 0
+        for event in events:
+            targets = [c for c in listeners if c.wants_event(event)]
+            if targets:
+                frame = encode_frame("events", event.get("category") or event.get("type", "event"), event)
+                delivered += self._deliver("events", "event", frame, targets)
+        return delivered
+
+    def publish_alerts(self, alerts: List[dict]) -> int:
+        """Deliver MonthResult alerts to their recipients."""
+        listeners = [c for c in self._connections if "alerts" in c.topics]
+        delivered = 0
+        for alert in alerts:
+            targets = [c for c in listeners if c.wants_alert(alert)]
+            if targets:
+                frame = encode_frame("alerts", alert.get("type", "alert"), alert)
+                delivered += self._deliver("alerts", "alert", frame, targets)
+        return delivered
+
+    # =========================================================================
+    # Filters
+    # =========================================================================
+
+    async def refresh_holdings(self, connections: Optional[Iterable[Connection]] = None) -> None:
+        """Reload participant ids and held properties for connected users (one query each)."""
+        from src.database import async_read_session
+        from src.models.network import Participant, ParticipantHolding
+
+        targets = [c for c in (connections or self._connections) if c.user_id]
+        if not targets:
+            return
+        user_ids = {c.user_id for c in targets}
+
+        try:
+            async with async_read_session() as session:
+                result = await session.execute(
+                    select(Participant.user_id, Participant.id)
+                    .where(Participant.user_id.in_(user_ids))
+                )
+                participant_by_user = dict(result.all())
+
+                properties: Dict[str, Set[str]] = {}
+                if participant_by_user:
+                    result = await session.execute(
+                        select(ParticipantHolding.participant_id, ParticipantHolding.property_id)
+                        .where(ParticipantHolding.participant_id.in_(participant_by_user.values()))
+                    )
+                    for participant_id, property_id in result.all():
+                        properties.setdefault(participant_id, set()).add(property_id)
+        except Exception as e:
+            logger.error("ws_holdings_refresh_failed", error=str(e))
+            return
+
+        for connection in targets:
+            connection.participant_id = participant_by_user.get(connection.user_id)
+            connection.property_ids = properties.get(connection.participant_id, set())
+
+    def get_metrics(self) -> dict:
+        topic_counts = {t: sum(1 for c in self._connections if t in c.topics) for t in sorted(TOPICS)}
+        return {
+            "connections": len(self._connections),
+            "topics": topic_counts,
+            "frames_sent": self.frames_sent,
+            "dropped": sum(c.outbox.dropped for c in self._connections),
+        }
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_realtime_bus: Optional[RealtimeBus] = None
+
+
+def get_realtime_bus() -> RealtimeBus:
+    """Get the singleton realtime bus."""
+    global _realtime_bus
+    if _realtime_bus is None:
+        _realtime_bus = RealtimeBus()
+    return _realtime_bus
@@ -0,0 +1,141 @@
+"""
+OSF Response Cache - Month-Versioned Cache for Polled Endpoints
+
+Network state only changes when a tick completes or an action lands, so
+polled GET endpoints serve pre-serialized bytes until then.
+
+Entries are keyed by (endpoint, params) and stamped with the world month
+and the cache's state version; a month change or any invalidate() makes
+them stale. Each entry carries a strong ETag so clients polling with
+If-None-Match get an empty 304 (suffixed with the encoding for brotli/gzip
+bodies, so each representation has its own validator), and keeps its
+encodings once made, so a month's response is compressed once however often
+it is polled.
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+import structlog
+
+from src.compression import compress, encoded_etag, etag_matches, get_compression_stats, negotiate
+from src.serialization import dumps
+
+logger = structlog.get_logger()
+
+# Smaller cached bodies are sent as-is
+MIN_COMPRESS_SIZE = 512
+
+
+@dataclass
+class CachedResponse:
+    """Serialized response body and validators."""
+    body: bytes
+    etag: str
+    month: int
+    version: int
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    def encode(self, encoding: str) -> bytes:
+        """The body in an encoding, compressed on first use."""
+        data = self.encoded.get(encoding)
+        if data is None:
+            data = self.encoded[encoding] = compress(self.body, encoding)
+        return data
+
+
+class ResponseCache:
+    """LRU of serialized JSON responses, invalidated by version bumps."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.version = 0
+        self._entries: "OrderedDict[Tuple[str, tuple], CachedResponse]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "not_modified": 0, "invalidations": 0}
+
+    def invalidate(self, reason: str = "") -> None:
+        """Mark every cached response stale."""
+        self.version += 1
+        self._entries.clear()
+        self.stats["invalidations"] += 1
+        logger.debug("response_cache_invalidated", reason=reason, version=self.version)
+
+    def get(self, key: Tuple[str, tuple], month: int) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None or entry.month != month or entry.version != self.version:
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Tuple[str, tuple], month: int, content: Any) -> CachedResponse:
+        body = dumps(content)
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        entry = CachedResponse(body=body, etag=etag, month=month, version=self.version)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    async def respond(
+        self,
+        request: Request,
+        month: int,
+        build: Callable[[], Any],
+        **params: Any,
+    ) -> Response:
+        """
+        Serve a cached JSON response for this endpoint and params.
+
+        build may be sync or async; it runs only on a miss.
+        """
+        key = (request.url.path, tuple(sorted(params.items())))
+        entry = self.get(key, month)
+        if entry is None:
+            self.stats["misses"] += 1
+            content = build()
+            if hasattr(content, "__await__"):
+                content = await content
+            entry = self.put(key, month, content)
+        else:
+            self.stats["hits"] += 1
+
+        encoding = None
+        headers = {"Cache-Control": "no-cache"}
+        if len(entry.body) >= MIN_COMPRESS_SIZE:
+            headers["Vary"] = "Accept-Encoding"
+            encoding = negotiate(request.headers.get("accept-encoding"))
+        headers["ETag"] = encoded_etag(entry.etag, encoding)
+
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            self.stats["not_modified"] += 1
+            return Response(status_code=304, headers=headers)
+
+        if encoding:
+            body = entry.encode(encoding)
+            get_compression_stats().record("cache", encoding, len(entry.body), len(body))
+            headers["Content-Encoding"] = encoding
+            return Response(content=body, media_type="application/json", headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    def get_stats(self) -> dict:
+        return {**self.stats, "entries": len(self._entries), "version": self.version}
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the singleton response cache."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
@@ -0,0 +1,674 @@
+"""
+OSF Simulation Store - Write-Behind Cache for Simulation Mode
+
+Simulation endpoints read and write plain dicts in memory, as before, but
+the state now lives in the sim_* and feedback_* tables:
+
+- Startup loads every row into memory, with hash indexes for the hot
+  lookups (email -> user, user -> holdings by property)
+- Mutations mark (kind, key) dirty; a background task flushes dirty rows
+  in batches (one transaction, multi-row upserts) every SIM_FLUSH_INTERVAL
+- A dirty key whose row no longer exists in memory is deleted
+- Shutdown flushes whatever is left
+
+The database is read only at startup, so simulation mode supports one API
+process. Several workers would each serve their own copy of users,
+balances and holdings until the next restart (see SIMULATION_MODE.md).
+Vote tallies are still written as increments (votes_for = votes_for + :n)
+rather than as the process's own total, so two processes overlapping
+during a restart or deploy do not lose votes.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import NAMESPACE_URL, uuid5
+
+from sqlalchemy import delete, select, update
+import structlog
+
+from src.config import get_settings
+from src.database import async_session
+from src.models.simulation import (
+    SimUser,
+    SimProperty,
+    SimHolding,
+    SimTransaction,
+    SimProposal,
+    SimVote,
+    FeedbackItem,
+    FeedbackVote,
+    FeedbackComment,
+)
+
+logger = structlog.get_logger()
+
+# Author of seeded proposals and feedback
+SYSTEM_USER_ID = "system"
+SYSTEM_USER_NAME = "OSF Team"
+
+# Rows per INSERT statement (keeps SQLite under its bound-parameter limit)
+UPSERT_CHUNK = 200
+
+# Parents before children so foreign keys resolve
+FLUSH_ORDER = (
+    "user", "holding", "transaction", "proposal", "proposal_vote",
+    "feedback", "feedback_vote", "comment",
+)
+
+# Counters shared by every worker: flushed as increments, never overwritten
+TALLIES = {
+    "proposal": ("votes_for", "votes_against"),
+    "feedback": ("upvotes", "downvotes"),
+}
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _dt(value) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _dec(value) -> Decimal:
+    return Decimal(str(value or 0))
+
+
+def _row_id(*parts: str) -> str:
+    """Stable id for rows keyed by a natural key (holdings, feedback votes)."""
+    return str(uuid5(NAMESPACE_URL, "/".join(parts)))
+
+
+def _upsert(session, model, rows: List[dict], update: bool = True, keep: Iterable[str] = ()):
+    """
+    INSERT ... ON CONFLICT (id) for PostgreSQL and SQLite.
+
+    An existing row keeps its created_at and the `keep` columns; they are
+    only written when the row is inserted.
+    """
+    if session.bind.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    stmt = insert(model).values(rows)
+    if not update:
+        return stmt.on_conflict_do_nothing(index_elements=["id"])
+    keep = {"id", "created_at", *keep}
+    return stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={name: stmt.excluded[name] for name in rows[0] if name not in keep},
+    )
+
+
+class SimStore:
+    """In-memory simulation state with batched write-behind persistence."""
+
+    def __init__(self, flush_interval: float = 1.0):
+        self.flush_interval = flush_interval
+
+        self.users: Dict[str, dict] = {}
+        self.user_by_email: Dict[str, str] = {}
+        self.holdings: Dict[str, Dict[str, dict]] = {}  # user_id -> property_id -> holding
+        self.transactions: Dict[str, List[dict]] = {}  # user_id -> transactions
+        self.proposals: Dict[str, dict] = {}
+        self.feedback: Dict[str, dict] = {}
+        self.feedback_votes: Dict[str, Dict[str, int]] = {}  # feedback_id -> {user_id: vote}
+        self.feedback_comments: Dict[str, List[dict]] = {}
+        self.property_addresses: Dict[str, str] = {}
+
+        # Append-only rows waiting for their first flush
+        self._new_proposal_votes: Dict[str, dict] = {}
+        # Tally changes not yet in the database: kind -> id -> column -> delta
+        # (_flushing holds the ones the running flush is writing)
+        self._tallies: Dict[str, Dict[str, Dict[str, float]]] = {kind: {} for kind in TALLIES}
+        self._flushing: Dict[str, Dict[str, Dict[str, float]]] = {kind: {} for kind in TALLIES}
+
+        self._dirty: Dict[str, Set] = {kind: set() for kind in FLUSH_ORDER}
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.stats: Dict[str, int] = {"flushes": 0, "rows_written": 0, "rows_deleted": 0, "flush_errors": 0}
+
+    def _mark(self, kind: str, key) -> None:
+        self._dirty[kind].add(key)
+
+    def _add_tally(self, kind: str, key: str, column: str, delta: float) -> None:
+        deltas = self._tallies[kind].setdefault(key, {})
+        deltas[column] = deltas.get(column, 0) + delta
+
+    def _unflushed(self, kind: str, key: str, column: str) -> float:
+        """Part of a tally this worker has counted but the database has not."""
+        return (
+            self._tallies[kind].get(key, {}).get(column, 0)
+            + self._flushing[kind].get(key, {}).get(column, 0)
+        )
+
+    def display_name(self, user_id: str) -> str:
+        if user_id == SYSTEM_USER_ID:
+            return SYSTEM_USER_NAME
+        user = self.users.get(user_id)
+        return (user or {}).get("display_name") or "Anonymous"
+
+    # =========================================================================
+    # Mutations (callers change the dicts, then report the change here)
+    # =========================================================================
+
+    def add_user(self, user: dict) -> None:
+        self.users[user["id"]] = user
+        self.user_by_email[user["email"]] = user["id"]
+        self.holdings[user["id"]] = {}
+        self.transactions[user["id"]] = []
+        self._mark("user", user["id"])
+
+    def touch_user(self, user_id: str) -> None:
+        self._mark("user", user_id)
+
+    def set_holding(self, user_id: str, property_id: str, holding: Optional[dict]) -> None:
+        """Store a holding, or remove it when holding is None."""
+        if holding is None:
+            self.holdings[user_id].pop(property_id, None)
+        else:
+            self.holdings[user_id][property_id] = holding
+        self._mark("holding", (user_id, property_id))
+
+    def add_transaction(self, user_id: str, tx: dict) -> None:
+        self.transactions[user_id].append(tx)
+        self._mark("transaction", (user_id, tx["id"]))
+
+    def reset_user(self, user_id: str, reset_tx: dict) -> None:
+        """Drop a user's holdings and transaction history, keeping only reset_tx."""
+        for property_id in self.holdings[user_id]:
+            self._mark("holding", (user_id, property_id))
+        for tx in self.transactions[user_id]:
+            self._mark("transaction", (user_id, tx["id"]))
+        self.holdings[user_id] = {}
+        self.transactions[user_id] = []
+        self.add_transaction(user_id, reset_tx)
+        self.touch_user(user_id)
+
+    def add_proposal(self, proposal: dict) -> None:
+        self.proposals[proposal["id"]] = proposal
+        self._mark("proposal", proposal["id"])
+
+    def record_proposal_vote(self, proposal_id: str, user_id: str, vote: str, voting_power: float) -> None:
+        vote_id = _row_id("proposal-vote", proposal_id, user_id, datetime.utcnow().isoformat())
+        self._new_proposal_votes[vote_id] = {
+            "id": vote_id,
+            "user_id": user_id,
+            "proposal_id": proposal_id,
+            "vote": vote,
+            "voting_power": _dec(voting_power),
+            "created_at": datetime.utcnow(),
+        }
+        if vote in ("for", "against"):
+            self._add_tally("proposal", proposal_id, f"votes_{vote}", _dec(voting_power))
+        self._mark("proposal_vote", vote_id)
+        self._mark("proposal", proposal_id)
+
+    def add_feedback(self, item: dict) -> None:
+        self.feedback[item["id"]] = item
+        self.feedback_votes[item["id"]] = {}
+        self.feedback_comments[item["id"]] = []
+        self._mark("feedback", item["id"])
+
+    def touch_feedback(self, feedback_id: str) -> None:
+        self._mark("feedback", feedback_id)
+
+    def set_feedback_vote(self, feedback_id: str, user_id: str, vote: int) -> None:
+        """Record a vote (0 removes it) and the item's new tallies."""
+        previous = self.feedback_votes[feedback_id].get(user_id, 0)
+        for value, delta in ((previous, -1), (vote, 1)):
+            if value:
+                self._add_tally("feedback", feedback_id, "upvotes" if value > 0 else "downvotes", delta)
+        if vote:
+            self.feedback_votes[feedback_id][user_id] = vote
+        else:
+            self.feedback_votes[feedback_id].pop(user_id, None)
+        self._mark("feedback_vote", (feedback_id, user_id))
+        self._mark("feedback", feedback_id)
+
+    def add_comment(self, feedback_id: str, comment: dict) -> None:
+        self.feedback_comments[feedback_id].append(comment)
+        self._mark("comment", (feedback_id, comment["id"]))
+
+    # =========================================================================
+    # Rows for the database (None = delete)
+    # =========================================================================
+
+    def _user_row(self, user_id: str) -> Optional[dict]:
+        user = self.users.get(user_id)
+        if user is None:
+            return None
+        return {
+            "id": user_id,
+            "email": user["email"],
+            "display_name": user.get("display_name"),
+            "balance_aud": _dec(user["balance_aud"]),
+            "total_trades": user.get("total_trades", 0),
+            "total_invested": _dec(user.get("total_invested")),
+            "created_at": _dt(user["created_at"]),
+            "last_active_at": _dt(user["last_active_at"]),
+        }
+
+    def _holding_row(self, key: Tuple[str, str]) -> Optional[dict]:
+        user_id, property_id = key
+        holding = self.holdings.get(user_id, {}).get(property_id)
+        if holding is None:
+            return None
+        # created_at only lands on insert (see _upsert)
+        now = datetime.utcnow()
+        return {
+            "id": _row_id("holding", user_id, property_id),
+            "user_id": user_id,
+            "property_id": property_id,
+            "token_amount": _dec(holding["token_amount"]),
+            "avg_purchase_price": _dec(holding["avg_price"]),
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def _transaction_row(self, key: Tuple[str, str], by_id: Dict[str, dict]) -> Optional[dict]:
+        user_id, tx_id = key
+        tx = by_id.get(tx_id)
+        if tx is None:
+            return None
+        return {
+            "id": tx_id,
+            "user_id": user_id,
+            "property_id": tx.get("property_id"),
+            "tx_type": tx["tx_type"],
+            "token_amount": _dec(tx["token_amount"]),
+            "aud_amount": _dec(tx["aud_amount"]),
+            "token_price": _dec(tx["token_price"]),
+            "created_at": _dt(tx["created_at"]),
+        }
+
+    def _proposal_row(self, proposal_id: str) -> Optional[dict]:
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None:
+            return None
+        return {
+            "id": proposal_id,
+            "proposer_id": proposal["proposer_id"],
+            "title": proposal["title"],
+            "description": proposal["description"],
+            "proposal_type": proposal.get("proposal_type", "feature"),
+            # Tallies without this worker's unflushed votes (added by increment)
+            "votes_for": _dec(proposal["votes_for"]) - _dec(self._unflushed("proposal", proposal_id, "votes_for")),
+            "votes_against": (
+                _dec(proposal["votes_against"]) - _dec(self._unflushed("proposal", proposal_id, "votes_against"))
+            ),
+            "status": proposal["status"],
+            "voting_ends_at": _dt(proposal["voting_ends_at"]),
+            "created_at": _dt(proposal["created_at"]),
+        }
+
+    def _feedback_row(self, feedback_id: str) -> Optional[dict]:
+        item = self.feedback.get(feedback_id)
+        if item is None:
+            return None
+        similar = item.get("ai_similar_items")
+        return {
+            "id": feedback_id,
+            "author_id": item["author_id"],
+            "title": item["title"],
+            "description": item["description"],
+            "feedback_type": item["feedback_type"],
+            "ai_category": item.get("ai_category"),
+            "ai_priority": item.get("ai_priority"),
+            "ai_summary": item.get("ai_summary"),
+            "ai_similar_items": json.dumps(similar) if similar is not None else None,
+            "ai_triaged_at": _dt(item.get("ai_triaged_at")),
+            "status": item["status"],
+            "resolution_notes": item.get("resolution_notes"),
+            "upvotes": item["upvotes"] - self._unflushed("feedback", feedback_id, "upvotes"),
+            "downvotes": item["downvotes"] - self._unflushed("feedback", feedback_id, "downvotes"),
+            "created_at": _dt(item["created_at"]),
+            "updated_at": _dt(item.get("updated_at") or item["created_at"]),
+        }
+
+    def _feedback_vote_row(self, key: Tuple[str, str]) -> Optional[dict]:
+        feedback_id, user_id = key
+        vote = self.feedback_votes.get(feedback_id, {}).get(user_id)
+        if not vote:
+            return None
+        return {
+            "id": _row_id("feedback-vote", feedback_id, user_id),
+            "user_id": user_id,
+            "feedback_id": feedback_id,
+            "vote": vote,
+            # Only used when the vote is first inserted (see _upsert)
+            "created_at": datetime.utcnow(),
+        }
+
+    def _comment_row(self, key: Tuple[str, str], by_id: Dict[str, dict]) -> Optional[dict]:
+        comment = by_id.get(key[1])
+        if comment is None:
+            return None
+        parent_id = comment.get("parent_id")
+        created_at = _dt(comment["created_at"])
+        return {
+            "id": comment["id"],
+            "feedback_id": comment["feedback_id"],
+            "author_id": comment["author_id"],
+            # Replies to unknown comments are stored as top-level
+            "parent_id": parent_id if parent_id in by_id else None,
+            "content": comment["content"],
+            "is_official": comment.get("is_official", False),
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+    def _resolve(self, kind: str, keys: Set) -> Tuple[object, List[dict], List[str]]:
+        """Build (model, rows to upsert, ids to delete) for dirty keys."""
+        if kind == "user":
+            model, row_for, id_for = SimUser, self._user_row, lambda k: k
+        elif kind == "holding":
+            model, row_for, id_for = SimHolding, self._holding_row, lambda k: _row_id("holding", *k)
+        elif kind == "transaction":
+            by_id = {
+                tx["id"]: tx
+                for user_id in {k[0] for k in keys}
+                for tx in self.transactions.get(user_id, [])
+            }
+            model, id_for = SimTransaction, lambda k: k[1]
+            row_for = lambda k: self._transaction_row(k, by_id)  # noqa: E731
+        elif kind == "proposal":
+            model, row_for, id_for = SimProposal, self._proposal_row, lambda k: k
+        elif kind == "proposal_vote":
+            model, row_for, id_for = SimVote, self._new_proposal_votes.get, lambda k: k
+        elif kind == "feedback":
+            model, row_for, id_for = FeedbackItem, self._feedback_row, lambda k: k
+        elif kind == "feedback_vote":
+            model, row_for, id_for = FeedbackVote, self._feedback_vote_row, lambda k: _row_id("feedback-vote", *k)
+        else:
+            by_id = {
+                c["id"]: c
+                for feedback_id in {k[0] for k in keys}
+                for c in self.feedback_comments.get(feedback_id, [])
+            }
+            model, id_for = FeedbackComment, lambda k: k[1]
+            row_for = lambda k: self._comment_row(k, by_id)  # noqa: E731
+
+        rows, deletes = [], []
+        for key in keys:
+            row = row_for(key)
+            if row is None:
+                deletes.append(id_for(key))
+            else:
+                rows.append(row)
+        return model, rows, deletes
+
+    # =========================================================================
+    # Flushing
+    # =========================================================================
+
+    @property
+    def pending(self) -> int:
+        return sum(len(keys) for keys in self._dirty.values())
+
+    async def flush(self) -> int:
+        """Write all dirty rows in one transaction. Returns rows written or deleted."""
+        async with self._flush_lock:
+            batch = {kind: keys for kind, keys in self._dirty.items() if keys}
+            if not batch:
+                return 0
+            self._dirty = {kind: set() for kind in FLUSH_ORDER}
+            self._flushing, self._tallies = self._tallies, {kind: {} for kind in TALLIES}
+
+            written = deleted = 0
+            try:
+                async with async_session() as session:
+                    for kind in FLUSH_ORDER:
+                        if kind not in batch:
+                            continue
+                        model, rows, deletes = self._resolve(kind, batch[kind])
+                        if deletes:
+                            await session.execute(delete(model).where(model.id.in_(deletes)))
+                            deleted += len(deletes)
+                        keep = TALLIES.get(kind, ())
+                        for i in range(0, len(rows), UPSERT_CHUNK):
+                            await session.execute(_upsert(session, model, rows[i:i + UPSERT_CHUNK], keep=keep))
+                        for key, deltas in self._flushing.get(kind, {}).items():
+                            await session.execute(
+                                update(model)
+                                .where(model.id == key)
+                                .values({column: getattr(model, column) + delta for column, delta in deltas.items()})
+                            )
+                        written += len(rows)
+                    await session.commit()
+            except Exception as e:
+                # Keep the keys dirty and retry on the next flush
+                for kind, keys in batch.items():
+                    self._dirty[kind] |= keys
+                for kind, pending in self._flushing.items():
+                    for key, deltas in pending.items():
+                        for column, delta in deltas.items():
+                            self._add_tally(kind, key, column, delta)
+                self._flushing = {kind: {} for kind in TALLIES}
+                self.stats["flush_errors"] += 1
+                logger.error("sim_store_flush_failed", error=str(e))
+                return 0
+            self._flushing = {kind: {} for kind in TALLIES}
+
+            for vote_id in batch.get("proposal_vote", ()):
+                self._new_proposal_votes.pop(vote_id, None)
+            self.stats["flushes"] += 1
+            self.stats["rows_written"] += written
+            self.stats["rows_deleted"] += deleted
+            logger.debug("sim_store_flushed", written=written, deleted=deleted)
+            return written + deleted
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self.pending:
+                await self.flush()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    async def load(
+        self,
+        properties: Iterable[dict],
+        proposals: Iterable[dict],
+        feedback: Iterable[dict],
+    ) -> None:
+        """Seed reference rows if missing, then read all simulation state."""
+        properties = list(properties)
+        self.property_addresses = {p["id"]: p["address"] for p in properties}
+
+        async with async_session() as session:
+            await session.execute(_upsert(session, SimUser, [{
+                "id": SYSTEM_USER_ID,
+                "email": "system@osf.local",
+                "display_name": SYSTEM_USER_NAME,
+            }], update=False))
+            await session.execute(_upsert(session, SimProperty, [
+                {
+                    "id": p["id"],
+                    "address": p["address"],
+                    "suburb": p["suburb"],
+                    "state": p["state"],
+                    "postcode": p["postcode"],
+                    "property_type": p["property_type"],
+                    "bedrooms": p["bedrooms"],
+                    "bathrooms": p["bathrooms"],
+                    "valuation_aud": _dec(p["valuation_aud"]),
+                    "weekly_rent_aud": _dec(p["weekly_rent_aud"]),
+                    "total_tokens": _dec(p["total_tokens"]),
+                    "token_price": _dec(p["token_price"]),
+                }
+                for p in properties
+            ]))
+            # Seeded rows are only inserted once; later votes must survive restarts
+            for proposal in proposals:
+                self.proposals[proposal["id"]] = {**proposal, "proposer_id": SYSTEM_USER_ID}
+                row = self._proposal_row(proposal["id"])
+                await session.execute(_upsert(session, SimProposal, [row], update=False))
+            for item in feedback:
+                self.feedback[item["id"]] = {**item, "author_id": SYSTEM_USER_ID}
+                row = self._feedback_row(item["id"])
+                await session.execute(_upsert(session, FeedbackItem, [row], update=False))
+            await session.commit()
+
+            await self._read_all(session)
+
+        logger.info("sim_store_loaded",
+                   users=len(self.users),
+                   proposals=len(self.proposals),
+                   feedback=len(self.feedback))
+
+    async def _read_all(self, session) -> None:
+        """Replace the in-memory state with the database contents (in place, so
+        references held by callers stay valid)."""
+        async def rows(model, order: Callable = None):
+            query = select(model)
+            if order is not None:
+                query = query.order_by(order)
+            return (await session.execute(query)).scalars().all()
+
+        for state in (
+            self.users, self.user_by_email, self.holdings, self.transactions,
+            self.proposals, self.feedback, self.feedback_votes, self.feedback_comments,
+        ):
+            state.clear()
+
+        for u in await rows(SimUser):
+            if u.id == SYSTEM_USER_ID:
+                continue
+            self.users[u.id] = {
+                "id": u.id,
+                "email": u.email,
+                "display_name": u.display_name,
+                "balance_aud": float(u.balance_aud),
+                "total_trades": u.total_trades,
+                "total_invested": float(u.total_invested),
+                "created_at": _iso(u.created_at),
+                "last_active_at": _iso(u.last_active_at),
+            }
+            self.user_by_email[u.email] = u.id
+            self.holdings[u.id] = {}
+            self.transactions[u.id] = []
+
+        for h in await rows(SimHolding):
+            if h.user_id in self.holdings:
+                self.holdings[h.user_id][h.property_id] = {
+                    "property_id": h.property_id,
+                    "token_amount": float(h.token_amount),
+                    "avg_price": float(h.avg_purchase_price),
+                }
+
+        for t in await rows(SimTransaction, SimTransaction.created_at):
+            if t.user_id not in self.transactions:
+                continue
+            self.transactions[t.user_id].append({
+                "id": t.id,
+                "tx_type": t.tx_type,
+                "property_id": t.property_id,
+                "property_address": self.property_addresses.get(t.property_id),
+                "token_amount": float(t.token_amount),
+                "aud_amount": float(t.aud_amount),
+                "token_price": float(t.token_price),
+                "created_at": _iso(t.created_at),
+            })
+            if t.tx_type == "reset":
+                # Drives the 24h reset cooldown
+                self.users[t.user_id]["last_reset"] = _iso(t.created_at)
+
+        for p in await rows(SimProposal, SimProposal.created_at):
+            self.proposals[p.id] = {
+                "id": p.id,
+                "proposer_id": p.proposer_id,
+                "proposer_name": self.display_name(p.proposer_id),
+                "title": p.title,
+                "description": p.description,
+                "proposal_type": p.proposal_type,
+                "votes_for": float(p.votes_for),
+                "votes_against": float(p.votes_against),
+                "status": p.status,
+                "voting_ends_at": _iso(p.voting_ends_at),
+                "created_at": _iso(p.created_at),
+            }
+
+        for f in await rows(FeedbackItem, FeedbackItem.created_at):
+            self.feedback[f.id] = {
+                "id": f.id,
+                "author_id": f.author_id,
+                "author_name": self.display_name(f.author_id),
+                "title": f.title,
+                "description": f.description,
+                "feedback_type": f.feedback_type,
+                "ai_category": f.ai_category,
+                "ai_priority": f.ai_priority,
+                "ai_summary": f.ai_summary,
+                "ai_similar_items": json.loads(f.ai_similar_items) if f.ai_similar_items else None,
+                "ai_triaged_at": _iso(f.ai_triaged_at),
+                "status": f.status,
+                "upvotes": f.upvotes,
+                "downvotes": f.downvotes,
+                "created_at": _iso(f.created_at),
+                "updated_at": _iso(f.updated_at),
+            }
+            self.feedback_votes[f.id] = {}
+            self.feedback_comments[f.id] = []
+
+        for v in await rows(FeedbackVote):
+            if v.feedback_id in self.feedback_votes:
+                self.feedback_votes[v.feedback_id][v.user_id] = v.vote
+
+        for c in await rows(FeedbackComment, FeedbackComment.created_at):
+            if c.feedback_id in self.feedback_comments:
+                self.feedback_comments[c.feedback_id].append({
+                    "id": c.id,
+                    "feedback_id": c.feedback_id,
+                    "author_id": c.author_id,
+                    "author_name": self.display_name(c.author_id),
+                    "content": c.content,
+                    "parent_id": c.parent_id,
+                    "is_official": c.is_official,
+                    "created_at": _iso(c.created_at),
+                })
+
+    def get_stats(self) -> dict:
+        return {
+            **self.stats,
+            "pending": self.pending,
+            "users": len(self.users),
+            "proposals": len(self.proposals),
+            "feedback": len(self.feedback),
+        }
+
+
+# =============================================================================
+# Singleton Instance
+# =============================================================================
+
+_sim_store: Optional[SimStore] = None
+
+
+def get_sim_store() -> SimStore:
+    """Get the singleton simulation store."""
+    global _sim_store
+    if _sim_store is None:
+        _sim_store = SimStore(flush_interval=get_settings().sim_flush_interval)
+    return _sim_store
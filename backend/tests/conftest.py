@@ -0,0 +1,54 @@
+"""
+Test setup: every run gets its own SQLite database in a temporary
+directory (src.database resolves data/osf_demo.db relative to the working
+directory when it is first imported), and one event loop shared by the
+async engine.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ["USE_SQLITE"] = "true"
+
+
+def pytest_sessionstart(session):
+    # Before collection, so before any test module imports src.database
+    os.chdir(tempfile.mkdtemp(prefix="osf-tests-"))
+
+
+@pytest.fixture(scope="session")
+def run():
+    """Run a coroutine on the session's event loop."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    from src.database import close_db
+    loop.run_until_complete(close_db())
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def db(run):
+    """Create the schema once per session."""
+    import src.models  # noqa: F401 (registers the tables)
+    from src.database import init_db
+    run(init_db())
+
+
+@pytest.fixture(scope="session")
+def api(run, db):
+    """Call the app in-process: api("GET", "/api/v1/...", params=...) -> httpx.Response."""
+    import httpx
+    from src.main import app
+
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    def request(method, url, **kwargs):
+        return run(client.request(method, url, **kwargs))
+
+    yield request
+    run(client.aclose())
@@ -0,0 +1,203 @@
+"""
+Trade, rent and dividend results of ActionProcessor.
+
+Pins what the handlers return and what ends up in the Numeric columns
+(balances to cents, token amounts to 1e-8, prices to 1e-4), so a change to
+how the arithmetic is carried out has to reproduce them exactly.
+"""
+
+import random
+from decimal import Decimal, ROUND_HALF_UP
+from uuid import uuid4
+
+import pytest
+
+CENT = Decimal("0.01")
+
+
+async def _setup(
+    balance="1000.00", token_price="1.2345", weekly_rent="450.55", total_tokens="100000", tenant=False,
+):
+    from src.database import async_session
+    from src.repositories.participant import ParticipantRepository
+    from src.repositories.property import PropertyStateRepository
+
+    property_id = str(uuid4())
+    async with async_session() as session:
+        participant = await ParticipantRepository(session).create(
+            name="Test Investor", balance=Decimal(balance),
+        )
+        await PropertyStateRepository(session).create_or_update(
+            property_id,
+            total_tokens=Decimal(total_tokens),
+            token_price=Decimal(token_price),
+            weekly_rent=Decimal(weekly_rent),
+        )
+        if tenant:
+            await PropertyStateRepository(session).set_tenant(
+                property_id, participant.id, Decimal(weekly_rent), lease_start_month=0, lease_end_month=12,
+            )
+        await session.commit()
+        return participant.id, property_id
+
+
+async def _state(participant_id, property_id):
+    """Stored participant, holding and property rows."""
+    from src.database import async_session
+    from src.repositories.participant import ParticipantRepository
+    from src.repositories.property import PropertyStateRepository
+
+    async with async_session() as session:
+        repo = ParticipantRepository(session)
+        participant = await repo.get_by_id(participant_id)
+        holdings = await repo.get_holdings(participant_id)
+        holding = next((h for h in holdings if h.property_id == property_id), None)
+        state = await PropertyStateRepository(session).get_by_id(property_id)
+        return participant, holding, state
+
+
+async def _set_price(property_id, price):
+    from src.database import async_session
+    from src.repositories.property import PropertyStateRepository
+
+    async with async_session() as session:
+        state = await PropertyStateRepository(session).get_by_id(property_id)
+        state.token_price = Decimal(price)
+        await session.commit()
+
+
+def _act(run, participant_id, action_type, **data):
+    from src.services.action_processor import ActionProcessor
+    return run(ActionProcessor().process_action(participant_id, action_type, data, network_month=1))
+
+
+def test_buy_rounds_only_when_stored(run, db):
+    participant_id, property_id = run(_setup())
+
+    result = _act(run, participant_id, "buy_tokens", property_id=property_id, token_amount=12.51)
+
+    assert result.success, result.message
+    # 12.51 x 1.2345 = 15.443595, carried unrounded into the balance
+    assert result.data == {
+        "property_id": property_id,
+        "tokens": 12.51,
+        "price_per_token": 1.2345,
+        "total_cost": 15.443595,
+        "new_balance": 984.556405,
+    }
+    assert result.message == "Bought 12.51 tokens for $15.443595"
+
+    participant, holding, state = run(_state(participant_id, property_id))
+    assert participant.balance == Decimal("984.56")
+    assert participant.total_invested == Decimal("15.44")
+    assert holding.token_amount == Decimal("12.51")
+    assert holding.avg_purchase_price == Decimal("1.2345")
+    assert state.tokens_available == Decimal("99987.49")
+    assert state.network_ownership == Decimal("0.01")
+
+
+def test_repeat_buy_weights_the_purchase_price(run, db):
+    participant_id, property_id = run(_setup())
+    _act(run, participant_id, "buy_tokens", property_id=property_id, token_amount=12.51)
+    run(_set_price(property_id, "1.5"))
+
+    result = _act(run, participant_id, "buy_tokens", property_id=property_id, token_amount="7.49")
+
+    assert result.success, result.message
+    _, holding, state = run(_state(participant_id, property_id))
+    assert holding.token_amount == Decimal("20.00")
+    # (12.51 x 1.2345 + 7.49 x 1.5) / 20 = 1.33392975
+    assert holding.avg_purchase_price == Decimal("1.3339")
+    assert state.tokens_available == Decimal("99980.00")
+    assert state.network_ownership == Decimal("0.02")
+
+
+def test_sell_returns_tokens_and_proceeds(run, db):
+    participant_id, property_id = run(_setup(token_price="2.5"))
+    _act(run, participant_id, "buy_tokens", property_id=property_id, token_amount=40)
+
+    result = _act(run, participant_id, "sell_tokens", property_id=property_id, token_amount=15.5)
+
+    assert result.success, result.message
+    assert result.data["total_proceeds"] == 38.75
+    assert result.data["new_balance"] == 938.75
+    participant, holding, state = run(_state(participant_id, property_id))
+    assert participant.balance == Decimal("938.75")
+    assert holding.token_amount == Decimal("24.5")
+    assert state.tokens_available == Decimal("99975.5")
+
+
+def test_rent_and_dividend_amounts(run, db):
+    participant_id, property_id = run(_setup(tenant=True))
+
+    paid = _act(run, participant_id, "pay_rent", property_id=property_id, weeks=2)
+    collected = _act(run, participant_id, "collect_rent", property_id=property_id)
+
+    assert paid.success, paid.message
+    assert paid.data["total_paid"] == 901.10
+    assert paid.data["new_balance"] == 98.90
+    assert collected.success, collected.message
+    # 450.55 x 4.33 = 1950.8815; 80% of it = 1560.7052
+    assert collected.message == "Collected $1950.88 rent, distributed $1560.71 dividends"
+    assert collected.data["rent_collected"] == 1950.8815
+    assert collected.data["dividends_distributed"] == 1560.7052
+
+    _, _, state = run(_state(participant_id, property_id))
+    assert state.total_rent_collected == Decimal("901.10")
+    assert state.total_dividends_paid == Decimal("1560.71")
+
+
+@pytest.mark.parametrize(
+    "action, data, error",
+    [
+        ("buy_tokens", {"token_amount": 1000}, "INSUFFICIENT_BALANCE"),
+        ("buy_tokens", {"token_amount": 1, "max_price": 1.2344}, "PRICE_TOO_HIGH"),
+        ("buy_tokens", {"token_amount": 0}, "INVALID_PARAMS"),
+        ("sell_tokens", {"token_amount": 1}, "INSUFFICIENT_TOKENS"),
+        ("pay_rent", {"weeks": 3}, "INSUFFICIENT_BALANCE"),
+    ],
+)
+def test_rejected_actions_change_nothing(run, db, action, data, error):
+    participant_id, property_id = run(_setup(tenant=True))
+
+    result = _act(run, participant_id, action, property_id=property_id, **data)
+
+    assert not result.success
+    assert result.error == error
+    participant, holding, state = run(_state(participant_id, property_id))
+    assert participant.balance == Decimal("1000.00")
+    assert holding is None
+    assert state.tokens_available == Decimal("100000")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_trades_match_decimal_reference(run, db, seed):
+    """A run of buys and sells leaves the same stored values as plain Decimal arithmetic."""
+    rng = random.Random(seed)
+    price = Decimal(rng.randint(5000, 40000)).scaleb(-4)
+    participant_id, property_id = run(_setup(balance="50000.00", token_price=str(price)))
+
+    balance, held, available = Decimal("50000.00"), Decimal(0), Decimal("100000")
+    for _ in range(12):
+        amount = Decimal(rng.randint(1, 400_000)).scaleb(-2)
+        if held and rng.random() < 0.4:
+            amount = min(amount, held)
+            result = _act(run, participant_id, "sell_tokens", property_id=property_id, token_amount=str(amount))
+            balance = (balance + amount * price).quantize(CENT, ROUND_HALF_UP)
+            held -= amount
+            available += amount
+        else:
+            result = _act(run, participant_id, "buy_tokens", property_id=property_id, token_amount=str(amount))
+            if amount * price > balance:
+                assert result.error == "INSUFFICIENT_BALANCE"
+                continue
+            balance = (balance - amount * price).quantize(CENT, ROUND_HALF_UP)
+            held += amount
+            available -= amount
+        assert result.success, result.message
+
+    participant, holding, state = run(_state(participant_id, property_id))
+    assert participant.balance == balance
+    assert (holding.token_amount if holding else Decimal(0)) == held
+    assert state.tokens_available == available
+    assert state.network_ownership == ((100000 - available) / 100000 * 100).quantize(CENT, ROUND_HALF_UP)
@@ -0,0 +1,134 @@
+"""
+Admission keys and stream slots.
+
+client_key only believes X-Forwarded-For from a configured proxy, and a
+streamed response gives its slot back however the response ends.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from starlette.requests import ClientDisconnect, Request
+
+from src.services.admission import AdmissionController, AdmittedStreamingResponse, client_key
+
+
+def _request(peer, forwarded=None):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "client": (peer, 1234)})
+
+
+@pytest.fixture
+def trusted(monkeypatch):
+    from src.config import get_settings
+    monkeypatch.setattr(get_settings(), "trusted_proxies", "10.0.0.0/8, 192.168.1.5")
+
+
+@pytest.mark.parametrize(
+    "peer, forwarded, key",
+    [
+        ("203.0.113.7", None, "ip:203.0.113.7"),
+        # Not from a proxy: the header is the caller's own claim
+        ("203.0.113.7", "198.51.100.1", "ip:203.0.113.7"),
+        ("10.1.2.3", "198.51.100.1", "ip:198.51.100.1"),
+        # The client can prepend anything; the last untrusted hop is who reached the proxy
+        ("10.1.2.3", "1.1.1.1, 198.51.100.1, 192.168.1.5", "ip:198.51.100.1"),
+        ("10.1.2.3", "10.9.9.9", "ip:10.9.9.9"),
+    ],
+)
+def test_forwarded_for_only_from_trusted_proxies(trusted, peer, forwarded, key):
+    assert client_key(_request(peer, forwarded)) == key
+
+
+def test_forwarded_for_ignored_without_trusted_proxies():
+    assert client_key(_request("10.1.2.3", "198.51.100.1")) == "ip:10.1.2.3"
+    assert client_key(_request("10.1.2.3", "198.51.100.1"), "u1") == "user:u1"
+
+
+def _controller():
+    return AdmissionController(
+        global_rate=100, global_burst=10, user_rate=100, user_burst=10,
+        max_concurrent=2, tick_reserved=0, queue_size=0, queue_timeout=1,
+    )
+
+
+SCOPE = {"type": "http", "asgi": {"spec_version": "2.4"}}
+
+
+async def _body():
+    yield b"data: 1\n\n"
+
+
+def test_stream_slot_released_after_body(run):
+    admission = _controller()
+    sent = []
+
+    async def send(message):
+        sent.append(message["type"])
+
+    async def respond():
+        await admission.acquire("ip:a")
+        await AdmittedStreamingResponse(_body(), admission)(SCOPE, None, send)
+
+    run(respond())
+    assert sent[0] == "http.response.start"
+    assert admission.get_metrics()["in_flight"] == 0
+
+
+def test_stream_slot_released_when_client_leaves_before_body(run):
+    admission = _controller()
+
+    async def send(message):
+        raise OSError("client went away")
+
+    async def respond():
+        await admission.acquire("ip:a")
+        response = AdmittedStreamingResponse(_body(), admission)
+        with pytest.raises(ClientDisconnect):
+            await response(SCOPE, None, send)
+
+    run(respond())
+    assert admission.get_metrics()["in_flight"] == 0
+
+
+class _FakeModels:
+    async def generate_content(self, **kwargs):
+        return SimpleNamespace(text="An answer.")
+
+
+@pytest.fixture
+def governor(api, monkeypatch):
+    """The governor chat with a stand-in model and a one-call-per-user bucket."""
+    from src.api import network
+    from src.main import app
+    from src.services.batch_processor import generate_demo_state
+
+    admission = AdmissionController(
+        global_rate=100, global_burst=100, user_rate=0.001, user_burst=1,
+        max_concurrent=10, tick_reserved=0, queue_size=0, queue_timeout=1,
+    )
+    monkeypatch.setattr(app.state, "network_state", generate_demo_state(month=0), raising=False)
+    monkeypatch.setattr(network.settings, "google_api_key", "test")
+    monkeypatch.setattr(network, "get_genai_client", lambda: SimpleNamespace(aio=SimpleNamespace(models=_FakeModels())))
+    monkeypatch.setattr(network, "get_admission", lambda: admission)
+
+    def chat(message, user_id, headers=None):
+        return api("POST", "/api/v1/network/governor/chat", json={"message": message, "user_id": user_id}, headers=headers)
+
+    return chat
+
+
+def test_body_user_id_does_not_get_a_fresh_bucket(governor):
+    assert governor("How is the network doing?", "user-1").status_code == 200
+    assert governor("What is the best suburb?", "user-2").status_code == 429
+
+
+def test_token_user_gets_its_own_bucket(governor):
+    from src.auth.jwt import create_access_token
+
+    token, _ = create_access_token("token-user", "token-user@example.com")
+    headers = {"authorization": f"Bearer {token}"}
+    assert governor("Which property yields most?", None, headers).status_code == 200
+    assert governor("And which yields least?", None, headers).status_code == 429
+    # Another caller (by address) still has its own bucket
+    assert governor("How many participants are there?", None).status_code == 200
@@ -0,0 +1,77 @@
+"""Which questions reuse a cached governor/advisor answer."""
+
+import pytest
+
+from src.services.answer_cache import AnswerCache, context_hash
+
+CONTEXT = context_hash({"month": 3, "properties": 12})
+QUESTION = "Which Perth suburbs with high rental yield and strong growth should I invest in?"
+
+
+@pytest.fixture
+def cache():
+    cache = AnswerCache(max_entries=8, similarity=0.85)
+    cache.put("governor", CONTEXT, QUESTION, "Try Midland.")
+    cache.put("governor", CONTEXT, "How do dividends work?", "Paid monthly.")
+    cache.put("governor", CONTEXT, "Should I buy property A?", "Property A looks good.")
+    cache.put("governor", CONTEXT, "Can I buy 10 tokens?", "Yes.")
+    return cache
+
+
+@pytest.mark.parametrize(
+    "question, answer",
+    [
+        ("which perth suburbs with high rental yield and strong growth should i invest in", "Try Midland."),
+        ("  How do dividends WORK  ", "Paid monthly."),
+    ],
+)
+def test_exact_after_normalizing(cache, question, answer):
+    assert cache.get("governor", CONTEXT, question) == answer
+    assert cache.stats["exact"] == 1
+
+
+@pytest.mark.parametrize(
+    "question, answer",
+    [
+        ("how does dividend work", "Paid monthly."),
+        ("Which Perth suburbs with high rental yields and strong growth should we invest in?", "Try Midland."),
+    ],
+)
+def test_similar_questions_share_an_answer(cache, question, answer):
+    assert cache.get("governor", CONTEXT, question) == answer
+    assert cache.stats["similar"] == 1
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        # Negations must agree, like numbers
+        "Which Perth suburbs with high rental yield and strong growth should I not invest in?",
+        "Which Perth suburbs with high rental yield and strong growth should I avoid?",
+        "Which Perth suburbs without high rental yield and strong growth should I invest in?",
+        "Can I buy 100 tokens?",
+        "Can I not buy 10 tokens?",
+        # A single letter can be the whole subject
+        "Should I buy property?",
+        "Should I buy property B?",
+        "What is the governor?",
+    ],
+)
+def test_must_not_match(cache, question):
+    assert cache.get("governor", CONTEXT, question) is None
+
+
+def test_scope_and_context_are_separate(cache):
+    assert cache.get("advisor", CONTEXT, "How do dividends work?") is None
+    assert cache.get("governor", context_hash({"month": 4, "properties": 12}), "How do dividends work?") is None
+
+
+def test_invalidate_and_lru(cache):
+    for n in range(8):
+        cache.put("governor", CONTEXT, f"Question number {n} please", "x")
+    assert len(cache) == 8
+    assert cache.get("governor", CONTEXT, "How do dividends work?") is None
+
+    cache.invalidate("month_completed")
+    assert len(cache) == 0
+    assert cache.get("governor", CONTEXT, "Question number 7 please") is None
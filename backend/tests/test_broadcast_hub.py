@@ -0,0 +1,60 @@
+"""Bounded SSE fan-out."""
+
+from src.services.broadcast_hub import BroadcastHub, encode_sse
+
+
+def _events(chunks):
+    return [chunk.decode().split("\n", 2)[1] for chunk in chunks]
+
+
+def test_coalesced_events_keep_arrival_order():
+    hub = BroadcastHub(capacity=8, coalesce=["clock_sync"])
+    subscriber = hub.subscribe()
+
+    hub.publish("clock_sync", {"month": 1})
+    hub.publish("month_completed", {"month": 1})
+    hub.publish("clock_sync", {"month": 2})
+    hub.publish("action_processed", {"id": "a"})
+
+    assert _events(subscriber.drain()) == [
+        'data: {"month":1}',
+        'data: {"month":2}',
+        'data: {"id":"a"}',
+    ]
+    assert subscriber.coalesced == 1
+
+
+def test_latest_state_follows_the_events_before_it():
+    hub = BroadcastHub(capacity=8, coalesce=["clock_sync"])
+    subscriber = hub.subscribe()
+
+    hub.publish("month_completed", {"month": 1})
+    hub.publish("clock_sync", {"month": 2})
+
+    assert subscriber.drain() == [
+        encode_sse("month_completed", {"month": 1}),
+        encode_sse("clock_sync", {"month": 2}),
+    ]
+
+
+def test_full_buffer_drops_oldest_event_but_keeps_latest_state():
+    hub = BroadcastHub(capacity=2, coalesce=["clock_sync"])
+    subscriber = hub.subscribe()
+
+    hub.publish("clock_sync", {"month": 1})
+    for i in range(3):
+        hub.publish("tick", {"i": i})
+
+    assert _events(subscriber.drain()) == ['data: {"month":1}', 'data: {"i":1}', 'data: {"i":2}']
+    assert subscriber.dropped == 1
+
+
+def test_lagging_subscriber_is_disconnected():
+    hub = BroadcastHub(capacity=1, max_drops=2)
+    subscriber = hub.subscribe()
+
+    for i in range(3):
+        hub.publish("tick", {"i": i})
+
+    assert subscriber.closed and subscriber.close_reason == "lagging"
+    assert hub.get_metrics()["disconnected_lagging"] == 1
@@ -0,0 +1,148 @@
+"""Compression middleware."""
+
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+
+from src.compression import ENCODINGS
+from src.middleware.compression import CompressionMiddleware
+
+
+def _tagged(request):
+    return Response(b'{"x": "' + b"a" * 4096 + b'"}', media_type="application/json", headers={"ETag": '"v1"'})
+
+
+def test_compressed_response_gets_an_encoded_etag(run):
+    app = CompressionMiddleware(Starlette(routes=[Route("/tagged", _tagged)]))
+
+    async def get(accept):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.get("/tagged", headers={"accept-encoding": accept})
+
+    encoded = run(get(ENCODINGS[0]))
+    identity = run(get("identity"))
+    assert encoded.headers["content-encoding"] == ENCODINGS[0]
+    assert encoded.headers["etag"] == f'"v1-{ENCODINGS[0]}"'
+    assert identity.headers["etag"] == '"v1"'
+
+
+def test_route_minimum_sizes_match_real_routes():
+    from src.main import app
+    from src.middleware.compression import ROUTE_MIN_SIZES
+
+    paths = list(app.openapi()["paths"])
+    for prefix in ROUTE_MIN_SIZES:
+        assert any(path.startswith(prefix) for path in paths), f"{prefix} matches no route"
+
+
+def _streaming_app(media_type, chunks, delivered):
+    """Sends chunks one message at a time; after each, records what reached the client."""
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", media_type.encode())]})
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+            delivered.append(len(sent))
+
+    sent = []
+    return app, sent
+
+
+def _call(run, app, sent, encoding):
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    scope = {"type": "http", "path": "/stream", "headers": [(b"accept-encoding", encoding.encode())]}
+    run(CompressionMiddleware(app, minimum_size=0)(scope, receive, send))
+
+
+def _decoder(encoding):
+    import zlib
+    if encoding == "br":
+        import brotli
+        return brotli.Decompressor().process
+    return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+
+
+def test_sse_is_never_compressed_or_held_back(run):
+    chunks = [b"data: one\n\n", b"data: two\n\n", b"data: three\n\n"]
+    delivered = []
+    app, sent = _streaming_app("text/event-stream", chunks, delivered)
+
+    _call(run, app, sent, ENCODINGS[0])
+
+    start, *bodies = sent
+    assert b"content-encoding" not in dict(start["headers"])
+    assert [m["body"] for m in bodies] == chunks
+    # Each event reached the client before the app sent the next one
+    assert delivered == [2, 3, 4]
+
+
+def test_chunked_body_is_flushed_chunk_by_chunk(run):
+    chunks = [b'{"items": [', b'"' + b"a" * 2000 + b'",', b'"' + b"b" * 2000 + b'"]}']
+    for encoding in ENCODINGS:
+        delivered = []
+        app, sent = _streaming_app("application/json", chunks, delivered)
+
+        _call(run, app, sent, encoding)
+
+        start, *bodies = sent
+        headers = dict(start["headers"])
+        assert headers[b"content-encoding"] == encoding.encode()
+        assert b"content-length" not in headers
+        assert delivered == [2, 3, 4]
+        # Whatever the app has sent so far decodes from what the client has
+        decode = _decoder(encoding)
+        received = b""
+        for i, message in enumerate(bodies):
+            received += decode(message["body"])
+            assert received == b"".join(chunks[: i + 1])
+        assert bodies[-1]["more_body"] is False
+
+
+def test_precompressed_siblings_are_written_whole_and_go_stale_with_the_source(tmp_path):
+    import os
+    from src.compression import SUFFIXES, precompress_file, precompressed_sibling
+
+    page = tmp_path / "viewer.html"
+    page.write_text("<html>" + "hello " * 500 + "</html>")
+
+    siblings = precompress_file(page)
+
+    assert set(siblings) == set(ENCODINGS)
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        ["viewer.html"] + ["viewer.html" + SUFFIXES[e] for e in ENCODINGS]
+    )
+    for sibling in siblings.values():
+        assert sibling.stat().st_mtime_ns == page.stat().st_mtime_ns
+    assert precompressed_sibling(page, ENCODINGS[0]) == (ENCODINGS[0], siblings[ENCODINGS[0]])
+
+    # Source edited after the siblings were written: serve it uncompressed
+    mtime = page.stat().st_mtime_ns + 1_000_000_000
+    os.utime(page, ns=(mtime, mtime))
+    assert precompressed_sibling(page, ENCODINGS[0]) is None
+
+
+def test_viewer_is_served_without_compressing_per_request(api, monkeypatch, tmp_path):
+    from src import compression, main
+
+    page = tmp_path / "viewer.html"
+    page.write_text("<html>" + "hello " * 500 + "</html>")
+    compression.precompress_file(page)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("compressed while serving /viewer")
+
+    monkeypatch.setattr(main, "VIEWER_PATH", str(page))
+    monkeypatch.setattr(compression, "precompress_file", fail)
+    monkeypatch.setattr(compression, "compress", fail)
+
+    response = api("GET", "/viewer", headers={"accept-encoding": ENCODINGS[0]})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == ENCODINGS[0]
+    assert response.text == page.read_text()
@@ -0,0 +1,61 @@
+"""
+Local context classification: safety phrases flag real emergencies but not
+ordinary questions about a property's features.
+"""
+
+import pytest
+
+from src.ai.context_classifier import ContextClassifier
+from src.ai.core import AssetClass, ContextType
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return ContextClassifier(min_confidence=0.85)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "there's a fire in the kitchen",
+        "the house is on fire",
+        "there is a fire",
+        "I smell gas in the hallway",
+        "the kitchen is flooding",
+        "water is flooding the laundry",
+        "sparks coming from the switchboard",
+        "the meter box is sparking",
+        "the bathroom ceiling collapsed",
+        "someone broke in last night",
+        "smoke coming out of the inverter",
+    ],
+)
+def test_emergencies(classifier, message):
+    assert classifier.classify(message) == (ContextType.EMERGENCY, 1.0)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "is there a fire pit",
+        "does the house have a fire place",
+        "is the suburb in a flooding zone",
+        "has the suburb flooded before",
+        "how much is the fire insurance",
+    ],
+)
+def test_questions_mentioning_hazards_are_not_emergencies(classifier, message):
+    result = classifier.classify(message)
+    assert result is None or result[0] != ContextType.EMERGENCY
+
+
+@pytest.mark.parametrize(
+    "message, label",
+    [
+        ("the heater is not working", ContextType.MAINTENANCE),
+        ("when is rent due", ContextType.FINANCIAL),
+        ("what is my solar output", ContextType.MONITORING),
+    ],
+)
+def test_everyday_labels(classifier, message, label):
+    assert classifier.classify(message, AssetClass.ENERGY)[0] == label
@@ -0,0 +1,87 @@
+"""Archiving network events to compressed monthly files."""
+
+from src.services.event_retention import EventArchive
+
+
+def _row(event_id, created_at, title="t"):
+    return {"id": event_id, "network_month": 3, "title": title, "created_at": created_at}
+
+
+def test_write_month_merges_with_the_existing_archive(tmp_path):
+    archive = EventArchive(str(tmp_path))
+    archive.write_month(3, [_row("a", "2026-01-01T00:00:00"), _row("b", "2026-01-02T00:00:00")])
+
+    entry = archive.write_month(3, [_row("b", "2026-01-02T00:00:00", "updated"), _row("c", "2026-01-03T00:00:00")])
+
+    rows = archive.read_month(3)
+    assert [(r["id"], r["title"]) for r in rows] == [("a", "t"), ("b", "updated"), ("c", "t")]
+    assert entry["count"] == 3
+    assert EventArchive(str(tmp_path)).index()["3"]["count"] == 3
+
+
+def test_rearchiving_a_month_keeps_events_already_archived(run, db, tmp_path):
+    from src.database import async_session
+    from src.repositories import NetworkRepository
+    from src.services.event_retention import EventRetention
+
+    async def add_event(title):
+        async with async_session() as session:
+            event = await NetworkRepository(session).create_event(
+                network_month=9001, event_type="market", title=title, description="",
+            )
+            await session.commit()
+            return event.id
+
+    retention = EventRetention(hot_months=1, archive_dir=str(tmp_path))
+    first = run(add_event("before archiving"))
+    assert run(retention.archive_month(9001)) == 1
+
+    # e.g. POST /network/events/generate for a month that is already archived
+    second = run(add_event("after archiving"))
+    run(retention.archive_month(9001))
+
+    assert {r["id"] for r in retention.archive.read_month(9001)} == {first, second}
+    assert retention.get_status()["archived_events"] == 2
+    # Rehydrate and archive again: still both, no duplicates
+    assert run(retention.rehydrate_month(9001)) == 2
+    run(retention.archive_month(9001))
+    assert sorted(r["id"] for r in retention.archive.read_month(9001)) == sorted([first, second])
+
+
+def test_rehydrated_month_is_kept_until_its_pin_expires(run, db, tmp_path, monkeypatch):
+    from types import SimpleNamespace
+    from src.database import async_session
+    from src.repositories import NetworkRepository
+    from src.services import event_retention
+    from src.services.event_retention import EventRetention
+
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(event_retention, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+    async def add_event():
+        async with async_session() as session:
+            await NetworkRepository(session).create_event(
+                network_month=9101, event_type="market", title="t", description="",
+            )
+            await session.commit()
+
+    async def hot_count():
+        async with async_session() as session:
+            return await NetworkRepository(session).count_events(network_month=9101)
+
+    retention = EventRetention(hot_months=1, archive_dir=str(tmp_path), rehydrate_hours=1)
+    run(add_event())
+    assert 9101 in run(retention.apply(current_month=9103))
+    assert run(retention.rehydrate_month(9101)) == 1
+
+    # The next ticks leave it alone while pinned...
+    clock.now += 3599
+    assert 9101 not in run(retention.apply(current_month=9104))
+    assert run(hot_count()) == 1
+    assert retention.get_status()["pinned_months"] == [9101]
+
+    # ...and archive it again once the pin has expired
+    clock.now += 2
+    assert 9101 in run(retention.apply(current_month=9105))
+    assert run(hot_count()) == 0
+    assert retention.get_status()["pinned_months"] == []
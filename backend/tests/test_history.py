@@ -0,0 +1,113 @@
+"""Chat history compaction: verbatim window, budget and cached summaries."""
+
+import asyncio
+
+from src.ai.core import Message
+from src.ai.history import HistoryManager, estimate_tokens
+
+
+class FakeSummarizer:
+    """Records each fold; folds wait for `release` when it is cleared."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, previous, messages, max_tokens):
+        self.calls.append((previous, [m.content for m in messages]))
+        number = len(self.calls)
+        await self.release.wait()
+        return f"summary {number} of {len(messages)}"
+
+
+def _history(n, prefix="m"):
+    return [Message(role="user" if i % 2 == 0 else "assistant", content=f"{prefix}{i}") for i in range(n)]
+
+
+def _manager(**kwargs):
+    summarize = FakeSummarizer()
+    return HistoryManager(summarize=summarize, **kwargs), summarize
+
+
+def test_last_turns_are_sent_verbatim_with_a_summary_of_the_rest(run):
+    manager, summarize = _manager(keep_turns=2, token_budget=2000)
+    history = _history(10)
+
+    async def turns():
+        first = manager.prepare(history, "c1")
+        await manager.drain()
+        return first, manager.prepare(history, "c1")
+
+    first, second = run(turns())
+
+    # No summary yet: everything verbatim, and the older six are folded for next time
+    assert first.summary is None and first.messages == history
+    assert summarize.calls == [(None, ["m0", "m1", "m2", "m3", "m4", "m5"])]
+    assert second.summary == "summary 1 of 6"
+    assert second.messages == history[-4:]
+    assert second.dropped == 6
+    assert len(summarize.calls) == 1
+
+
+def test_verbatim_messages_are_trimmed_oldest_first_to_the_budget(run):
+    manager, summarize = _manager(keep_turns=10, token_budget=100)
+    history = [Message(role="user", content=f"{i}" + "x" * 119) for i in range(6)]  # 31 tokens each
+
+    compact = manager.prepare(history, "c1")
+
+    assert estimate_tokens(history[0].content) == 31
+    assert compact.messages == history[-3:]
+    assert compact.dropped == 3
+    assert manager.stats["trimmed"] == 1
+    assert summarize.calls == []  # within keep_turns: nothing to fold
+
+
+def test_summary_is_reused_for_a_longer_history_but_not_an_edited_one(run):
+    manager, summarize = _manager(keep_turns=2, token_budget=2000)
+    history = _history(10)
+
+    async def turns():
+        manager.prepare(history, "c1")
+        await manager.drain()
+        longer = manager.prepare(history + _history(2, "n"), "c1")
+        await manager.drain()
+        edited = history[:3] + [Message(role="assistant", content="changed")] + history[4:]
+        return longer, manager.prepare(edited, "c1")
+
+    longer, edited = run(turns())
+
+    # The summary of m0..m5 still covers the start of the longer history;
+    # the two messages that left the window are folded into it next
+    assert longer.summary == "summary 1 of 6"
+    assert [m.content for m in longer.messages] == ["m6", "m7", "m8", "m9", "n0", "n1"]
+    assert summarize.calls[1] == ("summary 1 of 6", ["m6", "m7"])
+    # An edit inside the summarized part matches no cached summary
+    assert edited.summary is None
+    assert edited.messages[3].content == "changed"
+    assert summarize.calls[2][0] is None
+
+
+def test_one_fold_at_a_time_per_conversation(run):
+    manager, summarize = _manager(keep_turns=1, token_budget=2000)
+    summarize.release.clear()
+
+    async def turns():
+        manager.prepare(_history(4), "c1")
+        manager.prepare(_history(6), "c1")  # c1 is still folding: not scheduled
+        manager.prepare(_history(4), "c2")
+        await asyncio.sleep(0)
+        assert manager.get_metrics()["folding"] == 2
+        summarize.release.set()
+        await manager.drain()
+        manager.prepare(_history(6), "c1")
+        await manager.drain()
+
+    run(turns())
+
+    assert summarize.calls == [
+        (None, ["m0", "m1"]),
+        (None, ["m0", "m1"]),
+        ("summary 1 of 2", ["m2", "m3"]),
+    ]
+    assert manager.get_metrics()["folding"] == 0
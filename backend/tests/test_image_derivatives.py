@@ -0,0 +1,81 @@
+"""
+On-demand derivative builds: a source that cannot be built is not decoded
+again on every request, but is retried after a growing backoff.
+"""
+
+import io
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import image_derivatives
+from src.services.asset_store import AssetStore
+from src.services.image_derivatives import ImageDerivatives
+
+pytestmark = pytest.mark.skipif(not image_derivatives.available_formats(), reason="Pillow without AVIF/WebP")
+
+
+class InlineExecutor:
+    """Runs builds synchronously, counting them."""
+
+    def __init__(self):
+        self.builds = 0
+
+    def submit(self, fn, *args):
+        self.builds += 1
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, **kwargs):
+        pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(image_derivatives, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+@pytest.fixture
+def derivatives(tmp_path, clock):
+    service = ImageDerivatives(AssetStore(tmp_path))
+    service._executor = InlineExecutor()
+    return service
+
+
+def test_failed_source_is_backed_off(derivatives, clock):
+    url = derivatives.store.put(b"\x89PNG\r\n\x1a\n not really a png", "image/png")
+    executor = derivatives._executor
+
+    for _ in range(3):
+        assert derivatives.image_set(url) is None
+    assert executor.builds == 1
+
+    clock.now += image_derivatives.FAILURE_RETRY_SECONDS
+    derivatives.image_set(url)
+    assert executor.builds == 2
+    # Second failure: twice the wait
+    clock.now += image_derivatives.FAILURE_RETRY_SECONDS
+    derivatives.image_set(url)
+    assert executor.builds == 2
+    clock.now += image_derivatives.FAILURE_RETRY_SECONDS
+    derivatives.image_set(url)
+    assert executor.builds == 3
+
+
+def test_success_clears_the_failure(derivatives, clock):
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (400, 300), "teal").save(buffer, format="PNG")
+    url = derivatives.store.put(buffer.getvalue(), "image/png")
+    key = image_derivatives.manifest_path(derivatives.store.root, url, derivatives.recipe).name[: -len(".json")]
+    derivatives._failures[key] = (3, clock.now)
+
+    derivatives.image_set(url)
+
+    assert key not in derivatives._failures
+    assert derivatives.image_set(url)["width"] == 400
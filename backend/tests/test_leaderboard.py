@@ -0,0 +1,87 @@
+"""Incremental leaderboard ranking against a full recompute and sort."""
+
+import random
+
+from src.services.leaderboard import STARTING_BALANCE, LeaderboardEngine
+
+PRICES = {"p1": 1.0, "p2": 1.37, "p3": 0.82}
+
+
+def _full_sort(users, holdings):
+    """The pre-index leaderboard: value every user and sort (ties by user_id)."""
+    entries = []
+    for user_id, user in users.items():
+        value = user["balance_aud"] + sum(
+            h["token_amount"] * PRICES[h["property_id"]] for h in holdings.get(user_id, {}).values()
+        )
+        entries.append({
+            "user_id": user_id,
+            "display_name": user["display_name"],
+            "portfolio_value": value,
+            "total_return_percent": (value - STARTING_BALANCE) / STARTING_BALANCE * 100,
+            "total_trades": user["total_trades"],
+        })
+    entries.sort(key=lambda e: (-e["portfolio_value"], e["user_id"]))
+    for i, entry in enumerate(entries):
+        entry["rank"] = i + 1
+    return entries
+
+
+def test_page_and_rank_match_a_full_sort_after_trades_and_resets():
+    rng = random.Random(38)
+    engine = LeaderboardEngine()
+    engine.set_prices(PRICES)
+    users, holdings = {}, {}
+
+    def rank(user_id):
+        user = users[user_id]
+        engine.update_user(user_id, user["display_name"], user["balance_aud"],
+                           list(holdings.get(user_id, {}).values()), user["total_trades"])
+
+    for step in range(600):
+        action = rng.choice(["signup", "buy", "buy", "sell", "reset"] if users else ["signup"])
+        if action == "signup":
+            user_id = f"u{rng.randrange(10**6):06d}"
+            users[user_id] = {"display_name": f"User {step}", "balance_aud": STARTING_BALANCE, "total_trades": 0}
+            holdings[user_id] = {}
+        else:
+            user_id = rng.choice(sorted(users))
+            user, held = users[user_id], holdings[user_id]
+            if action == "reset":
+                user.update(balance_aud=STARTING_BALANCE, total_trades=0)
+                held.clear()
+            elif action == "buy":
+                property_id = rng.choice(sorted(PRICES))
+                amount = round(rng.uniform(10, 5000), 2)
+                user["balance_aud"] -= amount
+                user["total_trades"] += 1
+                holding = held.setdefault(property_id, {"property_id": property_id, "token_amount": 0.0})
+                holding["token_amount"] += amount / PRICES[property_id]
+            elif held:
+                property_id = rng.choice(sorted(held))
+                tokens = held[property_id]["token_amount"] * rng.choice([0.5, 1.0])
+                user["balance_aud"] += tokens * PRICES[property_id]
+                user["total_trades"] += 1
+                held[property_id]["token_amount"] -= tokens
+        rank(user_id)
+
+        if step % 50 == 49:
+            expected = _full_sort(users, holdings)
+            assert len(engine) == len(expected)
+            assert engine.page(0, len(expected)) == expected
+            assert engine.page(7, 5) == expected[7:12]
+            for entry in rng.sample(expected, min(10, len(expected))):
+                assert engine.rank_of(entry["user_id"]) == entry
+
+    # Resets leave several users on exactly the starting balance
+    assert sum(1 for e in _full_sort(users, holdings) if e["portfolio_value"] == STARTING_BALANCE) > 1
+
+
+def test_equal_values_rank_by_user_id_not_insertion_order():
+    engine = LeaderboardEngine()
+    for user_id in ["c", "a", "b"]:
+        engine.update_user(user_id, None, STARTING_BALANCE, [], 0)
+
+    assert [e["user_id"] for e in engine.page()] == ["a", "b", "c"]
+    assert engine.rank_of("c")["rank"] == 3
+    assert engine.rank_of("missing") is None
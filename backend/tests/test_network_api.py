@@ -0,0 +1,109 @@
+"""History and feed endpoints of the network API."""
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "url, param, bad",
+    [
+        ("/api/v1/network/history/snapshots", "months", [0, 121]),
+        ("/api/v1/network/history/events", "limit", [0, 201]),
+        ("/api/v1/network/history/metrics", "months", [0, 121]),
+        ("/api/v1/network/feed", "limit", [0, 101]),
+        ("/api/v1/participant/", "limit", [0, 501]),
+    ],
+)
+def test_page_sizes_are_bounded(api, url, param, bad):
+    for value in bad:
+        assert api("GET", url, params={param: value}).status_code == 422
+    assert api("GET", url, params={param: 1}).status_code == 200
+
+
+@pytest.fixture
+def selects():
+    """SELECT column lists run against the database, by table."""
+    import re
+    from sqlalchemy import event
+    from src.database import engine
+
+    seen = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        match = re.match(r"\s*SELECT (.+?) \s*FROM (\w+)", statement, re.S)
+        if match:
+            columns = {c.strip().rsplit(".", 1)[-1] for c in match.group(1).split(",")}
+            seen.append((match.group(2), columns))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    yield seen
+    event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+
+@pytest.mark.parametrize(
+    "url, fields, table, columns",
+    [
+        # Primary keys are always read (snapshots: id; events: id, network_month),
+        # and events also read created_at for the cursor
+        (
+            "/api/v1/network/history/snapshots", "month,governor_summary",
+            "network_snapshots", {"id", "network_month", "governor_summary"},
+        ),
+        (
+            "/api/v1/network/history/events", "title",
+            "network_events", {"id", "network_month", "created_at", "title"},
+        ),
+        (
+            "/api/v1/network/history/events", "id,data",
+            "network_events", {"id", "network_month", "created_at", "data"},
+        ),
+    ],
+)
+def test_fields_limit_the_columns_read(api, selects, url, fields, table, columns):
+    response = api("GET", url, params={"fields": fields})
+
+    assert response.status_code == 200
+    assert [c for t, c in selects if t == table] == [columns]
+
+
+def test_metrics_rollup_counts_events_generated_after_the_tick(api, run, db):
+    from sqlalchemy import func, select
+    from src.database import async_session
+    from src.models.network import NetworkEvent
+    from src.repositories import NetworkRepository
+    from src.services.event_generator import (
+        EventCategory, EventSeverity, SimulationEvent, get_event_generator,
+    )
+
+    month = 8001
+
+    async def tick():
+        async with async_session() as session:
+            repo = NetworkRepository(session)
+            await repo.create_event(month, "market", "At the tick", "d", severity="info")
+            await repo.record_monthly_metrics(await repo.create_snapshot(network_month=month))
+            await session.commit()
+
+    async def count():
+        async with async_session() as session:
+            result = await session.execute(
+                select(NetworkEvent.event_type, func.count(NetworkEvent.id))
+                .where(NetworkEvent.network_month == month)
+                .group_by(NetworkEvent.event_type)
+            )
+            return dict(result.all())
+
+    run(tick())
+    run(get_event_generator().save_events([
+        SimulationEvent(
+            id=f"e{i}", category=category, severity=EventSeverity.WARNING,
+            title="Later", description="d", impact={}, narrative="", month=month,
+        )
+        for i, category in enumerate([EventCategory.MARKET, EventCategory.GOVERNANCE])
+    ]))
+
+    history = api("GET", "/api/v1/network/history/metrics", params={"months": 120}).json()
+    rollup = next(m for m in history if m["month"] == month)
+    direct = run(count())
+    assert rollup["events_by_type"] == direct == {"market": 2, "governance": 1}
+    assert rollup["event_count"] == sum(direct.values())
+    assert rollup["events_by_severity"] == {"info": 1, "warning": 2}
@@ -0,0 +1,112 @@
+"""
+Monthly news: one generation per month at a time, stored when done, and
+never stored from events that were superseded while it ran.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeGenerator:
+    """compose_news_article that waits for release() and names the events it saw."""
+
+    def __init__(self):
+        self.calls = 0
+        self.gate = asyncio.Event()
+
+    def release(self):
+        self.gate.set()
+
+    async def compose_news_article(self, events, month):
+        self.calls += 1
+        titles = sorted(e.title for e in events)
+        await self.gate.wait()
+        return f"Month {month}: " + ", ".join(titles)
+
+
+@pytest.fixture
+def news(db, monkeypatch):
+    from src.services import event_generator, network_clock
+    from src.services import news as news_module
+
+    generator = FakeGenerator()
+    monkeypatch.setattr(event_generator.get_event_generator(), "compose_news_article", generator.compose_news_article)
+    monkeypatch.setattr(network_clock.get_network_clock(), "current_month", 10**6)
+    monkeypatch.setattr(news_module.settings, "google_api_key", "test")
+    return SimpleNamespace(service=news_module.NewsService(), generator=generator)
+
+
+async def _add_event(month, title):
+    from src.database import async_session
+    from src.repositories import NetworkRepository
+
+    async with async_session() as session:
+        await NetworkRepository(session).create_event(month, "market", title, "...")
+        await session.commit()
+
+
+async def _stored(month):
+    from src.database import async_read_session
+    from src.repositories import NetworkRepository
+
+    async with async_read_session() as session:
+        stored = await NetworkRepository(session).get_monthly_news(month)
+        return stored.article if stored else None
+
+
+def test_concurrent_requests_share_one_generation_and_store_it(run, news):
+    async def scenario():
+        await _add_event(7001, "Rates hold")
+        readers = [asyncio.create_task(news.service.get_news(7001, f"ip:{n}")) for n in range(5)]
+        await asyncio.sleep(0.05)
+        news.generator.release()
+        return await asyncio.gather(*readers)
+
+    results = run(scenario())
+
+    assert news.generator.calls == 1
+    assert {r["news"] for r in results} == {"Month 7001: Rates hold"}
+    assert news.service.stats["coalesced"] == 4
+    assert run(_stored(7001)) == "Month 7001: Rates hold"
+    # Served from the table afterwards
+    assert run(news.service.get_news(7001, "ip:late"))["news"] == "Month 7001: Rates hold"
+    assert news.generator.calls == 1
+
+
+def test_invalidate_during_generation_does_not_store_the_stale_article(run, news):
+    async def scenario():
+        await _add_event(7002, "Rates hold")
+        stale = asyncio.create_task(news.service.get_news(7002, "ip:a"))
+        await asyncio.sleep(0.05)
+        await _add_event(7002, "Iron ore rallies")
+        await news.service.invalidate(7002)
+        fresh = asyncio.create_task(news.service.get_news(7002, "ip:b"))
+        await asyncio.sleep(0.05)
+        news.generator.release()
+        return await stale, await fresh
+
+    stale, fresh = run(scenario())
+
+    assert stale["news"] == "Month 7002: Rates hold"
+    assert fresh["news"] == "Month 7002: Iron ore rallies, Rates hold"
+    assert news.generator.calls == 2
+    assert news.service.stats["discarded"] == 1
+    assert run(_stored(7002)) == "Month 7002: Iron ore rallies, Rates hold"
+
+
+def test_generate_events_stores_the_article_for_get_news(run, api, news, monkeypatch):
+    from src.services import news as news_module
+
+    monkeypatch.setattr(news_module, "get_news_service", lambda: news.service)
+    news.generator.release()
+    run(_add_event(7003, "Rates hold"))  # generate_events may roll no events
+
+    generated = api("POST", "/api/v1/network/events/generate", json={"month": 7003})
+    assert generated.status_code == 200
+    calls = news.generator.calls
+
+    served = api("GET", "/api/v1/network/news/7003")
+    assert served.json()["news"] == generated.json()["news_summary"]
+    assert news.generator.calls == calls == 1
@@ -0,0 +1,63 @@
+"""
+Who may subscribe to what on /ws.
+
+events and alerts are filtered to one user, so they need a valid access
+token; a bare ?user_id= is only trusted with WS_ALLOW_PLAIN_USER_ID.
+"""
+
+import orjson
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+
+@pytest.fixture
+def client(db):
+    from src.main import app
+    return TestClient(app)
+
+
+def _subscribe(ws, topics):
+    ws.send_text(orjson.dumps({"op": "sub", "topics": topics}).decode())
+    frames = []
+    while True:
+        frame = orjson.loads(ws.receive_text())
+        frames.append(frame)
+        if frame[:2] == ["sys", "topics"]:
+            return frames
+
+
+def test_anonymous_socket_gets_public_topics_only(client):
+    with client.websocket_connect("/api/v1/ws") as ws:
+        frames = _subscribe(ws, ["clock", "chat", "events", "alerts"])
+
+    assert frames[0] == ["sys", "error", {"error": "Authentication required", "topics": ["alerts", "events"]}]
+    assert frames[-1] == ["sys", "topics", {"topics": ["chat", "clock"]}]
+
+
+def test_token_unlocks_user_topics(client):
+    from src.auth.jwt import create_access_token
+
+    token, _ = create_access_token("user-1", "user@example.com")
+    with client.websocket_connect(f"/api/v1/ws?token={token}") as ws:
+        frames = _subscribe(ws, ["clock", "alerts"])
+
+    assert frames == [["sys", "topics", {"topics": ["alerts", "clock"]}]]
+
+
+@pytest.mark.parametrize("query", ["token=not-a-jwt", "user_id=someone-else"])
+def test_untrusted_identity_is_refused(client, query):
+    with pytest.raises(WebSocketDisconnect) as closed:
+        with client.websocket_connect(f"/api/v1/ws?{query}"):
+            pass
+    assert closed.value.code == 1008
+
+
+def test_plain_user_id_in_development(client, monkeypatch):
+    from src.api import realtime
+
+    monkeypatch.setattr(realtime.settings, "ws_allow_plain_user_id", True)
+    with client.websocket_connect("/api/v1/ws?user_id=dev-user") as ws:
+        frames = _subscribe(ws, ["events"])
+
+    assert frames == [["sys", "topics", {"topics": ["events"]}]]
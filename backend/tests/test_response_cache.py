@@ -0,0 +1,54 @@
+"""ETags and content negotiation of cached month responses."""
+
+from starlette.requests import Request
+
+from src.compression import ENCODINGS, encoded_etag, etag_matches
+from src.services.response_cache import ResponseCache
+
+BODY = {"items": [{"month": m, "summary": "steady growth " * 4} for m in range(20)]}
+
+
+def _request(accept_encoding=None, if_none_match=None):
+    headers = []
+    if accept_encoding:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    if if_none_match:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/api/v1/network/state", "headers": headers, "query_string": b""})
+
+
+def test_each_encoding_has_its_own_strong_etag(run):
+    cache = ResponseCache()
+    tags = {}
+    for accept in [None, *ENCODINGS]:
+        response = run(cache.respond(_request(accept), 1, lambda: BODY))
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == accept
+        tags[accept] = response.headers["etag"]
+
+    assert len(set(tags.values())) == len(tags)
+    for encoding in ENCODINGS:
+        assert tags[encoding] == tags[None][:-1] + f'-{encoding}"'
+
+
+def test_if_none_match_is_checked_against_the_negotiated_representation(run):
+    cache = ResponseCache()
+    encoding = ENCODINGS[0]
+    identity = run(cache.respond(_request(), 1, lambda: BODY)).headers["etag"]
+    encoded = encoded_etag(identity, encoding)
+
+    assert run(cache.respond(_request(encoding, encoded), 1, lambda: BODY)).status_code == 304
+    assert run(cache.respond(_request(None, identity), 1, lambda: BODY)).status_code == 304
+    # A validator for another representation does not match
+    assert run(cache.respond(_request(encoding, identity), 1, lambda: BODY)).status_code == 200
+    assert run(cache.respond(_request(None, encoded), 1, lambda: BODY)).status_code == 200
+    # Weak comparison, as If-None-Match uses
+    assert run(cache.respond(_request(encoding, "W/" + encoded), 1, lambda: BODY)).status_code == 304
+
+
+def test_etag_matches():
+    assert etag_matches('"a", "b-br"', '"b-br"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches('"a-br"', '"a"')
+    assert not etag_matches(None, '"a"')
+    assert encoded_etag('W/"a"', "br") == 'W/"a"'
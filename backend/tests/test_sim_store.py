@@ -0,0 +1,128 @@
+"""
+SimStore write-behind with several workers on one database.
+
+Each worker caches the rows and flushes its own changes; vote tallies must
+add up across workers, and rewriting a row must not move its created_at.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+PROPERTY = {
+    "id": "sim-test-property", "address": "1 Test St", "suburb": "Perth", "state": "WA", "postcode": "6000",
+    "property_type": "house", "bedrooms": 3, "bathrooms": 2, "valuation_aud": 500000,
+    "weekly_rent_aud": 600, "total_tokens": 500000, "token_price": 1,
+}
+
+
+def _seeds():
+    now = datetime.utcnow()
+    proposal = {
+        "id": str(uuid4()), "title": "Test proposal", "description": "...", "proposal_type": "feature",
+        "votes_for": 100, "votes_against": 50, "status": "active",
+        "voting_ends_at": (now + timedelta(days=5)).isoformat(), "created_at": now.isoformat(),
+    }
+    feedback = {
+        "id": str(uuid4()), "title": "Test feedback", "description": "...", "feedback_type": "bug",
+        "status": "open", "upvotes": 4, "downvotes": 1, "created_at": now.isoformat(),
+    }
+    return proposal, feedback
+
+
+def _user(store):
+    user_id = str(uuid4())
+    now = datetime.utcnow().isoformat()
+    store.add_user({
+        "id": user_id, "email": f"{user_id}@example.com", "display_name": "Tester",
+        "balance_aud": 1000.0, "created_at": now, "last_active_at": now,
+    })
+    return user_id
+
+
+@pytest.fixture
+def workers(run, db):
+    """Two stores loaded from the same database, as two worker processes would be."""
+    from src.services.sim_store import SimStore
+
+    proposal, feedback = _seeds()
+    stores = [SimStore(), SimStore()]
+    for store in stores:
+        run(store.load([PROPERTY], [proposal], [feedback]))
+    return stores, proposal["id"], feedback["id"]
+
+
+async def _read(model, row_id):
+    from src.database import async_session
+    async with async_session() as session:
+        return await session.get(model, row_id)
+
+
+def test_votes_from_every_worker_are_counted(run, workers):
+    from src.models.simulation import FeedbackItem, SimProposal
+
+    (a, b), proposal_id, feedback_id = workers
+    a_user, b_user = _user(a), _user(b)
+    for store, user_id, power in ((a, a_user, 10), (b, b_user, 5)):
+        store.proposals[proposal_id]["votes_for"] += power
+        store.record_proposal_vote(proposal_id, user_id, "for", power)
+        store.feedback[feedback_id]["upvotes"] += 1
+        store.set_feedback_vote(feedback_id, user_id, 1)
+    # a changes its mind after its first flush: -1 up, +1 down
+    run(a.flush())
+    a.feedback[feedback_id]["upvotes"] -= 1
+    a.feedback[feedback_id]["downvotes"] += 1
+    a.set_feedback_vote(feedback_id, a_user, -1)
+    run(b.flush())
+    run(a.flush())
+
+    proposal = run(_read(SimProposal, proposal_id))
+    feedback = run(_read(FeedbackItem, feedback_id))
+    assert proposal.votes_for == Decimal(115)
+    assert proposal.votes_against == Decimal(50)
+    assert (feedback.upvotes, feedback.downvotes) == (5, 2)
+
+
+def test_failed_flush_keeps_the_increments(run, workers, monkeypatch):
+    from src.models.simulation import SimProposal
+    from src.services import sim_store
+
+    (a, _), proposal_id, _ = workers
+    user_id = _user(a)
+    a.proposals[proposal_id]["votes_against"] += 7
+    a.record_proposal_vote(proposal_id, user_id, "against", 7)
+
+    def broken_session():
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(sim_store, "async_session", broken_session)
+    assert run(a.flush()) == 0
+    monkeypatch.undo()
+    run(a.flush())
+
+    assert run(_read(SimProposal, proposal_id)).votes_against == Decimal(57)
+
+
+def test_rewrites_keep_created_at(run, workers):
+    from src.models.simulation import FeedbackVote, SimHolding
+    from src.services.sim_store import _row_id
+
+    (a, _), _, feedback_id = workers
+    user_id = _user(a)
+    a.set_holding(user_id, PROPERTY["id"], {"property_id": PROPERTY["id"], "token_amount": 10, "avg_price": 1})
+    a.set_feedback_vote(feedback_id, user_id, 1)
+    run(a.flush())
+    holding_id = _row_id("holding", user_id, PROPERTY["id"])
+    vote_id = _row_id("feedback-vote", feedback_id, user_id)
+    created = run(_read(SimHolding, holding_id)).created_at, run(_read(FeedbackVote, vote_id)).created_at
+
+    a.set_holding(user_id, PROPERTY["id"], {"property_id": PROPERTY["id"], "token_amount": 25, "avg_price": 1.2})
+    a.set_feedback_vote(feedback_id, user_id, -1)
+    run(a.flush())
+
+    holding, vote = run(_read(SimHolding, holding_id)), run(_read(FeedbackVote, vote_id))
+    assert holding.token_amount == Decimal(25)
+    assert vote.vote == -1
+    assert (holding.created_at, vote.created_at) == created
@@ -0,0 +1,23 @@
+"""Import cost of the app (see scripts/bench_startup.py)."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location(
+    "bench_startup", Path(__file__).parent.parent / "scripts" / "bench_startup.py"
+)
+bench_startup = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench_startup)
+
+
+@pytest.mark.parametrize("api_key", ["", "test-key"])
+def test_importing_the_app_is_lazy_and_within_budget(monkeypatch, api_key):
+    monkeypatch.setenv("GOOGLE_API_KEY", api_key)
+    monkeypatch.delenv("AI_WARMUP", raising=False)
+
+    total_ms, modules = bench_startup.measure_import()
+
+    assert "google.genai" not in modules
+    assert 0 < total_ms <= bench_startup.IMPORT_BUDGET_MS
@@ -23,6 +23,8 @@ export interface PoolProperty {
   bedrooms: number;
   bathrooms: number;
   valuation: number;
+  gross_yield?: number;
+  land_size?: number;
   headline: string;
   has_images: boolean;
   // Optional highlights at top level (legacy format)
@@ -94,12 +96,23 @@ export interface PoolProperty {
     isometric: string;
     floorplan: string;
   };
+  // Resized AVIF/WebP variants, once built (keyed like images)
+  thumbnails?: Record<string, ImageSet>;
+}
+
+export interface ImageSet {
+  src: string;
+  srcset: string;
+  sources: Array<{ type: string; srcset: string }>;
+  width: number;
+  height: number;
 }
 
 export interface PoolAvatar {
   role: string;
   category: 'participant' | 'service';
   image: string;
+  thumbnail?: ImageSet | null;
   generated_at: string;
 }
 
@@ -167,6 +180,58 @@ export async function fetchProperties(limit = 12, status?: string): Promise<Pool
   }
 }
 
+export interface PoolSearchParams {
+  suburb?: string[];
+  property_type?: string[];
+  status?: string[];
+  min_price?: number;
+  max_price?: number;
+  min_yield?: number;
+  max_yield?: number;
+  min_bedrooms?: number;
+  max_bedrooms?: number;
+  min_land?: number;
+  max_land?: number;
+  // Field, prefixed with - for descending (e.g. '-valuation')
+  sort?: string;
+  limit?: number;
+  cursor?: string;
+  facets?: boolean;
+}
+
+export interface PoolSearchResult {
+  total: number;
+  items: PoolProperty[];
+  facets: Record<string, Record<string, number>> | null;
+  next_cursor: string | null;
+}
+
+/**
+ * Search the pool server-side (filters, facet counts, sort, cursor paging)
+ */
+export async function searchProperties(search: PoolSearchParams = {}): Promise<PoolSearchResult | null> {
+  try {
+    const params = new URLSearchParams();
+    for (const [key, value] of Object.entries(search)) {
+      if (value === undefined || value === null) continue;
+      if (Array.isArray(value)) {
+        value.forEach(v => params.append(key, v));
+      } else {
+        params.set(key, String(value));
+      }
+    }
+    
+    const res = await fetch(`${apiBase}/pool/properties/search?${params}`);
+    if (!res.ok) {
+      throw new Error(`Failed to search properties: ${res.status}`);
+    }
+    return await res.json();
+  } catch (e) {
+    console.error('Failed to search properties:', e);
+    return null;
+  }
+}
+
 /**
  * Fetch a single property with full details
  */